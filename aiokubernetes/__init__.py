@@ -1,605 +1,99 @@
 # coding: utf-8
 
 # flake8: noqa
-
 """
     Kubernetes
 
     No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
 
     OpenAPI spec version: v1.10.6
-    
+
     Generated by: https://github.com/swagger-api/swagger-codegen.git
+
+    NOTE: this file was converted by `create-client/lazy_init.py`.
 """
+import importlib
+import sys
+
+# Classes that are available as attributes of the `aiokubernetes` package, eg
+# `aiokubernetes.ApiClient`, and the module that defines them.
+_ATTRIBUTES = {
+    'ApiClient': 'aiokubernetes.api_client',
+    'Configuration': 'aiokubernetes.configuration',
+}
+
+# Sub-modules that are available as attributes of the `aiokubernetes` package.
+_SUBMODULES = {
+    'api',
+    'api_client',
+    'api_proxy',
+    'cache',
+    'cached',
+    'clients',
+    'codec',
+    'config',
+    'configuration',
+    'debounce',
+    'endpoint',
+    'hub',
+    'informer',
+    'jsonstream',
+    'pager',
+    'models',
+    'ratelimit',
+    'registry',
+    'rest',
+    'retry',
+    'selector',
+    'singleflight',
+    'swagger',
+    'utils',
+    'watch',
+    'workqueue',
+}
+
+
+def __getattr__(name):
+    # Convenience: import eg `aiokubernetes.swagger` on first access.
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{__name__}.{name}')
+
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    # `from aiokubernetes import *` exports all of the above as well as all
+    # APIs and models. Compute the list on demand because it requires the
+    # `api` and `models` packages.
+    if name == '__all__':
+        api = importlib.import_module(f'{__name__}.api')
+        models = importlib.import_module(f'{__name__}.models')
+        value = sorted(_ATTRIBUTES) + sorted(_SUBMODULES) + api.__all__ + models.__all__
+        globals()[name] = value
+        return value
 
+    # Expose all APIs and models at the top level, eg `aiokubernetes.V1Pod`.
+    for package in ('api', 'models'):
+        package = importlib.import_module(f'{__name__}.{package}')
+        if name in package._MODULES:
+            value = getattr(package, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-from __future__ import absolute_import
 
-# import apis into sdk package
-from aiokubernetes.api.admissionregistration_api import AdmissionregistrationApi
-from aiokubernetes.api.admissionregistration_v1alpha1_api import AdmissionregistrationV1alpha1Api
-from aiokubernetes.api.admissionregistration_v1beta1_api import AdmissionregistrationV1beta1Api
-from aiokubernetes.api.apiextensions_api import ApiextensionsApi
-from aiokubernetes.api.apiextensions_v1beta1_api import ApiextensionsV1beta1Api
-from aiokubernetes.api.apiregistration_api import ApiregistrationApi
-from aiokubernetes.api.apiregistration_v1_api import ApiregistrationV1Api
-from aiokubernetes.api.apiregistration_v1beta1_api import ApiregistrationV1beta1Api
-from aiokubernetes.api.apis_api import ApisApi
-from aiokubernetes.api.apps_api import AppsApi
-from aiokubernetes.api.apps_v1_api import AppsV1Api
-from aiokubernetes.api.apps_v1beta1_api import AppsV1beta1Api
-from aiokubernetes.api.apps_v1beta2_api import AppsV1beta2Api
-from aiokubernetes.api.authentication_api import AuthenticationApi
-from aiokubernetes.api.authentication_v1_api import AuthenticationV1Api
-from aiokubernetes.api.authentication_v1beta1_api import AuthenticationV1beta1Api
-from aiokubernetes.api.authorization_api import AuthorizationApi
-from aiokubernetes.api.authorization_v1_api import AuthorizationV1Api
-from aiokubernetes.api.authorization_v1beta1_api import AuthorizationV1beta1Api
-from aiokubernetes.api.autoscaling_api import AutoscalingApi
-from aiokubernetes.api.autoscaling_v1_api import AutoscalingV1Api
-from aiokubernetes.api.autoscaling_v2beta1_api import AutoscalingV2beta1Api
-from aiokubernetes.api.batch_api import BatchApi
-from aiokubernetes.api.batch_v1_api import BatchV1Api
-from aiokubernetes.api.batch_v1beta1_api import BatchV1beta1Api
-from aiokubernetes.api.batch_v2alpha1_api import BatchV2alpha1Api
-from aiokubernetes.api.certificates_api import CertificatesApi
-from aiokubernetes.api.certificates_v1beta1_api import CertificatesV1beta1Api
-from aiokubernetes.api.core_api import CoreApi
-from aiokubernetes.api.core_v1_api import CoreV1Api
-from aiokubernetes.api.custom_objects_api import CustomObjectsApi
-from aiokubernetes.api.events_api import EventsApi
-from aiokubernetes.api.events_v1beta1_api import EventsV1beta1Api
-from aiokubernetes.api.extensions_api import ExtensionsApi
-from aiokubernetes.api.extensions_v1beta1_api import ExtensionsV1beta1Api
-from aiokubernetes.api.logs_api import LogsApi
-from aiokubernetes.api.networking_api import NetworkingApi
-from aiokubernetes.api.networking_v1_api import NetworkingV1Api
-from aiokubernetes.api.policy_api import PolicyApi
-from aiokubernetes.api.policy_v1beta1_api import PolicyV1beta1Api
-from aiokubernetes.api.rbac_authorization_api import RbacAuthorizationApi
-from aiokubernetes.api.rbac_authorization_v1_api import RbacAuthorizationV1Api
-from aiokubernetes.api.rbac_authorization_v1alpha1_api import RbacAuthorizationV1alpha1Api
-from aiokubernetes.api.rbac_authorization_v1beta1_api import RbacAuthorizationV1beta1Api
-from aiokubernetes.api.scheduling_api import SchedulingApi
-from aiokubernetes.api.scheduling_v1alpha1_api import SchedulingV1alpha1Api
-from aiokubernetes.api.settings_api import SettingsApi
-from aiokubernetes.api.settings_v1alpha1_api import SettingsV1alpha1Api
-from aiokubernetes.api.storage_api import StorageApi
-from aiokubernetes.api.storage_v1_api import StorageV1Api
-from aiokubernetes.api.storage_v1alpha1_api import StorageV1alpha1Api
-from aiokubernetes.api.storage_v1beta1_api import StorageV1beta1Api
-from aiokubernetes.api.version_api import VersionApi
+def __dir__():
+    api = importlib.import_module(f'{__name__}.api')
+    models = importlib.import_module(f'{__name__}.models')
+    names = set(globals()) | set(_ATTRIBUTES) | _SUBMODULES
+    return sorted(names | set(api._MODULES) | set(models._MODULES))
 
-# import ApiClient
-from aiokubernetes.api_client import ApiClient
-from aiokubernetes.configuration import Configuration
-# import models into sdk package
-from aiokubernetes.models.admissionregistration_v1beta1_service_reference import AdmissionregistrationV1beta1ServiceReference
-from aiokubernetes.models.apiregistration_v1beta1_service_reference import ApiregistrationV1beta1ServiceReference
-from aiokubernetes.models.apps_v1beta1_deployment import AppsV1beta1Deployment
-from aiokubernetes.models.apps_v1beta1_deployment_condition import AppsV1beta1DeploymentCondition
-from aiokubernetes.models.apps_v1beta1_deployment_list import AppsV1beta1DeploymentList
-from aiokubernetes.models.apps_v1beta1_deployment_rollback import AppsV1beta1DeploymentRollback
-from aiokubernetes.models.apps_v1beta1_deployment_spec import AppsV1beta1DeploymentSpec
-from aiokubernetes.models.apps_v1beta1_deployment_status import AppsV1beta1DeploymentStatus
-from aiokubernetes.models.apps_v1beta1_deployment_strategy import AppsV1beta1DeploymentStrategy
-from aiokubernetes.models.apps_v1beta1_rollback_config import AppsV1beta1RollbackConfig
-from aiokubernetes.models.apps_v1beta1_rolling_update_deployment import AppsV1beta1RollingUpdateDeployment
-from aiokubernetes.models.apps_v1beta1_scale import AppsV1beta1Scale
-from aiokubernetes.models.apps_v1beta1_scale_spec import AppsV1beta1ScaleSpec
-from aiokubernetes.models.apps_v1beta1_scale_status import AppsV1beta1ScaleStatus
-from aiokubernetes.models.extensions_v1beta1_allowed_flex_volume import ExtensionsV1beta1AllowedFlexVolume
-from aiokubernetes.models.extensions_v1beta1_allowed_host_path import ExtensionsV1beta1AllowedHostPath
-from aiokubernetes.models.extensions_v1beta1_deployment import ExtensionsV1beta1Deployment
-from aiokubernetes.models.extensions_v1beta1_deployment_condition import ExtensionsV1beta1DeploymentCondition
-from aiokubernetes.models.extensions_v1beta1_deployment_list import ExtensionsV1beta1DeploymentList
-from aiokubernetes.models.extensions_v1beta1_deployment_rollback import ExtensionsV1beta1DeploymentRollback
-from aiokubernetes.models.extensions_v1beta1_deployment_spec import ExtensionsV1beta1DeploymentSpec
-from aiokubernetes.models.extensions_v1beta1_deployment_status import ExtensionsV1beta1DeploymentStatus
-from aiokubernetes.models.extensions_v1beta1_deployment_strategy import ExtensionsV1beta1DeploymentStrategy
-from aiokubernetes.models.extensions_v1beta1_fs_group_strategy_options import ExtensionsV1beta1FSGroupStrategyOptions
-from aiokubernetes.models.extensions_v1beta1_host_port_range import ExtensionsV1beta1HostPortRange
-from aiokubernetes.models.extensions_v1beta1_id_range import ExtensionsV1beta1IDRange
-from aiokubernetes.models.extensions_v1beta1_pod_security_policy import ExtensionsV1beta1PodSecurityPolicy
-from aiokubernetes.models.extensions_v1beta1_pod_security_policy_list import ExtensionsV1beta1PodSecurityPolicyList
-from aiokubernetes.models.extensions_v1beta1_pod_security_policy_spec import ExtensionsV1beta1PodSecurityPolicySpec
-from aiokubernetes.models.extensions_v1beta1_rollback_config import ExtensionsV1beta1RollbackConfig
-from aiokubernetes.models.extensions_v1beta1_rolling_update_deployment import ExtensionsV1beta1RollingUpdateDeployment
-from aiokubernetes.models.extensions_v1beta1_run_as_user_strategy_options import ExtensionsV1beta1RunAsUserStrategyOptions
-from aiokubernetes.models.extensions_v1beta1_se_linux_strategy_options import ExtensionsV1beta1SELinuxStrategyOptions
-from aiokubernetes.models.extensions_v1beta1_scale import ExtensionsV1beta1Scale
-from aiokubernetes.models.extensions_v1beta1_scale_spec import ExtensionsV1beta1ScaleSpec
-from aiokubernetes.models.extensions_v1beta1_scale_status import ExtensionsV1beta1ScaleStatus
-from aiokubernetes.models.extensions_v1beta1_supplemental_groups_strategy_options import ExtensionsV1beta1SupplementalGroupsStrategyOptions
-from aiokubernetes.models.policy_v1beta1_allowed_flex_volume import PolicyV1beta1AllowedFlexVolume
-from aiokubernetes.models.policy_v1beta1_allowed_host_path import PolicyV1beta1AllowedHostPath
-from aiokubernetes.models.policy_v1beta1_fs_group_strategy_options import PolicyV1beta1FSGroupStrategyOptions
-from aiokubernetes.models.policy_v1beta1_host_port_range import PolicyV1beta1HostPortRange
-from aiokubernetes.models.policy_v1beta1_id_range import PolicyV1beta1IDRange
-from aiokubernetes.models.policy_v1beta1_pod_security_policy import PolicyV1beta1PodSecurityPolicy
-from aiokubernetes.models.policy_v1beta1_pod_security_policy_list import PolicyV1beta1PodSecurityPolicyList
-from aiokubernetes.models.policy_v1beta1_pod_security_policy_spec import PolicyV1beta1PodSecurityPolicySpec
-from aiokubernetes.models.policy_v1beta1_run_as_user_strategy_options import PolicyV1beta1RunAsUserStrategyOptions
-from aiokubernetes.models.policy_v1beta1_se_linux_strategy_options import PolicyV1beta1SELinuxStrategyOptions
-from aiokubernetes.models.policy_v1beta1_supplemental_groups_strategy_options import PolicyV1beta1SupplementalGroupsStrategyOptions
-from aiokubernetes.models.runtime_raw_extension import RuntimeRawExtension
-from aiokubernetes.models.v1_api_group import V1APIGroup
-from aiokubernetes.models.v1_api_group_list import V1APIGroupList
-from aiokubernetes.models.v1_api_resource import V1APIResource
-from aiokubernetes.models.v1_api_resource_list import V1APIResourceList
-from aiokubernetes.models.v1_api_service import V1APIService
-from aiokubernetes.models.v1_api_service_condition import V1APIServiceCondition
-from aiokubernetes.models.v1_api_service_list import V1APIServiceList
-from aiokubernetes.models.v1_api_service_spec import V1APIServiceSpec
-from aiokubernetes.models.v1_api_service_status import V1APIServiceStatus
-from aiokubernetes.models.v1_api_versions import V1APIVersions
-from aiokubernetes.models.v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from aiokubernetes.models.v1_affinity import V1Affinity
-from aiokubernetes.models.v1_aggregation_rule import V1AggregationRule
-from aiokubernetes.models.v1_attached_volume import V1AttachedVolume
-from aiokubernetes.models.v1_azure_disk_volume_source import V1AzureDiskVolumeSource
-from aiokubernetes.models.v1_azure_file_persistent_volume_source import V1AzureFilePersistentVolumeSource
-from aiokubernetes.models.v1_azure_file_volume_source import V1AzureFileVolumeSource
-from aiokubernetes.models.v1_binding import V1Binding
-from aiokubernetes.models.v1_csi_persistent_volume_source import V1CSIPersistentVolumeSource
-from aiokubernetes.models.v1_capabilities import V1Capabilities
-from aiokubernetes.models.v1_ceph_fs_persistent_volume_source import V1CephFSPersistentVolumeSource
-from aiokubernetes.models.v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from aiokubernetes.models.v1_cinder_volume_source import V1CinderVolumeSource
-from aiokubernetes.models.v1_client_ip_config import V1ClientIPConfig
-from aiokubernetes.models.v1_cluster_role import V1ClusterRole
-from aiokubernetes.models.v1_cluster_role_binding import V1ClusterRoleBinding
-from aiokubernetes.models.v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from aiokubernetes.models.v1_cluster_role_list import V1ClusterRoleList
-from aiokubernetes.models.v1_component_condition import V1ComponentCondition
-from aiokubernetes.models.v1_component_status import V1ComponentStatus
-from aiokubernetes.models.v1_component_status_list import V1ComponentStatusList
-from aiokubernetes.models.v1_config_map import V1ConfigMap
-from aiokubernetes.models.v1_config_map_env_source import V1ConfigMapEnvSource
-from aiokubernetes.models.v1_config_map_key_selector import V1ConfigMapKeySelector
-from aiokubernetes.models.v1_config_map_list import V1ConfigMapList
-from aiokubernetes.models.v1_config_map_projection import V1ConfigMapProjection
-from aiokubernetes.models.v1_config_map_volume_source import V1ConfigMapVolumeSource
-from aiokubernetes.models.v1_container import V1Container
-from aiokubernetes.models.v1_container_image import V1ContainerImage
-from aiokubernetes.models.v1_container_port import V1ContainerPort
-from aiokubernetes.models.v1_container_state import V1ContainerState
-from aiokubernetes.models.v1_container_state_running import V1ContainerStateRunning
-from aiokubernetes.models.v1_container_state_terminated import V1ContainerStateTerminated
-from aiokubernetes.models.v1_container_state_waiting import V1ContainerStateWaiting
-from aiokubernetes.models.v1_container_status import V1ContainerStatus
-from aiokubernetes.models.v1_controller_revision import V1ControllerRevision
-from aiokubernetes.models.v1_controller_revision_list import V1ControllerRevisionList
-from aiokubernetes.models.v1_cross_version_object_reference import V1CrossVersionObjectReference
-from aiokubernetes.models.v1_daemon_endpoint import V1DaemonEndpoint
-from aiokubernetes.models.v1_daemon_set import V1DaemonSet
-from aiokubernetes.models.v1_daemon_set_condition import V1DaemonSetCondition
-from aiokubernetes.models.v1_daemon_set_list import V1DaemonSetList
-from aiokubernetes.models.v1_daemon_set_spec import V1DaemonSetSpec
-from aiokubernetes.models.v1_daemon_set_status import V1DaemonSetStatus
-from aiokubernetes.models.v1_daemon_set_update_strategy import V1DaemonSetUpdateStrategy
-from aiokubernetes.models.v1_delete_options import V1DeleteOptions
-from aiokubernetes.models.v1_deployment import V1Deployment
-from aiokubernetes.models.v1_deployment_condition import V1DeploymentCondition
-from aiokubernetes.models.v1_deployment_list import V1DeploymentList
-from aiokubernetes.models.v1_deployment_spec import V1DeploymentSpec
-from aiokubernetes.models.v1_deployment_status import V1DeploymentStatus
-from aiokubernetes.models.v1_deployment_strategy import V1DeploymentStrategy
-from aiokubernetes.models.v1_downward_api_projection import V1DownwardAPIProjection
-from aiokubernetes.models.v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from aiokubernetes.models.v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from aiokubernetes.models.v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from aiokubernetes.models.v1_endpoint_address import V1EndpointAddress
-from aiokubernetes.models.v1_endpoint_port import V1EndpointPort
-from aiokubernetes.models.v1_endpoint_subset import V1EndpointSubset
-from aiokubernetes.models.v1_endpoints import V1Endpoints
-from aiokubernetes.models.v1_endpoints_list import V1EndpointsList
-from aiokubernetes.models.v1_env_from_source import V1EnvFromSource
-from aiokubernetes.models.v1_env_var import V1EnvVar
-from aiokubernetes.models.v1_env_var_source import V1EnvVarSource
-from aiokubernetes.models.v1_event import V1Event
-from aiokubernetes.models.v1_event_list import V1EventList
-from aiokubernetes.models.v1_event_series import V1EventSeries
-from aiokubernetes.models.v1_event_source import V1EventSource
-from aiokubernetes.models.v1_exec_action import V1ExecAction
-from aiokubernetes.models.v1_fc_volume_source import V1FCVolumeSource
-from aiokubernetes.models.v1_flex_persistent_volume_source import V1FlexPersistentVolumeSource
-from aiokubernetes.models.v1_flex_volume_source import V1FlexVolumeSource
-from aiokubernetes.models.v1_flocker_volume_source import V1FlockerVolumeSource
-from aiokubernetes.models.v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from aiokubernetes.models.v1_git_repo_volume_source import V1GitRepoVolumeSource
-from aiokubernetes.models.v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from aiokubernetes.models.v1_group_version_for_discovery import V1GroupVersionForDiscovery
-from aiokubernetes.models.v1_http_get_action import V1HTTPGetAction
-from aiokubernetes.models.v1_http_header import V1HTTPHeader
-from aiokubernetes.models.v1_handler import V1Handler
-from aiokubernetes.models.v1_horizontal_pod_autoscaler import V1HorizontalPodAutoscaler
-from aiokubernetes.models.v1_horizontal_pod_autoscaler_list import V1HorizontalPodAutoscalerList
-from aiokubernetes.models.v1_horizontal_pod_autoscaler_spec import V1HorizontalPodAutoscalerSpec
-from aiokubernetes.models.v1_horizontal_pod_autoscaler_status import V1HorizontalPodAutoscalerStatus
-from aiokubernetes.models.v1_host_alias import V1HostAlias
-from aiokubernetes.models.v1_host_path_volume_source import V1HostPathVolumeSource
-from aiokubernetes.models.v1_ip_block import V1IPBlock
-from aiokubernetes.models.v1_iscsi_persistent_volume_source import V1ISCSIPersistentVolumeSource
-from aiokubernetes.models.v1_iscsi_volume_source import V1ISCSIVolumeSource
-from aiokubernetes.models.v1_initializer import V1Initializer
-from aiokubernetes.models.v1_initializers import V1Initializers
-from aiokubernetes.models.v1_job import V1Job
-from aiokubernetes.models.v1_job_condition import V1JobCondition
-from aiokubernetes.models.v1_job_list import V1JobList
-from aiokubernetes.models.v1_job_spec import V1JobSpec
-from aiokubernetes.models.v1_job_status import V1JobStatus
-from aiokubernetes.models.v1_key_to_path import V1KeyToPath
-from aiokubernetes.models.v1_label_selector import V1LabelSelector
-from aiokubernetes.models.v1_label_selector_requirement import V1LabelSelectorRequirement
-from aiokubernetes.models.v1_lifecycle import V1Lifecycle
-from aiokubernetes.models.v1_limit_range import V1LimitRange
-from aiokubernetes.models.v1_limit_range_item import V1LimitRangeItem
-from aiokubernetes.models.v1_limit_range_list import V1LimitRangeList
-from aiokubernetes.models.v1_limit_range_spec import V1LimitRangeSpec
-from aiokubernetes.models.v1_list_meta import V1ListMeta
-from aiokubernetes.models.v1_load_balancer_ingress import V1LoadBalancerIngress
-from aiokubernetes.models.v1_load_balancer_status import V1LoadBalancerStatus
-from aiokubernetes.models.v1_local_object_reference import V1LocalObjectReference
-from aiokubernetes.models.v1_local_subject_access_review import V1LocalSubjectAccessReview
-from aiokubernetes.models.v1_local_volume_source import V1LocalVolumeSource
-from aiokubernetes.models.v1_nfs_volume_source import V1NFSVolumeSource
-from aiokubernetes.models.v1_namespace import V1Namespace
-from aiokubernetes.models.v1_namespace_list import V1NamespaceList
-from aiokubernetes.models.v1_namespace_spec import V1NamespaceSpec
-from aiokubernetes.models.v1_namespace_status import V1NamespaceStatus
-from aiokubernetes.models.v1_network_policy import V1NetworkPolicy
-from aiokubernetes.models.v1_network_policy_egress_rule import V1NetworkPolicyEgressRule
-from aiokubernetes.models.v1_network_policy_ingress_rule import V1NetworkPolicyIngressRule
-from aiokubernetes.models.v1_network_policy_list import V1NetworkPolicyList
-from aiokubernetes.models.v1_network_policy_peer import V1NetworkPolicyPeer
-from aiokubernetes.models.v1_network_policy_port import V1NetworkPolicyPort
-from aiokubernetes.models.v1_network_policy_spec import V1NetworkPolicySpec
-from aiokubernetes.models.v1_node import V1Node
-from aiokubernetes.models.v1_node_address import V1NodeAddress
-from aiokubernetes.models.v1_node_affinity import V1NodeAffinity
-from aiokubernetes.models.v1_node_condition import V1NodeCondition
-from aiokubernetes.models.v1_node_config_source import V1NodeConfigSource
-from aiokubernetes.models.v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from aiokubernetes.models.v1_node_list import V1NodeList
-from aiokubernetes.models.v1_node_selector import V1NodeSelector
-from aiokubernetes.models.v1_node_selector_requirement import V1NodeSelectorRequirement
-from aiokubernetes.models.v1_node_selector_term import V1NodeSelectorTerm
-from aiokubernetes.models.v1_node_spec import V1NodeSpec
-from aiokubernetes.models.v1_node_status import V1NodeStatus
-from aiokubernetes.models.v1_node_system_info import V1NodeSystemInfo
-from aiokubernetes.models.v1_non_resource_attributes import V1NonResourceAttributes
-from aiokubernetes.models.v1_non_resource_rule import V1NonResourceRule
-from aiokubernetes.models.v1_object_field_selector import V1ObjectFieldSelector
-from aiokubernetes.models.v1_object_meta import V1ObjectMeta
-from aiokubernetes.models.v1_object_reference import V1ObjectReference
-from aiokubernetes.models.v1_owner_reference import V1OwnerReference
-from aiokubernetes.models.v1_persistent_volume import V1PersistentVolume
-from aiokubernetes.models.v1_persistent_volume_claim import V1PersistentVolumeClaim
-from aiokubernetes.models.v1_persistent_volume_claim_condition import V1PersistentVolumeClaimCondition
-from aiokubernetes.models.v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from aiokubernetes.models.v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from aiokubernetes.models.v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
-from aiokubernetes.models.v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from aiokubernetes.models.v1_persistent_volume_list import V1PersistentVolumeList
-from aiokubernetes.models.v1_persistent_volume_spec import V1PersistentVolumeSpec
-from aiokubernetes.models.v1_persistent_volume_status import V1PersistentVolumeStatus
-from aiokubernetes.models.v1_photon_persistent_disk_volume_source import V1PhotonPersistentDiskVolumeSource
-from aiokubernetes.models.v1_pod import V1Pod
-from aiokubernetes.models.v1_pod_affinity import V1PodAffinity
-from aiokubernetes.models.v1_pod_affinity_term import V1PodAffinityTerm
-from aiokubernetes.models.v1_pod_anti_affinity import V1PodAntiAffinity
-from aiokubernetes.models.v1_pod_condition import V1PodCondition
-from aiokubernetes.models.v1_pod_dns_config import V1PodDNSConfig
-from aiokubernetes.models.v1_pod_dns_config_option import V1PodDNSConfigOption
-from aiokubernetes.models.v1_pod_list import V1PodList
-from aiokubernetes.models.v1_pod_security_context import V1PodSecurityContext
-from aiokubernetes.models.v1_pod_spec import V1PodSpec
-from aiokubernetes.models.v1_pod_status import V1PodStatus
-from aiokubernetes.models.v1_pod_template import V1PodTemplate
-from aiokubernetes.models.v1_pod_template_list import V1PodTemplateList
-from aiokubernetes.models.v1_pod_template_spec import V1PodTemplateSpec
-from aiokubernetes.models.v1_policy_rule import V1PolicyRule
-from aiokubernetes.models.v1_portworx_volume_source import V1PortworxVolumeSource
-from aiokubernetes.models.v1_preconditions import V1Preconditions
-from aiokubernetes.models.v1_preferred_scheduling_term import V1PreferredSchedulingTerm
-from aiokubernetes.models.v1_probe import V1Probe
-from aiokubernetes.models.v1_projected_volume_source import V1ProjectedVolumeSource
-from aiokubernetes.models.v1_quobyte_volume_source import V1QuobyteVolumeSource
-from aiokubernetes.models.v1_rbd_persistent_volume_source import V1RBDPersistentVolumeSource
-from aiokubernetes.models.v1_rbd_volume_source import V1RBDVolumeSource
-from aiokubernetes.models.v1_replica_set import V1ReplicaSet
-from aiokubernetes.models.v1_replica_set_condition import V1ReplicaSetCondition
-from aiokubernetes.models.v1_replica_set_list import V1ReplicaSetList
-from aiokubernetes.models.v1_replica_set_spec import V1ReplicaSetSpec
-from aiokubernetes.models.v1_replica_set_status import V1ReplicaSetStatus
-from aiokubernetes.models.v1_replication_controller import V1ReplicationController
-from aiokubernetes.models.v1_replication_controller_condition import V1ReplicationControllerCondition
-from aiokubernetes.models.v1_replication_controller_list import V1ReplicationControllerList
-from aiokubernetes.models.v1_replication_controller_spec import V1ReplicationControllerSpec
-from aiokubernetes.models.v1_replication_controller_status import V1ReplicationControllerStatus
-from aiokubernetes.models.v1_resource_attributes import V1ResourceAttributes
-from aiokubernetes.models.v1_resource_field_selector import V1ResourceFieldSelector
-from aiokubernetes.models.v1_resource_quota import V1ResourceQuota
-from aiokubernetes.models.v1_resource_quota_list import V1ResourceQuotaList
-from aiokubernetes.models.v1_resource_quota_spec import V1ResourceQuotaSpec
-from aiokubernetes.models.v1_resource_quota_status import V1ResourceQuotaStatus
-from aiokubernetes.models.v1_resource_requirements import V1ResourceRequirements
-from aiokubernetes.models.v1_resource_rule import V1ResourceRule
-from aiokubernetes.models.v1_role import V1Role
-from aiokubernetes.models.v1_role_binding import V1RoleBinding
-from aiokubernetes.models.v1_role_binding_list import V1RoleBindingList
-from aiokubernetes.models.v1_role_list import V1RoleList
-from aiokubernetes.models.v1_role_ref import V1RoleRef
-from aiokubernetes.models.v1_rolling_update_daemon_set import V1RollingUpdateDaemonSet
-from aiokubernetes.models.v1_rolling_update_deployment import V1RollingUpdateDeployment
-from aiokubernetes.models.v1_rolling_update_stateful_set_strategy import V1RollingUpdateStatefulSetStrategy
-from aiokubernetes.models.v1_se_linux_options import V1SELinuxOptions
-from aiokubernetes.models.v1_scale import V1Scale
-from aiokubernetes.models.v1_scale_io_persistent_volume_source import V1ScaleIOPersistentVolumeSource
-from aiokubernetes.models.v1_scale_io_volume_source import V1ScaleIOVolumeSource
-from aiokubernetes.models.v1_scale_spec import V1ScaleSpec
-from aiokubernetes.models.v1_scale_status import V1ScaleStatus
-from aiokubernetes.models.v1_secret import V1Secret
-from aiokubernetes.models.v1_secret_env_source import V1SecretEnvSource
-from aiokubernetes.models.v1_secret_key_selector import V1SecretKeySelector
-from aiokubernetes.models.v1_secret_list import V1SecretList
-from aiokubernetes.models.v1_secret_projection import V1SecretProjection
-from aiokubernetes.models.v1_secret_reference import V1SecretReference
-from aiokubernetes.models.v1_secret_volume_source import V1SecretVolumeSource
-from aiokubernetes.models.v1_security_context import V1SecurityContext
-from aiokubernetes.models.v1_self_subject_access_review import V1SelfSubjectAccessReview
-from aiokubernetes.models.v1_self_subject_access_review_spec import V1SelfSubjectAccessReviewSpec
-from aiokubernetes.models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from aiokubernetes.models.v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from aiokubernetes.models.v1_server_address_by_client_cidr import V1ServerAddressByClientCIDR
-from aiokubernetes.models.v1_service import V1Service
-from aiokubernetes.models.v1_service_account import V1ServiceAccount
-from aiokubernetes.models.v1_service_account_list import V1ServiceAccountList
-from aiokubernetes.models.v1_service_list import V1ServiceList
-from aiokubernetes.models.v1_service_port import V1ServicePort
-from aiokubernetes.models.v1_service_reference import V1ServiceReference
-from aiokubernetes.models.v1_service_spec import V1ServiceSpec
-from aiokubernetes.models.v1_service_status import V1ServiceStatus
-from aiokubernetes.models.v1_session_affinity_config import V1SessionAffinityConfig
-from aiokubernetes.models.v1_stateful_set import V1StatefulSet
-from aiokubernetes.models.v1_stateful_set_condition import V1StatefulSetCondition
-from aiokubernetes.models.v1_stateful_set_list import V1StatefulSetList
-from aiokubernetes.models.v1_stateful_set_spec import V1StatefulSetSpec
-from aiokubernetes.models.v1_stateful_set_status import V1StatefulSetStatus
-from aiokubernetes.models.v1_stateful_set_update_strategy import V1StatefulSetUpdateStrategy
-from aiokubernetes.models.v1_status import V1Status
-from aiokubernetes.models.v1_status_cause import V1StatusCause
-from aiokubernetes.models.v1_status_details import V1StatusDetails
-from aiokubernetes.models.v1_storage_class import V1StorageClass
-from aiokubernetes.models.v1_storage_class_list import V1StorageClassList
-from aiokubernetes.models.v1_storage_os_persistent_volume_source import V1StorageOSPersistentVolumeSource
-from aiokubernetes.models.v1_storage_os_volume_source import V1StorageOSVolumeSource
-from aiokubernetes.models.v1_subject import V1Subject
-from aiokubernetes.models.v1_subject_access_review import V1SubjectAccessReview
-from aiokubernetes.models.v1_subject_access_review_spec import V1SubjectAccessReviewSpec
-from aiokubernetes.models.v1_subject_access_review_status import V1SubjectAccessReviewStatus
-from aiokubernetes.models.v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from aiokubernetes.models.v1_tcp_socket_action import V1TCPSocketAction
-from aiokubernetes.models.v1_taint import V1Taint
-from aiokubernetes.models.v1_token_review import V1TokenReview
-from aiokubernetes.models.v1_token_review_spec import V1TokenReviewSpec
-from aiokubernetes.models.v1_token_review_status import V1TokenReviewStatus
-from aiokubernetes.models.v1_toleration import V1Toleration
-from aiokubernetes.models.v1_user_info import V1UserInfo
-from aiokubernetes.models.v1_volume import V1Volume
-from aiokubernetes.models.v1_volume_device import V1VolumeDevice
-from aiokubernetes.models.v1_volume_mount import V1VolumeMount
-from aiokubernetes.models.v1_volume_node_affinity import V1VolumeNodeAffinity
-from aiokubernetes.models.v1_volume_projection import V1VolumeProjection
-from aiokubernetes.models.v1_vsphere_virtual_disk_volume_source import V1VsphereVirtualDiskVolumeSource
-from aiokubernetes.models.v1_watch_event import V1WatchEvent
-from aiokubernetes.models.v1_weighted_pod_affinity_term import V1WeightedPodAffinityTerm
-from aiokubernetes.models.v1alpha1_aggregation_rule import V1alpha1AggregationRule
-from aiokubernetes.models.v1alpha1_cluster_role import V1alpha1ClusterRole
-from aiokubernetes.models.v1alpha1_cluster_role_binding import V1alpha1ClusterRoleBinding
-from aiokubernetes.models.v1alpha1_cluster_role_binding_list import V1alpha1ClusterRoleBindingList
-from aiokubernetes.models.v1alpha1_cluster_role_list import V1alpha1ClusterRoleList
-from aiokubernetes.models.v1alpha1_initializer import V1alpha1Initializer
-from aiokubernetes.models.v1alpha1_initializer_configuration import V1alpha1InitializerConfiguration
-from aiokubernetes.models.v1alpha1_initializer_configuration_list import V1alpha1InitializerConfigurationList
-from aiokubernetes.models.v1alpha1_pod_preset import V1alpha1PodPreset
-from aiokubernetes.models.v1alpha1_pod_preset_list import V1alpha1PodPresetList
-from aiokubernetes.models.v1alpha1_pod_preset_spec import V1alpha1PodPresetSpec
-from aiokubernetes.models.v1alpha1_policy_rule import V1alpha1PolicyRule
-from aiokubernetes.models.v1alpha1_priority_class import V1alpha1PriorityClass
-from aiokubernetes.models.v1alpha1_priority_class_list import V1alpha1PriorityClassList
-from aiokubernetes.models.v1alpha1_role import V1alpha1Role
-from aiokubernetes.models.v1alpha1_role_binding import V1alpha1RoleBinding
-from aiokubernetes.models.v1alpha1_role_binding_list import V1alpha1RoleBindingList
-from aiokubernetes.models.v1alpha1_role_list import V1alpha1RoleList
-from aiokubernetes.models.v1alpha1_role_ref import V1alpha1RoleRef
-from aiokubernetes.models.v1alpha1_rule import V1alpha1Rule
-from aiokubernetes.models.v1alpha1_subject import V1alpha1Subject
-from aiokubernetes.models.v1alpha1_volume_attachment import V1alpha1VolumeAttachment
-from aiokubernetes.models.v1alpha1_volume_attachment_list import V1alpha1VolumeAttachmentList
-from aiokubernetes.models.v1alpha1_volume_attachment_source import V1alpha1VolumeAttachmentSource
-from aiokubernetes.models.v1alpha1_volume_attachment_spec import V1alpha1VolumeAttachmentSpec
-from aiokubernetes.models.v1alpha1_volume_attachment_status import V1alpha1VolumeAttachmentStatus
-from aiokubernetes.models.v1alpha1_volume_error import V1alpha1VolumeError
-from aiokubernetes.models.v1beta1_api_service import V1beta1APIService
-from aiokubernetes.models.v1beta1_api_service_condition import V1beta1APIServiceCondition
-from aiokubernetes.models.v1beta1_api_service_list import V1beta1APIServiceList
-from aiokubernetes.models.v1beta1_api_service_spec import V1beta1APIServiceSpec
-from aiokubernetes.models.v1beta1_api_service_status import V1beta1APIServiceStatus
-from aiokubernetes.models.v1beta1_aggregation_rule import V1beta1AggregationRule
-from aiokubernetes.models.v1beta1_certificate_signing_request import V1beta1CertificateSigningRequest
-from aiokubernetes.models.v1beta1_certificate_signing_request_condition import V1beta1CertificateSigningRequestCondition
-from aiokubernetes.models.v1beta1_certificate_signing_request_list import V1beta1CertificateSigningRequestList
-from aiokubernetes.models.v1beta1_certificate_signing_request_spec import V1beta1CertificateSigningRequestSpec
-from aiokubernetes.models.v1beta1_certificate_signing_request_status import V1beta1CertificateSigningRequestStatus
-from aiokubernetes.models.v1beta1_cluster_role import V1beta1ClusterRole
-from aiokubernetes.models.v1beta1_cluster_role_binding import V1beta1ClusterRoleBinding
-from aiokubernetes.models.v1beta1_cluster_role_binding_list import V1beta1ClusterRoleBindingList
-from aiokubernetes.models.v1beta1_cluster_role_list import V1beta1ClusterRoleList
-from aiokubernetes.models.v1beta1_controller_revision import V1beta1ControllerRevision
-from aiokubernetes.models.v1beta1_controller_revision_list import V1beta1ControllerRevisionList
-from aiokubernetes.models.v1beta1_cron_job import V1beta1CronJob
-from aiokubernetes.models.v1beta1_cron_job_list import V1beta1CronJobList
-from aiokubernetes.models.v1beta1_cron_job_spec import V1beta1CronJobSpec
-from aiokubernetes.models.v1beta1_cron_job_status import V1beta1CronJobStatus
-from aiokubernetes.models.v1beta1_custom_resource_definition import V1beta1CustomResourceDefinition
-from aiokubernetes.models.v1beta1_custom_resource_definition_condition import V1beta1CustomResourceDefinitionCondition
-from aiokubernetes.models.v1beta1_custom_resource_definition_list import V1beta1CustomResourceDefinitionList
-from aiokubernetes.models.v1beta1_custom_resource_definition_names import V1beta1CustomResourceDefinitionNames
-from aiokubernetes.models.v1beta1_custom_resource_definition_spec import V1beta1CustomResourceDefinitionSpec
-from aiokubernetes.models.v1beta1_custom_resource_definition_status import V1beta1CustomResourceDefinitionStatus
-from aiokubernetes.models.v1beta1_custom_resource_subresource_scale import V1beta1CustomResourceSubresourceScale
-from aiokubernetes.models.v1beta1_custom_resource_subresources import V1beta1CustomResourceSubresources
-from aiokubernetes.models.v1beta1_custom_resource_validation import V1beta1CustomResourceValidation
-from aiokubernetes.models.v1beta1_daemon_set import V1beta1DaemonSet
-from aiokubernetes.models.v1beta1_daemon_set_condition import V1beta1DaemonSetCondition
-from aiokubernetes.models.v1beta1_daemon_set_list import V1beta1DaemonSetList
-from aiokubernetes.models.v1beta1_daemon_set_spec import V1beta1DaemonSetSpec
-from aiokubernetes.models.v1beta1_daemon_set_status import V1beta1DaemonSetStatus
-from aiokubernetes.models.v1beta1_daemon_set_update_strategy import V1beta1DaemonSetUpdateStrategy
-from aiokubernetes.models.v1beta1_event import V1beta1Event
-from aiokubernetes.models.v1beta1_event_list import V1beta1EventList
-from aiokubernetes.models.v1beta1_event_series import V1beta1EventSeries
-from aiokubernetes.models.v1beta1_eviction import V1beta1Eviction
-from aiokubernetes.models.v1beta1_external_documentation import V1beta1ExternalDocumentation
-from aiokubernetes.models.v1beta1_http_ingress_path import V1beta1HTTPIngressPath
-from aiokubernetes.models.v1beta1_http_ingress_rule_value import V1beta1HTTPIngressRuleValue
-from aiokubernetes.models.v1beta1_ip_block import V1beta1IPBlock
-from aiokubernetes.models.v1beta1_ingress import V1beta1Ingress
-from aiokubernetes.models.v1beta1_ingress_backend import V1beta1IngressBackend
-from aiokubernetes.models.v1beta1_ingress_list import V1beta1IngressList
-from aiokubernetes.models.v1beta1_ingress_rule import V1beta1IngressRule
-from aiokubernetes.models.v1beta1_ingress_spec import V1beta1IngressSpec
-from aiokubernetes.models.v1beta1_ingress_status import V1beta1IngressStatus
-from aiokubernetes.models.v1beta1_ingress_tls import V1beta1IngressTLS
-from aiokubernetes.models.v1beta1_json import V1beta1JSON
-from aiokubernetes.models.v1beta1_json_schema_props import V1beta1JSONSchemaProps
-from aiokubernetes.models.v1beta1_json_schema_props_or_array import V1beta1JSONSchemaPropsOrArray
-from aiokubernetes.models.v1beta1_json_schema_props_or_bool import V1beta1JSONSchemaPropsOrBool
-from aiokubernetes.models.v1beta1_json_schema_props_or_string_array import V1beta1JSONSchemaPropsOrStringArray
-from aiokubernetes.models.v1beta1_job_template_spec import V1beta1JobTemplateSpec
-from aiokubernetes.models.v1beta1_local_subject_access_review import V1beta1LocalSubjectAccessReview
-from aiokubernetes.models.v1beta1_mutating_webhook_configuration import V1beta1MutatingWebhookConfiguration
-from aiokubernetes.models.v1beta1_mutating_webhook_configuration_list import V1beta1MutatingWebhookConfigurationList
-from aiokubernetes.models.v1beta1_network_policy import V1beta1NetworkPolicy
-from aiokubernetes.models.v1beta1_network_policy_egress_rule import V1beta1NetworkPolicyEgressRule
-from aiokubernetes.models.v1beta1_network_policy_ingress_rule import V1beta1NetworkPolicyIngressRule
-from aiokubernetes.models.v1beta1_network_policy_list import V1beta1NetworkPolicyList
-from aiokubernetes.models.v1beta1_network_policy_peer import V1beta1NetworkPolicyPeer
-from aiokubernetes.models.v1beta1_network_policy_port import V1beta1NetworkPolicyPort
-from aiokubernetes.models.v1beta1_network_policy_spec import V1beta1NetworkPolicySpec
-from aiokubernetes.models.v1beta1_non_resource_attributes import V1beta1NonResourceAttributes
-from aiokubernetes.models.v1beta1_non_resource_rule import V1beta1NonResourceRule
-from aiokubernetes.models.v1beta1_pod_disruption_budget import V1beta1PodDisruptionBudget
-from aiokubernetes.models.v1beta1_pod_disruption_budget_list import V1beta1PodDisruptionBudgetList
-from aiokubernetes.models.v1beta1_pod_disruption_budget_spec import V1beta1PodDisruptionBudgetSpec
-from aiokubernetes.models.v1beta1_pod_disruption_budget_status import V1beta1PodDisruptionBudgetStatus
-from aiokubernetes.models.v1beta1_policy_rule import V1beta1PolicyRule
-from aiokubernetes.models.v1beta1_replica_set import V1beta1ReplicaSet
-from aiokubernetes.models.v1beta1_replica_set_condition import V1beta1ReplicaSetCondition
-from aiokubernetes.models.v1beta1_replica_set_list import V1beta1ReplicaSetList
-from aiokubernetes.models.v1beta1_replica_set_spec import V1beta1ReplicaSetSpec
-from aiokubernetes.models.v1beta1_replica_set_status import V1beta1ReplicaSetStatus
-from aiokubernetes.models.v1beta1_resource_attributes import V1beta1ResourceAttributes
-from aiokubernetes.models.v1beta1_resource_rule import V1beta1ResourceRule
-from aiokubernetes.models.v1beta1_role import V1beta1Role
-from aiokubernetes.models.v1beta1_role_binding import V1beta1RoleBinding
-from aiokubernetes.models.v1beta1_role_binding_list import V1beta1RoleBindingList
-from aiokubernetes.models.v1beta1_role_list import V1beta1RoleList
-from aiokubernetes.models.v1beta1_role_ref import V1beta1RoleRef
-from aiokubernetes.models.v1beta1_rolling_update_daemon_set import V1beta1RollingUpdateDaemonSet
-from aiokubernetes.models.v1beta1_rolling_update_stateful_set_strategy import V1beta1RollingUpdateStatefulSetStrategy
-from aiokubernetes.models.v1beta1_rule_with_operations import V1beta1RuleWithOperations
-from aiokubernetes.models.v1beta1_self_subject_access_review import V1beta1SelfSubjectAccessReview
-from aiokubernetes.models.v1beta1_self_subject_access_review_spec import V1beta1SelfSubjectAccessReviewSpec
-from aiokubernetes.models.v1beta1_self_subject_rules_review import V1beta1SelfSubjectRulesReview
-from aiokubernetes.models.v1beta1_self_subject_rules_review_spec import V1beta1SelfSubjectRulesReviewSpec
-from aiokubernetes.models.v1beta1_stateful_set import V1beta1StatefulSet
-from aiokubernetes.models.v1beta1_stateful_set_condition import V1beta1StatefulSetCondition
-from aiokubernetes.models.v1beta1_stateful_set_list import V1beta1StatefulSetList
-from aiokubernetes.models.v1beta1_stateful_set_spec import V1beta1StatefulSetSpec
-from aiokubernetes.models.v1beta1_stateful_set_status import V1beta1StatefulSetStatus
-from aiokubernetes.models.v1beta1_stateful_set_update_strategy import V1beta1StatefulSetUpdateStrategy
-from aiokubernetes.models.v1beta1_storage_class import V1beta1StorageClass
-from aiokubernetes.models.v1beta1_storage_class_list import V1beta1StorageClassList
-from aiokubernetes.models.v1beta1_subject import V1beta1Subject
-from aiokubernetes.models.v1beta1_subject_access_review import V1beta1SubjectAccessReview
-from aiokubernetes.models.v1beta1_subject_access_review_spec import V1beta1SubjectAccessReviewSpec
-from aiokubernetes.models.v1beta1_subject_access_review_status import V1beta1SubjectAccessReviewStatus
-from aiokubernetes.models.v1beta1_subject_rules_review_status import V1beta1SubjectRulesReviewStatus
-from aiokubernetes.models.v1beta1_token_review import V1beta1TokenReview
-from aiokubernetes.models.v1beta1_token_review_spec import V1beta1TokenReviewSpec
-from aiokubernetes.models.v1beta1_token_review_status import V1beta1TokenReviewStatus
-from aiokubernetes.models.v1beta1_user_info import V1beta1UserInfo
-from aiokubernetes.models.v1beta1_validating_webhook_configuration import V1beta1ValidatingWebhookConfiguration
-from aiokubernetes.models.v1beta1_validating_webhook_configuration_list import V1beta1ValidatingWebhookConfigurationList
-from aiokubernetes.models.v1beta1_volume_attachment import V1beta1VolumeAttachment
-from aiokubernetes.models.v1beta1_volume_attachment_list import V1beta1VolumeAttachmentList
-from aiokubernetes.models.v1beta1_volume_attachment_source import V1beta1VolumeAttachmentSource
-from aiokubernetes.models.v1beta1_volume_attachment_spec import V1beta1VolumeAttachmentSpec
-from aiokubernetes.models.v1beta1_volume_attachment_status import V1beta1VolumeAttachmentStatus
-from aiokubernetes.models.v1beta1_volume_error import V1beta1VolumeError
-from aiokubernetes.models.v1beta1_webhook import V1beta1Webhook
-from aiokubernetes.models.v1beta1_webhook_client_config import V1beta1WebhookClientConfig
-from aiokubernetes.models.v1beta2_controller_revision import V1beta2ControllerRevision
-from aiokubernetes.models.v1beta2_controller_revision_list import V1beta2ControllerRevisionList
-from aiokubernetes.models.v1beta2_daemon_set import V1beta2DaemonSet
-from aiokubernetes.models.v1beta2_daemon_set_condition import V1beta2DaemonSetCondition
-from aiokubernetes.models.v1beta2_daemon_set_list import V1beta2DaemonSetList
-from aiokubernetes.models.v1beta2_daemon_set_spec import V1beta2DaemonSetSpec
-from aiokubernetes.models.v1beta2_daemon_set_status import V1beta2DaemonSetStatus
-from aiokubernetes.models.v1beta2_daemon_set_update_strategy import V1beta2DaemonSetUpdateStrategy
-from aiokubernetes.models.v1beta2_deployment import V1beta2Deployment
-from aiokubernetes.models.v1beta2_deployment_condition import V1beta2DeploymentCondition
-from aiokubernetes.models.v1beta2_deployment_list import V1beta2DeploymentList
-from aiokubernetes.models.v1beta2_deployment_spec import V1beta2DeploymentSpec
-from aiokubernetes.models.v1beta2_deployment_status import V1beta2DeploymentStatus
-from aiokubernetes.models.v1beta2_deployment_strategy import V1beta2DeploymentStrategy
-from aiokubernetes.models.v1beta2_replica_set import V1beta2ReplicaSet
-from aiokubernetes.models.v1beta2_replica_set_condition import V1beta2ReplicaSetCondition
-from aiokubernetes.models.v1beta2_replica_set_list import V1beta2ReplicaSetList
-from aiokubernetes.models.v1beta2_replica_set_spec import V1beta2ReplicaSetSpec
-from aiokubernetes.models.v1beta2_replica_set_status import V1beta2ReplicaSetStatus
-from aiokubernetes.models.v1beta2_rolling_update_daemon_set import V1beta2RollingUpdateDaemonSet
-from aiokubernetes.models.v1beta2_rolling_update_deployment import V1beta2RollingUpdateDeployment
-from aiokubernetes.models.v1beta2_rolling_update_stateful_set_strategy import V1beta2RollingUpdateStatefulSetStrategy
-from aiokubernetes.models.v1beta2_scale import V1beta2Scale
-from aiokubernetes.models.v1beta2_scale_spec import V1beta2ScaleSpec
-from aiokubernetes.models.v1beta2_scale_status import V1beta2ScaleStatus
-from aiokubernetes.models.v1beta2_stateful_set import V1beta2StatefulSet
-from aiokubernetes.models.v1beta2_stateful_set_condition import V1beta2StatefulSetCondition
-from aiokubernetes.models.v1beta2_stateful_set_list import V1beta2StatefulSetList
-from aiokubernetes.models.v1beta2_stateful_set_spec import V1beta2StatefulSetSpec
-from aiokubernetes.models.v1beta2_stateful_set_status import V1beta2StatefulSetStatus
-from aiokubernetes.models.v1beta2_stateful_set_update_strategy import V1beta2StatefulSetUpdateStrategy
-from aiokubernetes.models.v2alpha1_cron_job import V2alpha1CronJob
-from aiokubernetes.models.v2alpha1_cron_job_list import V2alpha1CronJobList
-from aiokubernetes.models.v2alpha1_cron_job_spec import V2alpha1CronJobSpec
-from aiokubernetes.models.v2alpha1_cron_job_status import V2alpha1CronJobStatus
-from aiokubernetes.models.v2alpha1_job_template_spec import V2alpha1JobTemplateSpec
-from aiokubernetes.models.v2beta1_cross_version_object_reference import V2beta1CrossVersionObjectReference
-from aiokubernetes.models.v2beta1_external_metric_source import V2beta1ExternalMetricSource
-from aiokubernetes.models.v2beta1_external_metric_status import V2beta1ExternalMetricStatus
-from aiokubernetes.models.v2beta1_horizontal_pod_autoscaler import V2beta1HorizontalPodAutoscaler
-from aiokubernetes.models.v2beta1_horizontal_pod_autoscaler_condition import V2beta1HorizontalPodAutoscalerCondition
-from aiokubernetes.models.v2beta1_horizontal_pod_autoscaler_list import V2beta1HorizontalPodAutoscalerList
-from aiokubernetes.models.v2beta1_horizontal_pod_autoscaler_spec import V2beta1HorizontalPodAutoscalerSpec
-from aiokubernetes.models.v2beta1_horizontal_pod_autoscaler_status import V2beta1HorizontalPodAutoscalerStatus
-from aiokubernetes.models.v2beta1_metric_spec import V2beta1MetricSpec
-from aiokubernetes.models.v2beta1_metric_status import V2beta1MetricStatus
-from aiokubernetes.models.v2beta1_object_metric_source import V2beta1ObjectMetricSource
-from aiokubernetes.models.v2beta1_object_metric_status import V2beta1ObjectMetricStatus
-from aiokubernetes.models.v2beta1_pods_metric_source import V2beta1PodsMetricSource
-from aiokubernetes.models.v2beta1_pods_metric_status import V2beta1PodsMetricStatus
-from aiokubernetes.models.v2beta1_resource_metric_source import V2beta1ResourceMetricSource
-from aiokubernetes.models.v2beta1_resource_metric_status import V2beta1ResourceMetricStatus
-from aiokubernetes.models.version_info import VersionInfo
 
-# These import are technically unnecessary but are convenient for end users.
-import aiokubernetes.config
-import aiokubernetes.swagger
-import aiokubernetes.clients
-import aiokubernetes.api_proxy
-import aiokubernetes.watch
-import aiokubernetes.utils
+# Python 3.6 does not support module level `__getattr__` functions.
+if sys.version_info < (3, 7):
+    for _name in sorted(_ATTRIBUTES) + sorted(_SUBMODULES):
+        __getattr__(_name)
+    from aiokubernetes.api import *  # noqa: F401,F403
+    from aiokubernetes.models import *  # noqa: F401,F403
+    __getattr__('__all__')
@@ -1,57 +1,96 @@
+# coding: utf-8
 
 # flake8: noqa
+"""
+    Kubernetes
 
-# import apis into api package
-from aiokubernetes.api.admissionregistration_api import AdmissionregistrationApi
-from aiokubernetes.api.admissionregistration_v1alpha1_api import AdmissionregistrationV1alpha1Api
-from aiokubernetes.api.admissionregistration_v1beta1_api import AdmissionregistrationV1beta1Api
-from aiokubernetes.api.apiextensions_api import ApiextensionsApi
-from aiokubernetes.api.apiextensions_v1beta1_api import ApiextensionsV1beta1Api
-from aiokubernetes.api.apiregistration_api import ApiregistrationApi
-from aiokubernetes.api.apiregistration_v1_api import ApiregistrationV1Api
-from aiokubernetes.api.apiregistration_v1beta1_api import ApiregistrationV1beta1Api
-from aiokubernetes.api.apis_api import ApisApi
-from aiokubernetes.api.apps_api import AppsApi
-from aiokubernetes.api.apps_v1_api import AppsV1Api
-from aiokubernetes.api.apps_v1beta1_api import AppsV1beta1Api
-from aiokubernetes.api.apps_v1beta2_api import AppsV1beta2Api
-from aiokubernetes.api.authentication_api import AuthenticationApi
-from aiokubernetes.api.authentication_v1_api import AuthenticationV1Api
-from aiokubernetes.api.authentication_v1beta1_api import AuthenticationV1beta1Api
-from aiokubernetes.api.authorization_api import AuthorizationApi
-from aiokubernetes.api.authorization_v1_api import AuthorizationV1Api
-from aiokubernetes.api.authorization_v1beta1_api import AuthorizationV1beta1Api
-from aiokubernetes.api.autoscaling_api import AutoscalingApi
-from aiokubernetes.api.autoscaling_v1_api import AutoscalingV1Api
-from aiokubernetes.api.autoscaling_v2beta1_api import AutoscalingV2beta1Api
-from aiokubernetes.api.batch_api import BatchApi
-from aiokubernetes.api.batch_v1_api import BatchV1Api
-from aiokubernetes.api.batch_v1beta1_api import BatchV1beta1Api
-from aiokubernetes.api.batch_v2alpha1_api import BatchV2alpha1Api
-from aiokubernetes.api.certificates_api import CertificatesApi
-from aiokubernetes.api.certificates_v1beta1_api import CertificatesV1beta1Api
-from aiokubernetes.api.core_api import CoreApi
-from aiokubernetes.api.core_v1_api import CoreV1Api
-from aiokubernetes.api.custom_objects_api import CustomObjectsApi
-from aiokubernetes.api.events_api import EventsApi
-from aiokubernetes.api.events_v1beta1_api import EventsV1beta1Api
-from aiokubernetes.api.extensions_api import ExtensionsApi
-from aiokubernetes.api.extensions_v1beta1_api import ExtensionsV1beta1Api
-from aiokubernetes.api.logs_api import LogsApi
-from aiokubernetes.api.networking_api import NetworkingApi
-from aiokubernetes.api.networking_v1_api import NetworkingV1Api
-from aiokubernetes.api.policy_api import PolicyApi
-from aiokubernetes.api.policy_v1beta1_api import PolicyV1beta1Api
-from aiokubernetes.api.rbac_authorization_api import RbacAuthorizationApi
-from aiokubernetes.api.rbac_authorization_v1_api import RbacAuthorizationV1Api
-from aiokubernetes.api.rbac_authorization_v1alpha1_api import RbacAuthorizationV1alpha1Api
-from aiokubernetes.api.rbac_authorization_v1beta1_api import RbacAuthorizationV1beta1Api
-from aiokubernetes.api.scheduling_api import SchedulingApi
-from aiokubernetes.api.scheduling_v1alpha1_api import SchedulingV1alpha1Api
-from aiokubernetes.api.settings_api import SettingsApi
-from aiokubernetes.api.settings_v1alpha1_api import SettingsV1alpha1Api
-from aiokubernetes.api.storage_api import StorageApi
-from aiokubernetes.api.storage_v1_api import StorageV1Api
-from aiokubernetes.api.storage_v1alpha1_api import StorageV1alpha1Api
-from aiokubernetes.api.storage_v1beta1_api import StorageV1beta1Api
-from aiokubernetes.api.version_api import VersionApi
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: v1.10.6
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+
+    NOTE: this file was converted by `create-client/lazy_init.py`.
+"""
+import importlib
+import sys
+
+# Map the name of every API class to the module that defines it. The modules are
+# only imported when the user accesses the name for the first time.
+_MODULES = {
+    'AdmissionregistrationApi': 'aiokubernetes.api.admissionregistration_api',
+    'AdmissionregistrationV1alpha1Api': 'aiokubernetes.api.admissionregistration_v1alpha1_api',
+    'AdmissionregistrationV1beta1Api': 'aiokubernetes.api.admissionregistration_v1beta1_api',
+    'ApiextensionsApi': 'aiokubernetes.api.apiextensions_api',
+    'ApiextensionsV1beta1Api': 'aiokubernetes.api.apiextensions_v1beta1_api',
+    'ApiregistrationApi': 'aiokubernetes.api.apiregistration_api',
+    'ApiregistrationV1Api': 'aiokubernetes.api.apiregistration_v1_api',
+    'ApiregistrationV1beta1Api': 'aiokubernetes.api.apiregistration_v1beta1_api',
+    'ApisApi': 'aiokubernetes.api.apis_api',
+    'AppsApi': 'aiokubernetes.api.apps_api',
+    'AppsV1Api': 'aiokubernetes.api.apps_v1_api',
+    'AppsV1beta1Api': 'aiokubernetes.api.apps_v1beta1_api',
+    'AppsV1beta2Api': 'aiokubernetes.api.apps_v1beta2_api',
+    'AuthenticationApi': 'aiokubernetes.api.authentication_api',
+    'AuthenticationV1Api': 'aiokubernetes.api.authentication_v1_api',
+    'AuthenticationV1beta1Api': 'aiokubernetes.api.authentication_v1beta1_api',
+    'AuthorizationApi': 'aiokubernetes.api.authorization_api',
+    'AuthorizationV1Api': 'aiokubernetes.api.authorization_v1_api',
+    'AuthorizationV1beta1Api': 'aiokubernetes.api.authorization_v1beta1_api',
+    'AutoscalingApi': 'aiokubernetes.api.autoscaling_api',
+    'AutoscalingV1Api': 'aiokubernetes.api.autoscaling_v1_api',
+    'AutoscalingV2beta1Api': 'aiokubernetes.api.autoscaling_v2beta1_api',
+    'BatchApi': 'aiokubernetes.api.batch_api',
+    'BatchV1Api': 'aiokubernetes.api.batch_v1_api',
+    'BatchV1beta1Api': 'aiokubernetes.api.batch_v1beta1_api',
+    'BatchV2alpha1Api': 'aiokubernetes.api.batch_v2alpha1_api',
+    'CertificatesApi': 'aiokubernetes.api.certificates_api',
+    'CertificatesV1beta1Api': 'aiokubernetes.api.certificates_v1beta1_api',
+    'CoreApi': 'aiokubernetes.api.core_api',
+    'CoreV1Api': 'aiokubernetes.api.core_v1_api',
+    'CustomObjectsApi': 'aiokubernetes.api.custom_objects_api',
+    'EventsApi': 'aiokubernetes.api.events_api',
+    'EventsV1beta1Api': 'aiokubernetes.api.events_v1beta1_api',
+    'ExtensionsApi': 'aiokubernetes.api.extensions_api',
+    'ExtensionsV1beta1Api': 'aiokubernetes.api.extensions_v1beta1_api',
+    'LogsApi': 'aiokubernetes.api.logs_api',
+    'NetworkingApi': 'aiokubernetes.api.networking_api',
+    'NetworkingV1Api': 'aiokubernetes.api.networking_v1_api',
+    'PolicyApi': 'aiokubernetes.api.policy_api',
+    'PolicyV1beta1Api': 'aiokubernetes.api.policy_v1beta1_api',
+    'RbacAuthorizationApi': 'aiokubernetes.api.rbac_authorization_api',
+    'RbacAuthorizationV1Api': 'aiokubernetes.api.rbac_authorization_v1_api',
+    'RbacAuthorizationV1alpha1Api': 'aiokubernetes.api.rbac_authorization_v1alpha1_api',
+    'RbacAuthorizationV1beta1Api': 'aiokubernetes.api.rbac_authorization_v1beta1_api',
+    'SchedulingApi': 'aiokubernetes.api.scheduling_api',
+    'SchedulingV1alpha1Api': 'aiokubernetes.api.scheduling_v1alpha1_api',
+    'SettingsApi': 'aiokubernetes.api.settings_api',
+    'SettingsV1alpha1Api': 'aiokubernetes.api.settings_v1alpha1_api',
+    'StorageApi': 'aiokubernetes.api.storage_api',
+    'StorageV1Api': 'aiokubernetes.api.storage_v1_api',
+    'StorageV1alpha1Api': 'aiokubernetes.api.storage_v1alpha1_api',
+    'StorageV1beta1Api': 'aiokubernetes.api.storage_v1beta1_api',
+    'VersionApi': 'aiokubernetes.api.version_api',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+
+
+# Python 3.6 does not support module level `__getattr__` functions.
+if sys.version_info < (3, 7):
+    for _name in _MODULES:
+        __getattr__(_name)
@@ -17,6 +17,7 @@ import re  # noqa: F401
 # python 2 and python 3 compatibility library
 
 from aiokubernetes.api_client import ApiClient
+from aiokubernetes.endpoint import Endpoint
 
 
 class AdmissionregistrationApi(object):
@@ -64,57 +65,15 @@ class AdmissionregistrationApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_group" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1APIGroup',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._get_api_group_endpoint.call(
+            self.api_client, (), kwargs)
+
+    _get_api_group_endpoint = Endpoint(
+        'get_api_group',
+        '/apis/admissionregistration.k8s.io/', 'GET',
+        required=(),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        response_type='V1APIGroup',
+        auth_settings=('BearerToken',),
+    )
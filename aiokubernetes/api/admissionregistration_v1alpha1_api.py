@@ -17,6 +17,7 @@ import re  # noqa: F401
 # python 2 and python 3 compatibility library
 
 from aiokubernetes.api_client import ApiClient
+from aiokubernetes.endpoint import Endpoint
 
 
 class AdmissionregistrationV1alpha1Api(object):
@@ -68,68 +69,21 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['body', 'pretty']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_initializer_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1alpha1InitializerConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._create_initializer_configuration_endpoint.call(
+            self.api_client, (body,), kwargs)
+
+    _create_initializer_configuration_endpoint = Endpoint(
+        'create_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'POST',
+        required=('body',),
+        query=(
+            ('pretty', 'pretty'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1alpha1InitializerConfiguration',
+        auth_settings=('BearerToken',),
+    )
 
     def delete_collection_initializer_configuration(self, **kwargs):  # noqa: E501
         """delete_collection_initializer_configuration  # noqa: E501
@@ -184,78 +138,29 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['pretty', '_continue', 'field_selector', 'include_uninitialized', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))  # noqa: E501
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))  # noqa: E501
-        if 'include_uninitialized' in params:
-            query_params.append(('includeUninitialized', params['include_uninitialized']))  # noqa: E501
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))  # noqa: E501
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._delete_collection_initializer_configuration_endpoint.call(
+            self.api_client, (), kwargs)
+
+    _delete_collection_initializer_configuration_endpoint = Endpoint(
+        'delete_collection_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'DELETE',
+        required=(),
+        query=(
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('include_uninitialized', 'includeUninitialized'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1Status',
+        auth_settings=('BearerToken',),
+    )
 
     def delete_initializer_configuration(self, name, body, **kwargs):  # noqa: E501
         """delete_initializer_configuration  # noqa: E501
@@ -304,80 +209,24 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['name', 'body', 'pretty', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_initializer_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `delete_initializer_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._delete_initializer_configuration_endpoint.call(
+            self.api_client, (name, body), kwargs)
+
+    _delete_initializer_configuration_endpoint = Endpoint(
+        'delete_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'DELETE',
+        required=('name', 'body'),
+        query=(
+            ('pretty', 'pretty'),
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1Status',
+        auth_settings=('BearerToken',),
+    )
 
     def get_api_resources(self, **kwargs):  # noqa: E501
         """get_api_resources  # noqa: E501
@@ -414,60 +263,18 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1APIResourceList',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._get_api_resources_endpoint.call(
+            self.api_client, (), kwargs)
+
+    _get_api_resources_endpoint = Endpoint(
+        'get_api_resources',
+        '/apis/admissionregistration.k8s.io/v1alpha1/', 'GET',
+        required=(),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        response_type='V1APIResourceList',
+        auth_settings=('BearerToken',),
+    )
 
     def list_initializer_configuration(self, **kwargs):  # noqa: E501
         """list_initializer_configuration  # noqa: E501
@@ -522,78 +329,29 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['pretty', '_continue', 'field_selector', 'include_uninitialized', 'label_selector', 'limit', 'resource_version', 'timeout_seconds', 'watch']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if '_continue' in params:
-            query_params.append(('continue', params['_continue']))  # noqa: E501
-        if 'field_selector' in params:
-            query_params.append(('fieldSelector', params['field_selector']))  # noqa: E501
-        if 'include_uninitialized' in params:
-            query_params.append(('includeUninitialized', params['include_uninitialized']))  # noqa: E501
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))  # noqa: E501
-        if 'limit' in params:
-            query_params.append(('limit', params['limit']))  # noqa: E501
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in params:
-            query_params.append(('timeoutSeconds', params['timeout_seconds']))  # noqa: E501
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1alpha1InitializerConfigurationList',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._list_initializer_configuration_endpoint.call(
+            self.api_client, (), kwargs)
+
+    _list_initializer_configuration_endpoint = Endpoint(
+        'list_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations', 'GET',
+        required=(),
+        query=(
+            ('pretty', 'pretty'),
+            ('_continue', 'continue'),
+            ('field_selector', 'fieldSelector'),
+            ('include_uninitialized', 'includeUninitialized'),
+            ('label_selector', 'labelSelector'),
+            ('limit', 'limit'),
+            ('resource_version', 'resourceVersion'),
+            ('timeout_seconds', 'timeoutSeconds'),
+            ('watch', 'watch'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1alpha1InitializerConfigurationList',
+        auth_settings=('BearerToken',),
+    )
 
     def patch_initializer_configuration(self, name, body, **kwargs):  # noqa: E501
         """patch_initializer_configuration  # noqa: E501
@@ -636,74 +394,21 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['name', 'body', 'pretty']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_initializer_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_initializer_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1alpha1InitializerConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._patch_initializer_configuration_endpoint.call(
+            self.api_client, (name, body), kwargs)
+
+    _patch_initializer_configuration_endpoint = Endpoint(
+        'patch_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'PATCH',
+        required=('name', 'body'),
+        query=(
+            ('pretty', 'pretty'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json'),  # noqa: E501
+        response_type='V1alpha1InitializerConfiguration',
+        auth_settings=('BearerToken',),
+    )
 
     def read_initializer_configuration(self, name, **kwargs):  # noqa: E501
         """read_initializer_configuration  # noqa: E501
@@ -748,72 +453,23 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['name', 'pretty', 'exact', 'export']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `read_initializer_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if 'exact' in params:
-            query_params.append(('exact', params['exact']))  # noqa: E501
-        if 'export' in params:
-            query_params.append(('export', params['export']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1alpha1InitializerConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._read_initializer_configuration_endpoint.call(
+            self.api_client, (name,), kwargs)
+
+    _read_initializer_configuration_endpoint = Endpoint(
+        'read_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'GET',
+        required=('name',),
+        query=(
+            ('pretty', 'pretty'),
+            ('exact', 'exact'),
+            ('export', 'export'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1alpha1InitializerConfiguration',
+        auth_settings=('BearerToken',),
+    )
 
     def replace_initializer_configuration(self, name, body, **kwargs):  # noqa: E501
         """replace_initializer_configuration  # noqa: E501
@@ -856,71 +512,18 @@ class AdmissionregistrationV1alpha1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['name', 'body', 'pretty']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_initializer_configuration" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_initializer_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_initializer_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1alpha1InitializerConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._replace_initializer_configuration_endpoint.call(
+            self.api_client, (name, body), kwargs)
+
+    _replace_initializer_configuration_endpoint = Endpoint(
+        'replace_initializer_configuration',
+        '/apis/admissionregistration.k8s.io/v1alpha1/initializerconfigurations/{name}', 'PUT',
+        required=('name', 'body'),
+        query=(
+            ('pretty', 'pretty'),
+        ),
+        accepts=('application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'),  # noqa: E501
+        content_types=('*/*',),
+        response_type='V1alpha1InitializerConfiguration',
+        auth_settings=('BearerToken',),
+    )
@@ -17,6 +17,7 @@ import re  # noqa: F401
 # python 2 and python 3 compatibility library
 
 from aiokubernetes.api_client import ApiClient
+from aiokubernetes.endpoint import Endpoint
 
 
 class CustomObjectsApi(object):
@@ -74,82 +75,20 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'body', 'pretty']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._create_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural, body), kwargs)
+
+    _create_cluster_custom_object_endpoint = Endpoint(
+        'create_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}', 'POST',
+        required=('group', 'version', 'plural', 'body'),
+        query=(
+            ('pretty', 'pretty'),
+        ),
+        accepts=('application/json',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def create_namespaced_custom_object(self, group, version, namespace, plural, body, **kwargs):  # noqa: E501
         """create_namespaced_custom_object  # noqa: E501
@@ -198,88 +137,20 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'body', 'pretty']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `create_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._create_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural, body), kwargs)
+
+    _create_namespaced_custom_object_endpoint = Endpoint(
+        'create_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'POST',
+        required=('group', 'version', 'namespace', 'plural', 'body'),
+        query=(
+            ('pretty', 'pretty'),
+        ),
+        accepts=('application/json',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def delete_cluster_custom_object(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """delete_cluster_custom_object  # noqa: E501
@@ -332,96 +203,23 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'name', 'body', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `delete_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._delete_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural, name, body), kwargs)
+
+    _delete_cluster_custom_object_endpoint = Endpoint(
+        'delete_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}/{name}', 'DELETE',
+        required=('group', 'version', 'plural', 'name', 'body'),
+        query=(
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def delete_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """delete_namespaced_custom_object  # noqa: E501
@@ -476,102 +274,23 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body', 'grace_period_seconds', 'orphan_dependents', 'propagation_policy']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `delete_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-        if 'grace_period_seconds' in params:
-            query_params.append(('gracePeriodSeconds', params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in params:
-            query_params.append(('orphanDependents', params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in params:
-            query_params.append(('propagationPolicy', params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._delete_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)  # noqa: E501
+
+    _delete_namespaced_custom_object_endpoint = Endpoint(
+        'delete_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'DELETE',
+        required=('group', 'version', 'namespace', 'plural', 'name', 'body'),
+        query=(
+            ('grace_period_seconds', 'gracePeriodSeconds'),
+            ('orphan_dependents', 'orphanDependents'),
+            ('propagation_policy', 'propagationPolicy'),
+        ),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def get_cluster_custom_object(self, group, version, plural, name, **kwargs):  # noqa: E501
         """get_cluster_custom_object  # noqa: E501
@@ -616,84 +335,18 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'name']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._get_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural, name), kwargs)
+
+    _get_cluster_custom_object_endpoint = Endpoint(
+        'get_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}/{name}', 'GET',
+        required=('group', 'version', 'plural', 'name'),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def get_namespaced_custom_object(self, group, version, namespace, plural, name, **kwargs):  # noqa: E501
         """get_namespaced_custom_object  # noqa: E501
@@ -740,90 +393,18 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'name']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._get_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural, name), kwargs)
+
+    _get_namespaced_custom_object_endpoint = Endpoint(
+        'get_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'GET',
+        required=('group', 'version', 'namespace', 'plural', 'name'),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def list_cluster_custom_object(self, group, version, plural, **kwargs):  # noqa: E501
         """list_cluster_custom_object  # noqa: E501
@@ -874,86 +455,24 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'pretty', 'label_selector', 'resource_version', 'watch']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `list_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `list_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `list_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))  # noqa: E501
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))  # noqa: E501
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/json;stream=watch'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._list_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural), kwargs)
+
+    _list_cluster_custom_object_endpoint = Endpoint(
+        'list_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}', 'GET',
+        required=('group', 'version', 'plural'),
+        query=(
+            ('pretty', 'pretty'),
+            ('label_selector', 'labelSelector'),
+            ('resource_version', 'resourceVersion'),
+            ('watch', 'watch'),
+        ),
+        accepts=('application/json', 'application/json;stream=watch'),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def list_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):  # noqa: E501
         """list_namespaced_custom_object  # noqa: E501
@@ -1006,92 +525,24 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'pretty', 'label_selector', 'resource_version', 'watch']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `list_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in params:
-            query_params.append(('pretty', params['pretty']))  # noqa: E501
-        if 'label_selector' in params:
-            query_params.append(('labelSelector', params['label_selector']))  # noqa: E501
-        if 'resource_version' in params:
-            query_params.append(('resourceVersion', params['resource_version']))  # noqa: E501
-        if 'watch' in params:
-            query_params.append(('watch', params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/json;stream=watch'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._list_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural), kwargs)
+
+    _list_namespaced_custom_object_endpoint = Endpoint(
+        'list_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'GET',
+        required=('group', 'version', 'namespace', 'plural'),
+        query=(
+            ('pretty', 'pretty'),
+            ('label_selector', 'labelSelector'),
+            ('resource_version', 'resourceVersion'),
+            ('watch', 'watch'),
+        ),
+        accepts=('application/json', 'application/json;stream=watch'),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def patch_cluster_custom_object(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """patch_cluster_custom_object  # noqa: E501
@@ -1138,90 +589,18 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'name', 'body']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._patch_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural, name, body), kwargs)
+
+    _patch_cluster_custom_object_endpoint = Endpoint(
+        'patch_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}/{name}', 'PATCH',
+        required=('group', 'version', 'plural', 'name', 'body'),
+        accepts=('application/json',),
+        content_types=('application/merge-patch+json',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """patch_namespaced_custom_object  # noqa: E501
@@ -1270,96 +649,18 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._patch_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)  # noqa: E501
+
+    _patch_namespaced_custom_object_endpoint = Endpoint(
+        'patch_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PATCH',
+        required=('group', 'version', 'namespace', 'plural', 'name', 'body'),
+        accepts=('application/json',),
+        content_types=('application/merge-patch+json',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def replace_cluster_custom_object(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """replace_cluster_custom_object  # noqa: E501
@@ -1406,90 +707,18 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'plural', 'name', 'body']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._replace_cluster_custom_object_endpoint.call(
+            self.api_client, (group, version, plural, name, body), kwargs)
+
+    _replace_cluster_custom_object_endpoint = Endpoint(
+        'replace_cluster_custom_object',
+        '/apis/{group}/{version}/{plural}/{name}', 'PUT',
+        required=('group', 'version', 'plural', 'name', 'body'),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
 
     def replace_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """replace_namespaced_custom_object  # noqa: E501
@@ -1538,93 +767,15 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = ['group', 'version', 'namespace', 'plural', 'name', 'body']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'group' is set
-        if ('group' not in params or
-                params['group'] is None):
-            raise ValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if ('version' not in params or
-                params['version'] is None):
-            raise ValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if ('namespace' not in params or
-                params['namespace'] is None):
-            raise ValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if ('plural' not in params or
-                params['plural'] is None):
-            raise ValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if ('name' not in params or
-                params['name'] is None):
-            raise ValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if ('body' not in params or
-                params['body'] is None):
-            raise ValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in params:
-            path_params['group'] = params['group']  # noqa: E501
-        if 'version' in params:
-            path_params['version'] = params['version']  # noqa: E501
-        if 'namespace' in params:
-            path_params['namespace'] = params['namespace']  # noqa: E501
-        if 'plural' in params:
-            path_params['plural'] = params['plural']  # noqa: E501
-        if 'name' in params:
-            path_params['name'] = params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in params:
-            body_params = params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['*/*'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._replace_namespaced_custom_object_endpoint.call(
+            self.api_client, (group, version, namespace, plural, name, body), kwargs)  # noqa: E501
+
+    _replace_namespaced_custom_object_endpoint = Endpoint(
+        'replace_namespaced_custom_object',
+        '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PUT',
+        required=('group', 'version', 'namespace', 'plural', 'name', 'body'),
+        accepts=('application/json',),
+        content_types=('*/*',),
+        response_type='object',
+        auth_settings=('BearerToken',),
+    )
@@ -17,6 +17,7 @@ import re  # noqa: F401
 # python 2 and python 3 compatibility library
 
 from aiokubernetes.api_client import ApiClient
+from aiokubernetes.endpoint import Endpoint
 
 
 class LogsApi(object):
@@ -64,58 +65,16 @@ class LogsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
+        return self._log_file_handler_endpoint.call(
+            self.api_client, (logpath,), kwargs)
 
-        all_params = ['logpath']  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method log_file_handler" % key
-                )
-            params[key] = val
-        del params['kwargs']
-        # verify the required parameter 'logpath' is set
-        if ('logpath' not in params or
-                params['logpath'] is None):
-            raise ValueError("Missing the required parameter `logpath` when calling `log_file_handler`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'logpath' in params:
-            path_params['logpath'] = params['logpath']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/logs/{logpath}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+    _log_file_handler_endpoint = Endpoint(
+        'log_file_handler',
+        '/logs/{logpath}', 'GET',
+        required=('logpath',),
+        response_type=None,
+        auth_settings=('BearerToken',),
+    )
 
     def log_file_list_handler(self, **kwargs):  # noqa: E501
         """log_file_list_handler  # noqa: E501
@@ -150,49 +109,13 @@ class LogsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        all_params = []  # noqa: E501
-        all_params.append('async')
-        all_params.append('_return_http_data_only')
-        all_params.append('_preload_content')
-        all_params.append('_request_timeout')
-
-        params = locals()
-        for key, val in params['kwargs'].items():
-            if key not in all_params:
-                raise TypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method log_file_list_handler" % key
-                )
-            params[key] = val
-        del params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/logs/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type=None,  # noqa: E501
-            auth_settings=auth_settings,
-            _return_http_data_only=params.get('_return_http_data_only'),
-            _preload_content=params.get('_preload_content', True),
-            _request_timeout=params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self._log_file_list_handler_endpoint.call(
+            self.api_client, (), kwargs)
+
+    _log_file_list_handler_endpoint = Endpoint(
+        'log_file_list_handler',
+        '/logs/', 'GET',
+        required=(),
+        response_type=None,
+        auth_settings=('BearerToken',),
+    )
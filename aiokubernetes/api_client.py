@@ -9,14 +9,13 @@
     Generated by: https://github.com/swagger-api/swagger-codegen.git
 """
 
-import datetime
 import json
 import mimetypes
 import os
 import re
 import ssl
 from collections import namedtuple
-from urllib.parse import quote, urlencode, urlparse, urlunparse
+from urllib.parse import urlencode, urlparse, urlunparse
 
 import aiohttp
 import certifi
@@ -82,14 +81,31 @@ class ApiClient(object):
                 configuration.cert_file, keyfile=configuration.key_file
             )
 
-        connector = aiohttp.TCPConnector(
-            limit=4,
-            ssl_context=ssl_context,
-            verify_ssl=configuration.verify_ssl
-        )
+        connector = k8s.clients.get_connector(configuration, ssl_context)
 
-        # https pool manager
-        self.session = aiohttp.ClientSession(connector=connector)
+        # https pool manager. Rate limit all requests if the configuration asks
+        # for it.
+        self.session = k8s.ratelimit.limit_session(
+            aiohttp.ClientSession(connector=connector), configuration)
+
+        # Separate pool for long lived streams like watches, followed logs or
+        # exec Websockets. This ensures they cannot starve ordinary requests.
+        connector = k8s.clients.get_connector(configuration, ssl_context, lane='stream')
+        self.stream_session = k8s.ratelimit.limit_session(
+            aiohttp.ClientSession(connector=connector), configuration)
+
+        # Coalesce identical concurrent GETs (see `singleflight.SingleFlight`).
+        if configuration.coalesce_requests:
+            self.singleflight = k8s.singleflight.SingleFlight()
+        else:
+            self.singleflight = None
+
+        # Cache GET responses (see `cache.ResponseCache`).
+        if configuration.response_cache_size > 0:
+            self.cache = k8s.cache.ResponseCache(
+                configuration.response_cache_size, configuration.response_cache_ttl)
+        else:
+            self.cache = None
 
     @property
     def user_agent(self):
@@ -102,6 +118,11 @@ class ApiClient(object):
 
     async def close(self):
         await self.session.close()
+        await self.stream_session.close()
+
+    async def prewarm(self):
+        """Open `configuration.connection_prewarm` connections in advance."""
+        await k8s.clients.prewarm(self.session, self.configuration)
 
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
@@ -154,21 +175,18 @@ class ApiClient(object):
         if self.cookie:
             header_params['Cookie'] = self.cookie
         if header_params:
-            header_params = dict(self.sanitize_for_serialization(header_params))
+            header_params = k8s.endpoint.sanitize_params(header_params)
 
-        # path parameters
+        # path parameters: expand the cached template for this resource path.
         if path_params:
-            path_params = dict(self.sanitize_for_serialization(path_params))
-            for k, v in path_params.items():
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
+            path_params = k8s.endpoint.sanitize_params(path_params)
+            template = k8s.endpoint.get_template(resource_path)
+            resource_path = template.expand(
+                path_params, config.safe_chars_for_path_param)
 
         # query parameters
         if query_params:
-            query_params = dict(self.sanitize_for_serialization(query_params))
+            query_params = dict(k8s.endpoint.sanitize_params(query_params))
 
         # post parameters
         if post_params or files:
@@ -193,16 +211,88 @@ class ApiClient(object):
             '_request_timeout': _request_timeout
         }
 
+        # Watches, followed logs and Websockets can occupy a connection for
+        # minutes. Route them through the dedicated stream session. Note that
+        # `_preload_content=False` alone does not make a stream, eg the pager
+        # uses it for ordinary LIST pages.
+        if k8s.clients.is_streaming(url, query_params):
+            session = self.stream_session
+        else:
+            session = self.session
+
         # For Websockets, return the raw HTTP response immediately. The
         # returned object is a `_WSRequestContextManager` and the caller can
         # use it as a context manager to process the Websocket data as it
         # streams in.
         if url.lower().endswith('/exec'):
-            response = await self.websocket_request(self.session, url, **kwargs)
+            response = await self.websocket_request(session, url, **kwargs)
             return ApiResponse(http=response, obj=None)
 
-        # Make the request and wait for a response.
-        response_data = await self.http_request(self.session, method, url, **kwargs)
+        # Ordinary GETs may be served from the cache or merged with identical
+        # concurrent requests if the configuration asks for it. This excludes
+        # callers that consume the raw response themselves.
+        method = method.upper()
+        if method == 'GET' and session is self.session and _preload_content:
+            return await self.fetch_get(session, url, response_type, kwargs)
+
+        try:
+            return await self.fetch(session, method, url, response_type, kwargs,
+                                    _preload_content)
+        finally:
+            # Writes may change any cached list or object of the same type.
+            if self.cache is not None and method != 'GET':
+                self.cache.invalidate(url)
+
+    async def fetch_get(self, session, url, response_type, kwargs):
+        """Return the `ApiResponse` of a GET request from the cache or `fetch`.
+
+        All callers that are served from the cache, or whose requests were
+        coalesced, receive the same `ApiResponse` object.
+        """
+        if self.cache is None and self.singleflight is None:
+            return await self.fetch(session, 'GET', url, response_type, kwargs)
+
+        key = k8s.singleflight.request_key('GET', url, kwargs, response_type)
+        if self.cache is not None:
+            response = self.cache.get(key)
+            if response is not None:
+                return response
+
+        if self.singleflight is None:
+            return await self.fetch_put(session, key, url, response_type, kwargs)
+        return await self.singleflight.do(
+            key, self.fetch_put, session, key, url, response_type, kwargs)
+
+    async def fetch_put(self, session, key, url, response_type, kwargs):
+        """Return the `ApiResponse` of a GET request and cache it if possible.
+
+        The response is not cached if a write invalidated the resource type
+        while the request was in flight, since it may predate that write.
+        """
+        if self.cache is None:
+            return await self.fetch(session, 'GET', url, response_type, kwargs)
+
+        generation = self.cache.generation(url)
+        response = await self.fetch(session, 'GET', url, response_type, kwargs)
+
+        # Only cache successful responses.
+        if response.http.status == 200:
+            self.cache.put(key, url, response, generation)
+        return response
+
+    async def fetch(self, session, method, url, response_type, kwargs,
+                    _preload_content=True):
+        """Make the request and return the `ApiResponse`.
+
+        This is the tail end of `call_api` once the URL, headers and body are
+        known.
+        """
+        # Make the request and wait for a response. Transient errors of
+        # idempotent requests are retried if the configuration asks for it.
+        kwargs = dict(kwargs)
+        kwargs['retry_policy'] = k8s.retry.get_policy(self.configuration)
+        kwargs['codec'] = codec = k8s.codec.get_codec(self.configuration)
+        response_data = await self.http_request(session, method, url, **kwargs)
 
         # Deserialize the response if the caller requested it. This is almost
         # always True, the only notable exception being the Watch class, which
@@ -215,7 +305,7 @@ class ApiClient(object):
                 assert response_type != "file"
 
                 # fetch data from response object
-                data = await response_data.json()
+                data = await response_data.json(loads=codec.loads)
 
                 # fixup: intercept ValueError (data may be none because request failed)
                 try:
@@ -264,7 +354,8 @@ class ApiClient(object):
 
     @staticmethod
     async def http_request(session, method, url, query_params=None, headers=None,
-                           body=None, post_params=None, _request_timeout=None):
+                           body=None, post_params=None, _request_timeout=None,
+                           retry_policy=None, codec=None):
         """Make HTTP request to `url` and return its response.
 
         :param: method: http request method
@@ -279,6 +370,9 @@ class ApiClient(object):
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :param: retry_policy: optional `retry.RetryPolicy` to retry transient
+                              errors of idempotent requests.
+        :param: codec: optional `codec.Codec` to encode the Json body.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']
@@ -303,14 +397,20 @@ class ApiClient(object):
         if query_params:
             args["url"] += '?' + urlencode(query_params)
 
+        # Determine idempotency before the body becomes an opaque Json string.
+        idempotent = k8s.retry.is_idempotent(method, body)
+
         # Automatically encode the data to Json if the headers indicate it is Json.
         # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
         if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
             if re.search('json', headers['Content-Type'], re.IGNORECASE):
                 if body is not None:
-                    body = json.dumps(body)
+                    body = json.dumps(body) if codec is None else codec.dumps(body)
                 args["data"] = body
-        return await session.request(**args)
+
+        if retry_policy is None:
+            return await session.request(**args)
+        return await retry_policy.request(session, idempotent=idempotent, **args)
 
     def prepare_post_parameters(self, post_params=None, files=None):
         """Builds form parameters.
@@ -346,15 +446,7 @@ class ApiClient(object):
         :param: accepts: List of headers.
         :return: Accept (e.g. application/json).
         """
-        if not accepts:
-            return
-
-        accepts = [x.lower() for x in accepts]
-
-        if 'application/json' in accepts:
-            return 'application/json'
-        else:
-            return ', '.join(accepts)
+        return k8s.endpoint.select_header_accept(accepts)
 
     def select_header_content_type(self, content_types):
         """Returns `Content-Type` based on an array of content_types provided.
@@ -362,15 +454,7 @@ class ApiClient(object):
         :param: content_types: List of content-types.
         :return: Content-Type (e.g. application/json).
         """
-        if not content_types:
-            return 'application/json'
-
-        content_types = [x.lower() for x in content_types]
-
-        if 'application/json' in content_types or '*/*' in content_types:
-            return 'application/json'
-        else:
-            return content_types[0]
+        return k8s.endpoint.select_header_content_type(content_types)
 
     def update_params_for_auth(self, headers, querys, auth_settings):
         """Updates header and query params based on authentication setting.
@@ -407,28 +491,9 @@ class ApiClient(object):
         If obj is dict, return the dict.
         If obj is swagger model, return the properties dict.
 
+        This delegates to the compiled and cached encoders of `swagger.serialize`.
+
         :param: obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj) for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj) for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except attributes `swagger_types`,
-            # `attribute_map` and attributes which value is not None. Convert
-            # attribute name to json key in model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in obj.swagger_types.items()
-                        if getattr(obj, attr) is not None}
-
-        return {k: self.sanitize_for_serialization(v) for k, v in obj_dict.items()}
+        return k8s.swagger.serialize(obj)
@@ -54,10 +54,13 @@ class ApiClientTest(TestCase):
         # the existing one created in the ctor.
         api_client = k8s.api_client.ApiClient(k8s.configuration.Configuration())
         await api_client.session.close()
+        await api_client.stream_session.close()
         api_client.session = mock.MagicMock(close=CoroutineMock())
+        api_client.stream_session = mock.MagicMock(close=CoroutineMock())
 
         self.assertIsNone(await api_client.close())
-        api_client.session.close.assert_called_once
+        api_client.session.close.assert_called_once()
+        api_client.stream_session.close.assert_called_once()
 
     async def test_exec_ws(self):
         """Verify the Websocket connection sends the correct headers."""
@@ -67,6 +70,7 @@ class ApiClientTest(TestCase):
         api_client = k8s.api_client.ApiClient(k8s.configuration.Configuration())
         await api_client.close()
         api_client.session = mock.MagicMock()
+        api_client.stream_session = mock.MagicMock()
 
         # Make the websocket request through our Mock.
         core_api = k8s.CoreV1Api(api_client=api_client)
@@ -75,8 +79,11 @@ class ApiClientTest(TestCase):
             stderr=True, stdin=False, stdout=True, tty=False
         )
 
+        # Websockets are long lived and must use the stream session.
+        assert not api_client.session.ws_connect.called
+
         # The WS connection must have received the correct headers.
-        api_client.session.ws_connect.assert_called_once_with(
+        api_client.stream_session.ws_connect.assert_called_once_with(
             'wss://localhost/api/v1/namespaces/namespace/pods/pod/exec?'
             'command=mock-command&stderr=True&stdin=False&stdout=True&tty=False',
             headers={
@@ -89,7 +96,7 @@ class ApiClientTest(TestCase):
 
         # The response must contain the verbatim response from the Websocket
         # session and no parsed data.
-        http = api_client.session.ws_connect.return_value
+        http = api_client.stream_session.ws_connect.return_value
         self.assertEqual(resp, ApiResponse(http=http, obj=None))
 
 
@@ -1,7 +1,7 @@
-import datetime
-import json
 from urllib.parse import urlencode
 
+import aiokubernetes as k8s
+
 
 class Proxy:
     def __init__(self, config, *args, **kwargs):
@@ -41,7 +41,7 @@ class Proxy:
         # Compile the necessary information to make the API request with
         # whatever client library the user chooses.
         return {
-            "data": json.dumps(body),
+            "data": k8s.codec.get_codec(self.config).dumps(body),
             "headers": headers,
             "method": method,
             "timeout": 5 * 60,
@@ -55,15 +55,7 @@ class Proxy:
         :param: accepts: List of headers.
         :return: Accept (e.g. application/json).
         """
-        if not accepts:
-            return None
-
-        accepts = [x.lower() for x in accepts]
-
-        if 'application/json' in accepts:
-            return 'application/json'
-        else:
-            return ', '.join(accepts)
+        return k8s.endpoint.select_header_accept(accepts)
 
     @staticmethod
     def select_header_content_type(content_types):
@@ -72,15 +64,7 @@ class Proxy:
         :param: content_types: List of content-types.
         :return: Content-Type (e.g. application/json).
         """
-        if not content_types:
-            return 'application/json'
-
-        content_types = [x.lower() for x in content_types]
-
-        if 'application/json' in content_types or '*/*' in content_types:
-            return 'application/json'
-        else:
-            return content_types[0]
+        return k8s.endpoint.select_header_content_type(content_types)
 
 
 def build_url(config, resource_path, path_params, query_params, header_params,
@@ -91,15 +75,16 @@ def build_url(config, resource_path, path_params, query_params, header_params,
 
     # Convert all Swagger models to Json compatible Python dicts.
     body = sanitize_for_serialization(body)
-    header_params = dict(sanitize_for_serialization(header_params))
-    path_params = dict(sanitize_for_serialization(path_params))
-    post_params = dict(sanitize_for_serialization(post_params))
-    query_params = sanitize_for_serialization(query_params)
+    header_params = k8s.endpoint.sanitize_params(header_params)
+    path_params = k8s.endpoint.sanitize_params(path_params)
+    post_params = dict(k8s.endpoint.sanitize_params(post_params))
+    query_params = k8s.endpoint.sanitize_params(query_params)
 
-    # Convert "/api/v1/namespace/{namespace}" -> "/api/v1/namespace/foo"
-    # This is particularly easy to do because it utilises the same syntax as
-    # the Python format strings.
-    resource_path = resource_path.format(**path_params)
+    # Convert "/api/v1/namespace/{namespace}" -> "/api/v1/namespace/foo" with
+    # the cached template for this resource path. Unlike `ApiClient`, the
+    # proxy does not quote the values.
+    template = k8s.endpoint.get_template(resource_path)
+    resource_path = template.format(path_params)
 
     # Convert [("limit", 5), ("command", ["ls", "pwd"])] to
     # [("limit", 5), ("command", "ls"), ("command", "pwd")]
@@ -167,29 +152,9 @@ def sanitize_for_serialization(obj):
     If obj is dict, return the dict.
     If obj is swagger model, return the properties dict.
 
+    This delegates to the compiled and cached encoders of `swagger.serialize`.
+
     :param: obj: The data to serialize.
     :return: The serialized form of data.
     """
-    PRIMITIVE_TYPES = (float, bool, bytes, int, str)
-    if obj is None:
-        return None
-    elif isinstance(obj, PRIMITIVE_TYPES):
-        return obj
-    elif isinstance(obj, list):
-        return [sanitize_for_serialization(sub_obj) for sub_obj in obj]
-    elif isinstance(obj, tuple):
-        return tuple(sanitize_for_serialization(sub_obj) for sub_obj in obj)
-    elif isinstance(obj, (datetime.datetime, datetime.date)):
-        return obj.isoformat()
-
-    if isinstance(obj, dict):
-        obj_dict = obj
-    else:
-        # Convert model obj to dict except attributes `swagger_types`,
-        # `attribute_map` and attributes which value is not None. Convert
-        # attribute name to json key in model definition for request.
-        obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                    for attr, _ in obj.swagger_types.items()
-                    if getattr(obj, attr) is not None}
-
-    return {k: sanitize_for_serialization(v) for k, v in obj_dict.items()}
+    return k8s.swagger.serialize(obj)
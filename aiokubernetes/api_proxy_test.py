@@ -43,6 +43,24 @@ class TestProxyClass:
             'data': '{"some": "body"}'
         }
 
+    def test_unquoted_path_params(self):
+        """The proxy must pass path values verbatim, like `str.format`."""
+        config = k8s.configuration.Configuration()
+        config.host = 'myhost'
+        proxy = k8s.api_proxy.Proxy(config)
+
+        ret = k8s.CoreV1Api(proxy).connect_get_namespaced_service_proxy_with_path(
+            'svc', 'ns', 'a/b:c')
+        assert ret['url'] == 'myhost/api/v1/namespaces/ns/services/svc/proxy/a/b:c'
+
+        ret = k8s.RbacAuthorizationV1Api(proxy).read_cluster_role('system:node')
+        assert ret['url'] == (
+            'myhost/apis/rbac.authorization.k8s.io/v1/clusterroles/system:node')
+
+        template = k8s.endpoint.get_template('/a/{x}/b')
+        assert template.format({'x': 'c d/e'}) == '/a/c d/e/b'
+        assert k8s.endpoint.get_template('/version/').format({}) == '/version/'
+
 
 class TestSupportFunctions:
     def test_select_header_accept_empty(self):
@@ -0,0 +1,243 @@
+"""Read-through cache for the GET responses of an `ApiClient`.
+
+Admission webhooks and reporting tools tend to read the same handful of
+objects over and over again. If `Configuration.response_cache_size` is
+positive, the `ApiClient` keeps the most recent GET responses in a
+`ResponseCache` and serves repeated reads from it until they expire.
+
+Cached responses are invalidated
+  * after `Configuration.response_cache_ttl` seconds,
+  * when the cache is full (least recently used entries go first),
+  * whenever the same `ApiClient` writes (POST, PUT, PATCH, DELETE) to a
+    resource of the same type,
+  * when a watch event reports a different `resourceVersion` for a cached
+    object (see `ResponseCache.observe`).
+
+The cache cannot see writes from other clients without a watch, which is why
+the TTL should be short. All callers of a cached read receive the very same
+`ApiResponse` object and must treat it as read-only.
+
+Example:
+
+    config.response_cache_size = 1000
+    client = k8s.api_client.ApiClient(config)
+    v1 = k8s.CoreV1Api(client)
+
+    # Optional: feed the cache with the events of a ConfigMap watch (see
+    # `examples/watch_resources.py`) to invalidate changed objects early.
+    async for event in k8s.watch.AioHttpClientWatch(request):
+        client.cache.observe(event)
+"""
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import urlsplit
+
+import aiokubernetes as k8s
+
+# One cached response.
+#   expires: `time.monotonic` after which the entry is stale.
+#   resource: eg ('api/v1', 'pods') or ('apis/apps/v1', 'deployments').
+#   name: (namespace, name) for reads of a single object, None for lists.
+#   resource_version: of the cached object or list (may be None).
+Entry = namedtuple('Entry', 'response expires resource name resource_version')
+
+
+def parse_path(url):
+    """Return the resource type, object name and subresource of `url`.
+
+    Examples:
+        "/api/v1/namespaces/foo/pods/bar" -> (('api/v1', 'pods'), ('foo', 'bar'), None)
+        "/apis/apps/v1/deployments" -> (('apis/apps/v1', 'deployments'), None, None)
+        "/api/v1/nodes/n1/status" -> (('api/v1', 'nodes'), (None, 'n1'), 'status')
+
+    Inputs:
+        url: str
+            Full URL or just its path. Query parameters are ignored.
+
+    Returns:
+        tuple: (resource, name, subresource) or (None, None, None) if `url` is
+        no resource path.
+    """
+    parts = urlsplit(url).path.strip('/').split('/')
+    if parts[0] == 'api':
+        prefix, parts = parts[:2], parts[2:]
+    elif parts[0] == 'apis':
+        prefix, parts = parts[:3], parts[3:]
+    else:
+        return None, None, None
+
+    # Strip the namespace, unless the resource *is* a namespace.
+    namespace = None
+    if len(parts) >= 3 and parts[0] == 'namespaces':
+        namespace, parts = parts[1], parts[2:]
+    if not parts or not parts[0]:
+        return None, None, None
+
+    resource = (str.join('/', prefix), parts[0])
+    name = (namespace, parts[1]) if len(parts) > 1 else None
+    subresource = str.join('/', parts[2:]) or None
+    return resource, name, subresource
+
+
+def get_resource_prefix(api_version):
+    """Return the URL prefix of `api_version`, eg 'apis/apps/v1' for 'apps/v1'."""
+    return 'api/v1' if api_version == 'v1' else 'apis/' + api_version
+
+
+class ResponseCache(object):
+    """Size bounded LRU cache with a TTL for `ApiResponse` objects.
+
+    Inputs:
+        maxsize: int
+            Maximum number of cached responses.
+        ttl: float
+            Seconds after which a cached response expires.
+    """
+    def __init__(self, maxsize=1024, ttl=5):
+        self.maxsize, self.ttl = maxsize, ttl
+
+        # {key: Entry} in least to most recently used order.
+        self._entries = OrderedDict()
+
+        # {resource: set(key)} to quickly invalidate all responses of a type.
+        self._by_resource = {}
+
+        # {resource: int} counts the invalidations of each type. A GET only
+        # caches its response if no write happened while it was in flight.
+        self._generations = {}
+
+        # Metrics.
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the cached response for `key` or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry.expires < time.monotonic():
+            self._drop(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.response
+
+    def generation(self, url):
+        """Return the invalidation generation of the resource type of `url`.
+
+        Record it before issuing a GET and pass it to `put` afterwards.
+        """
+        resource, _, _ = parse_path(url)
+        return self._generations.get(resource, 0)
+
+    def put(self, key, url, response, generation=None):
+        """Cache the `response` of the GET request to `url`.
+
+        Responses from anything other than a collection or a single object,
+        eg logs or other subresources, are ignored. So are responses whose
+        resource type was invalidated since `generation` was recorded, because
+        they may predate the write.
+
+        Inputs:
+            key: hashable
+                Typically the return value of `singleflight.request_key`.
+            url: str
+            response: ApiResponse
+            generation: int
+                Return value of `generation(url)` before the request was made.
+        """
+        resource, name, subresource = parse_path(url)
+        if resource is None or subresource is not None:
+            return
+        if generation is not None and generation != self._generations.get(resource, 0):
+            return
+
+        metadata = getattr(response.obj, 'metadata', None)
+        resource_version = getattr(metadata, 'resource_version', None)
+        entry = Entry(response, time.monotonic() + self.ttl, resource, name,
+                      resource_version)
+
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_resource.setdefault(resource, set()).add(key)
+
+        # Evict the least recently used entries.
+        while len(self._entries) > self.maxsize:
+            key, entry = self._entries.popitem(last=False)
+            self._unindex(key, entry.resource)
+            self.evictions += 1
+
+    def invalidate(self, url):
+        """Drop all cached responses for the resource type `url` refers to.
+
+        A write to a single object can change the result of every list of its
+        type, which is why this is deliberately coarse.
+
+        Returns:
+            int: number of dropped responses.
+        """
+        resource, _, _ = parse_path(url)
+        if resource is not None:
+            self._generations[resource] = self._generations.get(resource, 0) + 1
+        keys = list(self._by_resource.get(resource, ()))
+        for key in keys:
+            self._drop(key)
+        return len(keys)
+
+    def observe(self, event):
+        """Invalidate the responses that are outdated by the watch `event`.
+
+        Lists of the affected type are always dropped. Single objects are
+        only dropped if the event reports a different `resourceVersion` than
+        the cached one.
+
+        Inputs:
+            event: watch.WatchResponse
+        """
+        manifest = event.manifest
+        if event.name in ('ERROR', 'BOOKMARK') or not isinstance(manifest, dict):
+            return
+
+        api_version = manifest.get('apiVersion')
+        res = k8s.registry.get_resource(api_version, manifest.get('kind'))
+        if res is None:
+            return
+        resource = (get_resource_prefix(api_version), res.plural)
+
+        metadata = manifest.get('metadata') or {}
+        name = (metadata.get('namespace'), metadata.get('name'))
+        resource_version = metadata.get('resourceVersion')
+
+        for key in list(self._by_resource.get(resource, ())):
+            entry = self._entries[key]
+            if entry.name is None:
+                self._drop(key)
+            elif entry.name == name and entry.resource_version != resource_version:
+                self._drop(key)
+
+    def clear(self):
+        """Drop all cached responses."""
+        self._entries.clear()
+        self._by_resource.clear()
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unindex(key, entry.resource)
+            self.invalidations += 1
+
+    def _unindex(self, key, resource):
+        keys = self._by_resource.get(resource)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_resource[resource]
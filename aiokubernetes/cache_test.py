@@ -0,0 +1,212 @@
+import asyncio
+import unittest.mock as mock
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.api_client import ApiResponse
+from aiokubernetes.fakes_test import FakeResponse
+from aiokubernetes.watch import WatchResponse
+
+
+def make_response(name, rv='1'):
+    obj = k8s.V1ConfigMap(metadata=k8s.V1ObjectMeta(name=name, resource_version=rv))
+    return ApiResponse(http=None, obj=obj)
+
+
+def make_event(name, namespace='default', rv='1', kind='ConfigMap'):
+    manifest = {
+        'apiVersion': 'v1', 'kind': kind,
+        'metadata': {'name': name, 'namespace': namespace, 'resourceVersion': rv},
+    }
+    return WatchResponse(name='MODIFIED', raw=b'', manifest=manifest)
+
+
+class TestParsePath:
+    def test_parse(self):
+        fun = k8s.cache.parse_path
+        assert fun('https://host/api/v1/namespaces/foo/pods/bar') == (
+            ('api/v1', 'pods'), ('foo', 'bar'), None)
+        assert fun('/apis/apps/v1/namespaces/foo/deployments') == (
+            ('apis/apps/v1', 'deployments'), None, None)
+        assert fun('/api/v1/nodes/n1/status') == (
+            ('api/v1', 'nodes'), (None, 'n1'), 'status')
+        assert fun('/api/v1/namespaces/foo') == (
+            ('api/v1', 'namespaces'), (None, 'foo'), None)
+        assert fun('/api/v1/namespaces/foo/pods/bar/log') == (
+            ('api/v1', 'pods'), ('foo', 'bar'), 'log')
+        assert fun('/version/') == (None, None, None)
+        assert fun('/api/v1') == (None, None, None)
+
+    def test_prefix(self):
+        assert k8s.cache.get_resource_prefix('v1') == 'api/v1'
+        assert k8s.cache.get_resource_prefix('apps/v1') == 'apis/apps/v1'
+
+
+class TestResponseCache:
+    def test_get_put(self):
+        cache = k8s.cache.ResponseCache(maxsize=10, ttl=10)
+        url = '/api/v1/namespaces/default/configmaps/foo'
+        response = make_response('foo')
+        assert cache.get('a') is None
+
+        cache.put('a', url, response)
+        assert cache.get('a') is response
+        assert len(cache) == 1 and cache.hits == 1 and cache.misses == 1
+
+        # Subresources are not cached.
+        cache.put('b', url + '/status', response)
+        assert cache.get('b') is None
+
+    def test_ttl(self):
+        cache = k8s.cache.ResponseCache(maxsize=10, ttl=10)
+        url = '/api/v1/namespaces/default/configmaps/foo'
+        with mock.patch.object(k8s.cache.time, 'monotonic', return_value=100):
+            cache.put('a', url, make_response('foo'))
+        with mock.patch.object(k8s.cache.time, 'monotonic', return_value=105):
+            assert cache.get('a') is not None
+        with mock.patch.object(k8s.cache.time, 'monotonic', return_value=111):
+            assert cache.get('a') is None
+        assert len(cache) == 0
+
+    def test_lru(self):
+        cache = k8s.cache.ResponseCache(maxsize=2, ttl=10)
+        url = '/api/v1/namespaces/default/configmaps/'
+        cache.put('a', url + 'a', make_response('a'))
+        cache.put('b', url + 'b', make_response('b'))
+        assert cache.get('a') is not None
+
+        # Must evict 'b' since 'a' was used more recently.
+        cache.put('c', url + 'c', make_response('c'))
+        assert len(cache) == 2 and cache.evictions == 1
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+
+    def test_invalidate(self):
+        cache = k8s.cache.ResponseCache(maxsize=10, ttl=10)
+        cache.put('a', '/api/v1/namespaces/default/configmaps/a', make_response('a'))
+        cache.put('b', '/api/v1/namespaces/default/configmaps', make_response(None))
+        cache.put('c', '/api/v1/namespaces/default/secrets/c', make_response('c'))
+
+        # A write to a ConfigMap invalidates all ConfigMaps but nothing else.
+        assert cache.invalidate('/api/v1/namespaces/other/configmaps/x') == 2
+        assert cache.get('a') is None and cache.get('b') is None
+        assert cache.get('c') is not None
+        assert cache.invalidate('/api/v1/namespaces/default/pods') == 0
+
+    def test_generation(self):
+        cache = k8s.cache.ResponseCache(maxsize=10, ttl=10)
+        url = '/api/v1/namespaces/default/configmaps/a'
+        generation = cache.generation(url)
+
+        # A write to a Secret does not affect ConfigMaps.
+        cache.invalidate('/api/v1/namespaces/default/secrets/b')
+        cache.put('a', url, make_response('a'), generation)
+        assert cache.get('a') is not None
+
+        # Do not cache a response that may predate a write to its type.
+        cache.invalidate('/api/v1/namespaces/other/configmaps/x')
+        cache.put('a', url, make_response('a'), generation)
+        assert len(cache) == 0
+        cache.put('a', url, make_response('a'), cache.generation(url))
+        assert len(cache) == 1
+
+    def test_observe(self):
+        cache = k8s.cache.ResponseCache(maxsize=10, ttl=10)
+        url = '/api/v1/namespaces/default/configmaps'
+        cache.put('a', url + '/a', make_response('a', rv='5'))
+        cache.put('b', url + '/b', make_response('b', rv='5'))
+        cache.put('list', url, make_response(None))
+
+        # Same resource version: only the list is outdated.
+        cache.observe(make_event('a', rv='5'))
+        assert cache.get('list') is None
+        assert cache.get('a') is not None and cache.get('b') is not None
+
+        # Newer version of 'a'.
+        cache.observe(make_event('a', rv='6'))
+        assert cache.get('a') is None and cache.get('b') is not None
+
+        # Other kinds, unknown kinds and errors must not affect the cache.
+        cache.observe(make_event('b', rv='7', kind='Secret'))
+        cache.observe(make_event('b', rv='7', kind='Unknown'))
+        cache.observe(WatchResponse(name='ERROR', raw=b'', manifest={}))
+        assert cache.get('b') is not None
+
+
+class TestApiClient:
+    def test_call_api(self):
+        config = k8s.configuration.Configuration()
+        config.response_cache_size = 10
+        data = {'metadata': {'name': 'foo'}}
+
+        async def http_request(*args, **kwargs):
+            return FakeResponse(data=data)
+
+        async def run():
+            client = k8s.api_client.ApiClient(config)
+            v1 = k8s.CoreV1Api(client)
+            with mock.patch.object(client, 'http_request', side_effect=http_request) \
+                    as m_request:
+                ret1 = await v1.read_namespaced_config_map('foo', 'default')
+                ret2 = await v1.read_namespaced_config_map('foo', 'default')
+                assert ret1 is ret2
+                assert m_request.call_count == 1
+
+                # Writes invalidate the cache.
+                await v1.delete_namespaced_config_map(
+                    'foo', 'default', k8s.V1DeleteOptions())
+                assert len(client.cache) == 0
+                ret3 = await v1.read_namespaced_config_map('foo', 'default')
+                assert ret3 is not ret1
+                assert m_request.call_count == 3
+            await client.close()
+
+        fakes.run(run())
+
+    def test_write_during_get(self):
+        """A GET that overlaps with a write must not cache its response."""
+        config = k8s.configuration.Configuration()
+        config.response_cache_size = 10
+        data = {'metadata': {'name': 'foo'}}
+
+        async def run():
+            client = k8s.api_client.ApiClient(config)
+            v1 = k8s.CoreV1Api(client)
+            read_started, delete_done = asyncio.Event(), asyncio.Event()
+
+            async def http_request(session, method, url, **kwargs):
+                if method == 'GET':
+                    read_started.set()
+                    await delete_done.wait()
+                return FakeResponse(data=data)
+
+            async def delete():
+                await read_started.wait()
+                await v1.delete_namespaced_config_map(
+                    'foo', 'default', k8s.V1DeleteOptions())
+                delete_done.set()
+
+            with mock.patch.object(client, 'http_request', side_effect=http_request):
+                await asyncio.gather(
+                    v1.read_namespaced_config_map('foo', 'default'), delete())
+            assert len(client.cache) == 0
+            await client.close()
+
+        fakes.run(run())
+
+    def test_errors_not_cached(self):
+        config = k8s.configuration.Configuration()
+        config.response_cache_size = 10
+
+        async def http_request(*args, **kwargs):
+            return FakeResponse(data={}, status=404)
+
+        async def run():
+            client = k8s.api_client.ApiClient(config)
+            v1 = k8s.CoreV1Api(client)
+            with mock.patch.object(client, 'http_request', side_effect=http_request):
+                await v1.read_namespaced_config_map('foo', 'default')
+            assert len(client.cache) == 0
+            await client.close()
+
+        fakes.run(run())
@@ -0,0 +1,221 @@
+"""Answer the list and read calls of the generated APIs from informers.
+
+`CachedClient` is a drop-in replacement for an `ApiClient`. Pass it to any
+generated API class and all `list_*` and `read_*` calls for resources that are
+mirrored by one of its informers are served from the informer store, including
+the evaluation of label and field selectors (see `selector.Selector`).
+Everything else, most notably all writes, is forwarded to the wrapped
+`ApiClient` unchanged.
+
+Example:
+
+    proxy = k8s.api_proxy.Proxy(config)
+    informer = k8s.informer.Informer(
+        k8s.clients.get_aiohttp(config),
+        k8s.CoreV1Api(proxy).list_pod_for_all_namespaces,
+    )
+    task = asyncio.ensure_future(informer.run())
+    await informer.wait_synced()
+
+    client = k8s.cached.CachedClient(k8s.api_client.ApiClient(config), [informer])
+    v1 = k8s.CoreV1Api(client)
+
+    # Served from the informer store.
+    ret = await v1.read_namespaced_pod('my-pod', 'default')
+    ret = await v1.list_namespaced_pod('default', label_selector='app=foo')
+
+    # Sent to K8s.
+    await v1.delete_namespaced_pod('my-pod', 'default', k8s.V1DeleteOptions())
+
+Cached responses have no `http` response (ie `ApiResponse.http` is None) and
+their objects are shared with the informer store, which means they are
+read-only. The data is only as fresh as the informer.
+"""
+import re
+from collections import namedtuple
+from urllib.parse import parse_qsl, urlsplit
+
+import aiokubernetes as k8s
+from aiokubernetes.api_client import ApiResponse
+
+# Extract the namespace from a resource URL like "/api/v1/namespaces/foo/pods".
+_RE_NAMESPACE = re.compile(r'/(?:api|apis/[^/]+)/[^/]+/namespaces/([^/]+)/[^/]+')
+
+# Query parameters of list and read calls that the stores can honour. The
+# store always holds the latest state, which is good enough for
+# resourceVersion=0 ("any version"). All other queries, eg watches or paged
+# lists, are forwarded to K8s.
+_LOCAL_QUERY = frozenset((
+    'labelSelector', 'fieldSelector', 'pretty', 'includeUninitialized',
+    'resourceVersion', 'timeoutSeconds', 'watch',
+))
+
+# The objects an informer mirrors.
+#   namespace: None if the informer watches all namespaces.
+#   label_selector, field_selector: the selectors of the informer (or None).
+Scope = namedtuple('Scope', 'informer namespace label_selector field_selector')
+
+
+def get_scope(informer):
+    """Return the resource type and `Scope` of the objects in `informer`.
+
+    Inputs:
+        informer: informer.Informer
+            Its `list_fun` must be bound to an `api_proxy.Proxy`.
+
+    Returns:
+        tuple: (resource, Scope), where `resource` is eg ('api/v1', 'pods').
+    """
+    cargs = informer.list_fun(*informer.args, **informer.kwargs)
+    url = urlsplit(cargs['url'])
+    resource, name, _ = k8s.cache.parse_path(url.path)
+    if resource is None or name is not None:
+        raise ValueError(f'<{url.path}> is not a list endpoint')
+
+    match = _RE_NAMESPACE.fullmatch(url.path)
+    query = dict(parse_qsl(url.query))
+    scope = Scope(
+        informer=informer,
+        namespace=match.group(1) if match else None,
+        label_selector=query.get('labelSelector') or None,
+        field_selector=query.get('fieldSelector') or None,
+    )
+    return resource, scope
+
+
+class CachedClient(object):
+    """Serve list and read calls of the generated APIs from informer stores.
+
+    Inputs:
+        api_client: ApiClient
+            Handles all calls the informers cannot answer.
+        informers: iterable[informer.Informer]
+            Informers whose `list_fun` is bound to an `api_proxy.Proxy`. Stores
+            of informers that have not synced yet are ignored.
+    """
+    def __init__(self, api_client, informers=()):
+        self.api_client = api_client
+        self.configuration = api_client.configuration
+
+        # {resource: [Scope]}.
+        self._scopes = {}
+
+        # Metrics: GET requests answered locally and forwarded to K8s.
+        self.hits = 0
+        self.misses = 0
+
+        for informer in informers:
+            self.add_informer(informer)
+
+    def add_informer(self, informer):
+        """Serve the resources mirrored by `informer` from its store."""
+        resource, scope = get_scope(informer)
+        self._scopes.setdefault(resource, []).append(scope)
+
+    def select_header_accept(self, accepts):
+        return self.api_client.select_header_accept(accepts)
+
+    def select_header_content_type(self, content_types):
+        return self.api_client.select_header_content_type(content_types)
+
+    async def call_api(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None):
+        """Same as `ApiClient.call_api` but try the informer stores first."""
+        if method == 'GET' and _preload_content:
+            ret = self.lookup(
+                resource_path, path_params or {}, query_params or [], response_type)
+            if ret is not None:
+                self.hits += 1
+                return ret
+            self.misses += 1
+
+        return await self.api_client.call_api(
+            resource_path, method, path_params, query_params, header_params,
+            body=body, post_params=post_params, files=files,
+            response_type=response_type, auth_settings=auth_settings,
+            _return_http_data_only=_return_http_data_only,
+            collection_formats=collection_formats,
+            _preload_content=_preload_content, _request_timeout=_request_timeout,
+        )
+
+    def lookup(self, resource_path, path_params, query_params, response_type):
+        """Return the `ApiResponse` for a GET request from the stores.
+
+        Returns None if no informer can answer the request or the object does
+        not exist. The caller should then forward the request to K8s.
+
+        Inputs:
+            resource_path: str
+                Resource path template, eg "/api/v1/namespaces/{namespace}/pods".
+            path_params: dict
+            query_params: list[tuple]
+            response_type: str
+                Swagger model of the response, eg "V1PodList".
+        """
+        resource, name, subresource = k8s.cache.parse_path(resource_path)
+        if resource is None or subresource is not None:
+            return None
+
+        query = {k: v for k, v in query_params if v is not None}
+        if not set(query).issubset(_LOCAL_QUERY) or query.get('watch'):
+            return None
+        if str(query.get('resourceVersion', '0')) != '0':
+            return None
+
+        namespace = path_params.get('namespace')
+        label_selector = query.get('labelSelector') or None
+        field_selector = query.get('fieldSelector') or None
+        scope = self.find_scope(resource, namespace, label_selector, field_selector)
+        if scope is None:
+            return None
+        informer = scope.informer
+
+        # Read a single object.
+        if name is not None:
+            obj = informer.get(namespace, path_params['name'])
+            return None if obj is None else ApiResponse(http=None, obj=obj)
+
+        # Compile the selectors, unless the informer already applied them.
+        # Let K8s report malformed selectors.
+        if label_selector == scope.label_selector:
+            label_selector = None
+        if field_selector == scope.field_selector:
+            field_selector = None
+        try:
+            selector = k8s.selector.get_selector(label_selector, field_selector)
+        except ValueError:
+            return None
+
+        klass = getattr(k8s.models, response_type or '', None)
+        if klass is None:
+            return None
+
+        # Use the label indexes of the store, if there are any.
+        items = selector.select(informer.store, namespace)
+        obj = klass(
+            api_version=informer.api_version, kind=informer.kind, items=items,
+            metadata=k8s.V1ListMeta(resource_version=informer.resource_version),
+        )
+        return ApiResponse(http=None, obj=obj)
+
+    def find_scope(self, resource, namespace, label_selector, field_selector):
+        """Return the `Scope` of a synced informer that covers the query or None.
+
+        Informers that watch all namespaces cover every namespace. Informers
+        with selectors only cover queries with the very same selectors.
+        """
+        for scope in self._scopes.get(resource, ()):
+            if not scope.informer.synced:
+                continue
+            if scope.namespace is not None and scope.namespace != namespace:
+                continue
+            if scope.label_selector and scope.label_selector != label_selector:
+                continue
+            if scope.field_selector and scope.field_selector != field_selector:
+                continue
+            return scope
+        return None
@@ -0,0 +1,168 @@
+import unittest.mock as mock
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.api_client import ApiResponse
+from aiokubernetes.fakes_test import (
+    FakeClient, FakeResponse, make_pod, to_bytes,
+)
+
+
+def make_labelled_pod(name, namespace='default', labels=None):
+    pod = make_pod(name, namespace)
+    pod.metadata.labels = labels
+    return pod
+
+
+def make_informer(pods, *args, **kwargs):
+    """Return a synced informer for `pods`."""
+    proxy = k8s.api_proxy.Proxy(k8s.configuration.Configuration())
+    v1 = k8s.CoreV1Api(proxy)
+    if args:
+        list_fun = v1.list_namespaced_pod
+    else:
+        list_fun = v1.list_pod_for_all_namespaces
+
+    pod_list = k8s.V1PodList(
+        api_version='v1', kind='PodList',
+        metadata=k8s.V1ListMeta(resource_version='10'), items=pods,
+    )
+    client = FakeClient([FakeResponse(body=to_bytes(pod_list))])
+    informer = k8s.informer.Informer(client, list_fun, *args, **kwargs)
+    fakes.run(informer.sync())
+    return informer
+
+
+class TestScope:
+    def test_get_scope(self):
+        resource, scope = k8s.cached.get_scope(make_informer([]))
+        assert resource == ('api/v1', 'pods')
+        assert scope.namespace is None and scope.label_selector is None
+
+        informer = make_informer([], 'ns', label_selector='app=foo')
+        resource, scope = k8s.cached.get_scope(informer)
+        assert resource == ('api/v1', 'pods')
+        assert scope.namespace == 'ns' and scope.label_selector == 'app=foo'
+        assert scope.field_selector is None
+
+
+class TestCachedClient:
+    def setup_method(self):
+        self.pods = [
+            make_labelled_pod('a', labels={'app': 'foo'}),
+            make_labelled_pod('b', labels={'app': 'bar'}),
+            make_labelled_pod('c', namespace='other', labels={'app': 'foo'}),
+        ]
+        self.api_client = mock.MagicMock()
+        self.api_client.select_header_accept.return_value = 'application/json'
+        self.api_client.select_header_content_type.return_value = 'application/json'
+
+        async def call_api(*args, **kwargs):
+            return ApiResponse(http='server', obj=None)
+        self.api_client.call_api.side_effect = call_api
+
+    def test_read(self):
+        client = k8s.cached.CachedClient(self.api_client, [make_informer(self.pods)])
+        v1 = k8s.CoreV1Api(client)
+
+        ret = fakes.run(v1.read_namespaced_pod('a', 'default'))
+        assert ret.http is None
+        assert ret.obj.metadata.name == 'a'
+
+        # Unknown objects and subresources must come from the server.
+        ret = fakes.run(v1.read_namespaced_pod('x', 'default'))
+        assert ret.http == 'server'
+        ret = fakes.run(v1.read_namespaced_pod_status('a', 'default'))
+        assert ret.http == 'server'
+        assert client.hits == 1 and client.misses == 2
+
+    def test_list(self):
+        client = k8s.cached.CachedClient(self.api_client, [make_informer(self.pods)])
+        v1 = k8s.CoreV1Api(client)
+
+        ret = fakes.run(v1.list_namespaced_pod('default'))
+        assert isinstance(ret.obj, k8s.V1PodList)
+        assert ret.obj.kind == 'PodList'
+        assert ret.obj.metadata.resource_version == '10'
+        assert sorted(_.metadata.name for _ in ret.obj.items) == ['a', 'b']
+
+        ret = fakes.run(v1.list_pod_for_all_namespaces(label_selector='app=foo'))
+        assert sorted(_.metadata.name for _ in ret.obj.items) == ['a', 'c']
+
+        ret = fakes.run(v1.list_pod_for_all_namespaces(
+            field_selector='metadata.namespace=other'))
+        assert [_.metadata.name for _ in ret.obj.items] == ['c']
+
+        ret = fakes.run(v1.list_pod_for_all_namespaces(
+            label_selector='app notin (bar)', field_selector='metadata.name!=a'))
+        assert [_.metadata.name for _ in ret.obj.items] == ['c']
+        assert not self.api_client.call_api.called
+
+    def test_list_index(self):
+        """Use the label index of the store."""
+        informer = make_informer(self.pods)
+        informer.add_index('app', k8s.informer.index_label('app'))
+        client = k8s.cached.CachedClient(self.api_client, [informer])
+        v1 = k8s.CoreV1Api(client)
+
+        call = v1.list_namespaced_pod('default', label_selector='app=foo')
+        with mock.patch.object(informer.store, 'list') as m_list:
+            ret = fakes.run(call)
+        assert not m_list.called
+        assert [_.metadata.name for _ in ret.obj.items] == ['a']
+
+    @pytest.mark.parametrize('kwargs', [
+        {'watch': True},
+        {'limit': 5},
+        {'resource_version': '5'},
+        {'label_selector': 'app in foo'},
+        {'field_selector': 'spec.nodeName'},
+    ])
+    def test_forward(self, kwargs):
+        """Forward all queries the store cannot answer to K8s."""
+        client = k8s.cached.CachedClient(self.api_client, [make_informer(self.pods)])
+        v1 = k8s.CoreV1Api(client)
+        ret = fakes.run(v1.list_namespaced_pod('default', **kwargs))
+        assert ret.http == 'server'
+
+    def test_scope(self):
+        """Informers must only answer queries they cover."""
+        informer = make_informer(self.pods[:1], 'default', label_selector='app=foo')
+        client = k8s.cached.CachedClient(self.api_client, [informer])
+        v1 = k8s.CoreV1Api(client)
+
+        ret = fakes.run(v1.list_namespaced_pod('default', label_selector='app=foo'))
+        assert ret.http is None and len(ret.obj.items) == 1
+
+        for call in (v1.list_namespaced_pod('default'),
+                     v1.list_namespaced_pod('other', label_selector='app=foo'),
+                     v1.list_pod_for_all_namespaces(label_selector='app=foo'),
+                     v1.list_namespaced_config_map('default')):
+            assert fakes.run(call).http == 'server'
+
+    def test_writes(self):
+        client = k8s.cached.CachedClient(self.api_client, [make_informer(self.pods)])
+        v1 = k8s.CoreV1Api(client)
+        body = k8s.V1DeleteOptions()
+        ret = fakes.run(v1.delete_namespaced_pod('a', 'default', body))
+        assert ret.http == 'server'
+        args, kwargs = self.api_client.call_api.call_args
+        assert args[:2] == ('/api/v1/namespaces/{namespace}/pods/{name}', 'DELETE')
+        assert kwargs['response_type'] == 'V1Status'
+
+    def test_not_synced(self):
+        proxy = k8s.api_proxy.Proxy(k8s.configuration.Configuration())
+        informer = k8s.informer.Informer(
+            FakeClient([]), k8s.CoreV1Api(proxy).list_pod_for_all_namespaces)
+        client = k8s.cached.CachedClient(self.api_client, [informer])
+        ret = fakes.run(k8s.CoreV1Api(client).list_namespaced_pod('default'))
+        assert ret.http == 'server'
+
+    def test_invalid_informer(self):
+        proxy = k8s.api_proxy.Proxy(k8s.configuration.Configuration())
+        informer = k8s.informer.Informer(
+            FakeClient([]), k8s.CoreV1Api(proxy).read_namespaced_pod, 'a', 'b')
+        with pytest.raises(ValueError):
+            k8s.cached.CachedClient(self.api_client, [informer])
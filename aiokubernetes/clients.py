@@ -1,12 +1,120 @@
+import asyncio
 import ssl
+from urllib.parse import parse_qsl, urlparse
 
 import aiohttp
 import requests
 
+import aiokubernetes as k8s
+
+# Names of the connection lanes. Long lived streams like watches use the
+# `stream` lane, everything else the `default` lane.
+LANES = ('default', 'stream')
+
+# Query parameters that turn a request into a long lived stream.
+STREAM_PARAMS = ('watch', 'follow')
+
+
+def is_streaming(url, query_params=None):
+    """Return True if the request to `url` is a long lived stream.
+
+    This is the case for watches, followed logs and all Websocket connections
+    like `exec`, `attach` or `portforward`.
+
+    Inputs:
+        url: str
+            Request URL, possibly with a query string.
+        query_params: dict|list
+            Query parameters that are not (yet) part of `url`.
+
+    Returns:
+        bool
+    """
+    parts = urlparse(url)
+    if parts.path.rstrip('/').rsplit('/', 1)[-1] in ('exec', 'attach', 'portforward'):
+        return True
+
+    if isinstance(query_params, dict):
+        query_params = list(query_params.items())
+    params = parse_qsl(parts.query) + list(query_params or [])
+    return any(
+        key in STREAM_PARAMS and str(value).lower() == 'true'
+        for key, value in params
+    )
+
+
+def get_connector(config, ssl_context, lane='default'):
+    """Return an aiohttp connector with the pool settings from `config`.
+
+    Inputs:
+        config: k8s.configuration.Config instance
+        ssl_context: ssl.SSLContext
+            The context with the CA and client certificates.
+        lane: str
+            Must be one of `LANES`. The `stream` lane has its own size limit.
+
+    Returns:
+        aiohttp.TCPConnector
+    """
+    assert lane in LANES, f'Unknown connection lane <{lane}>'
+    if lane == 'stream':
+        limit = config.stream_connection_pool_maxsize
+    else:
+        limit = config.connection_pool_maxsize
+
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=config.connection_pool_maxsize_per_host,
+        keepalive_timeout=config.connection_keepalive_timeout,
+        ttl_dns_cache=config.dns_cache_ttl,
+        ssl_context=ssl_context,
+        verify_ssl=config.verify_ssl  # Bool, usually True.
+    )
+
+
+async def prewarm(session, config):
+    """Open `config.connection_prewarm` connections to the API server.
+
+    This makes the TCP and TLS handshakes before the first real request needs
+    them. The connections remain in the pool of `session` until they exceed
+    `config.connection_keepalive_timeout`.
+
+    Inputs:
+        session: aiohttp.ClientSession
+        config: k8s.configuration.Config instance
+    """
+    url = config.host + '/version'
+
+    async def connect():
+        # The response is irrelevant. Even a 401 or 403 returns a perfectly
+        # usable connection to the pool.
+        try:
+            resp = await session.request('GET', url)
+            await resp.read()
+            resp.release()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            pass
+
+    # Issue all requests concurrently to force the pool to open one connection
+    # for each.
+    await asyncio.gather(*[connect() for _ in range(config.connection_prewarm)])
+
+
+def get_ssl_context(config):
+    """Return the SSL context with the CA and client certificates in `config`."""
+    ssl_context = ssl.create_default_context(cafile=config.ssl_ca_cert)
+    if config.cert_file:
+        ssl_context.load_cert_chain(config.cert_file, keyfile=config.key_file)
+    return ssl_context
+
 
 def get_aiohttp(config):
     """Return a configured AioHttp client.
 
+    The client is a `LaneSession` that keeps long lived streams like watches
+    and ordinary requests in separate connection pools. Use it like an
+    `aiohttp.ClientSession`, ie `await client.request(**cargs)`.
+
     NOTE: this is a convenience function only to reduce boiler plate.
 
     Inputs:
@@ -14,18 +122,76 @@ def get_aiohttp(config):
             Typically you pass it whatever `k8s.utils.load_config()` returns.
 
     Returns:
-        Requests session instance.
+        LaneSession
     """
-    ssl_context = ssl.create_default_context(cafile=config.ssl_ca_cert)
-    if config.cert_file:
-        ssl_context.load_cert_chain(config.cert_file, keyfile=config.key_file)
+    ssl_context = get_ssl_context(config)
+    default = aiohttp.ClientSession(connector=get_connector(config, ssl_context))
+    stream = aiohttp.ClientSession(
+        connector=get_connector(config, ssl_context, lane='stream'))
 
-    connector = aiohttp.TCPConnector(
-        limit=4,
-        ssl_context=ssl_context,
-        verify_ssl=config.verify_ssl  # Bool, usually True.
+    # Rate limit all requests if the configuration asks for it.
+    return LaneSession(
+        default=k8s.ratelimit.limit_session(default, config),
+        stream=k8s.ratelimit.limit_session(stream, config),
     )
-    return aiohttp.ClientSession(connector=connector)
+
+
+class LaneSession:
+    """Route long lived streams and short requests through separate sessions.
+
+    Every session has its own connection pool. Watches, followed logs and
+    Websockets will therefore never occupy the connections that ordinary
+    GET/PATCH/... requests need.
+
+    Inputs:
+        default: aiohttp.ClientSession
+            For all ordinary requests.
+        stream: aiohttp.ClientSession
+            For watches, followed logs and Websockets.
+    """
+    def __init__(self, default, stream):
+        self.default = default
+        self.stream = stream
+
+    def get_session(self, url, params=None):
+        """Return the session for the request to `url`."""
+        return self.stream if is_streaming(url, params) else self.default
+
+    def request(self, method, url, **kwargs):
+        return self.get_session(url, kwargs.get('params')).request(
+            method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def ws_connect(self, url, **kwargs):
+        return self.stream.ws_connect(url, **kwargs)
+
+    @property
+    def closed(self):
+        return self.default.closed and self.stream.closed
+
+    async def close(self):
+        await self.default.close()
+        await self.stream.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
 
 
 def get_requests(config):
@@ -0,0 +1,144 @@
+import unittest.mock as mock
+
+import aiohttp
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+
+
+class TestConnectionPool:
+    @mock.patch.object(k8s.clients.aiohttp, 'TCPConnector')
+    def test_get_connector(self, m_connector):
+        config = k8s.configuration.Configuration()
+        config.connection_pool_maxsize = 20
+        config.connection_pool_maxsize_per_host = 10
+        config.connection_keepalive_timeout = 30
+        config.dns_cache_ttl = None
+        config.verify_ssl = False
+
+        ret = k8s.clients.get_connector(config, 'ssl-context')
+        assert ret is m_connector.return_value
+        m_connector.assert_called_once_with(
+            limit=20,
+            limit_per_host=10,
+            keepalive_timeout=30,
+            ttl_dns_cache=None,
+            ssl_context='ssl-context',
+            verify_ssl=False,
+        )
+
+    def test_default_pool_size(self):
+        # The pool must be large enough to not serialise concurrent requests.
+        config = k8s.configuration.Configuration()
+        assert config.connection_pool_maxsize >= 100
+        assert config.connection_prewarm == 0
+
+    def test_prewarm(self):
+        config = k8s.configuration.Configuration()
+        config.host = 'https://k8s'
+        config.connection_prewarm = 3
+
+        responses = [mock.MagicMock(), aiohttp.ClientConnectionError()]
+        urls = []
+
+        async def request(method, url):
+            urls.append((method, url))
+            ret = responses[len(urls) % 2]
+            if isinstance(ret, Exception):
+                raise ret
+            ret.read = fakes.AsyncMock()
+            return ret
+
+        session = mock.MagicMock(request=request)
+        fakes.run(k8s.clients.prewarm(session, config))
+        assert urls == [('GET', 'https://k8s/version')] * 3
+        responses[0].release.assert_called_with()
+
+    @mock.patch.object(k8s.clients.aiohttp, 'TCPConnector')
+    def test_get_connector_stream_lane(self, m_connector):
+        config = k8s.configuration.Configuration()
+        config.connection_pool_maxsize = 20
+        config.stream_connection_pool_maxsize = 5
+
+        k8s.clients.get_connector(config, 'ssl-context', lane='stream')
+        assert m_connector.call_args[1]['limit'] == 5
+
+
+class TestLanes:
+    def test_is_streaming(self):
+        fun = k8s.clients.is_streaming
+        assert fun('https://k8s/api/v1/pods?watch=True')
+        assert fun('https://k8s/api/v1/pods?limit=5&watch=true')
+        assert fun('https://k8s/api/v1/pods', {'watch': True})
+        assert fun('https://k8s/api/v1/pods', [('watch', True)])
+        assert fun('https://k8s/api/v1/namespaces/ns/pods/foo/log?follow=True')
+        assert fun('https://k8s/api/v1/namespaces/ns/pods/foo/exec?command=ls')
+        assert fun('https://k8s/api/v1/namespaces/ns/pods/foo/attach')
+
+        assert not fun('https://k8s/api/v1/pods')
+        assert not fun('https://k8s/api/v1/pods?watch=False')
+        assert not fun('https://k8s/api/v1/pods', {'watch': False})
+        assert not fun('https://k8s/api/v1/namespaces/ns/pods/foo/log')
+        assert not fun('https://k8s/api/v1/namespaces/exec/pods')
+
+    def test_lane_session(self):
+        default, stream = mock.MagicMock(), mock.MagicMock()
+        default.close = fakes.AsyncMock()
+        stream.close = fakes.AsyncMock()
+        client = k8s.clients.LaneSession(default=default, stream=stream)
+
+        # Use the Proxy to compile the requests just like a user would.
+        proxy = k8s.api_proxy.Proxy(k8s.configuration.Configuration())
+        corev1 = k8s.CoreV1Api(proxy)
+
+        client.request(**corev1.list_namespaced_pod('ns', watch=True))
+        assert stream.request.call_count == 1
+        assert default.request.call_count == 0
+
+        client.request(**corev1.read_namespaced_pod('foo', 'ns'))
+        assert stream.request.call_count == 1
+        assert default.request.call_count == 1
+
+        fakes.run(client.close())
+        default.close.assert_called_once_with()
+        stream.close.assert_called_once_with()
+
+    def test_get_aiohttp(self):
+        """The default client must keep streams and requests apart."""
+        config = k8s.configuration.Configuration()
+        config.connection_pool_maxsize = 20
+        config.stream_connection_pool_maxsize = 5
+
+        async def run():
+            client = k8s.clients.get_aiohttp(config)
+            assert isinstance(client, k8s.clients.LaneSession)
+            assert client.default.connector.limit == 20
+            assert client.stream.connector.limit == 5
+            async with client:
+                assert not client.closed
+            assert client.closed
+
+        fakes.run(run())
+
+    def test_api_client(self):
+        """`ApiClient` must route on watch/follow, not on `_preload_content`."""
+        sessions = []
+
+        async def http_request(session, *args, **kwargs):
+            sessions.append(session)
+            return fakes.FakeResponse(data={})
+
+        async def run():
+            client = k8s.api_client.ApiClient(k8s.configuration.Configuration())
+            v1 = k8s.CoreV1Api(client)
+            with mock.patch.object(client, 'http_request', side_effect=http_request):
+                # Pager style LIST page.
+                await v1.list_namespaced_pod('ns', limit=5, _preload_content=False)
+                await v1.list_namespaced_pod('ns', watch=True, _preload_content=False)
+                await v1.read_namespaced_pod_log('foo', 'ns', follow=True)
+            await client.close()
+            return client
+
+        client = fakes.run(run())
+        stream = client.stream_session
+        assert sessions == [client.session, stream, stream]
@@ -0,0 +1,123 @@
+"""Pluggable Json backends.
+
+The standard library `json` module is comparatively slow. This module wraps
+faster alternatives behind a common `Codec` interface, so that the rest of
+the library can use whichever one is installed:
+
+    config.json_codec = 'orjson'    # or 'ujson', 'msgspec', 'json', 'auto'
+
+All codecs accept `bytes` and `str` in `loads` and raise `ValueError` for
+invalid Json. `dumps` returns either `str` or `bytes`, both of which aiohttp
+accepts as request body.
+"""
+import json
+from collections import namedtuple
+
+# The Json backend: `loads(data) -> object` and `dumps(obj) -> str|bytes`.
+Codec = namedtuple('Codec', 'name loads dumps')
+
+# Order of preference when the user asks for the 'auto' codec.
+AUTO_ORDER = ('orjson', 'msgspec', 'ujson', 'json')
+
+# Cache for the codecs, keyed by name.
+_CODECS = {}
+
+
+def _make_json():
+    return Codec('json', json.loads, json.dumps)
+
+
+def _make_orjson():
+    import orjson
+    return Codec('orjson', orjson.loads, orjson.dumps)
+
+
+def _make_ujson():
+    import ujson
+
+    def dumps(obj):
+        return ujson.dumps(obj, escape_forward_slashes=False)
+    return Codec('ujson', ujson.loads, dumps)
+
+
+def _make_msgspec():
+    import msgspec
+    decoder, encoder = msgspec.json.Decoder(), msgspec.json.Encoder()
+
+    # Raise the same exception as all other codecs for invalid Json.
+    def loads(data):
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as err:
+            raise ValueError(str(err))
+    return Codec('msgspec', loads, encoder.encode)
+
+
+_FACTORIES = {
+    'json': _make_json,
+    'orjson': _make_orjson,
+    'ujson': _make_ujson,
+    'msgspec': _make_msgspec,
+}
+
+
+def get_codec(name=None):
+    """Return the Json codec `name`.
+
+    Inputs:
+        name: str|Codec|Configuration
+            One of 'json', 'orjson', 'ujson', 'msgspec' or 'auto'. The latter
+            picks the fastest installed backend. Codecs are returned verbatim
+            and `Configuration` instances use their `json_codec`. None means
+            'json'.
+
+    Returns:
+        Codec
+
+    Raises:
+        ValueError: if the codec is unknown.
+        ImportError: if the codec is not installed.
+    """
+    if isinstance(name, Codec):
+        return name
+    if name is None:
+        name = 'json'
+    elif not isinstance(name, str):
+        name = name.json_codec or 'json'
+
+    try:
+        return _CODECS[name]
+    except KeyError:
+        pass
+
+    if name == 'auto':
+        for candidate in AUTO_ORDER:
+            try:
+                codec = get_codec(candidate)
+                break
+            except ImportError:
+                continue
+    elif name in _FACTORIES:
+        codec = _FACTORIES[name]()
+    else:
+        raise ValueError(f'Unknown Json codec <{name}>')
+
+    _CODECS[name] = codec
+    return codec
+
+
+def get_codec_for(fun):
+    """Return the codec configured for the API method `fun`.
+
+    Input:
+        fun: callable
+            Generated API method bound to an `ApiClient` or `api_proxy.Proxy`,
+            eg `k8s.CoreV1Api(proxy).list_namespaced_pod`.
+
+    Returns:
+        Codec: the codec of the client configuration, or the standard
+            library codec if `fun` is not bound to a client.
+    """
+    client = getattr(getattr(fun, '__self__', None), 'api_client', None)
+    config = getattr(client, 'config', None) or getattr(client, 'configuration', None)
+    return get_codec(config)
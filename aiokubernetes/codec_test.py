@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes.fakes_test import event_line, make_pod
+
+
+class TestCodec:
+    @pytest.mark.parametrize('name', ['json', 'orjson', 'ujson', 'msgspec'])
+    def test_roundtrip(self, name):
+        if name != 'json':
+            pytest.importorskip(name)
+        codec = k8s.codec.get_codec(name)
+        assert codec.name == name
+        assert k8s.codec.get_codec(name) is codec
+
+        obj = {'a': [1, 2.5, None, True], 'b': {'c': 'ü/x'}}
+        data = codec.dumps(obj)
+        assert isinstance(data, (str, bytes))
+        assert json.loads(data) == obj
+        assert codec.loads(data) == obj
+        assert codec.loads(json.dumps(obj).encode('utf8')) == obj
+
+        for invalid in (b'{"a": ', b'\xff'):
+            with pytest.raises(ValueError):
+                codec.loads(invalid)
+
+    def test_get_codec(self):
+        json_codec = k8s.codec.get_codec('json')
+        assert k8s.codec.get_codec(None) is json_codec
+        assert k8s.codec.get_codec(json_codec) is json_codec
+        assert k8s.codec.get_codec('auto').name in k8s.codec.AUTO_ORDER
+
+        config = k8s.configuration.Configuration()
+        assert k8s.codec.get_codec(config) is json_codec
+
+        with pytest.raises(ValueError):
+            k8s.codec.get_codec('foo')
+
+    def test_get_codec_for(self):
+        """Use the codec of the configuration the API method is bound to."""
+        config = k8s.configuration.Configuration()
+        config.json_codec = 'auto'
+        fun = k8s.CoreV1Api(k8s.api_proxy.Proxy(config)).list_namespaced_pod
+        assert k8s.codec.get_codec_for(fun) is k8s.codec.get_codec('auto')
+        assert k8s.codec.get_codec_for(len) is k8s.codec.get_codec('json')
+
+    def test_proxy(self):
+        pytest.importorskip('orjson')
+        config = k8s.configuration.Configuration()
+        config.json_codec = 'orjson'
+        body = {'some': 'body'}
+        cargs = k8s.api_proxy.Proxy(config).call_api(
+            '/foo', 'POST', path_params={}, query_params=[], header_params={},
+            post_params={}, body=body, auth_settings=[])
+        assert cargs['data'] == b'{"some":"body"}'
+
+    def test_unpack(self):
+        codec = k8s.codec.get_codec('auto')
+        pod = make_pod('a')
+        line = event_line('ADDED', pod)
+        assert k8s.swagger.unpack_watch(line, codec) == k8s.swagger.unpack_watch(line)
+        assert k8s.swagger.parse_watch(b'{', codec) is None
+
+        data = json.dumps(k8s.api_proxy.sanitize_for_serialization(pod)).encode()
+        assert k8s.swagger.unpack(data, codec) == pod
+        assert k8s.swagger.unpack(b'\xff', codec) is None
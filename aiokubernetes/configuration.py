@@ -54,6 +54,62 @@ class Configuration():
         # Safe chars for path_param
         self.safe_chars_for_path_param = ''
 
+        # Connection pool of the aiohttp session.
+        # Maximum number of simultaneous connections (0 means unlimited).
+        self.connection_pool_maxsize = 100
+        # Maximum number of simultaneous connections to the same host (0 means
+        # unlimited).
+        self.connection_pool_maxsize_per_host = 0
+        # Seconds to keep idle connections open for re-use.
+        self.connection_keepalive_timeout = 15
+        # Seconds to cache DNS lookups (None means forever).
+        self.dns_cache_ttl = 10
+        # Number of connections to establish in advance with `clients.prewarm`.
+        self.connection_prewarm = 0
+        # Long lived streams (watches, log follows, exec) use a dedicated
+        # connection pool with this many connections (0 means unlimited), so
+        # that they can never starve ordinary requests.
+        self.stream_connection_pool_maxsize = 100
+
+        # Client side rate limiting (see `ratelimit.RateLimiter`).
+        # Sustained requests per second (None disables the rate limiter).
+        self.qps = None
+        # Maximum number of requests that may be made back-to-back.
+        self.burst = None
+        # Optional per verb/resource limits, eg {('LIST', 'pods'): (5, 10)}.
+        self.rate_limits = None
+        # The `RateLimiter` instance shared by all sessions of this config. It
+        # is created on demand and also provides the metrics.
+        self.rate_limiter = None
+
+        # Retry idempotent requests after 429, 5xx and connection errors (see
+        # `retry.RetryPolicy`).
+        # Maximum number of retries per request (0 disables retries).
+        self.max_retries = 0
+        # Base delay in seconds for the jittered exponential backoff.
+        self.retry_backoff = 0.5
+        # Maximum delay in seconds between two attempts.
+        self.retry_backoff_max = 30
+        # The `RetryPolicy` instance shared by all clients of this config. It
+        # is created on demand and also provides the metrics.
+        self.retry_policy = None
+
+        # Json backend for requests, responses and watch events: 'json' (the
+        # standard library), 'orjson', 'ujson', 'msgspec' or 'auto' to pick the
+        # fastest installed one (see `codec.get_codec`).
+        self.json_codec = 'json'
+
+        # Merge identical concurrent GET requests of an `ApiClient` into one
+        # (see `singleflight.SingleFlight`). All callers then share the same
+        # response object and must not modify it.
+        self.coalesce_requests = False
+
+        # Serve repeated GET requests of an `ApiClient` from a local LRU cache
+        # (see `cache.ResponseCache`). The cache holds at most this many
+        # responses (0 disables it) for `response_cache_ttl` seconds each.
+        self.response_cache_size = 0
+        self.response_cache_ttl = 5
+
     def get_api_key_with_prefix(self, identifier):
         """Gets API key (with prefix if set).
 
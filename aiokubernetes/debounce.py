@@ -0,0 +1,159 @@
+"""Collapse bursts of watch events for the same object.
+
+Busy objects like Endpoints, Nodes or leader election ConfigMaps change
+several times per second. Handlers that reconcile the full object for every
+MODIFIED event do a lot of redundant work. A `Debouncer` holds back the
+events of every object until it has been quiet for `window` seconds (but at
+most `max_delay` seconds) and then only yields its latest state.
+
+Example:
+
+    watch = k8s.watch.ResumableWatch(client, v1.list_endpoints_for_all_namespaces)
+    async for event in k8s.debounce.Debouncer(watch, window=0.5):
+        reconcile(event.name, event.obj)
+
+The collapsed event keeps the type of the first event if that was ADDED, ie
+ADDED followed by MODIFIED yields a single ADDED with the latest state. DELETED
+events are never delayed or merged with later events: they discard the pending
+event of the object and are yielded immediately. ADDED followed by DELETED
+within the window therefore only yields the DELETED event. This ensures that
+handlers always see the deletion, even if the object is re-created right away.
+All other events, eg ERROR or BOOKMARK, pass through unchanged.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+
+from aiokubernetes.watch import WatchResponse
+
+
+def object_key(event):
+    """Return the (namespace, name) of the object in `event` or None."""
+    if event.name not in ('ADDED', 'MODIFIED', 'DELETED') or not event.manifest:
+        return None
+    metadata = event.manifest.get('metadata') or {}
+    return (metadata.get('namespace'), metadata.get('name'))
+
+
+class Debouncer(object):
+    """Async iterator that collapses bursts of events for the same object.
+
+    Inputs:
+        watch: async iterator
+            Produces `WatchResponse` objects, eg `watch.ResumableWatch`.
+        window: float
+            Yield the latest event of an object once no other event for it
+            arrived for this many seconds.
+        max_delay: float
+            Never delay an event by more than this many seconds, even if the
+            object changes continuously. Defaults to 10 * `window`.
+    """
+    def __init__(self, watch, window=1, max_delay=None):
+        self.watch = watch
+        self.window = window
+        self.max_delay = 10 * window if max_delay is None else max_delay
+
+        # {key: [event, time of first event, time of last event]} in the order
+        # the objects first appeared.
+        self._pending = OrderedDict()
+
+        # Events that are due, and the exception that ended the watch.
+        self._ready = deque()
+        self._error = None
+        self._done = False
+
+        self._wakeup = asyncio.Event()
+        self._task = None
+
+        # Metrics: events that were merged into a pending event.
+        self.coalesced = 0
+
+    def __len__(self):
+        """Number of objects with a pending event."""
+        return len(self._pending)
+
+    def __aiter__(self):
+        return self
+
+    def push(self, event, now=None):
+        """Add `event` to the pending or ready events."""
+        now = time.monotonic() if now is None else now
+        key = object_key(event)
+        if key is None:
+            self._ready.append(event)
+        elif event.name == 'DELETED':
+            # The deletion supersedes any pending event for this object.
+            if self._pending.pop(key, None) is not None:
+                self.coalesced += 1
+            self._ready.append(event)
+        elif key in self._pending:
+            entry = self._pending[key]
+            if entry[0].name == 'ADDED':
+                event = WatchResponse(
+                    name='ADDED', raw=event.raw, manifest=event.manifest)
+            entry[0], entry[2] = event, now
+            self.coalesced += 1
+        else:
+            self._pending[key] = [event, now, now]
+        self._wakeup.set()
+
+    def flush(self, now=None):
+        """Move all pending events that are due to the ready queue.
+
+        Returns:
+            float: seconds until the next pending event is due, or None.
+        """
+        now = time.monotonic() if now is None else now
+        delay = None
+        for key, (event, first, last) in list(self._pending.items()):
+            due = min(last + self.window, first + self.max_delay)
+            if self._done or due <= now:
+                del self._pending[key]
+                self._ready.append(event)
+            elif delay is None or due - now < delay:
+                delay = due - now
+        return delay
+
+    async def __anext__(self):
+        if self._task is None and not self._done:
+            self._task = asyncio.ensure_future(self._read())
+
+        while True:
+            delay = self.flush()
+            if self._ready:
+                return self._ready.popleft()
+            if self._done:
+                if self._error is not None:
+                    err, self._error = self._error, None
+                    raise err
+                raise StopAsyncIteration
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _read(self):
+        """Feed all events from the watch into `push`."""
+        try:
+            async for event in self.watch:
+                self.push(event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self._error = err
+        finally:
+            self._done = True
+            self._wakeup.set()
+
+    def close(self):
+        """Stop reading the watch. Pending events are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+        self._pending.clear()
+        self._ready.clear()
+        self._done = True
+        close = getattr(self.watch, 'close', None)
+        if close is not None:
+            close()
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeWatch, make_event
+from aiokubernetes.watch import WatchResponse
+
+
+def summary(events):
+    return [(_.name, _.manifest['metadata']['name'],
+             _.manifest['metadata']['resourceVersion']) for _ in events]
+
+
+class TestDebouncer:
+    def test_push_flush(self):
+        deb = k8s.debounce.Debouncer(FakeWatch([]), window=1, max_delay=5)
+        deb.push(make_event('ADDED', 'a', rv='1'), now=0)
+        deb.push(make_event('MODIFIED', 'a', rv='2'), now=0.5)
+        deb.push(make_event('MODIFIED', 'b', rv='3'), now=0.5)
+        deb.push(make_event('MODIFIED', 'b', rv='4'), now=0.6)
+        assert len(deb) == 2 and deb.coalesced == 2
+
+        # Nothing is due yet: 'a' is due at 1.5 and 'b' at 1.6.
+        assert deb.flush(now=1) == pytest.approx(0.5)
+        assert len(deb._ready) == 0
+
+        # ADDED followed by MODIFIED must remain ADDED.
+        assert deb.flush(now=1.5) == pytest.approx(0.1)
+        assert summary(deb._ready) == [('ADDED', 'a', '2')]
+        assert deb.flush(now=2) is None
+        assert summary(deb._ready) == [('ADDED', 'a', '2'), ('MODIFIED', 'b', '4')]
+
+    def test_max_delay(self):
+        """Continuously changing objects must be yielded after `max_delay`."""
+        deb = k8s.debounce.Debouncer(FakeWatch([]), window=1, max_delay=3)
+        for idx in range(6):
+            deb.push(make_event('MODIFIED', 'a', rv=str(idx)), now=idx * 0.5)
+            deb.flush(now=idx * 0.5)
+        assert summary(deb._ready) == []
+        deb.flush(now=3)
+        assert summary(deb._ready) == [('MODIFIED', 'a', '5')]
+
+    def test_delete(self):
+        deb = k8s.debounce.Debouncer(FakeWatch([]), window=1)
+        deb.push(make_event('ADDED', 'a', rv='1'), now=0)
+        deb.push(make_event('MODIFIED', 'a', rv='2'), now=0)
+        deb.push(make_event('MODIFIED', 'b', rv='3'), now=0)
+
+        # Deletions are yielded immediately and supersede the pending event.
+        deb.push(make_event('DELETED', 'a', rv='4'), now=0)
+        assert summary(deb._ready) == [('DELETED', 'a', '4')]
+
+        # Re-create the object: the new ADDED must not be merged with DELETED.
+        deb.push(make_event('ADDED', 'a', rv='5'), now=0)
+        deb.flush(now=2)
+        assert summary(deb._ready) == [
+            ('DELETED', 'a', '4'), ('MODIFIED', 'b', '3'), ('ADDED', 'a', '5'),
+        ]
+
+    def test_added_deleted(self):
+        """ADDED followed by DELETED within the window only yields DELETED."""
+        deb = k8s.debounce.Debouncer(FakeWatch([]), window=1)
+        deb.push(make_event('ADDED', 'a', rv='1'), now=0)
+        deb.push(make_event('DELETED', 'a', rv='2'), now=0.5)
+        assert deb.flush(now=2) is None
+        assert summary(deb._ready) == [('DELETED', 'a', '2')]
+        assert len(deb) == 0 and deb.coalesced == 1
+
+    def test_passthrough(self):
+        deb = k8s.debounce.Debouncer(FakeWatch([]), window=1)
+        error = WatchResponse(name='ERROR', raw=b'', manifest={'code': 500})
+        deb.push(error, now=0)
+        assert list(deb._ready) == [error]
+
+    def test_iterate(self):
+        events = [
+            make_event('ADDED', 'a', rv='1'),
+            make_event('MODIFIED', 'a', rv='2'),
+            make_event('MODIFIED', 'a', rv='3'),
+            make_event('MODIFIED', 'b', rv='4'),
+            make_event('DELETED', 'b', rv='5'),
+        ]
+
+        async def run():
+            deb = k8s.debounce.Debouncer(FakeWatch(events), window=0.01)
+            return [_ async for _ in deb], deb.coalesced
+
+        ret, coalesced = fakes.run(run())
+        assert summary(ret) == [('DELETED', 'b', '5'), ('ADDED', 'a', '3')]
+        assert coalesced == 3
+
+    def test_window(self):
+        """Events must be yielded once the window expired, not at the end."""
+        class SlowWatch(FakeWatch):
+            async def __anext__(self):
+                if not self.events:
+                    await asyncio.sleep(10)
+                return await super().__anext__()
+
+        async def run():
+            events = [make_event('MODIFIED', 'a', rv=str(_)) for _ in range(3)]
+            watch = SlowWatch(events)
+            deb = k8s.debounce.Debouncer(watch, window=0.01)
+            event = await asyncio.wait_for(deb.__anext__(), 1)
+            deb.close()
+            assert watch.closed
+            with pytest.raises(StopAsyncIteration):
+                await deb.__anext__()
+            return event
+
+        assert summary([fakes.run(run())]) == [('MODIFIED', 'a', '2')]
+
+    def test_error(self):
+        async def run():
+            watch = FakeWatch([make_event('MODIFIED', 'a')], error=ValueError())
+            deb = k8s.debounce.Debouncer(watch, window=10)
+            ret = [await deb.__anext__()]
+            with pytest.raises(ValueError):
+                await deb.__anext__()
+            return ret
+
+        assert summary(fakes.run(run())) == [('MODIFIED', 'a', '1')]
+
+    def test_close(self):
+        """Closing the debouncer must not record the cancellation as an error."""
+        class BlockingWatch(FakeWatch):
+            async def __anext__(self):
+                await asyncio.sleep(10)
+
+        async def run():
+            watch = BlockingWatch([])
+            deb = k8s.debounce.Debouncer(watch, window=1)
+            task = asyncio.ensure_future(deb.__anext__())
+            await asyncio.sleep(0.01)
+            reader = deb._task
+            deb.close()
+            task.cancel()
+            await asyncio.gather(reader, task, return_exceptions=True)
+            return deb, watch
+
+        deb, watch = fakes.run(run())
+        assert deb._error is None and watch.closed
@@ -0,0 +1,268 @@
+"""Cached request templates shared by `ApiClient` and `api_proxy.Proxy`.
+
+Both clients turn the arguments of a generated API method into a URL. The
+naive approach re-parses the resource path, eg
+"/api/v1/namespaces/{namespace}/pods/{name}", and runs every parameter
+through the generic serialiser for every single request.
+
+This module parses every resource path only once into a `PathTemplate` and
+offers a fast path for the (typical) parameter dicts that contain nothing but
+strings and numbers.
+
+The generated `*_with_http_info` methods delegate to an `Endpoint` that holds
+everything the Swagger templates used to rebuild for every call, ie the valid
+keyword arguments, the query parameter names and the `Accept` and
+`Content-Type` headers (see `create-client/endpoints.py`).
+"""
+import re
+from urllib.parse import quote
+
+import aiokubernetes as k8s
+
+# Matches the placeholders in resource paths, eg "{namespace}".
+_RE_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+# Path values that consist only of these characters need no quoting. This
+# covers all K8s names since they must be valid DNS (sub)domains.
+_RE_UNRESERVED = re.compile(r'[A-Za-z0-9._~-]*')
+
+# Parameter values of these types need no serialisation.
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Cache for the `PathTemplate` of every resource path.
+_TEMPLATES = {}
+
+# Keyword arguments that every generated API method accepts.
+_COMMON_PARAMS = (
+    'async', '_return_http_data_only', '_preload_content', '_request_timeout',
+)
+
+
+class PathTemplate(object):
+    """Pre-parsed resource path like "/api/v1/namespaces/{namespace}/pods".
+
+    Inputs:
+        path: str
+            Resource path with placeholders in curly braces.
+    """
+    __slots__ = ('path', 'names', 'fmt')
+
+    def __init__(self, path):
+        self.path = path
+
+        # "/a/{x}/b/{y}" -> names=('x', 'y') and fmt="/a/{}/b/{}". Escape all
+        # other curly braces to not confuse `str.format`.
+        self.names = tuple(_RE_PLACEHOLDER.findall(path))
+        literals = _RE_PLACEHOLDER.split(path)[::2]
+        literals = [_.replace('{', '{{').replace('}', '}}') for _ in literals]
+        self.fmt = str.join('{}', literals)
+
+    def expand(self, path_params, safe=''):
+        """Return the path with all placeholders replaced by `path_params`.
+
+        Inputs:
+            path_params: dict
+                Values for the placeholders.
+            safe: str
+                Characters that must not be quoted (see `urllib.parse.quote`).
+
+        Returns:
+            str
+        """
+        if not self.names:
+            return self.path
+        return self.fmt.format(*[
+            quote_value(path_params[name], safe) for name in self.names
+        ])
+
+    def format(self, path_params):
+        """Return the path with all placeholders replaced by `path_params`.
+
+        Same as `path.format(**path_params)`, ie the values are not quoted.
+        `api_proxy` relies on that to pass values like 'system:node' or the
+        'a/b' of `*_proxy_with_path` methods through verbatim.
+        """
+        if not self.names:
+            return self.path
+        return self.fmt.format(*[path_params[name] for name in self.names])
+
+
+def get_template(path):
+    """Return the (cached) `PathTemplate` for the resource `path`."""
+    try:
+        return _TEMPLATES[path]
+    except KeyError:
+        template = _TEMPLATES[path] = PathTemplate(path)
+        return template
+
+
+def quote_value(value, safe=''):
+    """Return the URL quoted string representation of the path `value`."""
+    if type(value) is not str:
+        value = str(value)
+    if _RE_UNRESERVED.fullmatch(value):
+        return value
+    return quote(value, safe=safe)
+
+
+def sanitize_params(params):
+    """Return a Json compatible copy of the header, path or query `params`.
+
+    This is equivalent to `swagger.serialize` but avoids the per-value
+    dispatch if all values are strings or numbers, which is almost always the
+    case.
+
+    Input:
+        params: dict|list[tuple]
+            Eg {'Accept': 'application/json'} or [('limit', 5)].
+
+    Returns:
+        dict|list[tuple]: copy of `params`.
+    """
+    if not params:
+        return {} if isinstance(params, dict) else []
+
+    if isinstance(params, dict):
+        for value in params.values():
+            if type(value) not in _PRIMITIVE_TYPES:
+                return k8s.swagger.serialize(params)
+        return dict(params)
+
+    for item in params:
+        if type(item) is not tuple or type(item[1]) not in _PRIMITIVE_TYPES:
+            return k8s.swagger.serialize(params)
+    return list(params)
+
+
+def select_header_accept(accepts):
+    """Return the `Accept` header for the list of `accepts` (or None)."""
+    if not accepts:
+        return None
+
+    accepts = [x.lower() for x in accepts]
+    if 'application/json' in accepts:
+        return 'application/json'
+    return ', '.join(accepts)
+
+
+def select_header_content_type(content_types):
+    """Return the `Content-Type` header for the list of `content_types`."""
+    if not content_types:
+        return 'application/json'
+
+    content_types = [x.lower() for x in content_types]
+    if 'application/json' in content_types or '*/*' in content_types:
+        return 'application/json'
+    return content_types[0]
+
+
+class Endpoint(object):
+    """Static description of a generated API method, eg `list_namespaced_pod`.
+
+    Every generated `*_with_http_info` method owns one `Endpoint` instance and
+    forwards its arguments to `call`, which validates them and passes the
+    request to `call_api` of the `ApiClient` or `api_proxy.Proxy`.
+
+    Inputs:
+        name: str
+            Name of the API method (used in error messages).
+        path: str
+            Resource path, eg "/api/v1/namespaces/{namespace}/pods".
+        method: str
+            HTTP method, eg 'GET'.
+        required: tuple[str]
+            Names of the positional arguments of the method. These are the
+            path parameters and, if the method has one, the 'body'.
+        query: tuple[tuple[str, str]]
+            (argument name, query parameter name) of all optional query
+            parameters, eg ('_continue', 'continue').
+        accepts: tuple[str]|None
+            Response content types, eg ('application/json', ...).
+        content_types: tuple[str]|None
+            Request content types, eg ('*/*',).
+        response_type: str
+            Name of the Swagger type of the response, eg 'V1PodList'.
+        auth_settings: tuple[str]
+            Authentication setting identifiers, eg ('BearerToken',).
+    """
+    __slots__ = (
+        'name', 'path', 'method', 'required', 'query', 'params', 'headers',
+        'response_type', 'auth_settings',
+    )
+
+    def __init__(self, name, path, method, required=(), query=(), accepts=None,
+                 content_types=None, response_type=None, auth_settings=()):
+        self.name = name
+        self.path = path
+        self.method = method
+        self.required = required
+        self.query = query
+        self.response_type = response_type
+        self.auth_settings = list(auth_settings)
+
+        # All keyword arguments the method accepts.
+        self.params = frozenset([_[0] for _ in query] + list(_COMMON_PARAMS))
+
+        self.headers = {}
+        if accepts is not None:
+            self.headers['Accept'] = select_header_accept(accepts)
+        if content_types is not None:
+            self.headers['Content-Type'] = select_header_content_type(content_types)
+
+    def call(self, api_client, args, kwargs):
+        """Return `api_client.call_api(...)` for the method arguments.
+
+        Inputs:
+            api_client: ApiClient|api_proxy.Proxy
+                Typically the `api_client` attribute of the API class.
+            args: tuple
+                Values of the positional arguments (see `required`).
+            kwargs: dict
+                Keyword arguments of the method, eg {'label_selector': 'a=b'}.
+
+        Returns:
+            Whatever `api_client.call_api` returns.
+        """
+        params = self.params
+        for key in kwargs:
+            if key not in params:
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'"
+                    " to method %s" % (key, self.name)
+                )
+
+        path_params, body = {}, None
+        for key, value in zip(self.required, args):
+            if value is None:
+                raise ValueError(
+                    "Missing the required parameter `%s` when calling `%s`"
+                    % (key, self.name)
+                )
+            if key == 'body':
+                body = value
+            else:
+                path_params[key] = value
+
+        # Keep the order of the query parameters stable, irrespective of the
+        # order of the keyword arguments.
+        if kwargs:
+            query_params = [
+                (name, kwargs[key]) for key, name in self.query if key in kwargs
+            ]
+        else:
+            query_params = []
+
+        return api_client.call_api(
+            self.path, self.method,
+            path_params,
+            query_params,
+            dict(self.headers),
+            body=body,
+            post_params=[],
+            files={},
+            response_type=self.response_type,
+            auth_settings=self.auth_settings,
+            _return_http_data_only=kwargs.get('_return_http_data_only'),
+            _preload_content=kwargs.get('_preload_content', True),
+            _request_timeout=kwargs.get('_request_timeout'),
+            collection_formats={})
@@ -0,0 +1,103 @@
+import unittest.mock as mock
+
+import pytest
+
+import aiokubernetes as k8s
+
+
+class TestPathTemplate:
+    def test_expand(self):
+        path = '/api/v1/namespaces/{namespace}/pods/{name}/exec'
+        template = k8s.endpoint.get_template(path)
+        assert template.names == ('namespace', 'name')
+        assert k8s.endpoint.get_template(path) is template
+
+        ret = template.expand({'name': 'foo', 'namespace': 'bar'})
+        assert ret == '/api/v1/namespaces/bar/pods/foo/exec'
+
+        # Quote unusual values.
+        ret = template.expand({'name': 'a b/c', 'namespace': 5})
+        assert ret == '/api/v1/namespaces/5/pods/a%20b%2Fc/exec'
+        ret = template.expand({'name': 'a/b', 'namespace': 'x'}, safe='/')
+        assert ret == '/api/v1/namespaces/x/pods/a/b/exec'
+
+    def test_no_placeholders(self):
+        template = k8s.endpoint.get_template('/version/')
+        assert template.expand({}) == '/version/'
+
+
+class TestSanitizeParams:
+    def test_primitive(self):
+        fun = k8s.endpoint.sanitize_params
+        params = {'a': 'b', 'c': 1}
+        ret = fun(params)
+        assert ret == params and ret is not params
+
+        params = [('limit', 5), ('watch', True)]
+        ret = fun(params)
+        assert ret == params and ret is not params
+
+        assert fun({}) == {} and fun([]) == [] and fun(None) == []
+
+    def test_complex(self):
+        """Fall back to the generic serialiser for all other values."""
+        fun = k8s.endpoint.sanitize_params
+        obj = k8s.V1DeleteOptions(grace_period_seconds=0)
+        assert fun({'a': obj}) == {'a': {'gracePeriodSeconds': 0}}
+        assert fun([('command', ['ls', 'pwd'])]) == [('command', ['ls', 'pwd'])]
+
+
+class TestEndpoint:
+    def setup_method(self):
+        self.api_client = mock.MagicMock()
+        self.v1 = k8s.CoreV1Api(self.api_client)
+
+    def test_call(self):
+        self.v1.list_namespaced_pod('ns', watch=True, label_selector='a=b')
+        args, kwargs = self.api_client.call_api.call_args
+        assert args == (
+            '/api/v1/namespaces/{namespace}/pods', 'GET',
+            {'namespace': 'ns'},
+            [('labelSelector', 'a=b'), ('watch', True)],
+            {'Accept': 'application/json', 'Content-Type': 'application/json'},
+        )
+        assert kwargs == dict(
+            body=None, post_params=[], files={}, response_type='V1PodList',
+            auth_settings=['BearerToken'], _return_http_data_only=True,
+            _preload_content=True, _request_timeout=None, collection_formats={},
+        )
+
+        # Must not share the mutable arguments between calls.
+        args[4]['foo'] = 'bar'
+        self.v1.list_namespaced_pod('ns')
+        args, _ = self.api_client.call_api.call_args
+        assert args[3] == [] and 'foo' not in args[4]
+
+    def test_body(self):
+        body = k8s.V1Pod()
+        self.v1.create_namespaced_pod('ns', body, _preload_content=False)
+        args, kwargs = self.api_client.call_api.call_args
+        assert args[:3] == ('/api/v1/namespaces/{namespace}/pods', 'POST',
+                            {'namespace': 'ns'})
+        assert kwargs['body'] is body and kwargs['_preload_content'] is False
+
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError) as err:
+            self.v1.list_namespaced_pod('ns', foo=1)
+        assert str(err.value) == (
+            "Got an unexpected keyword argument 'foo' to method list_namespaced_pod")
+
+        with pytest.raises(ValueError) as err:
+            self.v1.read_namespaced_pod('foo', None)
+        assert str(err.value) == (
+            "Missing the required parameter `namespace` when calling "
+            "`read_namespaced_pod`")
+        assert not self.api_client.call_api.called
+
+    def test_headers(self):
+        endpoint = k8s.endpoint.Endpoint(
+            'foo', '/foo', 'GET', accepts=('Text/Plain', 'Text/HTML'))
+        assert endpoint.headers == {'Accept': 'text/plain, text/html'}
+        endpoint = k8s.endpoint.Endpoint(
+            'foo', '/foo', 'PATCH', content_types=('application/merge-patch+json',))
+        assert endpoint.headers == {'Content-Type': 'application/merge-patch+json'}
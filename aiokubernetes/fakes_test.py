@@ -0,0 +1,157 @@
+"""Fakes and helpers shared by the colocated `*_test.py` files.
+
+Like those files, this module is test code and contains no tests itself.
+Runtime code must never import it.
+"""
+import asyncio
+import json
+import unittest.mock as mock
+
+import aiokubernetes as k8s
+
+
+def run(coro):
+    """Run `coro` on a fresh event loop and return its result.
+
+    Stands in for `asyncio.run`, which does not exist in Python 3.6. The loop
+    remains the current loop afterwards (closed), which allows tests to create
+    asyncio primitives outside of coroutines on Python versions before 3.10.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+class AsyncMock(mock.MagicMock):
+    """MagicMock that must be awaited, like `mock.AsyncMock` in Python 3.8+."""
+    async def __call__(self, *args, **kwargs):
+        return super().__call__(*args, **kwargs)
+
+
+def make_pod(name, namespace='default', rv='1'):
+    meta = k8s.V1ObjectMeta(name=name, namespace=namespace, resource_version=rv)
+    return k8s.V1Pod(api_version='v1', kind='Pod', metadata=meta)
+
+
+def to_bytes(obj):
+    """Return the Json encoded Swagger object `obj`."""
+    return json.dumps(k8s.api_proxy.sanitize_for_serialization(obj)).encode('utf8')
+
+
+def event_line(name, obj):
+    """Return the line K8s would send for the watch event `name` of `obj`."""
+    event = {'type': name, 'object': k8s.api_proxy.sanitize_for_serialization(obj)}
+    return json.dumps(event).encode('utf8') + b'\n'
+
+
+def error_line(code):
+    """Return the line K8s would send for a watch error with status `code`."""
+    obj = {'apiVersion': 'v1', 'kind': 'Status', 'code': code, 'message': 'error'}
+    return json.dumps({'type': 'ERROR', 'object': obj}).encode('utf8') + b'\n'
+
+
+def make_event(name, obj_name, rv='1', namespace='default'):
+    """Return a `WatchResponse` for a Pod manifest."""
+    manifest = {
+        'apiVersion': 'v1', 'kind': 'Pod',
+        'metadata': {'name': obj_name, 'namespace': namespace, 'resourceVersion': rv},
+    }
+    return k8s.watch.WatchResponse(name=name, raw=b'', manifest=manifest)
+
+
+class FakeContent:
+    """Stand-in for `aiohttp.StreamReader`.
+
+    `readline` returns the queued `lines` (and raises queued exceptions),
+    `read` returns chunks of `body`.
+    """
+    def __init__(self, body=b'', lines=()):
+        self.body = body
+        self.lines = list(lines)
+
+    async def readline(self):
+        if not self.lines:
+            return b''
+        line = self.lines.pop(0)
+        if isinstance(line, Exception):
+            raise line
+        return line
+
+    async def read(self, n=-1):
+        if n < 0:
+            n = len(self.body)
+        ret, self.body = self.body[:n], self.body[n:]
+        return ret
+
+
+class FakeResponse:
+    """Minimal stand-in for an aiohttp response."""
+    def __init__(self, body=b'', lines=(), status=200, headers=None, data=None):
+        self.status, self.reason = status, 'reason'
+        self.headers = headers or {}
+        self.body, self.data = body, data
+        self.content = FakeContent(body, lines)
+        self.released = self.closed = False
+
+    async def read(self):
+        return self.body
+
+    async def json(self, loads=None):
+        return self.data
+
+    def release(self):
+        self.released = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    """Stand-in for `aiohttp.ClientSession`.
+
+    Returns the queued responses in order and records the arguments of every
+    request. Queued exceptions will be raised instead of returned.
+    """
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    @property
+    def urls(self):
+        return [_['url'] for _ in self.calls]
+
+    async def request(self, **cargs):
+        self.calls.append(cargs)
+        ret = self.responses.pop(0)
+        if isinstance(ret, Exception):
+            raise ret
+        return ret
+
+
+class FakeWatch:
+    """Async iterator over `events` that records whether it was closed.
+
+    Raises `error` once all events were consumed, if specified.
+    """
+    def __init__(self, events, error=None):
+        self.events = list(events)
+        self.error = error
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        await asyncio.sleep(0)
+        if self.events:
+            return self.events.pop(0)
+        if self.error is not None:
+            raise self.error
+        raise StopAsyncIteration
+
+    def close(self):
+        self.closed = True
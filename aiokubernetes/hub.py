@@ -0,0 +1,232 @@
+"""Fan out watch streams to subscribers with bounded queues.
+
+The examples consume every watch in its own coroutine and handle the events
+inline. A slow handler therefore stops the stream from being read, the TCP
+buffers fill up and K8s eventually drops the watch.
+
+A `WatchHub` reads any number of watch streams as fast as they arrive and
+hands the events to its subscribers. Every `Subscription` has its own bounded
+queue and a policy for when that queue is full:
+
+  * 'block': stop reading the stream until the subscriber catches up. No
+    event is lost, but a slow subscriber delays all other subscribers of the
+    same stream.
+  * 'drop_oldest': discard the oldest queued event.
+  * 'coalesce': replace the queued event for the same object with the new
+    one, ie the subscriber only sees the latest state of every object. If the
+    queue is full of distinct objects it behaves like 'block'.
+  * 'resync': discard all queued events and queue a single RESYNC event
+    instead. The subscriber must then re-list the resource, eg with
+    `Informer.sync`.
+
+Example:
+
+    hub = k8s.hub.WatchHub()
+    v1 = k8s.CoreV1Api(proxy)
+    hub.add_stream('pods', k8s.watch.ResumableWatch(
+        client, v1.list_pod_for_all_namespaces))
+    hub.add_stream('nodes', k8s.watch.ResumableWatch(client, v1.list_node))
+
+    sub = hub.subscribe(['pods'], maxsize=100, policy='coalesce')
+    async for stream, event in sub:
+        print(stream, event.name, event.metadata.name)
+"""
+import asyncio
+import itertools
+from collections import OrderedDict
+
+from aiokubernetes.watch import WatchResponse
+
+# All slow consumer policies.
+POLICIES = ('block', 'drop_oldest', 'coalesce', 'resync')
+
+# Name of the event that a 'resync' subscription receives after an overflow.
+RESYNC = 'RESYNC'
+
+
+def event_key(stream, event):
+    """Return the (stream, namespace, name) key of `event` or None.
+
+    Events without an object, eg errors and bookmarks, have no key.
+    """
+    if event.name in ('ERROR', 'BOOKMARK', None) or not event.manifest:
+        return None
+    metadata = event.manifest.get('metadata') or {}
+    return (stream, metadata.get('namespace'), metadata.get('name'))
+
+
+class Subscription(object):
+    """Bounded queue of (stream, WatchResponse) tuples for one subscriber.
+
+    Subscriptions are async iterators and stop once they were closed and all
+    queued events were consumed. Use `WatchHub.subscribe` to create them.
+
+    Inputs:
+        streams: set[str]|None
+            Names of the streams to receive events from (None means all).
+        maxsize: int
+            Maximum number of queued events.
+        policy: str
+            What to do if the queue is full (see `POLICIES`).
+    """
+    def __init__(self, streams=None, maxsize=1000, policy='block'):
+        if policy not in POLICIES:
+            raise ValueError(f'Unknown policy <{policy}>')
+        assert maxsize >= 1, 'Queue size must be at least 1'
+        self.streams = None if streams is None else set(streams)
+        self.maxsize, self.policy = maxsize, policy
+        self.closed = False
+
+        # {key: (stream, event)} in FIFO order. The keys are unique counters,
+        # or the object keys for the 'coalesce' policy.
+        self._items = OrderedDict()
+        self._counter = itertools.count()
+
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+        # Metrics: events that were discarded, merged into a queued event for
+        # the same object, and the number of RESYNC events.
+        self.dropped = 0
+        self.coalesced = 0
+        self.resyncs = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._items:
+            if self.closed:
+                raise StopAsyncIteration
+            self._readable.clear()
+            await self._readable.wait()
+
+        _, item = self._items.popitem(last=False)
+        self._writable.set()
+        return item
+
+    async def put(self, stream, event):
+        """Queue `event` from `stream` and apply the policy if the queue is full.
+
+        Only waits if the queue is full and the policy is 'block' or
+        'coalesce'. Events for closed subscriptions are silently discarded.
+        """
+        if self.closed:
+            return
+
+        key = None
+        if self.policy == 'coalesce':
+            key = event_key(stream, event)
+            if key is not None and key in self._items:
+                self._items[key] = (stream, event)
+                self.coalesced += 1
+                return
+        if key is None:
+            key = next(self._counter)
+
+        while len(self._items) >= self.maxsize:
+            if self.policy == 'drop_oldest':
+                self._items.popitem(last=False)
+                self.dropped += 1
+            elif self.policy == 'resync':
+                # Replace the backlog with a single RESYNC event. This is the
+                # only case where the queue may hold `maxsize + 1` events.
+                self.dropped += len(self._items)
+                self.resyncs += 1
+                self._items.clear()
+                marker = WatchResponse(name=RESYNC, raw=b'', obj=None)
+                self._items[next(self._counter)] = (stream, marker)
+                break
+            else:
+                self._writable.clear()
+                await self._writable.wait()
+                if self.closed:
+                    return
+
+        self._items[key] = (stream, event)
+        self._readable.set()
+
+    def close(self):
+        """Stop the subscription once all queued events were consumed."""
+        self.closed = True
+        self._readable.set()
+        self._writable.set()
+
+
+class WatchHub(object):
+    """Read many watch streams and fan their events out to subscribers."""
+    def __init__(self):
+        # {stream name: task} of all running streams.
+        self._tasks = {}
+        self._subscriptions = []
+
+        # {stream name: exception} for streams that aborted with an error.
+        self.errors = {}
+
+    def add_stream(self, name, watch):
+        """Start to read the events of `watch` and publish them as `name`.
+
+        Inputs:
+            name: str
+                Unique name of the stream, eg 'pods'.
+            watch: async iterator
+                Produces `WatchResponse` objects, typically a
+                `watch.ResumableWatch` or `watch.AioHttpClientWatch`.
+        """
+        if name in self._tasks:
+            raise ValueError(f'Stream <{name}> already exists')
+        self._tasks[name] = asyncio.ensure_future(self._pump(name, watch))
+
+    async def remove_stream(self, name):
+        """Stop reading the stream `name`."""
+        task = self._tasks.pop(name)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def subscribe(self, streams=None, maxsize=1000, policy='block'):
+        """Return a new `Subscription` for the events of `streams`.
+
+        Inputs:
+            streams: iterable[str]|None
+                Stream names (None means all streams, including future ones).
+            maxsize: int
+                Maximum number of queued events.
+            policy: str
+                One of `POLICIES`.
+        """
+        sub = Subscription(streams, maxsize, policy)
+        self._subscriptions.append(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        """Remove and close the subscription `sub`."""
+        if sub in self._subscriptions:
+            self._subscriptions.remove(sub)
+        sub.close()
+
+    async def close(self):
+        """Stop all streams and close all subscriptions."""
+        for name in list(self._tasks):
+            await self.remove_stream(name)
+        for sub in list(self._subscriptions):
+            self.unsubscribe(sub)
+
+    async def _pump(self, name, watch):
+        """Publish the events of `watch` to all interested subscribers."""
+        try:
+            async for event in watch:
+                for sub in list(self._subscriptions):
+                    if sub.streams is None or name in sub.streams:
+                        await sub.put(name, event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:
+            self.errors[name] = err
+        finally:
+            close = getattr(watch, 'close', None)
+            if close is not None:
+                close()
@@ -0,0 +1,173 @@
+import asyncio
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeWatch, make_event
+
+
+def summary(items):
+    return [(stream, event.name, event.manifest and event.manifest['metadata']['name'])
+            for stream, event in items]
+
+
+async def drain(sub):
+    """Return all events that are currently queued in `sub`."""
+    sub.close()
+    return [_ async for _ in sub]
+
+
+class TestSubscription:
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            k8s.hub.Subscription(policy='foo')
+
+    def test_block(self):
+        async def run():
+            sub = k8s.hub.Subscription(maxsize=2, policy='block')
+            await sub.put('s', make_event('ADDED', 'a'))
+            await sub.put('s', make_event('ADDED', 'b'))
+
+            # The queue is full: the producer must wait for the consumer.
+            task = asyncio.ensure_future(sub.put('s', make_event('ADDED', 'c')))
+            await asyncio.sleep(0.01)
+            assert not task.done() and len(sub) == 2
+
+            assert summary([await sub.__anext__()]) == [('s', 'ADDED', 'a')]
+            await asyncio.wait_for(task, 1)
+            return await drain(sub)
+
+        ret = fakes.run(run())
+        assert summary(ret) == [('s', 'ADDED', 'b'), ('s', 'ADDED', 'c')]
+
+    def test_drop_oldest(self):
+        async def run():
+            sub = k8s.hub.Subscription(maxsize=2, policy='drop_oldest')
+            for name in 'abcd':
+                await sub.put('s', make_event('ADDED', name))
+            assert sub.dropped == 2
+            return await drain(sub)
+
+        ret = fakes.run(run())
+        assert summary(ret) == [('s', 'ADDED', 'c'), ('s', 'ADDED', 'd')]
+
+    def test_coalesce(self):
+        async def run():
+            sub = k8s.hub.Subscription(maxsize=10, policy='coalesce')
+            await sub.put('s', make_event('ADDED', 'a'))
+            await sub.put('s', make_event('ADDED', 'b'))
+            await sub.put('s', make_event('MODIFIED', 'a', rv='2'))
+            await sub.put('s', make_event('DELETED', 'b', rv='3'))
+
+            # Same name but different namespace or stream.
+            await sub.put('s', make_event('ADDED', 'a', namespace='other'))
+            await sub.put('t', make_event('ADDED', 'a'))
+            assert sub.coalesced == 2
+            return await drain(sub)
+
+        ret = fakes.run(run())
+        assert summary(ret) == [
+            ('s', 'MODIFIED', 'a'), ('s', 'DELETED', 'b'),
+            ('s', 'ADDED', 'a'), ('t', 'ADDED', 'a'),
+        ]
+        assert ret[0][1].manifest['metadata']['resourceVersion'] == '2'
+
+    def test_resync(self):
+        async def run():
+            sub = k8s.hub.Subscription(maxsize=2, policy='resync')
+            for name in 'abc':
+                await sub.put('s', make_event('ADDED', name))
+            assert sub.resyncs == 1 and sub.dropped == 2
+            return await drain(sub)
+
+        ret = fakes.run(run())
+        assert summary(ret) == [('s', 'RESYNC', None), ('s', 'ADDED', 'c')]
+
+    def test_close(self):
+        async def run():
+            sub = k8s.hub.Subscription(maxsize=1)
+            await sub.put('s', make_event('ADDED', 'a'))
+
+            # Closing must release blocked producers and waiting consumers.
+            task = asyncio.ensure_future(sub.put('s', make_event('ADDED', 'b')))
+            await asyncio.sleep(0)
+            sub.close()
+            await asyncio.wait_for(task, 1)
+            await sub.put('s', make_event('ADDED', 'c'))
+            return [_ async for _ in sub]
+
+        assert summary(fakes.run(run())) == [('s', 'ADDED', 'a')]
+
+
+class TestWatchHub:
+    def test_fan_out(self):
+        async def run():
+            hub = k8s.hub.WatchHub()
+            sub_all = hub.subscribe()
+            sub_pods = hub.subscribe(['pods'], policy='drop_oldest')
+
+            watch_pods = FakeWatch([make_event('ADDED', 'a'), make_event('ADDED', 'b')])
+            watch_nodes = FakeWatch([make_event('ADDED', 'n1')])
+            hub.add_stream('pods', watch_pods)
+            hub.add_stream('nodes', watch_nodes)
+            with pytest.raises(ValueError):
+                hub.add_stream('pods', watch_pods)
+
+            await asyncio.sleep(0.05)
+            await hub.close()
+            assert watch_pods.closed and watch_nodes.closed
+            return [_ async for _ in sub_all], [_ async for _ in sub_pods]
+
+        ret_all, ret_pods = fakes.run(run())
+        assert sorted(summary(ret_all)) == [
+            ('nodes', 'ADDED', 'n1'), ('pods', 'ADDED', 'a'), ('pods', 'ADDED', 'b'),
+        ]
+        assert summary(ret_pods) == [('pods', 'ADDED', 'a'), ('pods', 'ADDED', 'b')]
+
+    def test_slow_subscriber(self):
+        """A full 'drop_oldest' queue must not stall the stream."""
+        async def run():
+            hub = k8s.hub.WatchHub()
+            slow = hub.subscribe(maxsize=1, policy='drop_oldest')
+            fast = hub.subscribe(maxsize=100)
+            events = [make_event('ADDED', str(_)) for _ in range(10)]
+            hub.add_stream('pods', FakeWatch(events))
+
+            received = []
+            async for _, event in fast:
+                received.append(event)
+                if len(received) == 10:
+                    break
+            await hub.close()
+            return received, [_ async for _ in slow], slow.dropped
+
+        received, slow, dropped = fakes.run(run())
+        assert len(received) == 10
+        assert summary(slow) == [('pods', 'ADDED', '9')]
+        assert dropped == 9
+
+    def test_unsubscribe(self):
+        async def run():
+            hub = k8s.hub.WatchHub()
+            sub = hub.subscribe(maxsize=1)
+            hub.unsubscribe(sub)
+            hub.add_stream('pods', FakeWatch([make_event('ADDED', 'a')] * 5))
+            await asyncio.sleep(0.05)
+            await hub.close()
+            return [_ async for _ in sub]
+
+        assert fakes.run(run()) == []
+
+    def test_error(self):
+        async def run():
+            hub = k8s.hub.WatchHub()
+            watch = FakeWatch([], error=k8s.watch.ResourceExpired())
+            hub.add_stream('pods', watch)
+            await asyncio.sleep(0.05)
+            assert watch.closed
+            await hub.close()
+            return hub.errors
+
+        errors = fakes.run(run())
+        assert isinstance(errors['pods'], k8s.watch.ResourceExpired)
@@ -0,0 +1,363 @@
+"""Maintain a local cache of K8s resources via the list+watch pattern.
+
+An `Informer` lists all resources once, then opens a watch from the
+`resourceVersion` of that list and applies every event to a local `Store`.
+Consumers can query the store at any time without contacting the API server.
+
+Example:
+
+    config = k8s.utils.load_config(warn=False)
+    client = k8s.clients.get_aiohttp(config)
+    proxy = k8s.api_proxy.Proxy(config)
+
+    informer = k8s.informer.Informer(
+        client, k8s.CoreV1Api(proxy).list_namespaced_pod, 'default')
+    task = asyncio.ensure_future(informer.run())
+    await informer.wait_synced()
+
+    pod = informer.get('default', 'my-pod')
+"""
+import asyncio
+import random
+
+import aiohttp
+
+import aiokubernetes as k8s
+from aiokubernetes.rest import ApiException
+
+
+def object_key(obj):
+    """Return the (namespace, name) tuple that identifies `obj`.
+
+    The namespace is None for cluster scoped resources like Namespaces or
+    Nodes.
+
+    Input:
+        obj: Swagger object
+            Must have a `metadata` attribute, eg `V1Pod`.
+
+    Returns:
+        tuple: (namespace, name)
+    """
+    return (obj.metadata.namespace, obj.metadata.name)
+
+
+class Store:
+    """In-memory cache of Swagger objects keyed by namespace and name.
+
+    The store can maintain secondary indexes (see `add_index`) to quickly find
+    all objects with a given property, eg all Pods on a Node.
+
+    The store is not thread safe. It is meant to be used from a single event
+    loop, typically by an `Informer`.
+    """
+    def __init__(self):
+        self._items = {}
+
+        # {index name: index function} and
+        # {index name: {index value: set((namespace, name))}}.
+        self._indexers = {}
+        self._indices = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def add(self, obj):
+        """Insert `obj` or replace the cached version of it."""
+        key = object_key(obj)
+        old = self._items.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self._items[key] = obj
+        self._index(key, obj)
+
+    def delete(self, obj):
+        """Remove `obj` from the store (no-op if it does not exist)."""
+        key = object_key(obj)
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._unindex(key, old)
+
+    def replace(self, objs):
+        """Replace the entire content of the store with `objs`."""
+        self._items = {object_key(obj): obj for obj in objs}
+        self._indices = {name: {} for name in self._indexers}
+        for key, obj in self._items.items():
+            self._index(key, obj)
+
+    def get(self, namespace, name):
+        """Return the cached object or None if it does not exist.
+
+        Input:
+            namespace: str
+                Use None for cluster scoped resources.
+            name: str
+
+        Returns:
+            Swagger object or None.
+        """
+        return self._items.get((namespace, name))
+
+    def keys(self):
+        """Return a list of (namespace, name) tuples of all cached objects."""
+        return list(self._items)
+
+    def list(self, namespace=None):
+        """Return all cached objects, optionally only those in `namespace`."""
+        if namespace is None:
+            return list(self._items.values())
+        return [v for (ns, _), v in self._items.items() if ns == namespace]
+
+    def add_index(self, name, fun):
+        """Maintain the secondary index `name` for all current and future objects.
+
+        Example:
+            store.add_index('node', k8s.informer.index_node_name)
+            pods = store.by_index('node', 'worker-1')
+
+        Inputs:
+            name: str
+                Name of the index.
+            fun: callable
+                fun(obj) -> iterable of hashable index values for `obj`, eg
+                `index_node_name`. Objects can have any number of values.
+        """
+        if name in self._indexers:
+            raise ValueError(f'Index <{name}> already exists')
+        self._indexers[name] = fun
+        self._indices[name] = {}
+        for key, obj in self._items.items():
+            self._index_one(name, key, obj)
+
+    def index_keys(self, name, value):
+        """Return the set of (namespace, name) keys with `value` in index `name`."""
+        return set(self._indices[name].get(value, ()))
+
+    def by_index(self, name, value):
+        """Return all objects with `value` in index `name`.
+
+        Raises KeyError if the index does not exist.
+        """
+        items = self._items
+        return [items[key] for key in self._indices[name].get(value, ())]
+
+    def index_values(self, name):
+        """Return all values in index `name`, eg the names of all Nodes with Pods."""
+        return list(self._indices[name])
+
+    def get_label_index(self, label):
+        """Return the name of an `index_label(label)` index, or None."""
+        for name, fun in self._indexers.items():
+            if getattr(fun, 'label', None) == label:
+                return name
+        return None
+
+    def _index(self, key, obj):
+        for name in self._indexers:
+            self._index_one(name, key, obj)
+
+    def _index_one(self, name, key, obj):
+        index = self._indices[name]
+        for value in self._indexers[name](obj):
+            index.setdefault(value, set()).add(key)
+
+    def _unindex(self, key, obj):
+        for name, fun in self._indexers.items():
+            index = self._indices[name]
+            for value in fun(obj):
+                keys = index.get(value)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+
+def index_node_name(obj):
+    """Index function for the Node a Pod is scheduled on (see `Store.add_index`)."""
+    node_name = getattr(getattr(obj, 'spec', None), 'node_name', None)
+    return (node_name,) if node_name else ()
+
+
+def index_owner_uid(obj):
+    """Index function for the UIDs of all owners of `obj`, eg its ReplicaSet."""
+    return tuple(ref.uid for ref in obj.metadata.owner_references or ())
+
+
+def index_label(label):
+    """Return an index function for the value of `label`.
+
+    Example:
+        store.add_index('app', k8s.informer.index_label('app'))
+        pods = store.by_index('app', 'nginx')
+    """
+    def index(obj):
+        labels = obj.metadata.labels
+        if labels and label in labels:
+            return (labels[label],)
+        return ()
+
+    # Allows `Store.get_label_index` to find this index.
+    index.label = label
+    return index
+
+
+class Informer:
+    """List+Watch a K8s resource and mirror it in a local `Store`.
+
+    The informer uses the same machinery as the examples: `list_fun` is a
+    generated API method bound to an `api_proxy.Proxy` (eg
+    `k8s.CoreV1Api(proxy).list_namespaced_pod`) and `client` is the aiohttp
+    session that makes the actual requests.
+
+    Inputs:
+        client: aiohttp.ClientSession
+            Typically the return value of `k8s.clients.get_aiohttp`.
+        list_fun: callable
+            Generated `list_*` method bound to an `api_proxy.Proxy` instance.
+        *args, **kwargs:
+            Passed verbatim to `list_fun`, eg the namespace or a label selector.
+    """
+    # Server side timeout for each watch request. The informer will
+    # automatically open another watch once the timeout expires.
+    watch_timeout = 300
+
+    # Seconds to wait before re-listing the resource after an error. The delay
+    # doubles with every consecutive failure up to `retry_delay_max`.
+    retry_delay = 1
+    retry_delay_max = 30
+
+    def __init__(self, client, list_fun, *args, **kwargs):
+        self.client = client
+        self.list_fun = list_fun
+        self.args, self.kwargs = args, kwargs
+        self.store = Store()
+
+        # Resource version of the most recent list or event. This is where the
+        # next watch will resume from.
+        self.resource_version = None
+        self._synced = asyncio.Event()
+
+        # API version and kind of the list, eg 'v1' and 'PodList'.
+        self.api_version = self.kind = None
+
+        # Metrics: number of errors `run` recovered from, and the last one.
+        self.errors = 0
+        self.last_error = None
+
+    def get(self, namespace, name):
+        """Return the cached object `name` in `namespace` (or None)."""
+        return self.store.get(namespace, name)
+
+    def list(self, namespace=None):
+        """Return all cached objects, optionally only those in `namespace`."""
+        return self.store.list(namespace)
+
+    def add_index(self, name, fun):
+        """Add a secondary index to the store (see `Store.add_index`)."""
+        self.store.add_index(name, fun)
+
+    def by_index(self, name, value):
+        """Return all cached objects with `value` in index `name`."""
+        return self.store.by_index(name, value)
+
+    @property
+    def synced(self):
+        """True once the store was populated by the initial list call."""
+        return self._synced.is_set()
+
+    async def wait_synced(self):
+        """Wait until the store was populated by the initial list call."""
+        await self._synced.wait()
+
+    async def sync(self):
+        """List all resources and replace the store content with the result.
+
+        Raises `ApiException` if K8s rejected the request.
+        """
+        cargs = self.list_fun(*self.args, watch=False, **self.kwargs)
+        resp = await self.client.request(**cargs)
+        try:
+            if resp.status != 200:
+                raise ApiException(status=resp.status, reason=resp.reason)
+            codec = k8s.codec.get_codec_for(self.list_fun)
+            obj = k8s.swagger.unpack(await resp.read(), codec)
+        finally:
+            resp.release()
+
+        if obj is None:
+            raise ApiException(status=0, reason="Could not decode list response")
+
+        self.store.replace(obj.items or [])
+        self.resource_version = obj.metadata.resource_version
+        self.api_version, self.kind = obj.api_version, obj.kind
+        self._synced.set()
+
+    def apply_event(self, name, obj):
+        """Update the store with the watch event `name` for `obj`.
+
+        Inputs:
+            name: str
+                K8s event type, eg ADDED, MODIFIED or DELETED.
+            obj: Swagger object
+                The object the event refers to.
+        """
+        if name == 'DELETED':
+            self.store.delete(obj)
+        else:
+            self.store.add(obj)
+        self.resource_version = obj.metadata.resource_version
+
+    async def watch(self):
+        """Apply the watch events to the store until the watch expires.
+
+        The watch transparently resumes after timeouts and connection drops
+        and only returns once K8s reports that our resource version is too old.
+
+        Returns:
+            bool: False to indicate that the store must be re-listed.
+        """
+        watch = k8s.watch.ResumableWatch(
+            self.client, self.list_fun, *self.args,
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            **self.kwargs
+        )
+        try:
+            async for event in watch:
+                self.apply_event(event.name, event.obj)
+        except k8s.watch.ResourceExpired:
+            return False
+        finally:
+            watch.close()
+        return True
+
+    async def run(self):
+        """List the resource, then watch it forever.
+
+        Re-list the resource if K8s no longer has the resource version of the
+        last event (410 Gone). Any other error, eg a failed list or a watch
+        that K8s rejected, marks the informer as not synced until it has
+        re-listed the resource after an exponential backoff. Cancel the task
+        running this coroutine to stop the informer.
+        """
+        failures = 0
+        while True:
+            try:
+                await self.sync()
+                failures = 0
+                while await self.watch():
+                    pass
+            except (ApiException, aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # The store no longer receives updates and may be stale.
+                self._synced.clear()
+                self.errors += 1
+                self.last_error = err
+
+                delay = self.retry_delay * 2 ** min(failures, 30)
+                failures += 1
+                await asyncio.sleep(
+                    random.uniform(0.5, 1) * min(delay, self.retry_delay_max))
@@ -0,0 +1,193 @@
+import asyncio
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import (
+    FakeClient, FakeResponse, error_line, event_line, make_pod, to_bytes,
+)
+
+
+class TestStore:
+    def test_add_get_delete(self):
+        store = k8s.informer.Store()
+        pod_a, pod_b = make_pod('a'), make_pod('b', namespace='other')
+        assert store.get('default', 'a') is None
+
+        store.add(pod_a)
+        store.add(pod_b)
+        assert len(store) == 2
+        assert store.get('default', 'a') is pod_a
+        assert store.get('other', 'b') is pod_b
+        assert store.list('other') == [pod_b]
+        assert sorted(store.keys()) == [('default', 'a'), ('other', 'b')]
+
+        store.delete(pod_a)
+        store.delete(pod_a)
+        assert store.list() == [pod_b]
+
+        store.replace([pod_a])
+        assert store.list() == [pod_a]
+
+
+class TestIndex:
+    def make_pod(self, name, node=None, owners=(), labels=None):
+        pod = make_pod(name)
+        pod.spec = k8s.V1PodSpec(containers=[], node_name=node)
+        pod.metadata.labels = labels
+        pod.metadata.owner_references = [
+            k8s.V1OwnerReference(
+                api_version='v1', kind='ReplicaSet', name=uid, uid=uid)
+            for uid in owners
+        ] or None
+        return pod
+
+    def test_index(self):
+        store = k8s.informer.Store()
+        store.add(self.make_pod('a', node='n1', owners=['rs1']))
+        store.add_index('node', k8s.informer.index_node_name)
+        store.add_index('owner', k8s.informer.index_owner_uid)
+        store.add_index('app', k8s.informer.index_label('app'))
+
+        # The index must cover objects that existed before it.
+        assert [_.metadata.name for _ in store.by_index('node', 'n1')] == ['a']
+
+        store.add(self.make_pod('b', node='n1', owners=['rs1', 'rs2'],
+                                labels={'app': 'foo'}))
+        store.add(self.make_pod('c'))
+        assert store.index_keys('node', 'n1') == {('default', 'a'), ('default', 'b')}
+        assert store.index_keys('owner', 'rs2') == {('default', 'b')}
+        assert store.index_keys('app', 'foo') == {('default', 'b')}
+        assert sorted(store.index_values('owner')) == ['rs1', 'rs2']
+        assert store.by_index('node', 'unknown') == []
+
+        # Update: 'b' moves to another node.
+        store.add(self.make_pod('b', node='n2'))
+        assert store.index_keys('node', 'n1') == {('default', 'a')}
+        assert store.index_keys('node', 'n2') == {('default', 'b')}
+        assert store.index_values('owner') == ['rs1']
+        assert store.index_values('app') == []
+
+        # Delete 'a'. The index must use the stored object, not the argument.
+        store.delete(make_pod('a'))
+        assert store.index_values('node') == ['n2']
+
+        store.replace([self.make_pod('d', node='n3')])
+        assert store.index_values('node') == ['n3']
+        assert store.by_index('node', 'n3')[0].metadata.name == 'd'
+
+    def test_errors(self):
+        store = k8s.informer.Store()
+        store.add_index('node', k8s.informer.index_node_name)
+        with pytest.raises(ValueError):
+            store.add_index('node', k8s.informer.index_node_name)
+        with pytest.raises(KeyError):
+            store.by_index('unknown', 'n1')
+
+
+class TestInformer:
+    def setup_method(self):
+        config = k8s.configuration.Configuration()
+        self.list_fun = k8s.CoreV1Api(k8s.api_proxy.Proxy(config)).list_namespaced_pod
+
+    def test_sync_and_watch(self):
+        pod_list = k8s.V1PodList(
+            api_version='v1', kind='PodList',
+            metadata=k8s.V1ListMeta(resource_version='10'),
+            items=[make_pod('a'), make_pod('b')],
+        )
+        lines = [
+            event_line('ADDED', make_pod('c', rv='11')),
+            event_line('MODIFIED', make_pod('a', rv='12')),
+            event_line('DELETED', make_pod('b', rv='13')),
+        ]
+        client = FakeClient([
+            FakeResponse(body=to_bytes(pod_list)),
+            FakeResponse(lines=lines),
+            FakeResponse(lines=[error_line(410)]),
+        ])
+        informer = k8s.informer.Informer(client, self.list_fun, 'default')
+        informer.add_index('rv', lambda obj: [obj.metadata.resource_version])
+
+        async def run():
+            await informer.sync()
+            assert informer.synced
+            assert informer.resource_version == '10'
+            assert (informer.api_version, informer.kind) == ('v1', 'PodList')
+            assert await informer.watch() is False
+
+        fakes.run(run())
+
+        # The watch must have resumed from the resource version of the list.
+        assert 'watch=False' in client.urls[0]
+        assert 'resourceVersion=10' in client.urls[1]
+        assert 'watch=True' in client.urls[1]
+        assert 'resourceVersion=13' in client.urls[2]
+
+        assert sorted(informer.store.keys()) == [('default', 'a'), ('default', 'c')]
+        assert [_.metadata.name for _ in informer.by_index('rv', '12')] == ['a']
+        assert informer.get('default', 'a').metadata.resource_version == '12'
+        assert informer.resource_version == '13'
+
+    def test_watch_error(self):
+        client = FakeClient([FakeResponse(lines=[error_line(410)])])
+        informer = k8s.informer.Informer(client, self.list_fun, 'default')
+        assert fakes.run(informer.watch()) is False
+
+    def test_run_recovers(self):
+        """`run` must survive 5xx and rejected watches by re-listing."""
+        informer = None
+
+        class BlockingClient(FakeClient):
+            """Record whether the informer was synced at every request."""
+            synced = []
+
+            async def request(self, **cargs):
+                self.synced.append(informer.synced)
+                if self.responses:
+                    return await super().request(**cargs)
+                self.calls.append(cargs)
+                await asyncio.sleep(10)
+
+        def make_list(names, rv):
+            pod_list = k8s.V1PodList(
+                api_version='v1', kind='PodList',
+                metadata=k8s.V1ListMeta(resource_version=rv),
+                items=[make_pod(name) for name in names],
+            )
+            return FakeResponse(body=to_bytes(pod_list))
+
+        client = BlockingClient([
+            FakeResponse(status=500),
+            make_list(['a'], rv='10'),
+            FakeResponse(status=403),
+            make_list(['b'], rv='20'),
+        ])
+        informer = k8s.informer.Informer(client, self.list_fun, 'default')
+        informer.retry_delay = 0
+
+        async def run():
+            task = asyncio.ensure_future(informer.run())
+            while len(client.synced) < 5:
+                await asyncio.sleep(0.001)
+            assert not task.done()
+            task.cancel()
+
+        fakes.run(run())
+
+        # 1) failed list, 2) list, 3) rejected watch, 4) re-list, 5) watch.
+        assert client.synced == [False, False, True, False, True]
+        assert 'watch=True' in client.urls[4]
+        assert 'resourceVersion=20' in client.urls[4]
+        assert informer.store.keys() == [('default', 'b')]
+        assert informer.errors == 2
+        assert informer.last_error.status == 403
+
+    def test_sync_error(self):
+        client = FakeClient([FakeResponse(status=403)])
+        informer = k8s.informer.Informer(client, self.list_fun, 'default')
+        with pytest.raises(k8s.rest.ApiException) as err:
+            fakes.run(informer.sync())
+        assert err.value.status == 403
+        assert not informer.synced
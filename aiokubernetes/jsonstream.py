@@ -0,0 +1,219 @@
+"""Decode the items of large K8s list responses while they stream in.
+
+`swagger.unpack` needs the entire response in memory, first as bytes, then as
+Json dicts and finally as Swagger objects. For a cluster wide list of many
+thousands of resources this easily amounts to gigabytes.
+
+A `ListStream` instead reads the response in chunks and decodes one element
+of the `items` array at a time. The peak memory is thus proportional to the
+size of the largest item, not the entire list:
+
+    cargs = k8s.CoreV1Api(proxy).list_pod_for_all_namespaces()
+    resp = await client.request(**cargs)
+    async for pod in k8s.jsonstream.ListStream(resp):
+        print(pod.metadata.name)
+
+For methods bound to an `ApiClient`, pass `_preload_content=False` and wrap
+the `http` attribute of the returned `ApiResponse` instead.
+"""
+import codecs
+import collections
+import json
+import re
+
+import aiokubernetes as k8s
+from aiokubernetes.rest import ApiException
+
+# Whitespace and the commas between object members and array elements.
+_RE_SKIP = re.compile(r'[ \t\n\r,]*')
+_RE_COLON = re.compile(r'[ \t\n\r]*:')
+
+# Parser states.
+_START, _KEY, _VALUE, _ITEMS_OPEN, _ITEMS, _END = range(6)
+
+
+class _Incomplete(Exception):
+    """The buffer ends before the current Json value does."""
+
+
+class ListParser(object):
+    """Incrementally split a Json encoded K8s list into its items.
+
+    Feed the raw response body chunk by chunk to `feed`. It returns the Json
+    decoded items that were completed by the chunk. All other top level keys,
+    eg `kind` and `metadata`, are available in `head`.
+
+    The parser uses `json.JSONDecoder.raw_decode` to decode the items, ie the
+    heavy lifting happens in C. Only the top level object is traversed in
+    Python.
+    """
+    _decode = json.JSONDecoder().raw_decode
+
+    def __init__(self):
+        # All top level keys except `items`.
+        self.head = {}
+
+        self._utf8 = codecs.getincrementaldecoder('utf8')()
+        self._buf = ''
+        self._state = _START
+        self._key = None
+
+    @property
+    def done(self):
+        """True once the closing brace of the list was parsed."""
+        return self._state == _END
+
+    def feed(self, data):
+        """Parse the next chunk of `data` and return the completed items.
+
+        Input:
+            data: bytes
+                Next chunk of the UTF-8 encoded response body.
+
+        Returns:
+            list[dict]: Json decoded items (may be empty).
+        """
+        buf = self._buf + self._utf8.decode(data)
+        pos, items = 0, []
+        try:
+            while True:
+                pos = _RE_SKIP.match(buf, pos).end()
+                if pos == len(buf):
+                    break
+                pos = self._step(buf, pos, items)
+        except _Incomplete:
+            pass
+        self._buf = buf[pos:]
+        return items
+
+    def close(self):
+        """Raise ValueError unless the entire list was parsed."""
+        if self._state != _END or self._buf.strip():
+            raise ValueError('Incomplete or invalid Json list')
+
+    def _step(self, buf, pos, items):
+        """Parse the next token at `pos` and return the position after it."""
+        char, state = buf[pos], self._state
+        if state == _ITEMS:
+            if char == ']':
+                self._state = _KEY
+                return pos + 1
+            item, pos = self._value(buf, pos)
+            items.append(item)
+            return pos
+        elif state == _KEY:
+            if char == '}':
+                self._state = _END
+                return pos + 1
+            key, end = self._value(buf, pos)
+            colon = _RE_COLON.match(buf, end)
+            if colon is None:
+                if buf[end:].strip():
+                    raise ValueError(f'Expected ":" at position {end}')
+                raise _Incomplete
+            self._key = key
+            self._state = _ITEMS_OPEN if key == 'items' else _VALUE
+            return colon.end()
+        elif state == _VALUE:
+            self.head[self._key], pos = self._value(buf, pos)
+            self._state = _KEY
+            return pos
+        elif state == _ITEMS_OPEN:
+            if char == '[':
+                self._state = _ITEMS
+                return pos + 1
+            # Most likely `null`.
+            self.head['items'], pos = self._value(buf, pos)
+            self._state = _KEY
+            return pos
+        elif state == _START and char == '{':
+            self._state = _KEY
+            return pos + 1
+        raise ValueError(f'Unexpected character {char!r} at position {pos}')
+
+    def _value(self, buf, pos):
+        """Decode the Json value at `pos` and return it with its end position.
+
+        Raises `_Incomplete` if the value extends beyond the buffer. This
+        includes invalid Json, which will only be reported by `close`.
+        """
+        try:
+            value, end = self._decode(buf, pos)
+        except json.JSONDecodeError:
+            raise _Incomplete
+        # Numbers and literals at the end of the buffer may be truncated.
+        if end == len(buf) and not isinstance(value, (dict, list, str)):
+            raise _Incomplete
+        return value, end
+
+
+class ListStream(object):
+    """Async iterator over the items of a K8s list response.
+
+    The items are converted into Swagger objects of the type implied by the
+    list, eg `V1Pod` for a `V1PodList`. K8s always sends `kind` and
+    `apiVersion` before the items. Should they arrive later, the items are
+    buffered until the type is known.
+
+    Inputs:
+        response: aiohttp.ClientResponse
+            Response of a `list_*` call with `watch=False`.
+        chunk_size: int
+            Number of bytes to read at once.
+    """
+    def __init__(self, response, chunk_size=2 ** 16):
+        self.response = response
+        self.chunk_size = chunk_size
+        self.parser = ListParser()
+        self._items = collections.deque()
+        self._decode = None
+
+    @property
+    def head(self):
+        """Top level keys of the list except `items`, eg `metadata`."""
+        return self.parser.head
+
+    @property
+    def resource_version(self):
+        return (self.head.get('metadata') or {}).get('resourceVersion')
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        resp = self.response
+        if resp.status != 200:
+            self.close()
+            raise ApiException(status=resp.status, reason=resp.reason)
+
+        while True:
+            if self._items and self._decoder() is not None:
+                return self._decode(self._items.popleft())
+            if self.parser.done:
+                self.close()
+                if self._items:
+                    raise ApiException(status=0, reason="Could not determine list type")
+                raise StopAsyncIteration
+
+            data = await resp.content.read(self.chunk_size)
+            if not data:
+                self.close()
+                try:
+                    self.parser.close()
+                except ValueError:
+                    reason = "Could not decode list response"
+                    raise ApiException(status=0, reason=reason)
+                continue
+
+            self._items.extend(self.parser.feed(data))
+
+    def _decoder(self):
+        """Return the item decoder, or None if the list type is still unknown."""
+        if self._decode is None:
+            head = self.parser.head
+            if 'apiVersion' in head and 'kind' in head:
+                self._decode = k8s.pager.get_item_decoder(head)
+        return self._decode
+
+    def close(self):
+        self.response.release()
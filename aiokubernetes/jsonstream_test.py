@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeResponse, make_pod, to_bytes
+
+
+def make_list(names, rv='10'):
+    pod_list = k8s.V1PodList(
+        api_version='v1', kind='PodList',
+        metadata=k8s.V1ListMeta(resource_version=rv),
+        items=[make_pod(name) for name in names],
+    )
+    return to_bytes(pod_list)
+
+
+def parse(data, chunk_size):
+    parser = k8s.jsonstream.ListParser()
+    items = []
+    for i in range(0, len(data), chunk_size):
+        items.extend(parser.feed(data[i:i + chunk_size]))
+    parser.close()
+    return parser.head, items
+
+
+class TestListParser:
+    def test_chunks(self):
+        """Must produce the same items irrespective of the chunk boundaries."""
+        data = {
+            'kind': 'FooList', 'apiVersion': 'v1',
+            'metadata': {'resourceVersion': '5'},
+            'items': [{'x': 'a"\\]}', 'y': [1, 2.5, None]}, {'z': 'ü'}, {}],
+            'trailer': 12,
+        }
+        raw = json.dumps(data, ensure_ascii=False).encode('utf8')
+        for chunk_size in (1, 2, 3, 7, len(raw)):
+            head, items = parse(raw, chunk_size)
+            assert items == data['items']
+            assert head == {k: v for k, v in data.items() if k != 'items'}
+
+    def test_null_items(self):
+        head, items = parse(b'{"kind": "FooList", "items": null}', 4)
+        assert items == [] and head == {'kind': 'FooList', 'items': None}
+
+    def test_invalid(self):
+        for data in (b'[1, 2]', b'{"items": [{"a": 1}'):
+            with pytest.raises(ValueError):
+                parse(data, 3)
+
+
+class TestListStream:
+    def test_items(self):
+        resp = FakeResponse(make_list(['a', 'b', 'c'], rv='7'))
+        stream = k8s.jsonstream.ListStream(resp, chunk_size=50)
+
+        async def run():
+            return [_ async for _ in stream]
+
+        pods = fakes.run(run())
+        assert pods == [make_pod('a'), make_pod('b'), make_pod('c')]
+        assert stream.resource_version == '7'
+        assert resp.released
+
+    def test_error(self):
+        stream = k8s.jsonstream.ListStream(FakeResponse(status=403))
+        with pytest.raises(k8s.rest.ApiException) as err:
+            fakes.run(stream.__anext__())
+        assert err.value.status == 403
+
+    def test_truncated(self):
+        stream = k8s.jsonstream.ListStream(FakeResponse(make_list(['a'])[:-5]))
+
+        async def run():
+            return [_ async for _ in stream]
+
+        with pytest.raises(k8s.rest.ApiException) as err:
+            fakes.run(run())
+        assert err.value.status == 0
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+import aiokubernetes as k8s
+
+
+class TestLazyImport:
+    @pytest.mark.skipif(sys.version_info < (3, 7),
+                        reason="Python 3.6 imports everything eagerly")
+    def test_import_is_lazy(self):
+        """Importing the package must not import any API or model modules."""
+        code = (
+            "import sys, aiokubernetes;"
+            "print(sorted(_ for _ in sys.modules if _.startswith('aiokubernetes')))"
+        )
+        out = subprocess.check_output([sys.executable, '-c', code])
+        assert out.decode('utf8').strip() == "['aiokubernetes']"
+
+    def test_attributes(self):
+        # Top level access must return the same objects as the sub-packages.
+        assert k8s.CoreV1Api is k8s.api.CoreV1Api
+        assert k8s.V1Pod is k8s.models.V1Pod
+        assert k8s.V1Pod.__module__ == 'aiokubernetes.models.v1_pod'
+
+        # Hand written modules must be accessible without an explicit import.
+        assert k8s.swagger.__name__ == 'aiokubernetes.swagger'
+
+        assert 'V1Pod' in dir(k8s)
+        assert 'CoreV1Api' in dir(k8s.api)
+
+        for obj in (k8s, k8s.api, k8s.models):
+            with pytest.raises(AttributeError):
+                obj.DoesNotExist
+
+    def test_public_names(self):
+        """All names the eager `__init__` exported must still be available."""
+        assert k8s.ApiClient is k8s.api_client.ApiClient
+        assert k8s.Configuration is k8s.configuration.Configuration
+        for name in ('config', 'swagger', 'clients', 'api_proxy', 'watch', 'utils'):
+            assert getattr(k8s, name).__name__ == f'aiokubernetes.{name}'
+
+        names = {}
+        exec('from aiokubernetes import *', names)
+        for name in ('ApiClient', 'Configuration', 'CoreV1Api', 'V1Pod', 'watch'):
+            assert names[name] is getattr(k8s, name)
+        assert len(k8s.__all__) == len(set(k8s.__all__))
+        assert set(k8s.api.__all__) < set(k8s.__all__)
+        assert set(k8s.models.__all__) < set(k8s.__all__)
+        assert 'ApiClient' in dir(k8s)
@@ -41,6 +41,13 @@ class AdmissionregistrationV1beta1ServiceReference(object):
         'path': 'path'
     }
 
+    __slots__ = (
+        '_name',
+        '_namespace',
+        '_path',
+        'discriminator',
+    )
+
     def __init__(self, name=None, namespace=None, path=None):  # noqa: E501
         """AdmissionregistrationV1beta1ServiceReference - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class AdmissionregistrationV1beta1ServiceReference(object):
         if not isinstance(other, AdmissionregistrationV1beta1ServiceReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
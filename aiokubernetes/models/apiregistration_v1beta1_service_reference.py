@@ -39,6 +39,12 @@ class ApiregistrationV1beta1ServiceReference(object):
         'namespace': 'namespace'
     }
 
+    __slots__ = (
+        '_name',
+        '_namespace',
+        'discriminator',
+    )
+
     def __init__(self, name=None, namespace=None):  # noqa: E501
         """ApiregistrationV1beta1ServiceReference - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class ApiregistrationV1beta1ServiceReference(object):
         if not isinstance(other, ApiregistrationV1beta1ServiceReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,16 @@ class AppsV1beta1DeploymentCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_last_transition_time',
+        '_last_update_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, last_transition_time=None, last_update_time=None, message=None, reason=None, status=None, type=None):  # noqa: E501
         """AppsV1beta1DeploymentCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class AppsV1beta1DeploymentCondition(object):
         if not isinstance(other, AppsV1beta1DeploymentCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -53,6 +53,18 @@ class AppsV1beta1DeploymentStatus(object):
         'updated_replicas': 'updatedReplicas'
     }
 
+    __slots__ = (
+        '_available_replicas',
+        '_collision_count',
+        '_conditions',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        '_unavailable_replicas',
+        '_updated_replicas',
+        'discriminator',
+    )
+
     def __init__(self, available_replicas=None, collision_count=None, conditions=None, observed_generation=None, ready_replicas=None, replicas=None, unavailable_replicas=None, updated_replicas=None):  # noqa: E501
         """AppsV1beta1DeploymentStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -304,7 +316,10 @@ class AppsV1beta1DeploymentStatus(object):
         if not isinstance(other, AppsV1beta1DeploymentStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
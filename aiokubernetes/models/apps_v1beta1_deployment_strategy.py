@@ -41,6 +41,12 @@ class AppsV1beta1DeploymentStrategy(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_rolling_update',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, rolling_update=None, type=None):  # noqa: E501
         """AppsV1beta1DeploymentStrategy - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class AppsV1beta1DeploymentStrategy(object):
         if not isinstance(other, AppsV1beta1DeploymentStrategy):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class AppsV1beta1ScaleStatus(object):
         'target_selector': 'targetSelector'
     }
 
+    __slots__ = (
+        '_replicas',
+        '_selector',
+        '_target_selector',
+        'discriminator',
+    )
+
     def __init__(self, replicas=None, selector=None, target_selector=None):  # noqa: E501
         """AppsV1beta1ScaleStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class AppsV1beta1ScaleStatus(object):
         if not isinstance(other, AppsV1beta1ScaleStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,15 @@ class ExtensionsV1beta1DeploymentRollback(object):
         'updated_annotations': 'updatedAnnotations'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_name',
+        '_rollback_to',
+        '_updated_annotations',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, name=None, rollback_to=None, updated_annotations=None):  # noqa: E501
         """ExtensionsV1beta1DeploymentRollback - a model defined in Swagger"""  # noqa: E501
 
@@ -222,7 +231,10 @@ class ExtensionsV1beta1DeploymentRollback(object):
         if not isinstance(other, ExtensionsV1beta1DeploymentRollback):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
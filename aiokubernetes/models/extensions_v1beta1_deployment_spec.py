@@ -58,6 +58,19 @@ class ExtensionsV1beta1DeploymentSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_paused',
+        '_progress_deadline_seconds',
+        '_replicas',
+        '_revision_history_limit',
+        '_rollback_to',
+        '_selector',
+        '_strategy',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, min_ready_seconds=None, paused=None, progress_deadline_seconds=None, replicas=None, revision_history_limit=None, rollback_to=None, selector=None, strategy=None, template=None):  # noqa: E501
         """ExtensionsV1beta1DeploymentSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -336,7 +349,10 @@ class ExtensionsV1beta1DeploymentSpec(object):
         if not isinstance(other, ExtensionsV1beta1DeploymentSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class ExtensionsV1beta1HostPortRange(object):
         'min': 'min'
     }
 
+    __slots__ = (
+        '_max',
+        '_min',
+        'discriminator',
+    )
+
     def __init__(self, max=None, min=None):  # noqa: E501
         """ExtensionsV1beta1HostPortRange - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class ExtensionsV1beta1HostPortRange(object):
         if not isinstance(other, ExtensionsV1beta1HostPortRange):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class ExtensionsV1beta1ScaleSpec(object):
         'replicas': 'replicas'
     }
 
+    __slots__ = (
+        '_replicas',
+        'discriminator',
+    )
+
     def __init__(self, replicas=None):  # noqa: E501
         """ExtensionsV1beta1ScaleSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class ExtensionsV1beta1ScaleSpec(object):
         if not isinstance(other, ExtensionsV1beta1ScaleSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class ExtensionsV1beta1SupplementalGroupsStrategyOptions(object):
         'rule': 'rule'
     }
 
+    __slots__ = (
+        '_ranges',
+        '_rule',
+        'discriminator',
+    )
+
     def __init__(self, ranges=None, rule=None):  # noqa: E501
         """ExtensionsV1beta1SupplementalGroupsStrategyOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class ExtensionsV1beta1SupplementalGroupsStrategyOptions(object):
         if not isinstance(other, ExtensionsV1beta1SupplementalGroupsStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class PolicyV1beta1AllowedFlexVolume(object):
         'driver': 'driver'
     }
 
+    __slots__ = (
+        '_driver',
+        'discriminator',
+    )
+
     def __init__(self, driver=None):  # noqa: E501
         """PolicyV1beta1AllowedFlexVolume - a model defined in Swagger"""  # noqa: E501
 
@@ -107,7 +112,10 @@ class PolicyV1beta1AllowedFlexVolume(object):
         if not isinstance(other, PolicyV1beta1AllowedFlexVolume):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class PolicyV1beta1AllowedHostPath(object):
         'path_prefix': 'pathPrefix'
     }
 
+    __slots__ = (
+        '_path_prefix',
+        'discriminator',
+    )
+
     def __init__(self, path_prefix=None):  # noqa: E501
         """PolicyV1beta1AllowedHostPath - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class PolicyV1beta1AllowedHostPath(object):
         if not isinstance(other, PolicyV1beta1AllowedHostPath):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -79,6 +79,28 @@ class PolicyV1beta1PodSecurityPolicySpec(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        '_allow_privilege_escalation',
+        '_allowed_capabilities',
+        '_allowed_flex_volumes',
+        '_allowed_host_paths',
+        '_default_add_capabilities',
+        '_default_allow_privilege_escalation',
+        '_fs_group',
+        '_host_ipc',
+        '_host_network',
+        '_host_pid',
+        '_host_ports',
+        '_privileged',
+        '_read_only_root_filesystem',
+        '_required_drop_capabilities',
+        '_run_as_user',
+        '_se_linux',
+        '_supplemental_groups',
+        '_volumes',
+        'discriminator',
+    )
+
     def __init__(self, allow_privilege_escalation=None, allowed_capabilities=None, allowed_flex_volumes=None, allowed_host_paths=None, default_add_capabilities=None, default_allow_privilege_escalation=None, fs_group=None, host_ipc=None, host_network=None, host_pid=None, host_ports=None, privileged=None, read_only_root_filesystem=None, required_drop_capabilities=None, run_as_user=None, se_linux=None, supplemental_groups=None, volumes=None):  # noqa: E501
         """PolicyV1beta1PodSecurityPolicySpec - a model defined in Swagger"""  # noqa: E501
 
@@ -594,7 +616,10 @@ class PolicyV1beta1PodSecurityPolicySpec(object):
         if not isinstance(other, PolicyV1beta1PodSecurityPolicySpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class PolicyV1beta1RunAsUserStrategyOptions(object):
         'rule': 'rule'
     }
 
+    __slots__ = (
+        '_ranges',
+        '_rule',
+        'discriminator',
+    )
+
     def __init__(self, ranges=None, rule=None):  # noqa: E501
         """PolicyV1beta1RunAsUserStrategyOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class PolicyV1beta1RunAsUserStrategyOptions(object):
         if not isinstance(other, PolicyV1beta1RunAsUserStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class PolicyV1beta1SELinuxStrategyOptions(object):
         'se_linux_options': 'seLinuxOptions'
     }
 
+    __slots__ = (
+        '_rule',
+        '_se_linux_options',
+        'discriminator',
+    )
+
     def __init__(self, rule=None, se_linux_options=None):  # noqa: E501
         """PolicyV1beta1SELinuxStrategyOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class PolicyV1beta1SELinuxStrategyOptions(object):
         if not isinstance(other, PolicyV1beta1SELinuxStrategyOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
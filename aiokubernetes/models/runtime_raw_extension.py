@@ -37,6 +37,11 @@ class RuntimeRawExtension(object):
         'raw': 'Raw'
     }
 
+    __slots__ = (
+        '_raw',
+        'discriminator',
+    )
+
     def __init__(self, raw=None):  # noqa: E501
         """RuntimeRawExtension - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +114,10 @@ class RuntimeRawExtension(object):
         if not isinstance(other, RuntimeRawExtension):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
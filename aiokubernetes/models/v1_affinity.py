@@ -45,6 +45,13 @@ class V1Affinity(object):
         'pod_anti_affinity': 'podAntiAffinity'
     }
 
+    __slots__ = (
+        '_node_affinity',
+        '_pod_affinity',
+        '_pod_anti_affinity',
+        'discriminator',
+    )
+
     def __init__(self, node_affinity=None, pod_affinity=None, pod_anti_affinity=None):  # noqa: E501
         """V1Affinity - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +173,10 @@ class V1Affinity(object):
         if not isinstance(other, V1Affinity):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
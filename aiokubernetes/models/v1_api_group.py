@@ -50,6 +50,16 @@ class V1APIGroup(object):
         'versions': 'versions'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_name',
+        '_preferred_version',
+        '_server_address_by_client_cid_rs',
+        '_versions',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, name=None, preferred_version=None, server_address_by_client_cid_rs=None, versions=None):  # noqa: E501
         """V1APIGroup - a model defined in Swagger"""  # noqa: E501
 
@@ -252,7 +262,10 @@ class V1APIGroup(object):
         if not isinstance(other, V1APIGroup):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1APIGroupList(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_groups',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, groups=None, kind=None):  # noqa: E501
         """V1APIGroupList - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1APIGroupList(object):
         if not isinstance(other, V1APIGroupList):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -53,6 +53,19 @@ class V1APIResource(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        '_categories',
+        '_group',
+        '_kind',
+        '_name',
+        '_namespaced',
+        '_short_names',
+        '_singular_name',
+        '_verbs',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, categories=None, group=None, kind=None, name=None, namespaced=None, short_names=None, singular_name=None, verbs=None, version=None):  # noqa: E501
         """V1APIResource - a model defined in Swagger"""  # noqa: E501
 
@@ -335,7 +348,10 @@ class V1APIResource(object):
         if not isinstance(other, V1APIResource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
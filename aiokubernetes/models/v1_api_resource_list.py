@@ -45,6 +45,14 @@ class V1APIResourceList(object):
         'resources': 'resources'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_group_version',
+        '_kind',
+        '_resources',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, group_version=None, kind=None, resources=None):  # noqa: E501
         """V1APIResourceList - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1APIResourceList(object):
         if not isinstance(other, V1APIResourceList):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
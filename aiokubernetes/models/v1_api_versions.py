@@ -45,6 +45,14 @@ class V1APIVersions(object):
         'versions': 'versions'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_server_address_by_client_cid_rs',
+        '_versions',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, server_address_by_client_cid_rs=None, versions=None):  # noqa: E501
         """V1APIVersions - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1APIVersions(object):
         if not isinstance(other, V1APIVersions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
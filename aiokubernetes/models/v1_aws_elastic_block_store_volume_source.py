@@ -43,6 +43,14 @@ class V1AWSElasticBlockStoreVolumeSource(object):
         'volume_id': 'volumeID'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_partition',
+        '_read_only',
+        '_volume_id',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, partition=None, read_only=None, volume_id=None):  # noqa: E501
         """V1AWSElasticBlockStoreVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1AWSElasticBlockStoreVolumeSource(object):
         if not isinstance(other, V1AWSElasticBlockStoreVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
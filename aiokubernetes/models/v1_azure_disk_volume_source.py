@@ -47,6 +47,16 @@ class V1AzureDiskVolumeSource(object):
         'read_only': 'readOnly'
     }
 
+    __slots__ = (
+        '_caching_mode',
+        '_disk_name',
+        '_disk_uri',
+        '_fs_type',
+        '_kind',
+        '_read_only',
+        'discriminator',
+    )
+
     def __init__(self, caching_mode=None, disk_name=None, disk_uri=None, fs_type=None, kind=None, read_only=None):  # noqa: E501
         """V1AzureDiskVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1AzureDiskVolumeSource(object):
         if not isinstance(other, V1AzureDiskVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1AzureFilePersistentVolumeSource(object):
         'share_name': 'shareName'
     }
 
+    __slots__ = (
+        '_read_only',
+        '_secret_name',
+        '_secret_namespace',
+        '_share_name',
+        'discriminator',
+    )
+
     def __init__(self, read_only=None, secret_name=None, secret_namespace=None, share_name=None):  # noqa: E501
         """V1AzureFilePersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1AzureFilePersistentVolumeSource(object):
         if not isinstance(other, V1AzureFilePersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
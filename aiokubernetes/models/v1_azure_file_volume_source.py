@@ -41,6 +41,13 @@ class V1AzureFileVolumeSource(object):
         'share_name': 'shareName'
     }
 
+    __slots__ = (
+        '_read_only',
+        '_secret_name',
+        '_share_name',
+        'discriminator',
+    )
+
     def __init__(self, read_only=None, secret_name=None, share_name=None):  # noqa: E501
         """V1AzureFileVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1AzureFileVolumeSource(object):
         if not isinstance(other, V1AzureFileVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
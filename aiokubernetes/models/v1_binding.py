@@ -46,6 +46,14 @@ class V1Binding(object):
         'target': 'target'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_target',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, target=None):  # noqa: E501
         """V1Binding - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1Binding(object):
         if not isinstance(other, V1Binding):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
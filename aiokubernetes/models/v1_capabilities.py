@@ -39,6 +39,12 @@ class V1Capabilities(object):
         'drop': 'drop'
     }
 
+    __slots__ = (
+        '_add',
+        '_drop',
+        'discriminator',
+    )
+
     def __init__(self, add=None, drop=None):  # noqa: E501
         """V1Capabilities - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1Capabilities(object):
         if not isinstance(other, V1Capabilities):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
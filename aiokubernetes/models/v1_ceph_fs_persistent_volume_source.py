@@ -49,6 +49,16 @@ class V1CephFSPersistentVolumeSource(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_monitors',
+        '_path',
+        '_read_only',
+        '_secret_file',
+        '_secret_ref',
+        '_user',
+        'discriminator',
+    )
+
     def __init__(self, monitors=None, path=None, read_only=None, secret_file=None, secret_ref=None, user=None):  # noqa: E501
         """V1CephFSPersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1CephFSPersistentVolumeSource(object):
         if not isinstance(other, V1CephFSPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
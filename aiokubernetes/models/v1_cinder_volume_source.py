@@ -41,6 +41,13 @@ class V1CinderVolumeSource(object):
         'volume_id': 'volumeID'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_read_only',
+        '_volume_id',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, read_only=None, volume_id=None):  # noqa: E501
         """V1CinderVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V1CinderVolumeSource(object):
         if not isinstance(other, V1CinderVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
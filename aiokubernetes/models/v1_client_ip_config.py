@@ -37,6 +37,11 @@ class V1ClientIPConfig(object):
         'timeout_seconds': 'timeoutSeconds'
     }
 
+    __slots__ = (
+        '_timeout_seconds',
+        'discriminator',
+    )
+
     def __init__(self, timeout_seconds=None):  # noqa: E501
         """V1ClientIPConfig - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1ClientIPConfig(object):
         if not isinstance(other, V1ClientIPConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
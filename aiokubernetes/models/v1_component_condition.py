@@ -43,6 +43,14 @@ class V1ComponentCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_error',
+        '_message',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, error=None, message=None, status=None, type=None):  # noqa: E501
         """V1ComponentCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1ComponentCondition(object):
         if not isinstance(other, V1ComponentCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,15 @@ class V1ConfigMap(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_binary_data',
+        '_data',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, binary_data=None, data=None, kind=None, metadata=None):  # noqa: E501
         """V1ConfigMap - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1ConfigMap(object):
         if not isinstance(other, V1ConfigMap):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
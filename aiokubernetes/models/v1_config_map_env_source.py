@@ -39,6 +39,12 @@ class V1ConfigMapEnvSource(object):
         'optional': 'optional'
     }
 
+    __slots__ = (
+        '_name',
+        '_optional',
+        'discriminator',
+    )
+
     def __init__(self, name=None, optional=None):  # noqa: E501
         """V1ConfigMapEnvSource - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1ConfigMapEnvSource(object):
         if not isinstance(other, V1ConfigMapEnvSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1ConfigMapKeySelector(object):
         'optional': 'optional'
     }
 
+    __slots__ = (
+        '_key',
+        '_name',
+        '_optional',
+        'discriminator',
+    )
+
     def __init__(self, key=None, name=None, optional=None):  # noqa: E501
         """V1ConfigMapKeySelector - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V1ConfigMapKeySelector(object):
         if not isinstance(other, V1ConfigMapKeySelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,14 @@ class V1ConfigMapVolumeSource(object):
         'optional': 'optional'
     }
 
+    __slots__ = (
+        '_default_mode',
+        '_items',
+        '_name',
+        '_optional',
+        'discriminator',
+    )
+
     def __init__(self, default_mode=None, items=None, name=None, optional=None):  # noqa: E501
         """V1ConfigMapVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1ConfigMapVolumeSource(object):
         if not isinstance(other, V1ConfigMapVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -87,6 +87,31 @@ class V1Container(object):
         'working_dir': 'workingDir'
     }
 
+    __slots__ = (
+        '_args',
+        '_command',
+        '_env',
+        '_env_from',
+        '_image',
+        '_image_pull_policy',
+        '_lifecycle',
+        '_liveness_probe',
+        '_name',
+        '_ports',
+        '_readiness_probe',
+        '_resources',
+        '_security_context',
+        '_stdin',
+        '_stdin_once',
+        '_termination_message_path',
+        '_termination_message_policy',
+        '_tty',
+        '_volume_devices',
+        '_volume_mounts',
+        '_working_dir',
+        'discriminator',
+    )
+
     def __init__(self, args=None, command=None, env=None, env_from=None, image=None, image_pull_policy=None, lifecycle=None, liveness_probe=None, name=None, ports=None, readiness_probe=None, resources=None, security_context=None, stdin=None, stdin_once=None, termination_message_path=None, termination_message_policy=None, tty=None, volume_devices=None, volume_mounts=None, working_dir=None):  # noqa: E501
         """V1Container - a model defined in Swagger"""  # noqa: E501
 
@@ -677,7 +702,10 @@ class V1Container(object):
         if not isinstance(other, V1Container):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
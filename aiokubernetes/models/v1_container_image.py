@@ -39,6 +39,12 @@ class V1ContainerImage(object):
         'size_bytes': 'sizeBytes'
     }
 
+    __slots__ = (
+        '_names',
+        '_size_bytes',
+        'discriminator',
+    )
+
     def __init__(self, names=None, size_bytes=None):  # noqa: E501
         """V1ContainerImage - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1ContainerImage(object):
         if not isinstance(other, V1ContainerImage):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,15 @@ class V1ContainerPort(object):
         'protocol': 'protocol'
     }
 
+    __slots__ = (
+        '_container_port',
+        '_host_ip',
+        '_host_port',
+        '_name',
+        '_protocol',
+        'discriminator',
+    )
+
     def __init__(self, container_port=None, host_ip=None, host_port=None, name=None, protocol=None):  # noqa: E501
         """V1ContainerPort - a model defined in Swagger"""  # noqa: E501
 
@@ -219,7 +228,10 @@ class V1ContainerPort(object):
         if not isinstance(other, V1ContainerPort):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,13 @@ class V1ContainerState(object):
         'waiting': 'waiting'
     }
 
+    __slots__ = (
+        '_running',
+        '_terminated',
+        '_waiting',
+        'discriminator',
+    )
+
     def __init__(self, running=None, terminated=None, waiting=None):  # noqa: E501
         """V1ContainerState - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +173,10 @@ class V1ContainerState(object):
         if not isinstance(other, V1ContainerState):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class V1ContainerStateRunning(object):
         'started_at': 'startedAt'
     }
 
+    __slots__ = (
+        '_started_at',
+        'discriminator',
+    )
+
     def __init__(self, started_at=None):  # noqa: E501
         """V1ContainerStateRunning - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1ContainerStateRunning(object):
         if not isinstance(other, V1ContainerStateRunning):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
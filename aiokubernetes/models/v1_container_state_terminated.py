@@ -49,6 +49,17 @@ class V1ContainerStateTerminated(object):
         'started_at': 'startedAt'
     }
 
+    __slots__ = (
+        '_container_id',
+        '_exit_code',
+        '_finished_at',
+        '_message',
+        '_reason',
+        '_signal',
+        '_started_at',
+        'discriminator',
+    )
+
     def __init__(self, container_id=None, exit_code=None, finished_at=None, message=None, reason=None, signal=None, started_at=None):  # noqa: E501
         """V1ContainerStateTerminated - a model defined in Swagger"""  # noqa: E501
 
@@ -275,7 +286,10 @@ class V1ContainerStateTerminated(object):
         if not isinstance(other, V1ContainerStateTerminated):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
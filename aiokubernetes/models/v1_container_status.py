@@ -53,6 +53,18 @@ class V1ContainerStatus(object):
         'state': 'state'
     }
 
+    __slots__ = (
+        '_container_id',
+        '_image',
+        '_image_id',
+        '_last_state',
+        '_name',
+        '_ready',
+        '_restart_count',
+        '_state',
+        'discriminator',
+    )
+
     def __init__(self, container_id=None, image=None, image_id=None, last_state=None, name=None, ready=None, restart_count=None, state=None):  # noqa: E501
         """V1ContainerStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -309,7 +321,10 @@ class V1ContainerStatus(object):
         if not isinstance(other, V1ContainerStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1CrossVersionObjectReference(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, name=None):  # noqa: E501
         """V1CrossVersionObjectReference - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1CrossVersionObjectReference(object):
         if not isinstance(other, V1CrossVersionObjectReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
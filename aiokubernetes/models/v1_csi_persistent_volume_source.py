@@ -53,6 +53,18 @@ class V1CSIPersistentVolumeSource(object):
         'volume_handle': 'volumeHandle'
     }
 
+    __slots__ = (
+        '_controller_publish_secret_ref',
+        '_driver',
+        '_fs_type',
+        '_node_publish_secret_ref',
+        '_node_stage_secret_ref',
+        '_read_only',
+        '_volume_attributes',
+        '_volume_handle',
+        'discriminator',
+    )
+
     def __init__(self, controller_publish_secret_ref=None, driver=None, fs_type=None, node_publish_secret_ref=None, node_stage_secret_ref=None, read_only=None, volume_attributes=None, volume_handle=None):  # noqa: E501
         """V1CSIPersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -306,7 +318,10 @@ class V1CSIPersistentVolumeSource(object):
         if not isinstance(other, V1CSIPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
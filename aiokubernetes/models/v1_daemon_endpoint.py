@@ -37,6 +37,11 @@ class V1DaemonEndpoint(object):
         'port': 'Port'
     }
 
+    __slots__ = (
+        '_port',
+        'discriminator',
+    )
+
     def __init__(self, port=None):  # noqa: E501
         """V1DaemonEndpoint - a model defined in Swagger"""  # noqa: E501
 
@@ -107,7 +112,10 @@ class V1DaemonEndpoint(object):
         if not isinstance(other, V1DaemonEndpoint):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -57,6 +57,20 @@ class V1DaemonSetStatus(object):
         'updated_number_scheduled': 'updatedNumberScheduled'
     }
 
+    __slots__ = (
+        '_collision_count',
+        '_conditions',
+        '_current_number_scheduled',
+        '_desired_number_scheduled',
+        '_number_available',
+        '_number_misscheduled',
+        '_number_ready',
+        '_number_unavailable',
+        '_observed_generation',
+        '_updated_number_scheduled',
+        'discriminator',
+    )
+
     def __init__(self, collision_count=None, conditions=None, current_number_scheduled=None, desired_number_scheduled=None, number_available=None, number_misscheduled=None, number_ready=None, number_unavailable=None, observed_generation=None, updated_number_scheduled=None):  # noqa: E501
         """V1DaemonSetStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -364,7 +378,10 @@ class V1DaemonSetStatus(object):
         if not isinstance(other, V1DaemonSetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,16 @@ class V1DeleteOptions(object):
         'propagation_policy': 'propagationPolicy'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_grace_period_seconds',
+        '_kind',
+        '_orphan_dependents',
+        '_preconditions',
+        '_propagation_policy',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, grace_period_seconds=None, kind=None, orphan_dependents=None, preconditions=None, propagation_policy=None):  # noqa: E501
         """V1DeleteOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1DeleteOptions(object):
         if not isinstance(other, V1DeleteOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1DownwardAPIProjection(object):
         'items': 'items'
     }
 
+    __slots__ = (
+        '_items',
+        'discriminator',
+    )
+
     def __init__(self, items=None):  # noqa: E501
         """V1DownwardAPIProjection - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1DownwardAPIProjection(object):
         if not isinstance(other, V1DownwardAPIProjection):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1DownwardAPIVolumeFile(object):
         'resource_field_ref': 'resourceFieldRef'
     }
 
+    __slots__ = (
+        '_field_ref',
+        '_mode',
+        '_path',
+        '_resource_field_ref',
+        'discriminator',
+    )
+
     def __init__(self, field_ref=None, mode=None, path=None, resource_field_ref=None):  # noqa: E501
         """V1DownwardAPIVolumeFile - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1DownwardAPIVolumeFile(object):
         if not isinstance(other, V1DownwardAPIVolumeFile):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class V1DownwardAPIVolumeSource(object):
         'items': 'items'
     }
 
+    __slots__ = (
+        '_default_mode',
+        '_items',
+        'discriminator',
+    )
+
     def __init__(self, default_mode=None, items=None):  # noqa: E501
         """V1DownwardAPIVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1DownwardAPIVolumeSource(object):
         if not isinstance(other, V1DownwardAPIVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1EmptyDirVolumeSource(object):
         'size_limit': 'sizeLimit'
     }
 
+    __slots__ = (
+        '_medium',
+        '_size_limit',
+        'discriminator',
+    )
+
     def __init__(self, medium=None, size_limit=None):  # noqa: E501
         """V1EmptyDirVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1EmptyDirVolumeSource(object):
         if not isinstance(other, V1EmptyDirVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,14 @@ class V1EndpointAddress(object):
         'target_ref': 'targetRef'
     }
 
+    __slots__ = (
+        '_hostname',
+        '_ip',
+        '_node_name',
+        '_target_ref',
+        'discriminator',
+    )
+
     def __init__(self, hostname=None, ip=None, node_name=None, target_ref=None):  # noqa: E501
         """V1EndpointAddress - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V1EndpointAddress(object):
         if not isinstance(other, V1EndpointAddress):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
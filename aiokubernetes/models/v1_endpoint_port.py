@@ -41,6 +41,13 @@ class V1EndpointPort(object):
         'protocol': 'protocol'
     }
 
+    __slots__ = (
+        '_name',
+        '_port',
+        '_protocol',
+        'discriminator',
+    )
+
     def __init__(self, name=None, port=None, protocol=None):  # noqa: E501
         """V1EndpointPort - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V1EndpointPort(object):
         if not isinstance(other, V1EndpointPort):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
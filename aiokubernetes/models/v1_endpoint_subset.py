@@ -44,6 +44,13 @@ class V1EndpointSubset(object):
         'ports': 'ports'
     }
 
+    __slots__ = (
+        '_addresses',
+        '_not_ready_addresses',
+        '_ports',
+        'discriminator',
+    )
+
     def __init__(self, addresses=None, not_ready_addresses=None, ports=None):  # noqa: E501
         """V1EndpointSubset - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1EndpointSubset(object):
         if not isinstance(other, V1EndpointSubset):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1Endpoints(object):
         'subsets': 'subsets'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_subsets',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, subsets=None):  # noqa: E501
         """V1Endpoints - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V1Endpoints(object):
         if not isinstance(other, V1Endpoints):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
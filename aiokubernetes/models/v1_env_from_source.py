@@ -44,6 +44,13 @@ class V1EnvFromSource(object):
         'secret_ref': 'secretRef'
     }
 
+    __slots__ = (
+        '_config_map_ref',
+        '_prefix',
+        '_secret_ref',
+        'discriminator',
+    )
+
     def __init__(self, config_map_ref=None, prefix=None, secret_ref=None):  # noqa: E501
         """V1EnvFromSource - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1EnvFromSource(object):
         if not isinstance(other, V1EnvFromSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1EnvVar(object):
         'value_from': 'valueFrom'
     }
 
+    __slots__ = (
+        '_name',
+        '_value',
+        '_value_from',
+        'discriminator',
+    )
+
     def __init__(self, name=None, value=None, value_from=None):  # noqa: E501
         """V1EnvVar - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1EnvVar(object):
         if not isinstance(other, V1EnvVar):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
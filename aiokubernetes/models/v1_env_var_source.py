@@ -48,6 +48,14 @@ class V1EnvVarSource(object):
         'secret_key_ref': 'secretKeyRef'
     }
 
+    __slots__ = (
+        '_config_map_key_ref',
+        '_field_ref',
+        '_resource_field_ref',
+        '_secret_key_ref',
+        'discriminator',
+    )
+
     def __init__(self, config_map_key_ref=None, field_ref=None, resource_field_ref=None, secret_key_ref=None):  # noqa: E501
         """V1EnvVarSource - a model defined in Swagger"""  # noqa: E501
 
@@ -195,7 +203,10 @@ class V1EnvVarSource(object):
         if not isinstance(other, V1EnvVarSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
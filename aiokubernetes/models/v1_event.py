@@ -74,6 +74,27 @@ class V1Event(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_action',
+        '_api_version',
+        '_count',
+        '_event_time',
+        '_first_timestamp',
+        '_involved_object',
+        '_kind',
+        '_last_timestamp',
+        '_message',
+        '_metadata',
+        '_reason',
+        '_related',
+        '_reporting_component',
+        '_reporting_instance',
+        '_series',
+        '_source',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, action=None, api_version=None, count=None, event_time=None, first_timestamp=None, involved_object=None, kind=None, last_timestamp=None, message=None, metadata=None, reason=None, related=None, reporting_component=None, reporting_instance=None, series=None, source=None, type=None):  # noqa: E501
         """V1Event - a model defined in Swagger"""  # noqa: E501
 
@@ -561,7 +582,10 @@ class V1Event(object):
         if not isinstance(other, V1Event):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
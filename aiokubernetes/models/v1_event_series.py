@@ -41,6 +41,13 @@ class V1EventSeries(object):
         'state': 'state'
     }
 
+    __slots__ = (
+        '_count',
+        '_last_observed_time',
+        '_state',
+        'discriminator',
+    )
+
     def __init__(self, count=None, last_observed_time=None, state=None):  # noqa: E501
         """V1EventSeries - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1EventSeries(object):
         if not isinstance(other, V1EventSeries):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1EventSource(object):
         'host': 'host'
     }
 
+    __slots__ = (
+        '_component',
+        '_host',
+        'discriminator',
+    )
+
     def __init__(self, component=None, host=None):  # noqa: E501
         """V1EventSource - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1EventSource(object):
         if not isinstance(other, V1EventSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
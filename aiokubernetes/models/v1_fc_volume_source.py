@@ -45,6 +45,15 @@ class V1FCVolumeSource(object):
         'wwids': 'wwids'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_lun',
+        '_read_only',
+        '_target_ww_ns',
+        '_wwids',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, lun=None, read_only=None, target_ww_ns=None, wwids=None):  # noqa: E501
         """V1FCVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -218,7 +227,10 @@ class V1FCVolumeSource(object):
         if not isinstance(other, V1FCVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,15 @@ class V1FlexVolumeSource(object):
         'secret_ref': 'secretRef'
     }
 
+    __slots__ = (
+        '_driver',
+        '_fs_type',
+        '_options',
+        '_read_only',
+        '_secret_ref',
+        'discriminator',
+    )
+
     def __init__(self, driver=None, fs_type=None, options=None, read_only=None, secret_ref=None):  # noqa: E501
         """V1FlexVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -221,7 +230,10 @@ class V1FlexVolumeSource(object):
         if not isinstance(other, V1FlexVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
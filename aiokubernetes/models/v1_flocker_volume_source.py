@@ -39,6 +39,12 @@ class V1FlockerVolumeSource(object):
         'dataset_uuid': 'datasetUUID'
     }
 
+    __slots__ = (
+        '_dataset_name',
+        '_dataset_uuid',
+        'discriminator',
+    )
+
     def __init__(self, dataset_name=None, dataset_uuid=None):  # noqa: E501
         """V1FlockerVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1FlockerVolumeSource(object):
         if not isinstance(other, V1FlockerVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1GCEPersistentDiskVolumeSource(object):
         'read_only': 'readOnly'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_partition',
+        '_pd_name',
+        '_read_only',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, partition=None, pd_name=None, read_only=None):  # noqa: E501
         """V1GCEPersistentDiskVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1GCEPersistentDiskVolumeSource(object):
         if not isinstance(other, V1GCEPersistentDiskVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1GitRepoVolumeSource(object):
         'revision': 'revision'
     }
 
+    __slots__ = (
+        '_directory',
+        '_repository',
+        '_revision',
+        'discriminator',
+    )
+
     def __init__(self, directory=None, repository=None, revision=None):  # noqa: E501
         """V1GitRepoVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V1GitRepoVolumeSource(object):
         if not isinstance(other, V1GitRepoVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
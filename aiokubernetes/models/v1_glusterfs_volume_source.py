@@ -41,6 +41,13 @@ class V1GlusterfsVolumeSource(object):
         'read_only': 'readOnly'
     }
 
+    __slots__ = (
+        '_endpoints',
+        '_path',
+        '_read_only',
+        'discriminator',
+    )
+
     def __init__(self, endpoints=None, path=None, read_only=None):  # noqa: E501
         """V1GlusterfsVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1GlusterfsVolumeSource(object):
         if not isinstance(other, V1GlusterfsVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1GroupVersionForDiscovery(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        '_group_version',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group_version=None, version=None):  # noqa: E501
         """V1GroupVersionForDiscovery - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1GroupVersionForDiscovery(object):
         if not isinstance(other, V1GroupVersionForDiscovery):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,13 @@ class V1Handler(object):
         'tcp_socket': 'tcpSocket'
     }
 
+    __slots__ = (
+        '__exec',
+        '_http_get',
+        '_tcp_socket',
+        'discriminator',
+    )
+
     def __init__(self, _exec=None, http_get=None, tcp_socket=None):  # noqa: E501
         """V1Handler - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +173,10 @@ class V1Handler(object):
         if not isinstance(other, V1Handler):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,14 @@ class V1HorizontalPodAutoscalerSpec(object):
         'target_cpu_utilization_percentage': 'targetCPUUtilizationPercentage'
     }
 
+    __slots__ = (
+        '_max_replicas',
+        '_min_replicas',
+        '_scale_target_ref',
+        '_target_cpu_utilization_percentage',
+        'discriminator',
+    )
+
     def __init__(self, max_replicas=None, min_replicas=None, scale_target_ref=None, target_cpu_utilization_percentage=None):  # noqa: E501
         """V1HorizontalPodAutoscalerSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1HorizontalPodAutoscalerSpec(object):
         if not isinstance(other, V1HorizontalPodAutoscalerSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
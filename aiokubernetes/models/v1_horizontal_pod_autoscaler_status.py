@@ -45,6 +45,15 @@ class V1HorizontalPodAutoscalerStatus(object):
         'observed_generation': 'observedGeneration'
     }
 
+    __slots__ = (
+        '_current_cpu_utilization_percentage',
+        '_current_replicas',
+        '_desired_replicas',
+        '_last_scale_time',
+        '_observed_generation',
+        'discriminator',
+    )
+
     def __init__(self, current_cpu_utilization_percentage=None, current_replicas=None, desired_replicas=None, last_scale_time=None, observed_generation=None):  # noqa: E501
         """V1HorizontalPodAutoscalerStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1HorizontalPodAutoscalerStatus(object):
         if not isinstance(other, V1HorizontalPodAutoscalerStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
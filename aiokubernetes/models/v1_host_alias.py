@@ -39,6 +39,12 @@ class V1HostAlias(object):
         'ip': 'ip'
     }
 
+    __slots__ = (
+        '_hostnames',
+        '_ip',
+        'discriminator',
+    )
+
     def __init__(self, hostnames=None, ip=None):  # noqa: E501
         """V1HostAlias - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1HostAlias(object):
         if not isinstance(other, V1HostAlias):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
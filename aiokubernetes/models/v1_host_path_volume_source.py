@@ -39,6 +39,12 @@ class V1HostPathVolumeSource(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_path',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, path=None, type=None):  # noqa: E501
         """V1HostPathVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1HostPathVolumeSource(object):
         if not isinstance(other, V1HostPathVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
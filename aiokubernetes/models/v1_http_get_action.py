@@ -47,6 +47,15 @@ class V1HTTPGetAction(object):
         'scheme': 'scheme'
     }
 
+    __slots__ = (
+        '_host',
+        '_http_headers',
+        '_path',
+        '_port',
+        '_scheme',
+        'discriminator',
+    )
+
     def __init__(self, host=None, http_headers=None, path=None, port=None, scheme=None):  # noqa: E501
         """V1HTTPGetAction - a model defined in Swagger"""  # noqa: E501
 
@@ -221,7 +230,10 @@ class V1HTTPGetAction(object):
         if not isinstance(other, V1HTTPGetAction):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
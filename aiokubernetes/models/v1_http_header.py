@@ -39,6 +39,12 @@ class V1HTTPHeader(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_name',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, name=None, value=None):  # noqa: E501
         """V1HTTPHeader - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1HTTPHeader(object):
         if not isinstance(other, V1HTTPHeader):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,12 @@ class V1Initializers(object):
         'result': 'result'
     }
 
+    __slots__ = (
+        '_pending',
+        '_result',
+        'discriminator',
+    )
+
     def __init__(self, pending=None, result=None):  # noqa: E501
         """V1Initializers - a model defined in Swagger"""  # noqa: E501
 
@@ -138,7 +144,10 @@ class V1Initializers(object):
         if not isinstance(other, V1Initializers):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1IPBlock(object):
         '_except': 'except'
     }
 
+    __slots__ = (
+        '_cidr',
+        '__except',
+        'discriminator',
+    )
+
     def __init__(self, cidr=None, _except=None):  # noqa: E501
         """V1IPBlock - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1IPBlock(object):
         if not isinstance(other, V1IPBlock):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -59,6 +59,21 @@ class V1ISCSIVolumeSource(object):
         'target_portal': 'targetPortal'
     }
 
+    __slots__ = (
+        '_chap_auth_discovery',
+        '_chap_auth_session',
+        '_fs_type',
+        '_initiator_name',
+        '_iqn',
+        '_iscsi_interface',
+        '_lun',
+        '_portals',
+        '_read_only',
+        '_secret_ref',
+        '_target_portal',
+        'discriminator',
+    )
+
     def __init__(self, chap_auth_discovery=None, chap_auth_session=None, fs_type=None, initiator_name=None, iqn=None, iscsi_interface=None, lun=None, portals=None, read_only=None, secret_ref=None, target_portal=None):  # noqa: E501
         """V1ISCSIVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -391,7 +406,10 @@ class V1ISCSIVolumeSource(object):
         if not isinstance(other, V1ISCSIVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
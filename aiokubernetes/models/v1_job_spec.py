@@ -52,6 +52,17 @@ class V1JobSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_active_deadline_seconds',
+        '_backoff_limit',
+        '_completions',
+        '_manual_selector',
+        '_parallelism',
+        '_selector',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, active_deadline_seconds=None, backoff_limit=None, completions=None, manual_selector=None, parallelism=None, selector=None, template=None):  # noqa: E501
         """V1JobSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -278,7 +289,10 @@ class V1JobSpec(object):
         if not isinstance(other, V1JobSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
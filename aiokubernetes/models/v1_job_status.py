@@ -49,6 +49,16 @@ class V1JobStatus(object):
         'succeeded': 'succeeded'
     }
 
+    __slots__ = (
+        '_active',
+        '_completion_time',
+        '_conditions',
+        '_failed',
+        '_start_time',
+        '_succeeded',
+        'discriminator',
+    )
+
     def __init__(self, active=None, completion_time=None, conditions=None, failed=None, start_time=None, succeeded=None):  # noqa: E501
         """V1JobStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1JobStatus(object):
         if not isinstance(other, V1JobStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
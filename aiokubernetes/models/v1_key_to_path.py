@@ -41,6 +41,13 @@ class V1KeyToPath(object):
         'path': 'path'
     }
 
+    __slots__ = (
+        '_key',
+        '_mode',
+        '_path',
+        'discriminator',
+    )
+
     def __init__(self, key=None, mode=None, path=None):  # noqa: E501
         """V1KeyToPath - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1KeyToPath(object):
         if not isinstance(other, V1KeyToPath):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
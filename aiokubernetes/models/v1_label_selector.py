@@ -41,6 +41,12 @@ class V1LabelSelector(object):
         'match_labels': 'matchLabels'
     }
 
+    __slots__ = (
+        '_match_expressions',
+        '_match_labels',
+        'discriminator',
+    )
+
     def __init__(self, match_expressions=None, match_labels=None):  # noqa: E501
         """V1LabelSelector - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1LabelSelector(object):
         if not isinstance(other, V1LabelSelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
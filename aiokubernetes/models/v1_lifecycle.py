@@ -41,6 +41,12 @@ class V1Lifecycle(object):
         'pre_stop': 'preStop'
     }
 
+    __slots__ = (
+        '_post_start',
+        '_pre_stop',
+        'discriminator',
+    )
+
     def __init__(self, post_start=None, pre_stop=None):  # noqa: E501
         """V1Lifecycle - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1Lifecycle(object):
         if not isinstance(other, V1Lifecycle):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,16 @@ class V1LimitRangeItem(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_default',
+        '_default_request',
+        '_max',
+        '_max_limit_request_ratio',
+        '_min',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, default=None, default_request=None, max=None, max_limit_request_ratio=None, min=None, type=None):  # noqa: E501
         """V1LimitRangeItem - a model defined in Swagger"""  # noqa: E501
 
@@ -246,7 +256,10 @@ class V1LimitRangeItem(object):
         if not isinstance(other, V1LimitRangeItem):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1LimitRangeSpec(object):
         'limits': 'limits'
     }
 
+    __slots__ = (
+        '_limits',
+        'discriminator',
+    )
+
     def __init__(self, limits=None):  # noqa: E501
         """V1LimitRangeSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +114,10 @@ class V1LimitRangeSpec(object):
         if not isinstance(other, V1LimitRangeSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
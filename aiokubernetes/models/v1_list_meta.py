@@ -41,6 +41,13 @@ class V1ListMeta(object):
         'self_link': 'selfLink'
     }
 
+    __slots__ = (
+        '__continue',
+        '_resource_version',
+        '_self_link',
+        'discriminator',
+    )
+
     def __init__(self, _continue=None, resource_version=None, self_link=None):  # noqa: E501
         """V1ListMeta - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1ListMeta(object):
         if not isinstance(other, V1ListMeta):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1LoadBalancerIngress(object):
         'ip': 'ip'
     }
 
+    __slots__ = (
+        '_hostname',
+        '_ip',
+        'discriminator',
+    )
+
     def __init__(self, hostname=None, ip=None):  # noqa: E501
         """V1LoadBalancerIngress - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1LoadBalancerIngress(object):
         if not isinstance(other, V1LoadBalancerIngress):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
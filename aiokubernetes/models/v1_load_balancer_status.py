@@ -39,6 +39,11 @@ class V1LoadBalancerStatus(object):
         'ingress': 'ingress'
     }
 
+    __slots__ = (
+        '_ingress',
+        'discriminator',
+    )
+
     def __init__(self, ingress=None):  # noqa: E501
         """V1LoadBalancerStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1LoadBalancerStatus(object):
         if not isinstance(other, V1LoadBalancerStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
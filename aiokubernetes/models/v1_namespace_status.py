@@ -37,6 +37,11 @@ class V1NamespaceStatus(object):
         'phase': 'phase'
     }
 
+    __slots__ = (
+        '_phase',
+        'discriminator',
+    )
+
     def __init__(self, phase=None):  # noqa: E501
         """V1NamespaceStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1NamespaceStatus(object):
         if not isinstance(other, V1NamespaceStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,12 @@ class V1NetworkPolicyEgressRule(object):
         'to': 'to'
     }
 
+    __slots__ = (
+        '_ports',
+        '_to',
+        'discriminator',
+    )
+
     def __init__(self, ports=None, to=None):  # noqa: E501
         """V1NetworkPolicyEgressRule - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1NetworkPolicyEgressRule(object):
         if not isinstance(other, V1NetworkPolicyEgressRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
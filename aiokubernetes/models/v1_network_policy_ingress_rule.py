@@ -42,6 +42,12 @@ class V1NetworkPolicyIngressRule(object):
         'ports': 'ports'
     }
 
+    __slots__ = (
+        '__from',
+        '_ports',
+        'discriminator',
+    )
+
     def __init__(self, _from=None, ports=None):  # noqa: E501
         """V1NetworkPolicyIngressRule - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1NetworkPolicyIngressRule(object):
         if not isinstance(other, V1NetworkPolicyIngressRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
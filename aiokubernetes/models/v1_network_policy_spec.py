@@ -47,6 +47,14 @@ class V1NetworkPolicySpec(object):
         'policy_types': 'policyTypes'
     }
 
+    __slots__ = (
+        '_egress',
+        '_ingress',
+        '_pod_selector',
+        '_policy_types',
+        'discriminator',
+    )
+
     def __init__(self, egress=None, ingress=None, pod_selector=None, policy_types=None):  # noqa: E501
         """V1NetworkPolicySpec - a model defined in Swagger"""  # noqa: E501
 
@@ -195,7 +203,10 @@ class V1NetworkPolicySpec(object):
         if not isinstance(other, V1NetworkPolicySpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
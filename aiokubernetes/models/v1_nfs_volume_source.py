@@ -41,6 +41,13 @@ class V1NFSVolumeSource(object):
         'server': 'server'
     }
 
+    __slots__ = (
+        '_path',
+        '_read_only',
+        '_server',
+        'discriminator',
+    )
+
     def __init__(self, path=None, read_only=None, server=None):  # noqa: E501
         """V1NFSVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1NFSVolumeSource(object):
         if not isinstance(other, V1NFSVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1NodeAddress(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_address',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, address=None, type=None):  # noqa: E501
         """V1NodeAddress - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1NodeAddress(object):
         if not isinstance(other, V1NodeAddress):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,12 @@ class V1NodeAffinity(object):
         'required_during_scheduling_ignored_during_execution': 'requiredDuringSchedulingIgnoredDuringExecution'
     }
 
+    __slots__ = (
+        '_preferred_during_scheduling_ignored_during_execution',
+        '_required_during_scheduling_ignored_during_execution',
+        'discriminator',
+    )
+
     def __init__(self, preferred_during_scheduling_ignored_during_execution=None, required_during_scheduling_ignored_during_execution=None):  # noqa: E501
         """V1NodeAffinity - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1NodeAffinity(object):
         if not isinstance(other, V1NodeAffinity):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
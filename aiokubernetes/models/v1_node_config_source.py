@@ -43,6 +43,13 @@ class V1NodeConfigSource(object):
         'kind': 'kind'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_config_map_ref',
+        '_kind',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, config_map_ref=None, kind=None):  # noqa: E501
         """V1NodeConfigSource - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1NodeConfigSource(object):
         if not isinstance(other, V1NodeConfigSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1NodeDaemonEndpoints(object):
         'kubelet_endpoint': 'kubeletEndpoint'
     }
 
+    __slots__ = (
+        '_kubelet_endpoint',
+        'discriminator',
+    )
+
     def __init__(self, kubelet_endpoint=None):  # noqa: E501
         """V1NodeDaemonEndpoints - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1NodeDaemonEndpoints(object):
         if not isinstance(other, V1NodeDaemonEndpoints):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
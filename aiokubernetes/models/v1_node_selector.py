@@ -39,6 +39,11 @@ class V1NodeSelector(object):
         'node_selector_terms': 'nodeSelectorTerms'
     }
 
+    __slots__ = (
+        '_node_selector_terms',
+        'discriminator',
+    )
+
     def __init__(self, node_selector_terms=None):  # noqa: E501
         """V1NodeSelector - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +114,10 @@ class V1NodeSelector(object):
         if not isinstance(other, V1NodeSelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1NodeSelectorTerm(object):
         'match_expressions': 'matchExpressions'
     }
 
+    __slots__ = (
+        '_match_expressions',
+        'discriminator',
+    )
+
     def __init__(self, match_expressions=None):  # noqa: E501
         """V1NodeSelectorTerm - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +114,10 @@ class V1NodeSelectorTerm(object):
         if not isinstance(other, V1NodeSelectorTerm):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,6 +50,16 @@ class V1NodeSpec(object):
         'unschedulable': 'unschedulable'
     }
 
+    __slots__ = (
+        '_config_source',
+        '_external_id',
+        '_pod_cidr',
+        '_provider_id',
+        '_taints',
+        '_unschedulable',
+        'discriminator',
+    )
+
     def __init__(self, config_source=None, external_id=None, pod_cidr=None, provider_id=None, taints=None, unschedulable=None):  # noqa: E501
         """V1NodeSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1NodeSpec(object):
         if not isinstance(other, V1NodeSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -62,6 +62,20 @@ class V1NodeStatus(object):
         'volumes_in_use': 'volumesInUse'
     }
 
+    __slots__ = (
+        '_addresses',
+        '_allocatable',
+        '_capacity',
+        '_conditions',
+        '_daemon_endpoints',
+        '_images',
+        '_node_info',
+        '_phase',
+        '_volumes_attached',
+        '_volumes_in_use',
+        'discriminator',
+    )
+
     def __init__(self, addresses=None, allocatable=None, capacity=None, conditions=None, daemon_endpoints=None, images=None, node_info=None, phase=None, volumes_attached=None, volumes_in_use=None):  # noqa: E501
         """V1NodeStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -365,7 +379,10 @@ class V1NodeStatus(object):
         if not isinstance(other, V1NodeStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,6 +55,20 @@ class V1NodeSystemInfo(object):
         'system_uuid': 'systemUUID'
     }
 
+    __slots__ = (
+        '_architecture',
+        '_boot_id',
+        '_container_runtime_version',
+        '_kernel_version',
+        '_kube_proxy_version',
+        '_kubelet_version',
+        '_machine_id',
+        '_operating_system',
+        '_os_image',
+        '_system_uuid',
+        'discriminator',
+    )
+
     def __init__(self, architecture=None, boot_id=None, container_runtime_version=None, kernel_version=None, kube_proxy_version=None, kubelet_version=None, machine_id=None, operating_system=None, os_image=None, system_uuid=None):  # noqa: E501
         """V1NodeSystemInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -368,7 +382,10 @@ class V1NodeSystemInfo(object):
         if not isinstance(other, V1NodeSystemInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
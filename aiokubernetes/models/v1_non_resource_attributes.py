@@ -39,6 +39,12 @@ class V1NonResourceAttributes(object):
         'verb': 'verb'
     }
 
+    __slots__ = (
+        '_path',
+        '_verb',
+        'discriminator',
+    )
+
     def __init__(self, path=None, verb=None):  # noqa: E501
         """V1NonResourceAttributes - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1NonResourceAttributes(object):
         if not isinstance(other, V1NonResourceAttributes):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1NonResourceRule(object):
         'verbs': 'verbs'
     }
 
+    __slots__ = (
+        '_non_resource_ur_ls',
+        '_verbs',
+        'discriminator',
+    )
+
     def __init__(self, non_resource_ur_ls=None, verbs=None):  # noqa: E501
         """V1NonResourceRule - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1NonResourceRule(object):
         if not isinstance(other, V1NonResourceRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1ObjectFieldSelector(object):
         'field_path': 'fieldPath'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_field_path',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, field_path=None):  # noqa: E501
         """V1ObjectFieldSelector - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1ObjectFieldSelector(object):
         if not isinstance(other, V1ObjectFieldSelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
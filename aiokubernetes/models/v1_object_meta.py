@@ -70,6 +70,26 @@ class V1ObjectMeta(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        '_annotations',
+        '_cluster_name',
+        '_creation_timestamp',
+        '_deletion_grace_period_seconds',
+        '_deletion_timestamp',
+        '_finalizers',
+        '_generate_name',
+        '_generation',
+        '_initializers',
+        '_labels',
+        '_name',
+        '_namespace',
+        '_owner_references',
+        '_resource_version',
+        '_self_link',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, annotations=None, cluster_name=None, creation_timestamp=None, deletion_grace_period_seconds=None, deletion_timestamp=None, finalizers=None, generate_name=None, generation=None, initializers=None, labels=None, name=None, namespace=None, owner_references=None, resource_version=None, self_link=None, uid=None):  # noqa: E501
         """V1ObjectMeta - a model defined in Swagger"""  # noqa: E501
 
@@ -529,7 +549,10 @@ class V1ObjectMeta(object):
         if not isinstance(other, V1ObjectMeta):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
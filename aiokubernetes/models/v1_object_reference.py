@@ -49,6 +49,17 @@ class V1ObjectReference(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_field_path',
+        '_kind',
+        '_name',
+        '_namespace',
+        '_resource_version',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, field_path=None, kind=None, name=None, namespace=None, resource_version=None, uid=None):  # noqa: E501
         """V1ObjectReference - a model defined in Swagger"""  # noqa: E501
 
@@ -274,7 +285,10 @@ class V1ObjectReference(object):
         if not isinstance(other, V1ObjectReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,16 @@ class V1OwnerReference(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_block_owner_deletion',
+        '_controller',
+        '_kind',
+        '_name',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, block_owner_deletion=None, controller=None, kind=None, name=None, uid=None):  # noqa: E501
         """V1OwnerReference - a model defined in Swagger"""  # noqa: E501
 
@@ -250,7 +260,10 @@ class V1OwnerReference(object):
         if not isinstance(other, V1OwnerReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
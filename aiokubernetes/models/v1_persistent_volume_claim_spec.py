@@ -50,6 +50,16 @@ class V1PersistentVolumeClaimSpec(object):
         'volume_name': 'volumeName'
     }
 
+    __slots__ = (
+        '_access_modes',
+        '_resources',
+        '_selector',
+        '_storage_class_name',
+        '_volume_mode',
+        '_volume_name',
+        'discriminator',
+    )
+
     def __init__(self, access_modes=None, resources=None, selector=None, storage_class_name=None, volume_mode=None, volume_name=None):  # noqa: E501
         """V1PersistentVolumeClaimSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1PersistentVolumeClaimSpec(object):
         if not isinstance(other, V1PersistentVolumeClaimSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
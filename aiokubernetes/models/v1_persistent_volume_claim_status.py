@@ -45,6 +45,14 @@ class V1PersistentVolumeClaimStatus(object):
         'phase': 'phase'
     }
 
+    __slots__ = (
+        '_access_modes',
+        '_capacity',
+        '_conditions',
+        '_phase',
+        'discriminator',
+    )
+
     def __init__(self, access_modes=None, capacity=None, conditions=None, phase=None):  # noqa: E501
         """V1PersistentVolumeClaimStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1PersistentVolumeClaimStatus(object):
         if not isinstance(other, V1PersistentVolumeClaimStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1PersistentVolumeClaimVolumeSource(object):
         'read_only': 'readOnly'
     }
 
+    __slots__ = (
+        '_claim_name',
+        '_read_only',
+        'discriminator',
+    )
+
     def __init__(self, claim_name=None, read_only=None):  # noqa: E501
         """V1PersistentVolumeClaimVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1PersistentVolumeClaimVolumeSource(object):
         if not isinstance(other, V1PersistentVolumeClaimVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -120,6 +120,40 @@ class V1PersistentVolumeSpec(object):
         'vsphere_volume': 'vsphereVolume'
     }
 
+    __slots__ = (
+        '_access_modes',
+        '_aws_elastic_block_store',
+        '_azure_disk',
+        '_azure_file',
+        '_capacity',
+        '_cephfs',
+        '_cinder',
+        '_claim_ref',
+        '_csi',
+        '_fc',
+        '_flex_volume',
+        '_flocker',
+        '_gce_persistent_disk',
+        '_glusterfs',
+        '_host_path',
+        '_iscsi',
+        '_local',
+        '_mount_options',
+        '_nfs',
+        '_node_affinity',
+        '_persistent_volume_reclaim_policy',
+        '_photon_persistent_disk',
+        '_portworx_volume',
+        '_quobyte',
+        '_rbd',
+        '_scale_io',
+        '_storage_class_name',
+        '_storageos',
+        '_volume_mode',
+        '_vsphere_volume',
+        'discriminator',
+    )
+
     def __init__(self, access_modes=None, aws_elastic_block_store=None, azure_disk=None, azure_file=None, capacity=None, cephfs=None, cinder=None, claim_ref=None, csi=None, fc=None, flex_volume=None, flocker=None, gce_persistent_disk=None, glusterfs=None, host_path=None, iscsi=None, local=None, mount_options=None, nfs=None, node_affinity=None, persistent_volume_reclaim_policy=None, photon_persistent_disk=None, portworx_volume=None, quobyte=None, rbd=None, scale_io=None, storage_class_name=None, storageos=None, volume_mode=None, vsphere_volume=None):  # noqa: E501
         """V1PersistentVolumeSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -943,7 +977,10 @@ class V1PersistentVolumeSpec(object):
         if not isinstance(other, V1PersistentVolumeSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1PersistentVolumeStatus(object):
         'reason': 'reason'
     }
 
+    __slots__ = (
+        '_message',
+        '_phase',
+        '_reason',
+        'discriminator',
+    )
+
     def __init__(self, message=None, phase=None, reason=None):  # noqa: E501
         """V1PersistentVolumeStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1PersistentVolumeStatus(object):
         if not isinstance(other, V1PersistentVolumeStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
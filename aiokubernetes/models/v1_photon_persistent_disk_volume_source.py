@@ -39,6 +39,12 @@ class V1PhotonPersistentDiskVolumeSource(object):
         'pd_id': 'pdID'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_pd_id',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, pd_id=None):  # noqa: E501
         """V1PhotonPersistentDiskVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1PhotonPersistentDiskVolumeSource(object):
         if not isinstance(other, V1PhotonPersistentDiskVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1PodAffinityTerm(object):
         'topology_key': 'topologyKey'
     }
 
+    __slots__ = (
+        '_label_selector',
+        '_namespaces',
+        '_topology_key',
+        'discriminator',
+    )
+
     def __init__(self, label_selector=None, namespaces=None, topology_key=None):  # noqa: E501
         """V1PodAffinityTerm - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1PodAffinityTerm(object):
         if not isinstance(other, V1PodAffinityTerm):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1PodDNSConfig(object):
         'searches': 'searches'
     }
 
+    __slots__ = (
+        '_nameservers',
+        '_options',
+        '_searches',
+        'discriminator',
+    )
+
     def __init__(self, nameservers=None, options=None, searches=None):  # noqa: E501
         """V1PodDNSConfig - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1PodDNSConfig(object):
         if not isinstance(other, V1PodDNSConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1PodDNSConfigOption(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_name',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, name=None, value=None):  # noqa: E501
         """V1PodDNSConfigOption - a model defined in Swagger"""  # noqa: E501
 
@@ -132,7 +138,10 @@ class V1PodDNSConfigOption(object):
         if not isinstance(other, V1PodDNSConfigOption):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,16 @@ class V1PodSecurityContext(object):
         'supplemental_groups': 'supplementalGroups'
     }
 
+    __slots__ = (
+        '_fs_group',
+        '_run_as_group',
+        '_run_as_non_root',
+        '_run_as_user',
+        '_se_linux_options',
+        '_supplemental_groups',
+        'discriminator',
+    )
+
     def __init__(self, fs_group=None, run_as_group=None, run_as_non_root=None, run_as_user=None, se_linux_options=None, supplemental_groups=None):  # noqa: E501
         """V1PodSecurityContext - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1PodSecurityContext(object):
         if not isinstance(other, V1PodSecurityContext):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
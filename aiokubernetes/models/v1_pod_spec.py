@@ -98,6 +98,37 @@ class V1PodSpec(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        '_active_deadline_seconds',
+        '_affinity',
+        '_automount_service_account_token',
+        '_containers',
+        '_dns_config',
+        '_dns_policy',
+        '_host_aliases',
+        '_host_ipc',
+        '_host_network',
+        '_host_pid',
+        '_hostname',
+        '_image_pull_secrets',
+        '_init_containers',
+        '_node_name',
+        '_node_selector',
+        '_priority',
+        '_priority_class_name',
+        '_restart_policy',
+        '_scheduler_name',
+        '_security_context',
+        '_service_account',
+        '_service_account_name',
+        '_share_process_namespace',
+        '_subdomain',
+        '_termination_grace_period_seconds',
+        '_tolerations',
+        '_volumes',
+        'discriminator',
+    )
+
     def __init__(self, active_deadline_seconds=None, affinity=None, automount_service_account_token=None, containers=None, dns_config=None, dns_policy=None, host_aliases=None, host_ipc=None, host_network=None, host_pid=None, hostname=None, image_pull_secrets=None, init_containers=None, node_name=None, node_selector=None, priority=None, priority_class_name=None, restart_policy=None, scheduler_name=None, security_context=None, service_account=None, service_account_name=None, share_process_namespace=None, subdomain=None, termination_grace_period_seconds=None, tolerations=None, volumes=None):  # noqa: E501
         """V1PodSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -844,7 +875,10 @@ class V1PodSpec(object):
         if not isinstance(other, V1PodSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
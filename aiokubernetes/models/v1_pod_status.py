@@ -60,6 +60,21 @@ class V1PodStatus(object):
         'start_time': 'startTime'
     }
 
+    __slots__ = (
+        '_conditions',
+        '_container_statuses',
+        '_host_ip',
+        '_init_container_statuses',
+        '_message',
+        '_nominated_node_name',
+        '_phase',
+        '_pod_ip',
+        '_qos_class',
+        '_reason',
+        '_start_time',
+        'discriminator',
+    )
+
     def __init__(self, conditions=None, container_statuses=None, host_ip=None, init_container_statuses=None, message=None, nominated_node_name=None, phase=None, pod_ip=None, qos_class=None, reason=None, start_time=None):  # noqa: E501
         """V1PodStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -389,7 +404,10 @@ class V1PodStatus(object):
         if not isinstance(other, V1PodStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
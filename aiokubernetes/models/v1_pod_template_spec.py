@@ -42,6 +42,12 @@ class V1PodTemplateSpec(object):
         'spec': 'spec'
     }
 
+    __slots__ = (
+        '_metadata',
+        '_spec',
+        'discriminator',
+    )
+
     def __init__(self, metadata=None, spec=None):  # noqa: E501
         """V1PodTemplateSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1PodTemplateSpec(object):
         if not isinstance(other, V1PodTemplateSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
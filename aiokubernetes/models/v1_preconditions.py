@@ -37,6 +37,11 @@ class V1Preconditions(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, uid=None):  # noqa: E501
         """V1Preconditions - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1Preconditions(object):
         if not isinstance(other, V1Preconditions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
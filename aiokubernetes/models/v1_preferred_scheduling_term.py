@@ -41,6 +41,12 @@ class V1PreferredSchedulingTerm(object):
         'weight': 'weight'
     }
 
+    __slots__ = (
+        '_preference',
+        '_weight',
+        'discriminator',
+    )
+
     def __init__(self, preference=None, weight=None):  # noqa: E501
         """V1PreferredSchedulingTerm - a model defined in Swagger"""  # noqa: E501
 
@@ -138,7 +144,10 @@ class V1PreferredSchedulingTerm(object):
         if not isinstance(other, V1PreferredSchedulingTerm):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,6 +55,18 @@ class V1Probe(object):
         'timeout_seconds': 'timeoutSeconds'
     }
 
+    __slots__ = (
+        '__exec',
+        '_failure_threshold',
+        '_http_get',
+        '_initial_delay_seconds',
+        '_period_seconds',
+        '_success_threshold',
+        '_tcp_socket',
+        '_timeout_seconds',
+        'discriminator',
+    )
+
     def __init__(self, _exec=None, failure_threshold=None, http_get=None, initial_delay_seconds=None, period_seconds=None, success_threshold=None, tcp_socket=None, timeout_seconds=None):  # noqa: E501
         """V1Probe - a model defined in Swagger"""  # noqa: E501
 
@@ -306,7 +318,10 @@ class V1Probe(object):
         if not isinstance(other, V1Probe):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
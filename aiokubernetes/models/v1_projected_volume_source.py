@@ -41,6 +41,12 @@ class V1ProjectedVolumeSource(object):
         'sources': 'sources'
     }
 
+    __slots__ = (
+        '_default_mode',
+        '_sources',
+        'discriminator',
+    )
+
     def __init__(self, default_mode=None, sources=None):  # noqa: E501
         """V1ProjectedVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1ProjectedVolumeSource(object):
         if not isinstance(other, V1ProjectedVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
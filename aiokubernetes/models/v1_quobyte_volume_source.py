@@ -45,6 +45,15 @@ class V1QuobyteVolumeSource(object):
         'volume': 'volume'
     }
 
+    __slots__ = (
+        '_group',
+        '_read_only',
+        '_registry',
+        '_user',
+        '_volume',
+        'discriminator',
+    )
+
     def __init__(self, group=None, read_only=None, registry=None, user=None, volume=None):  # noqa: E501
         """V1QuobyteVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1QuobyteVolumeSource(object):
         if not isinstance(other, V1QuobyteVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -53,6 +53,18 @@ class V1RBDPersistentVolumeSource(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_image',
+        '_keyring',
+        '_monitors',
+        '_pool',
+        '_read_only',
+        '_secret_ref',
+        '_user',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, image=None, keyring=None, monitors=None, pool=None, read_only=None, secret_ref=None, user=None):  # noqa: E501
         """V1RBDPersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -306,7 +318,10 @@ class V1RBDPersistentVolumeSource(object):
         if not isinstance(other, V1RBDPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,15 @@ class V1ReplicationControllerCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_last_transition_time',
+        '_message',
+        '_reason',
+        '_status',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, last_transition_time=None, message=None, reason=None, status=None, type=None):  # noqa: E501
         """V1ReplicationControllerCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1ReplicationControllerCondition(object):
         if not isinstance(other, V1ReplicationControllerCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,16 @@ class V1ReplicationControllerStatus(object):
         'replicas': 'replicas'
     }
 
+    __slots__ = (
+        '_available_replicas',
+        '_conditions',
+        '_fully_labeled_replicas',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        'discriminator',
+    )
+
     def __init__(self, available_replicas=None, conditions=None, fully_labeled_replicas=None, observed_generation=None, ready_replicas=None, replicas=None):  # noqa: E501
         """V1ReplicationControllerStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1ReplicationControllerStatus(object):
         if not isinstance(other, V1ReplicationControllerStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1ResourceFieldSelector(object):
         'resource': 'resource'
     }
 
+    __slots__ = (
+        '_container_name',
+        '_divisor',
+        '_resource',
+        'discriminator',
+    )
+
     def __init__(self, container_name=None, divisor=None, resource=None):  # noqa: E501
         """V1ResourceFieldSelector - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V1ResourceFieldSelector(object):
         if not isinstance(other, V1ResourceFieldSelector):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1ResourceQuotaSpec(object):
         'scopes': 'scopes'
     }
 
+    __slots__ = (
+        '_hard',
+        '_scopes',
+        'discriminator',
+    )
+
     def __init__(self, hard=None, scopes=None):  # noqa: E501
         """V1ResourceQuotaSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1ResourceQuotaSpec(object):
         if not isinstance(other, V1ResourceQuotaSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
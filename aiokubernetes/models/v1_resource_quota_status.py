@@ -39,6 +39,12 @@ class V1ResourceQuotaStatus(object):
         'used': 'used'
     }
 
+    __slots__ = (
+        '_hard',
+        '_used',
+        'discriminator',
+    )
+
     def __init__(self, hard=None, used=None):  # noqa: E501
         """V1ResourceQuotaStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1ResourceQuotaStatus(object):
         if not isinstance(other, V1ResourceQuotaStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1ResourceRequirements(object):
         'requests': 'requests'
     }
 
+    __slots__ = (
+        '_limits',
+        '_requests',
+        'discriminator',
+    )
+
     def __init__(self, limits=None, requests=None):  # noqa: E501
         """V1ResourceRequirements - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1ResourceRequirements(object):
         if not isinstance(other, V1ResourceRequirements):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
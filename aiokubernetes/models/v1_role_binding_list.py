@@ -46,6 +46,14 @@ class V1RoleBindingList(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_items',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, items=None, kind=None, metadata=None):  # noqa: E501
         """V1RoleBindingList - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1RoleBindingList(object):
         if not isinstance(other, V1RoleBindingList):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1RoleRef(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_api_group',
+        '_kind',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, api_group=None, kind=None, name=None):  # noqa: E501
         """V1RoleRef - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1RoleRef(object):
         if not isinstance(other, V1RoleRef):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
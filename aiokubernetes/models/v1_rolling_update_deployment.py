@@ -39,6 +39,12 @@ class V1RollingUpdateDeployment(object):
         'max_unavailable': 'maxUnavailable'
     }
 
+    __slots__ = (
+        '_max_surge',
+        '_max_unavailable',
+        'discriminator',
+    )
+
     def __init__(self, max_surge=None, max_unavailable=None):  # noqa: E501
         """V1RollingUpdateDeployment - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1RollingUpdateDeployment(object):
         if not isinstance(other, V1RollingUpdateDeployment):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
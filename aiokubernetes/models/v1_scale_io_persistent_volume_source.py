@@ -57,6 +57,20 @@ class V1ScaleIOPersistentVolumeSource(object):
         'volume_name': 'volumeName'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_gateway',
+        '_protection_domain',
+        '_read_only',
+        '_secret_ref',
+        '_ssl_enabled',
+        '_storage_mode',
+        '_storage_pool',
+        '_system',
+        '_volume_name',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, gateway=None, protection_domain=None, read_only=None, secret_ref=None, ssl_enabled=None, storage_mode=None, storage_pool=None, system=None, volume_name=None):  # noqa: E501
         """V1ScaleIOPersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -363,7 +377,10 @@ class V1ScaleIOPersistentVolumeSource(object):
         if not isinstance(other, V1ScaleIOPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
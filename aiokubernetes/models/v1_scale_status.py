@@ -39,6 +39,12 @@ class V1ScaleStatus(object):
         'selector': 'selector'
     }
 
+    __slots__ = (
+        '_replicas',
+        '_selector',
+        'discriminator',
+    )
+
     def __init__(self, replicas=None, selector=None):  # noqa: E501
         """V1ScaleStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1ScaleStatus(object):
         if not isinstance(other, V1ScaleStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1SELinuxOptions(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_level',
+        '_role',
+        '_type',
+        '_user',
+        'discriminator',
+    )
+
     def __init__(self, level=None, role=None, type=None, user=None):  # noqa: E501
         """V1SELinuxOptions - a model defined in Swagger"""  # noqa: E501
 
@@ -190,7 +198,10 @@ class V1SELinuxOptions(object):
         if not isinstance(other, V1SELinuxOptions):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
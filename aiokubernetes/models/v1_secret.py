@@ -49,6 +49,16 @@ class V1Secret(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_data',
+        '_kind',
+        '_metadata',
+        '_string_data',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, data=None, kind=None, metadata=None, string_data=None, type=None):  # noqa: E501
         """V1Secret - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1Secret(object):
         if not isinstance(other, V1Secret):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
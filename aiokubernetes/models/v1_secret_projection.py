@@ -43,6 +43,13 @@ class V1SecretProjection(object):
         'optional': 'optional'
     }
 
+    __slots__ = (
+        '_items',
+        '_name',
+        '_optional',
+        'discriminator',
+    )
+
     def __init__(self, items=None, name=None, optional=None):  # noqa: E501
         """V1SecretProjection - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1SecretProjection(object):
         if not isinstance(other, V1SecretProjection):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
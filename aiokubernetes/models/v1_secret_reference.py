@@ -39,6 +39,12 @@ class V1SecretReference(object):
         'namespace': 'namespace'
     }
 
+    __slots__ = (
+        '_name',
+        '_namespace',
+        'discriminator',
+    )
+
     def __init__(self, name=None, namespace=None):  # noqa: E501
         """V1SecretReference - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1SecretReference(object):
         if not isinstance(other, V1SecretReference):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
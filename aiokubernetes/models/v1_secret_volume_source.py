@@ -45,6 +45,14 @@ class V1SecretVolumeSource(object):
         'secret_name': 'secretName'
     }
 
+    __slots__ = (
+        '_default_mode',
+        '_items',
+        '_optional',
+        '_secret_name',
+        'discriminator',
+    )
+
     def __init__(self, default_mode=None, items=None, optional=None, secret_name=None):  # noqa: E501
         """V1SecretVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1SecretVolumeSource(object):
         if not isinstance(other, V1SecretVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,18 @@ class V1SecurityContext(object):
         'se_linux_options': 'seLinuxOptions'
     }
 
+    __slots__ = (
+        '_allow_privilege_escalation',
+        '_capabilities',
+        '_privileged',
+        '_read_only_root_filesystem',
+        '_run_as_group',
+        '_run_as_non_root',
+        '_run_as_user',
+        '_se_linux_options',
+        'discriminator',
+    )
+
     def __init__(self, allow_privilege_escalation=None, capabilities=None, privileged=None, read_only_root_filesystem=None, run_as_group=None, run_as_non_root=None, run_as_user=None, se_linux_options=None):  # noqa: E501
         """V1SecurityContext - a model defined in Swagger"""  # noqa: E501
 
@@ -305,7 +317,10 @@ class V1SecurityContext(object):
         if not isinstance(other, V1SecurityContext):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
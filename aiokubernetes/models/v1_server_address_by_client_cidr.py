@@ -39,6 +39,12 @@ class V1ServerAddressByClientCIDR(object):
         'server_address': 'serverAddress'
     }
 
+    __slots__ = (
+        '_client_cidr',
+        '_server_address',
+        'discriminator',
+    )
+
     def __init__(self, client_cidr=None, server_address=None):  # noqa: E501
         """V1ServerAddressByClientCIDR - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1ServerAddressByClientCIDR(object):
         if not isinstance(other, V1ServerAddressByClientCIDR):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
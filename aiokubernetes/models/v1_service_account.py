@@ -51,6 +51,16 @@ class V1ServiceAccount(object):
         'secrets': 'secrets'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_automount_service_account_token',
+        '_image_pull_secrets',
+        '_kind',
+        '_metadata',
+        '_secrets',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, automount_service_account_token=None, image_pull_secrets=None, kind=None, metadata=None, secrets=None):  # noqa: E501
         """V1ServiceAccount - a model defined in Swagger"""  # noqa: E501
 
@@ -250,7 +260,10 @@ class V1ServiceAccount(object):
         if not isinstance(other, V1ServiceAccount):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
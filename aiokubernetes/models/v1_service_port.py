@@ -45,6 +45,15 @@ class V1ServicePort(object):
         'target_port': 'targetPort'
     }
 
+    __slots__ = (
+        '_name',
+        '_node_port',
+        '_port',
+        '_protocol',
+        '_target_port',
+        'discriminator',
+    )
+
     def __init__(self, name=None, node_port=None, port=None, protocol=None, target_port=None):  # noqa: E501
         """V1ServicePort - a model defined in Swagger"""  # noqa: E501
 
@@ -219,7 +228,10 @@ class V1ServicePort(object):
         if not isinstance(other, V1ServicePort):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
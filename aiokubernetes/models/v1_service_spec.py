@@ -64,6 +64,23 @@ class V1ServiceSpec(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_cluster_ip',
+        '_external_i_ps',
+        '_external_name',
+        '_external_traffic_policy',
+        '_health_check_node_port',
+        '_load_balancer_ip',
+        '_load_balancer_source_ranges',
+        '_ports',
+        '_publish_not_ready_addresses',
+        '_selector',
+        '_session_affinity',
+        '_session_affinity_config',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, cluster_ip=None, external_i_ps=None, external_name=None, external_traffic_policy=None, health_check_node_port=None, load_balancer_ip=None, load_balancer_source_ranges=None, ports=None, publish_not_ready_addresses=None, selector=None, session_affinity=None, session_affinity_config=None, type=None):  # noqa: E501
         """V1ServiceSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -445,7 +462,10 @@ class V1ServiceSpec(object):
         if not isinstance(other, V1ServiceSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1ServiceStatus(object):
         'load_balancer': 'loadBalancer'
     }
 
+    __slots__ = (
+        '_load_balancer',
+        'discriminator',
+    )
+
     def __init__(self, load_balancer=None):  # noqa: E501
         """V1ServiceStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1ServiceStatus(object):
         if not isinstance(other, V1ServiceStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1SessionAffinityConfig(object):
         'client_ip': 'clientIP'
     }
 
+    __slots__ = (
+        '_client_ip',
+        'discriminator',
+    )
+
     def __init__(self, client_ip=None):  # noqa: E501
         """V1SessionAffinityConfig - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1SessionAffinityConfig(object):
         if not isinstance(other, V1SessionAffinityConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -54,6 +54,18 @@ class V1Status(object):
         'status': 'status'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_code',
+        '_details',
+        '_kind',
+        '_message',
+        '_metadata',
+        '_reason',
+        '_status',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, code=None, details=None, kind=None, message=None, metadata=None, reason=None, status=None):  # noqa: E501
         """V1Status - a model defined in Swagger"""  # noqa: E501
 
@@ -305,7 +317,10 @@ class V1Status(object):
         if not isinstance(other, V1Status):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V1StatusCause(object):
         'reason': 'reason'
     }
 
+    __slots__ = (
+        '_field',
+        '_message',
+        '_reason',
+        'discriminator',
+    )
+
     def __init__(self, field=None, message=None, reason=None):  # noqa: E501
         """V1StatusCause - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1StatusCause(object):
         if not isinstance(other, V1StatusCause):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,16 @@ class V1StatusDetails(object):
         'uid': 'uid'
     }
 
+    __slots__ = (
+        '_causes',
+        '_group',
+        '_kind',
+        '_name',
+        '_retry_after_seconds',
+        '_uid',
+        'discriminator',
+    )
+
     def __init__(self, causes=None, group=None, kind=None, name=None, retry_after_seconds=None, uid=None):  # noqa: E501
         """V1StatusDetails - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1StatusDetails(object):
         if not isinstance(other, V1StatusDetails):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
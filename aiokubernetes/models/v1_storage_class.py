@@ -55,6 +55,19 @@ class V1StorageClass(object):
         'volume_binding_mode': 'volumeBindingMode'
     }
 
+    __slots__ = (
+        '_allow_volume_expansion',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_mount_options',
+        '_parameters',
+        '_provisioner',
+        '_reclaim_policy',
+        '_volume_binding_mode',
+        'discriminator',
+    )
+
     def __init__(self, allow_volume_expansion=None, api_version=None, kind=None, metadata=None, mount_options=None, parameters=None, provisioner=None, reclaim_policy=None, volume_binding_mode=None):  # noqa: E501
         """V1StorageClass - a model defined in Swagger"""  # noqa: E501
 
@@ -333,7 +346,10 @@ class V1StorageClass(object):
         if not isinstance(other, V1StorageClass):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,15 @@ class V1StorageOSPersistentVolumeSource(object):
         'volume_namespace': 'volumeNamespace'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_read_only',
+        '_secret_ref',
+        '_volume_name',
+        '_volume_namespace',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, read_only=None, secret_ref=None, volume_name=None, volume_namespace=None):  # noqa: E501
         """V1StorageOSPersistentVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1StorageOSPersistentVolumeSource(object):
         if not isinstance(other, V1StorageOSPersistentVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
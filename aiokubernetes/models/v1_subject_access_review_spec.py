@@ -50,6 +50,16 @@ class V1SubjectAccessReviewSpec(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_extra',
+        '_groups',
+        '_non_resource_attributes',
+        '_resource_attributes',
+        '_uid',
+        '_user',
+        'discriminator',
+    )
+
     def __init__(self, extra=None, groups=None, non_resource_attributes=None, resource_attributes=None, uid=None, user=None):  # noqa: E501
         """V1SubjectAccessReviewSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1SubjectAccessReviewSpec(object):
         if not isinstance(other, V1SubjectAccessReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1SubjectAccessReviewStatus(object):
         'reason': 'reason'
     }
 
+    __slots__ = (
+        '_allowed',
+        '_denied',
+        '_evaluation_error',
+        '_reason',
+        'discriminator',
+    )
+
     def __init__(self, allowed=None, denied=None, evaluation_error=None, reason=None):  # noqa: E501
         """V1SubjectAccessReviewStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1SubjectAccessReviewStatus(object):
         if not isinstance(other, V1SubjectAccessReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1Taint(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_effect',
+        '_key',
+        '_time_added',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, effect=None, key=None, time_added=None, value=None):  # noqa: E501
         """V1Taint - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1Taint(object):
         if not isinstance(other, V1Taint):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
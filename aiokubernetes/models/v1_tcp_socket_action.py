@@ -39,6 +39,12 @@ class V1TCPSocketAction(object):
         'port': 'port'
     }
 
+    __slots__ = (
+        '_host',
+        '_port',
+        'discriminator',
+    )
+
     def __init__(self, host=None, port=None):  # noqa: E501
         """V1TCPSocketAction - a model defined in Swagger"""  # noqa: E501
 
@@ -135,7 +141,10 @@ class V1TCPSocketAction(object):
         if not isinstance(other, V1TCPSocketAction):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1TokenReviewStatus(object):
         'user': 'user'
     }
 
+    __slots__ = (
+        '_authenticated',
+        '_error',
+        '_user',
+        'discriminator',
+    )
+
     def __init__(self, authenticated=None, error=None, user=None):  # noqa: E501
         """V1TokenReviewStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1TokenReviewStatus(object):
         if not isinstance(other, V1TokenReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
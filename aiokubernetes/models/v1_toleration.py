@@ -45,6 +45,15 @@ class V1Toleration(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_effect',
+        '_key',
+        '_operator',
+        '_toleration_seconds',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, effect=None, key=None, operator=None, toleration_seconds=None, value=None):  # noqa: E501
         """V1Toleration - a model defined in Swagger"""  # noqa: E501
 
@@ -218,7 +227,10 @@ class V1Toleration(object):
         if not isinstance(other, V1Toleration):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -119,6 +119,38 @@ class V1Volume(object):
         'vsphere_volume': 'vsphereVolume'
     }
 
+    __slots__ = (
+        '_aws_elastic_block_store',
+        '_azure_disk',
+        '_azure_file',
+        '_cephfs',
+        '_cinder',
+        '_config_map',
+        '_downward_api',
+        '_empty_dir',
+        '_fc',
+        '_flex_volume',
+        '_flocker',
+        '_gce_persistent_disk',
+        '_git_repo',
+        '_glusterfs',
+        '_host_path',
+        '_iscsi',
+        '_name',
+        '_nfs',
+        '_persistent_volume_claim',
+        '_photon_persistent_disk',
+        '_portworx_volume',
+        '_projected',
+        '_quobyte',
+        '_rbd',
+        '_scale_io',
+        '_secret',
+        '_storageos',
+        '_vsphere_volume',
+        'discriminator',
+    )
+
     def __init__(self, aws_elastic_block_store=None, azure_disk=None, azure_file=None, cephfs=None, cinder=None, config_map=None, downward_api=None, empty_dir=None, fc=None, flex_volume=None, flocker=None, gce_persistent_disk=None, git_repo=None, glusterfs=None, host_path=None, iscsi=None, name=None, nfs=None, persistent_volume_claim=None, photon_persistent_disk=None, portworx_volume=None, projected=None, quobyte=None, rbd=None, scale_io=None, secret=None, storageos=None, vsphere_volume=None):  # noqa: E501
         """V1Volume - a model defined in Swagger"""  # noqa: E501
 
@@ -891,7 +923,10 @@ class V1Volume(object):
         if not isinstance(other, V1Volume):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
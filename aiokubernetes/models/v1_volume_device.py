@@ -39,6 +39,12 @@ class V1VolumeDevice(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_device_path',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, device_path=None, name=None):  # noqa: E501
         """V1VolumeDevice - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1VolumeDevice(object):
         if not isinstance(other, V1VolumeDevice):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,15 @@ class V1VolumeMount(object):
         'sub_path': 'subPath'
     }
 
+    __slots__ = (
+        '_mount_path',
+        '_mount_propagation',
+        '_name',
+        '_read_only',
+        '_sub_path',
+        'discriminator',
+    )
+
     def __init__(self, mount_path=None, mount_propagation=None, name=None, read_only=None, sub_path=None):  # noqa: E501
         """V1VolumeMount - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1VolumeMount(object):
         if not isinstance(other, V1VolumeMount):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
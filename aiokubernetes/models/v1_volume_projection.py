@@ -45,6 +45,13 @@ class V1VolumeProjection(object):
         'secret': 'secret'
     }
 
+    __slots__ = (
+        '_config_map',
+        '_downward_api',
+        '_secret',
+        'discriminator',
+    )
+
     def __init__(self, config_map=None, downward_api=None, secret=None):  # noqa: E501
         """V1VolumeProjection - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +173,10 @@ class V1VolumeProjection(object):
         if not isinstance(other, V1VolumeProjection):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1VsphereVirtualDiskVolumeSource(object):
         'volume_path': 'volumePath'
     }
 
+    __slots__ = (
+        '_fs_type',
+        '_storage_policy_id',
+        '_storage_policy_name',
+        '_volume_path',
+        'discriminator',
+    )
+
     def __init__(self, fs_type=None, storage_policy_id=None, storage_policy_name=None, volume_path=None):  # noqa: E501
         """V1VsphereVirtualDiskVolumeSource - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1VsphereVirtualDiskVolumeSource(object):
         if not isinstance(other, V1VsphereVirtualDiskVolumeSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
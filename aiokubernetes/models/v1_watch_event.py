@@ -41,6 +41,12 @@ class V1WatchEvent(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_object',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, object=None, type=None):  # noqa: E501
         """V1WatchEvent - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1WatchEvent(object):
         if not isinstance(other, V1WatchEvent):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
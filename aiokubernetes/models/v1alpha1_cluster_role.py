@@ -49,6 +49,15 @@ class V1alpha1ClusterRole(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_aggregation_rule',
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_rules',
+        'discriminator',
+    )
+
     def __init__(self, aggregation_rule=None, api_version=None, kind=None, metadata=None, rules=None):  # noqa: E501
         """V1alpha1ClusterRole - a model defined in Swagger"""  # noqa: E501
 
@@ -223,7 +232,10 @@ class V1alpha1ClusterRole(object):
         if not isinstance(other, V1alpha1ClusterRole):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,15 @@ class V1alpha1ClusterRoleBinding(object):
         'subjects': 'subjects'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_role_ref',
+        '_subjects',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, role_ref=None, subjects=None):  # noqa: E501
         """V1alpha1ClusterRoleBinding - a model defined in Swagger"""  # noqa: E501
 
@@ -224,7 +233,10 @@ class V1alpha1ClusterRoleBinding(object):
         if not isinstance(other, V1alpha1ClusterRoleBinding):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
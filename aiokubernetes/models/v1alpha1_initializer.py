@@ -41,6 +41,12 @@ class V1alpha1Initializer(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_name',
+        '_rules',
+        'discriminator',
+    )
+
     def __init__(self, name=None, rules=None):  # noqa: E501
         """V1alpha1Initializer - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1alpha1Initializer(object):
         if not isinstance(other, V1alpha1Initializer):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1alpha1InitializerConfiguration(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_initializers',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, initializers=None, kind=None, metadata=None):  # noqa: E501
         """V1alpha1InitializerConfiguration - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V1alpha1InitializerConfiguration(object):
         if not isinstance(other, V1alpha1InitializerConfiguration):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1alpha1PodPreset(object):
         'spec': 'spec'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_spec',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, spec=None):  # noqa: E501
         """V1alpha1PodPreset - a model defined in Swagger"""  # noqa: E501
 
@@ -189,7 +197,10 @@ class V1alpha1PodPreset(object):
         if not isinstance(other, V1alpha1PodPreset):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
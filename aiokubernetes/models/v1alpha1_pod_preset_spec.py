@@ -51,6 +51,15 @@ class V1alpha1PodPresetSpec(object):
         'volumes': 'volumes'
     }
 
+    __slots__ = (
+        '_env',
+        '_env_from',
+        '_selector',
+        '_volume_mounts',
+        '_volumes',
+        'discriminator',
+    )
+
     def __init__(self, env=None, env_from=None, selector=None, volume_mounts=None, volumes=None):  # noqa: E501
         """V1alpha1PodPresetSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -224,7 +233,10 @@ class V1alpha1PodPresetSpec(object):
         if not isinstance(other, V1alpha1PodPresetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
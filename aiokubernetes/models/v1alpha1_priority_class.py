@@ -49,6 +49,16 @@ class V1alpha1PriorityClass(object):
         'value': 'value'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_description',
+        '_global_default',
+        '_kind',
+        '_metadata',
+        '_value',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, description=None, global_default=None, kind=None, metadata=None, value=None):  # noqa: E501
         """V1alpha1PriorityClass - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1alpha1PriorityClass(object):
         if not isinstance(other, V1alpha1PriorityClass):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
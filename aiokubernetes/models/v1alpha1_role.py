@@ -46,6 +46,14 @@ class V1alpha1Role(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_rules',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, rules=None):  # noqa: E501
         """V1alpha1Role - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1alpha1Role(object):
         if not isinstance(other, V1alpha1Role):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
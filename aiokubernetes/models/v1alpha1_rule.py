@@ -41,6 +41,13 @@ class V1alpha1Rule(object):
         'resources': 'resources'
     }
 
+    __slots__ = (
+        '_api_groups',
+        '_api_versions',
+        '_resources',
+        'discriminator',
+    )
+
     def __init__(self, api_groups=None, api_versions=None, resources=None):  # noqa: E501
         """V1alpha1Rule - a model defined in Swagger"""  # noqa: E501
 
@@ -162,7 +169,10 @@ class V1alpha1Rule(object):
         if not isinstance(other, V1alpha1Rule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class V1alpha1VolumeAttachmentSource(object):
         'persistent_volume_name': 'persistentVolumeName'
     }
 
+    __slots__ = (
+        '_persistent_volume_name',
+        'discriminator',
+    )
+
     def __init__(self, persistent_volume_name=None):  # noqa: E501
         """V1alpha1VolumeAttachmentSource - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1alpha1VolumeAttachmentSource(object):
         if not isinstance(other, V1alpha1VolumeAttachmentSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
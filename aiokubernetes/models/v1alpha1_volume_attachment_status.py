@@ -45,6 +45,14 @@ class V1alpha1VolumeAttachmentStatus(object):
         'detach_error': 'detachError'
     }
 
+    __slots__ = (
+        '_attach_error',
+        '_attached',
+        '_attachment_metadata',
+        '_detach_error',
+        'discriminator',
+    )
+
     def __init__(self, attach_error=None, attached=None, attachment_metadata=None, detach_error=None):  # noqa: E501
         """V1alpha1VolumeAttachmentStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V1alpha1VolumeAttachmentStatus(object):
         if not isinstance(other, V1alpha1VolumeAttachmentStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
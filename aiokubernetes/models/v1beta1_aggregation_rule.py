@@ -39,6 +39,11 @@ class V1beta1AggregationRule(object):
         'cluster_role_selectors': 'clusterRoleSelectors'
     }
 
+    __slots__ = (
+        '_cluster_role_selectors',
+        'discriminator',
+    )
+
     def __init__(self, cluster_role_selectors=None):  # noqa: E501
         """V1beta1AggregationRule - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1beta1AggregationRule(object):
         if not isinstance(other, V1beta1AggregationRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -51,6 +51,17 @@ class V1beta1APIServiceSpec(object):
         'version_priority': 'versionPriority'
     }
 
+    __slots__ = (
+        '_ca_bundle',
+        '_group',
+        '_group_priority_minimum',
+        '_insecure_skip_tls_verify',
+        '_service',
+        '_version',
+        '_version_priority',
+        'discriminator',
+    )
+
     def __init__(self, ca_bundle=None, group=None, group_priority_minimum=None, insecure_skip_tls_verify=None, service=None, version=None, version_priority=None):  # noqa: E501
         """V1beta1APIServiceSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -282,7 +293,10 @@ class V1beta1APIServiceSpec(object):
         if not isinstance(other, V1beta1APIServiceSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1beta1CertificateSigningRequestCondition(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_last_update_time',
+        '_message',
+        '_reason',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, last_update_time=None, message=None, reason=None, type=None):  # noqa: E501
         """V1beta1CertificateSigningRequestCondition - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1beta1CertificateSigningRequestCondition(object):
         if not isinstance(other, V1beta1CertificateSigningRequestCondition):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
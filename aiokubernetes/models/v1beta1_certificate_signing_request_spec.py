@@ -47,6 +47,16 @@ class V1beta1CertificateSigningRequestSpec(object):
         'username': 'username'
     }
 
+    __slots__ = (
+        '_extra',
+        '_groups',
+        '_request',
+        '_uid',
+        '_usages',
+        '_username',
+        'discriminator',
+    )
+
     def __init__(self, extra=None, groups=None, request=None, uid=None, usages=None, username=None):  # noqa: E501
         """V1beta1CertificateSigningRequestSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -249,7 +259,10 @@ class V1beta1CertificateSigningRequestSpec(object):
         if not isinstance(other, V1beta1CertificateSigningRequestSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
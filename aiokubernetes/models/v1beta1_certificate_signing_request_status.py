@@ -41,6 +41,12 @@ class V1beta1CertificateSigningRequestStatus(object):
         'conditions': 'conditions'
     }
 
+    __slots__ = (
+        '_certificate',
+        '_conditions',
+        'discriminator',
+    )
+
     def __init__(self, certificate=None, conditions=None):  # noqa: E501
         """V1beta1CertificateSigningRequestStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -138,7 +144,10 @@ class V1beta1CertificateSigningRequestStatus(object):
         if not isinstance(other, V1beta1CertificateSigningRequestStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
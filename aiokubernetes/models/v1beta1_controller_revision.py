@@ -48,6 +48,15 @@ class V1beta1ControllerRevision(object):
         'revision': 'revision'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_data',
+        '_kind',
+        '_metadata',
+        '_revision',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, data=None, kind=None, metadata=None, revision=None):  # noqa: E501
         """V1beta1ControllerRevision - a model defined in Swagger"""  # noqa: E501
 
@@ -222,7 +231,10 @@ class V1beta1ControllerRevision(object):
         if not isinstance(other, V1beta1ControllerRevision):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class V1beta1CronJobStatus(object):
         'last_schedule_time': 'lastScheduleTime'
     }
 
+    __slots__ = (
+        '_active',
+        '_last_schedule_time',
+        'discriminator',
+    )
+
     def __init__(self, active=None, last_schedule_time=None):  # noqa: E501
         """V1beta1CronJobStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1beta1CronJobStatus(object):
         if not isinstance(other, V1beta1CronJobStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
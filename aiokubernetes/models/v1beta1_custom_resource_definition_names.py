@@ -47,6 +47,16 @@ class V1beta1CustomResourceDefinitionNames(object):
         'singular': 'singular'
     }
 
+    __slots__ = (
+        '_categories',
+        '_kind',
+        '_list_kind',
+        '_plural',
+        '_short_names',
+        '_singular',
+        'discriminator',
+    )
+
     def __init__(self, categories=None, kind=None, list_kind=None, plural=None, short_names=None, singular=None):  # noqa: E501
         """V1beta1CustomResourceDefinitionNames - a model defined in Swagger"""  # noqa: E501
 
@@ -248,7 +258,10 @@ class V1beta1CustomResourceDefinitionNames(object):
         if not isinstance(other, V1beta1CustomResourceDefinitionNames):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
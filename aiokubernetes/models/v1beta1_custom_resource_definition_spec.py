@@ -51,6 +51,16 @@ class V1beta1CustomResourceDefinitionSpec(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        '_group',
+        '_names',
+        '_scope',
+        '_subresources',
+        '_validation',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group=None, names=None, scope=None, subresources=None, validation=None, version=None):  # noqa: E501
         """V1beta1CustomResourceDefinitionSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -254,7 +264,10 @@ class V1beta1CustomResourceDefinitionSpec(object):
         if not isinstance(other, V1beta1CustomResourceDefinitionSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
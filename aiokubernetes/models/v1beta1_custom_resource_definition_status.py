@@ -42,6 +42,12 @@ class V1beta1CustomResourceDefinitionStatus(object):
         'conditions': 'conditions'
     }
 
+    __slots__ = (
+        '_accepted_names',
+        '_conditions',
+        'discriminator',
+    )
+
     def __init__(self, accepted_names=None, conditions=None):  # noqa: E501
         """V1beta1CustomResourceDefinitionStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -139,7 +145,10 @@ class V1beta1CustomResourceDefinitionStatus(object):
         if not isinstance(other, V1beta1CustomResourceDefinitionStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
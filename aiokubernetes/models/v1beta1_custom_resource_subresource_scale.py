@@ -41,6 +41,13 @@ class V1beta1CustomResourceSubresourceScale(object):
         'status_replicas_path': 'statusReplicasPath'
     }
 
+    __slots__ = (
+        '_label_selector_path',
+        '_spec_replicas_path',
+        '_status_replicas_path',
+        'discriminator',
+    )
+
     def __init__(self, label_selector_path=None, spec_replicas_path=None, status_replicas_path=None):  # noqa: E501
         """V1beta1CustomResourceSubresourceScale - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1beta1CustomResourceSubresourceScale(object):
         if not isinstance(other, V1beta1CustomResourceSubresourceScale):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class V1beta1CustomResourceSubresources(object):
         'status': 'status'
     }
 
+    __slots__ = (
+        '_scale',
+        '_status',
+        'discriminator',
+    )
+
     def __init__(self, scale=None, status=None):  # noqa: E501
         """V1beta1CustomResourceSubresources - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1beta1CustomResourceSubresources(object):
         if not isinstance(other, V1beta1CustomResourceSubresources):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,11 @@ class V1beta1CustomResourceValidation(object):
         'open_apiv3_schema': 'openAPIV3Schema'
     }
 
+    __slots__ = (
+        '_open_apiv3_schema',
+        'discriminator',
+    )
+
     def __init__(self, open_apiv3_schema=None):  # noqa: E501
         """V1beta1CustomResourceValidation - a model defined in Swagger"""  # noqa: E501
 
@@ -108,7 +113,10 @@ class V1beta1CustomResourceValidation(object):
         if not isinstance(other, V1beta1CustomResourceValidation):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
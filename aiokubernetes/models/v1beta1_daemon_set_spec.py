@@ -51,6 +51,16 @@ class V1beta1DaemonSetSpec(object):
         'update_strategy': 'updateStrategy'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_revision_history_limit',
+        '_selector',
+        '_template',
+        '_template_generation',
+        '_update_strategy',
+        'discriminator',
+    )
+
     def __init__(self, min_ready_seconds=None, revision_history_limit=None, selector=None, template=None, template_generation=None, update_strategy=None):  # noqa: E501
         """V1beta1DaemonSetSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -251,7 +261,10 @@ class V1beta1DaemonSetSpec(object):
         if not isinstance(other, V1beta1DaemonSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -74,6 +74,27 @@ class V1beta1Event(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_action',
+        '_api_version',
+        '_deprecated_count',
+        '_deprecated_first_timestamp',
+        '_deprecated_last_timestamp',
+        '_deprecated_source',
+        '_event_time',
+        '_kind',
+        '_metadata',
+        '_note',
+        '_reason',
+        '_regarding',
+        '_related',
+        '_reporting_controller',
+        '_reporting_instance',
+        '_series',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, action=None, api_version=None, deprecated_count=None, deprecated_first_timestamp=None, deprecated_last_timestamp=None, deprecated_source=None, event_time=None, kind=None, metadata=None, note=None, reason=None, regarding=None, related=None, reporting_controller=None, reporting_instance=None, series=None, type=None):  # noqa: E501
         """V1beta1Event - a model defined in Swagger"""  # noqa: E501
 
@@ -558,7 +579,10 @@ class V1beta1Event(object):
         if not isinstance(other, V1beta1Event):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
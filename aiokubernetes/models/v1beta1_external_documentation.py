@@ -39,6 +39,12 @@ class V1beta1ExternalDocumentation(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_description',
+        '_url',
+        'discriminator',
+    )
+
     def __init__(self, description=None, url=None):  # noqa: E501
         """V1beta1ExternalDocumentation - a model defined in Swagger"""  # noqa: E501
 
@@ -130,7 +136,10 @@ class V1beta1ExternalDocumentation(object):
         if not isinstance(other, V1beta1ExternalDocumentation):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
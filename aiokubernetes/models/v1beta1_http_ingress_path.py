@@ -41,6 +41,12 @@ class V1beta1HTTPIngressPath(object):
         'path': 'path'
     }
 
+    __slots__ = (
+        '_backend',
+        '_path',
+        'discriminator',
+    )
+
     def __init__(self, backend=None, path=None):  # noqa: E501
         """V1beta1HTTPIngressPath - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1beta1HTTPIngressPath(object):
         if not isinstance(other, V1beta1HTTPIngressPath):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
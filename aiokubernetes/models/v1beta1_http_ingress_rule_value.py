@@ -39,6 +39,11 @@ class V1beta1HTTPIngressRuleValue(object):
         'paths': 'paths'
     }
 
+    __slots__ = (
+        '_paths',
+        'discriminator',
+    )
+
     def __init__(self, paths=None):  # noqa: E501
         """V1beta1HTTPIngressRuleValue - a model defined in Swagger"""  # noqa: E501
 
@@ -109,7 +114,10 @@ class V1beta1HTTPIngressRuleValue(object):
         if not isinstance(other, V1beta1HTTPIngressRuleValue):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
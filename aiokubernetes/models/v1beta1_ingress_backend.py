@@ -39,6 +39,12 @@ class V1beta1IngressBackend(object):
         'service_port': 'servicePort'
     }
 
+    __slots__ = (
+        '_service_name',
+        '_service_port',
+        'discriminator',
+    )
+
     def __init__(self, service_name=None, service_port=None):  # noqa: E501
         """V1beta1IngressBackend - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V1beta1IngressBackend(object):
         if not isinstance(other, V1beta1IngressBackend):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class V1beta1IngressRule(object):
         'http': 'http'
     }
 
+    __slots__ = (
+        '_host',
+        '_http',
+        'discriminator',
+    )
+
     def __init__(self, host=None, http=None):  # noqa: E501
         """V1beta1IngressRule - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1IngressRule(object):
         if not isinstance(other, V1beta1IngressRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
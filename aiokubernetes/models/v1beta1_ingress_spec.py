@@ -45,6 +45,13 @@ class V1beta1IngressSpec(object):
         'tls': 'tls'
     }
 
+    __slots__ = (
+        '_backend',
+        '_rules',
+        '_tls',
+        'discriminator',
+    )
+
     def __init__(self, backend=None, rules=None, tls=None):  # noqa: E501
         """V1beta1IngressSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -166,7 +173,10 @@ class V1beta1IngressSpec(object):
         if not isinstance(other, V1beta1IngressSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V1beta1IngressTLS(object):
         'secret_name': 'secretName'
     }
 
+    __slots__ = (
+        '_hosts',
+        '_secret_name',
+        'discriminator',
+    )
+
     def __init__(self, hosts=None, secret_name=None):  # noqa: E501
         """V1beta1IngressTLS - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1IngressTLS(object):
         if not isinstance(other, V1beta1IngressTLS):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
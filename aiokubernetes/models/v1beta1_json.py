@@ -37,6 +37,11 @@ class V1beta1JSON(object):
         'raw': 'Raw'
     }
 
+    __slots__ = (
+        '_raw',
+        'discriminator',
+    )
+
     def __init__(self, raw=None):  # noqa: E501
         """V1beta1JSON - a model defined in Swagger"""  # noqa: E501
 
@@ -107,7 +112,10 @@ class V1beta1JSON(object):
         if not isinstance(other, V1beta1JSON):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -108,6 +108,46 @@ class V1beta1JSONSchemaProps(object):
         'unique_items': 'uniqueItems'
     }
 
+    __slots__ = (
+        '_ref',
+        '_schema',
+        '_additional_items',
+        '_additional_properties',
+        '_all_of',
+        '_any_of',
+        '_default',
+        '_definitions',
+        '_dependencies',
+        '_description',
+        '_enum',
+        '_example',
+        '_exclusive_maximum',
+        '_exclusive_minimum',
+        '_external_docs',
+        '_format',
+        '_id',
+        '_items',
+        '_max_items',
+        '_max_length',
+        '_max_properties',
+        '_maximum',
+        '_min_items',
+        '_min_length',
+        '_min_properties',
+        '_minimum',
+        '_multiple_of',
+        '__not',
+        '_one_of',
+        '_pattern',
+        '_pattern_properties',
+        '_properties',
+        '_required',
+        '_title',
+        '_type',
+        '_unique_items',
+        'discriminator',
+    )
+
     def __init__(self, ref=None, schema=None, additional_items=None, additional_properties=None, all_of=None, any_of=None, default=None, definitions=None, dependencies=None, description=None, enum=None, example=None, exclusive_maximum=None, exclusive_minimum=None, external_docs=None, format=None, id=None, items=None, max_items=None, max_length=None, max_properties=None, maximum=None, min_items=None, min_length=None, min_properties=None, minimum=None, multiple_of=None, _not=None, one_of=None, pattern=None, pattern_properties=None, properties=None, required=None, title=None, type=None, unique_items=None):  # noqa: E501
         """V1beta1JSONSchemaProps - a model defined in Swagger"""  # noqa: E501
 
@@ -1015,7 +1055,10 @@ class V1beta1JSONSchemaProps(object):
         if not isinstance(other, V1beta1JSONSchemaProps):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
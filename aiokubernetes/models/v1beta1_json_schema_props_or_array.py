@@ -41,6 +41,12 @@ class V1beta1JSONSchemaPropsOrArray(object):
         'schema': 'Schema'
     }
 
+    __slots__ = (
+        '_json_schemas',
+        '_schema',
+        'discriminator',
+    )
+
     def __init__(self, json_schemas=None, schema=None):  # noqa: E501
         """V1beta1JSONSchemaPropsOrArray - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1JSONSchemaPropsOrArray(object):
         if not isinstance(other, V1beta1JSONSchemaPropsOrArray):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,12 @@ class V1beta1JSONSchemaPropsOrBool(object):
         'schema': 'Schema'
     }
 
+    __slots__ = (
+        '_allows',
+        '_schema',
+        'discriminator',
+    )
+
     def __init__(self, allows=None, schema=None):  # noqa: E501
         """V1beta1JSONSchemaPropsOrBool - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1JSONSchemaPropsOrBool(object):
         if not isinstance(other, V1beta1JSONSchemaPropsOrBool):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
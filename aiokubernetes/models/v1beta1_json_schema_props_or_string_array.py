@@ -41,6 +41,12 @@ class V1beta1JSONSchemaPropsOrStringArray(object):
         'schema': 'Schema'
     }
 
+    __slots__ = (
+        '__property',
+        '_schema',
+        'discriminator',
+    )
+
     def __init__(self, _property=None, schema=None):  # noqa: E501
         """V1beta1JSONSchemaPropsOrStringArray - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1JSONSchemaPropsOrStringArray(object):
         if not isinstance(other, V1beta1JSONSchemaPropsOrStringArray):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1beta1MutatingWebhookConfiguration(object):
         'webhooks': 'webhooks'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_webhooks',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, webhooks=None):  # noqa: E501
         """V1beta1MutatingWebhookConfiguration - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V1beta1MutatingWebhookConfiguration(object):
         if not isinstance(other, V1beta1MutatingWebhookConfiguration):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
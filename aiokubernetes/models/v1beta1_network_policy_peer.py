@@ -44,6 +44,13 @@ class V1beta1NetworkPolicyPeer(object):
         'pod_selector': 'podSelector'
     }
 
+    __slots__ = (
+        '_ip_block',
+        '_namespace_selector',
+        '_pod_selector',
+        'discriminator',
+    )
+
     def __init__(self, ip_block=None, namespace_selector=None, pod_selector=None):  # noqa: E501
         """V1beta1NetworkPolicyPeer - a model defined in Swagger"""  # noqa: E501
 
@@ -165,7 +172,10 @@ class V1beta1NetworkPolicyPeer(object):
         if not isinstance(other, V1beta1NetworkPolicyPeer):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V1beta1PodDisruptionBudgetList(object):
         'metadata': 'metadata'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_items',
+        '_kind',
+        '_metadata',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, items=None, kind=None, metadata=None):  # noqa: E501
         """V1beta1PodDisruptionBudgetList - a model defined in Swagger"""  # noqa: E501
 
@@ -190,7 +198,10 @@ class V1beta1PodDisruptionBudgetList(object):
         if not isinstance(other, V1beta1PodDisruptionBudgetList):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1beta1PodDisruptionBudgetSpec(object):
         'selector': 'selector'
     }
 
+    __slots__ = (
+        '_max_unavailable',
+        '_min_available',
+        '_selector',
+        'discriminator',
+    )
+
     def __init__(self, max_unavailable=None, min_available=None, selector=None):  # noqa: E501
         """V1beta1PodDisruptionBudgetSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V1beta1PodDisruptionBudgetSpec(object):
         if not isinstance(other, V1beta1PodDisruptionBudgetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -47,6 +47,16 @@ class V1beta1PodDisruptionBudgetStatus(object):
         'observed_generation': 'observedGeneration'
     }
 
+    __slots__ = (
+        '_current_healthy',
+        '_desired_healthy',
+        '_disrupted_pods',
+        '_disruptions_allowed',
+        '_expected_pods',
+        '_observed_generation',
+        'discriminator',
+    )
+
     def __init__(self, current_healthy=None, desired_healthy=None, disrupted_pods=None, disruptions_allowed=None, expected_pods=None, observed_generation=None):  # noqa: E501
         """V1beta1PodDisruptionBudgetStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -251,7 +261,10 @@ class V1beta1PodDisruptionBudgetStatus(object):
         if not isinstance(other, V1beta1PodDisruptionBudgetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
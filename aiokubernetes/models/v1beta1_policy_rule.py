@@ -45,6 +45,15 @@ class V1beta1PolicyRule(object):
         'verbs': 'verbs'
     }
 
+    __slots__ = (
+        '_api_groups',
+        '_non_resource_ur_ls',
+        '_resource_names',
+        '_resources',
+        '_verbs',
+        'discriminator',
+    )
+
     def __init__(self, api_groups=None, non_resource_ur_ls=None, resource_names=None, resources=None, verbs=None):  # noqa: E501
         """V1beta1PolicyRule - a model defined in Swagger"""  # noqa: E501
 
@@ -219,7 +228,10 @@ class V1beta1PolicyRule(object):
         if not isinstance(other, V1beta1PolicyRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -49,6 +49,17 @@ class V1beta1ResourceAttributes(object):
         'version': 'version'
     }
 
+    __slots__ = (
+        '_group',
+        '_name',
+        '_namespace',
+        '_resource',
+        '_subresource',
+        '_verb',
+        '_version',
+        'discriminator',
+    )
+
     def __init__(self, group=None, name=None, namespace=None, resource=None, subresource=None, verb=None, version=None):  # noqa: E501
         """V1beta1ResourceAttributes - a model defined in Swagger"""  # noqa: E501
 
@@ -274,7 +285,10 @@ class V1beta1ResourceAttributes(object):
         if not isinstance(other, V1beta1ResourceAttributes):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
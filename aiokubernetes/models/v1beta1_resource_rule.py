@@ -43,6 +43,14 @@ class V1beta1ResourceRule(object):
         'verbs': 'verbs'
     }
 
+    __slots__ = (
+        '_api_groups',
+        '_resource_names',
+        '_resources',
+        '_verbs',
+        'discriminator',
+    )
+
     def __init__(self, api_groups=None, resource_names=None, resources=None, verbs=None):  # noqa: E501
         """V1beta1ResourceRule - a model defined in Swagger"""  # noqa: E501
 
@@ -191,7 +199,10 @@ class V1beta1ResourceRule(object):
         if not isinstance(other, V1beta1ResourceRule):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1beta1RuleWithOperations(object):
         'resources': 'resources'
     }
 
+    __slots__ = (
+        '_api_groups',
+        '_api_versions',
+        '_operations',
+        '_resources',
+        'discriminator',
+    )
+
     def __init__(self, api_groups=None, api_versions=None, operations=None, resources=None):  # noqa: E501
         """V1beta1RuleWithOperations - a model defined in Swagger"""  # noqa: E501
 
@@ -190,7 +198,10 @@ class V1beta1RuleWithOperations(object):
         if not isinstance(other, V1beta1RuleWithOperations):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -42,6 +42,12 @@ class V1beta1SelfSubjectAccessReviewSpec(object):
         'resource_attributes': 'resourceAttributes'
     }
 
+    __slots__ = (
+        '_non_resource_attributes',
+        '_resource_attributes',
+        'discriminator',
+    )
+
     def __init__(self, non_resource_attributes=None, resource_attributes=None):  # noqa: E501
         """V1beta1SelfSubjectAccessReviewSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -137,7 +143,10 @@ class V1beta1SelfSubjectAccessReviewSpec(object):
         if not isinstance(other, V1beta1SelfSubjectAccessReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class V1beta1SelfSubjectRulesReviewSpec(object):
         'namespace': 'namespace'
     }
 
+    __slots__ = (
+        '_namespace',
+        'discriminator',
+    )
+
     def __init__(self, namespace=None):  # noqa: E501
         """V1beta1SelfSubjectRulesReviewSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1beta1SelfSubjectRulesReviewSpec(object):
         if not isinstance(other, V1beta1SelfSubjectRulesReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
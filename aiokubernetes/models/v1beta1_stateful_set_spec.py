@@ -56,6 +56,18 @@ class V1beta1StatefulSetSpec(object):
         'volume_claim_templates': 'volumeClaimTemplates'
     }
 
+    __slots__ = (
+        '_pod_management_policy',
+        '_replicas',
+        '_revision_history_limit',
+        '_selector',
+        '_service_name',
+        '_template',
+        '_update_strategy',
+        '_volume_claim_templates',
+        'discriminator',
+    )
+
     def __init__(self, pod_management_policy=None, replicas=None, revision_history_limit=None, selector=None, service_name=None, template=None, update_strategy=None, volume_claim_templates=None):  # noqa: E501
         """V1beta1StatefulSetSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -309,7 +321,10 @@ class V1beta1StatefulSetSpec(object):
         if not isinstance(other, V1beta1StatefulSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
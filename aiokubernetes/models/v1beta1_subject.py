@@ -43,6 +43,14 @@ class V1beta1Subject(object):
         'namespace': 'namespace'
     }
 
+    __slots__ = (
+        '_api_group',
+        '_kind',
+        '_name',
+        '_namespace',
+        'discriminator',
+    )
+
     def __init__(self, api_group=None, kind=None, name=None, namespace=None):  # noqa: E501
         """V1beta1Subject - a model defined in Swagger"""  # noqa: E501
 
@@ -192,7 +200,10 @@ class V1beta1Subject(object):
         if not isinstance(other, V1beta1Subject):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
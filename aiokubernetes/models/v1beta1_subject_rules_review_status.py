@@ -46,6 +46,14 @@ class V1beta1SubjectRulesReviewStatus(object):
         'resource_rules': 'resourceRules'
     }
 
+    __slots__ = (
+        '_evaluation_error',
+        '_incomplete',
+        '_non_resource_rules',
+        '_resource_rules',
+        'discriminator',
+    )
+
     def __init__(self, evaluation_error=None, incomplete=None, non_resource_rules=None, resource_rules=None):  # noqa: E501
         """V1beta1SubjectRulesReviewStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -196,7 +204,10 @@ class V1beta1SubjectRulesReviewStatus(object):
         if not isinstance(other, V1beta1SubjectRulesReviewStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class V1beta1TokenReviewSpec(object):
         'token': 'token'
     }
 
+    __slots__ = (
+        '_token',
+        'discriminator',
+    )
+
     def __init__(self, token=None):  # noqa: E501
         """V1beta1TokenReviewSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1beta1TokenReviewSpec(object):
         if not isinstance(other, V1beta1TokenReviewSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,14 @@ class V1beta1UserInfo(object):
         'username': 'username'
     }
 
+    __slots__ = (
+        '_extra',
+        '_groups',
+        '_uid',
+        '_username',
+        'discriminator',
+    )
+
     def __init__(self, extra=None, groups=None, uid=None, username=None):  # noqa: E501
         """V1beta1UserInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -190,7 +198,10 @@ class V1beta1UserInfo(object):
         if not isinstance(other, V1beta1UserInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V1beta1VolumeAttachmentSpec(object):
         'source': 'source'
     }
 
+    __slots__ = (
+        '_attacher',
+        '_node_name',
+        '_source',
+        'discriminator',
+    )
+
     def __init__(self, attacher=None, node_name=None, source=None):  # noqa: E501
         """V1beta1VolumeAttachmentSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -167,7 +174,10 @@ class V1beta1VolumeAttachmentSpec(object):
         if not isinstance(other, V1beta1VolumeAttachmentSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
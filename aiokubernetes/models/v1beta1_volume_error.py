@@ -39,6 +39,12 @@ class V1beta1VolumeError(object):
         'time': 'time'
     }
 
+    __slots__ = (
+        '_message',
+        '_time',
+        'discriminator',
+    )
+
     def __init__(self, message=None, time=None):  # noqa: E501
         """V1beta1VolumeError - a model defined in Swagger"""  # noqa: E501
 
@@ -134,7 +140,10 @@ class V1beta1VolumeError(object):
         if not isinstance(other, V1beta1VolumeError):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
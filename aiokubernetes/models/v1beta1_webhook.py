@@ -49,6 +49,15 @@ class V1beta1Webhook(object):
         'rules': 'rules'
     }
 
+    __slots__ = (
+        '_client_config',
+        '_failure_policy',
+        '_name',
+        '_namespace_selector',
+        '_rules',
+        'discriminator',
+    )
+
     def __init__(self, client_config=None, failure_policy=None, name=None, namespace_selector=None, rules=None):  # noqa: E501
         """V1beta1Webhook - a model defined in Swagger"""  # noqa: E501
 
@@ -224,7 +233,10 @@ class V1beta1Webhook(object):
         if not isinstance(other, V1beta1Webhook):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
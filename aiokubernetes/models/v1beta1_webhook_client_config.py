@@ -43,6 +43,13 @@ class V1beta1WebhookClientConfig(object):
         'url': 'url'
     }
 
+    __slots__ = (
+        '_ca_bundle',
+        '_service',
+        '_url',
+        'discriminator',
+    )
+
     def __init__(self, ca_bundle=None, service=None, url=None):  # noqa: E501
         """V1beta1WebhookClientConfig - a model defined in Swagger"""  # noqa: E501
 
@@ -167,7 +174,10 @@ class V1beta1WebhookClientConfig(object):
         if not isinstance(other, V1beta1WebhookClientConfig):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,6 +55,18 @@ class V1beta2DeploymentSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_paused',
+        '_progress_deadline_seconds',
+        '_replicas',
+        '_revision_history_limit',
+        '_selector',
+        '_strategy',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, min_ready_seconds=None, paused=None, progress_deadline_seconds=None, replicas=None, revision_history_limit=None, selector=None, strategy=None, template=None):  # noqa: E501
         """V1beta2DeploymentSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -308,7 +320,10 @@ class V1beta2DeploymentSpec(object):
         if not isinstance(other, V1beta2DeploymentSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
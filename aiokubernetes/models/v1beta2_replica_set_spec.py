@@ -46,6 +46,14 @@ class V1beta2ReplicaSetSpec(object):
         'template': 'template'
     }
 
+    __slots__ = (
+        '_min_ready_seconds',
+        '_replicas',
+        '_selector',
+        '_template',
+        'discriminator',
+    )
+
     def __init__(self, min_ready_seconds=None, replicas=None, selector=None, template=None):  # noqa: E501
         """V1beta2ReplicaSetSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V1beta2ReplicaSetSpec(object):
         if not isinstance(other, V1beta2ReplicaSetSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -37,6 +37,11 @@ class V1beta2RollingUpdateDaemonSet(object):
         'max_unavailable': 'maxUnavailable'
     }
 
+    __slots__ = (
+        '_max_unavailable',
+        'discriminator',
+    )
+
     def __init__(self, max_unavailable=None):  # noqa: E501
         """V1beta2RollingUpdateDaemonSet - a model defined in Swagger"""  # noqa: E501
 
@@ -106,7 +111,10 @@ class V1beta2RollingUpdateDaemonSet(object):
         if not isinstance(other, V1beta2RollingUpdateDaemonSet):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
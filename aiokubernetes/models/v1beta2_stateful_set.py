@@ -49,6 +49,15 @@ class V1beta2StatefulSet(object):
         'status': 'status'
     }
 
+    __slots__ = (
+        '_api_version',
+        '_kind',
+        '_metadata',
+        '_spec',
+        '_status',
+        'discriminator',
+    )
+
     def __init__(self, api_version=None, kind=None, metadata=None, spec=None, status=None):  # noqa: E501
         """V1beta2StatefulSet - a model defined in Swagger"""  # noqa: E501
 
@@ -220,7 +229,10 @@ class V1beta2StatefulSet(object):
         if not isinstance(other, V1beta2StatefulSet):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -55,6 +55,19 @@ class V1beta2StatefulSetStatus(object):
         'updated_replicas': 'updatedReplicas'
     }
 
+    __slots__ = (
+        '_collision_count',
+        '_conditions',
+        '_current_replicas',
+        '_current_revision',
+        '_observed_generation',
+        '_ready_replicas',
+        '_replicas',
+        '_update_revision',
+        '_updated_replicas',
+        'discriminator',
+    )
+
     def __init__(self, collision_count=None, conditions=None, current_replicas=None, current_revision=None, observed_generation=None, ready_replicas=None, replicas=None, update_revision=None, updated_replicas=None):  # noqa: E501
         """V1beta2StatefulSetStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -333,7 +346,10 @@ class V1beta2StatefulSetStatus(object):
         if not isinstance(other, V1beta2StatefulSetStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -51,6 +51,17 @@ class V2alpha1CronJobSpec(object):
         'suspend': 'suspend'
     }
 
+    __slots__ = (
+        '_concurrency_policy',
+        '_failed_jobs_history_limit',
+        '_job_template',
+        '_schedule',
+        '_starting_deadline_seconds',
+        '_successful_jobs_history_limit',
+        '_suspend',
+        'discriminator',
+    )
+
     def __init__(self, concurrency_policy=None, failed_jobs_history_limit=None, job_template=None, schedule=None, starting_deadline_seconds=None, successful_jobs_history_limit=None, suspend=None):  # noqa: E501
         """V2alpha1CronJobSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -278,7 +289,10 @@ class V2alpha1CronJobSpec(object):
         if not isinstance(other, V2alpha1CronJobSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
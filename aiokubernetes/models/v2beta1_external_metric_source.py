@@ -45,6 +45,14 @@ class V2beta1ExternalMetricSource(object):
         'target_value': 'targetValue'
     }
 
+    __slots__ = (
+        '_metric_name',
+        '_metric_selector',
+        '_target_average_value',
+        '_target_value',
+        'discriminator',
+    )
+
     def __init__(self, metric_name=None, metric_selector=None, target_average_value=None, target_value=None):  # noqa: E501
         """V2beta1ExternalMetricSource - a model defined in Swagger"""  # noqa: E501
 
@@ -193,7 +201,10 @@ class V2beta1ExternalMetricSource(object):
         if not isinstance(other, V2beta1ExternalMetricSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -45,6 +45,14 @@ class V2beta1ExternalMetricStatus(object):
         'metric_selector': 'metricSelector'
     }
 
+    __slots__ = (
+        '_current_average_value',
+        '_current_value',
+        '_metric_name',
+        '_metric_selector',
+        'discriminator',
+    )
+
     def __init__(self, current_average_value=None, current_value=None, metric_name=None, metric_selector=None):  # noqa: E501
         """V2beta1ExternalMetricStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -194,7 +202,10 @@ class V2beta1ExternalMetricStatus(object):
         if not isinstance(other, V2beta1ExternalMetricStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -46,6 +46,14 @@ class V2beta1HorizontalPodAutoscalerSpec(object):
         'scale_target_ref': 'scaleTargetRef'
     }
 
+    __slots__ = (
+        '_max_replicas',
+        '_metrics',
+        '_min_replicas',
+        '_scale_target_ref',
+        'discriminator',
+    )
+
     def __init__(self, max_replicas=None, metrics=None, min_replicas=None, scale_target_ref=None):  # noqa: E501
         """V2beta1HorizontalPodAutoscalerSpec - a model defined in Swagger"""  # noqa: E501
 
@@ -195,7 +203,10 @@ class V2beta1HorizontalPodAutoscalerSpec(object):
         if not isinstance(other, V2beta1HorizontalPodAutoscalerSpec):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
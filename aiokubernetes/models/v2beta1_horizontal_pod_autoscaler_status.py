@@ -50,6 +50,16 @@ class V2beta1HorizontalPodAutoscalerStatus(object):
         'observed_generation': 'observedGeneration'
     }
 
+    __slots__ = (
+        '_conditions',
+        '_current_metrics',
+        '_current_replicas',
+        '_desired_replicas',
+        '_last_scale_time',
+        '_observed_generation',
+        'discriminator',
+    )
+
     def __init__(self, conditions=None, current_metrics=None, current_replicas=None, desired_replicas=None, last_scale_time=None, observed_generation=None):  # noqa: E501
         """V2beta1HorizontalPodAutoscalerStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -253,7 +263,10 @@ class V2beta1HorizontalPodAutoscalerStatus(object):
         if not isinstance(other, V2beta1HorizontalPodAutoscalerStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -50,6 +50,15 @@ class V2beta1MetricStatus(object):
         'type': 'type'
     }
 
+    __slots__ = (
+        '_external',
+        '_object',
+        '_pods',
+        '_resource',
+        '_type',
+        'discriminator',
+    )
+
     def __init__(self, external=None, object=None, pods=None, resource=None, type=None):  # noqa: E501
         """V2beta1MetricStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -224,7 +233,10 @@ class V2beta1MetricStatus(object):
         if not isinstance(other, V2beta1MetricStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -43,6 +43,13 @@ class V2beta1ObjectMetricSource(object):
         'target_value': 'targetValue'
     }
 
+    __slots__ = (
+        '_metric_name',
+        '_target',
+        '_target_value',
+        'discriminator',
+    )
+
     def __init__(self, metric_name=None, target=None, target_value=None):  # noqa: E501
         """V2beta1ObjectMetricSource - a model defined in Swagger"""  # noqa: E501
 
@@ -167,7 +174,10 @@ class V2beta1ObjectMetricSource(object):
         if not isinstance(other, V2beta1ObjectMetricSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
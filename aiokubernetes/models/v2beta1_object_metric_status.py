@@ -43,6 +43,13 @@ class V2beta1ObjectMetricStatus(object):
         'target': 'target'
     }
 
+    __slots__ = (
+        '_current_value',
+        '_metric_name',
+        '_target',
+        'discriminator',
+    )
+
     def __init__(self, current_value=None, metric_name=None, target=None):  # noqa: E501
         """V2beta1ObjectMetricStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -167,7 +174,10 @@ class V2beta1ObjectMetricStatus(object):
         if not isinstance(other, V2beta1ObjectMetricStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V2beta1PodsMetricSource(object):
         'target_average_value': 'targetAverageValue'
     }
 
+    __slots__ = (
+        '_metric_name',
+        '_target_average_value',
+        'discriminator',
+    )
+
     def __init__(self, metric_name=None, target_average_value=None):  # noqa: E501
         """V2beta1PodsMetricSource - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V2beta1PodsMetricSource(object):
         if not isinstance(other, V2beta1PodsMetricSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -39,6 +39,12 @@ class V2beta1PodsMetricStatus(object):
         'metric_name': 'metricName'
     }
 
+    __slots__ = (
+        '_current_average_value',
+        '_metric_name',
+        'discriminator',
+    )
+
     def __init__(self, current_average_value=None, metric_name=None):  # noqa: E501
         """V2beta1PodsMetricStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -136,7 +142,10 @@ class V2beta1PodsMetricStatus(object):
         if not isinstance(other, V2beta1PodsMetricStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
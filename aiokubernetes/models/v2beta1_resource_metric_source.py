@@ -41,6 +41,13 @@ class V2beta1ResourceMetricSource(object):
         'target_average_value': 'targetAverageValue'
     }
 
+    __slots__ = (
+        '_name',
+        '_target_average_utilization',
+        '_target_average_value',
+        'discriminator',
+    )
+
     def __init__(self, name=None, target_average_utilization=None, target_average_value=None):  # noqa: E501
         """V2beta1ResourceMetricSource - a model defined in Swagger"""  # noqa: E501
 
@@ -163,7 +170,10 @@ class V2beta1ResourceMetricSource(object):
         if not isinstance(other, V2beta1ResourceMetricSource):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -41,6 +41,13 @@ class V2beta1ResourceMetricStatus(object):
         'name': 'name'
     }
 
+    __slots__ = (
+        '_current_average_utilization',
+        '_current_average_value',
+        '_name',
+        'discriminator',
+    )
+
     def __init__(self, current_average_utilization=None, current_average_value=None, name=None):  # noqa: E501
         """V2beta1ResourceMetricStatus - a model defined in Swagger"""  # noqa: E501
 
@@ -164,7 +171,10 @@ class V2beta1ResourceMetricStatus(object):
         if not isinstance(other, V2beta1ResourceMetricStatus):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
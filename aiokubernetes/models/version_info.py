@@ -53,6 +53,19 @@ class VersionInfo(object):
         'platform': 'platform'
     }
 
+    __slots__ = (
+        '_build_date',
+        '_compiler',
+        '_git_commit',
+        '_git_tree_state',
+        '_git_version',
+        '_go_version',
+        '_major',
+        '_minor',
+        '_platform',
+        'discriminator',
+    )
+
     def __init__(self, build_date=None, compiler=None, git_commit=None, git_tree_state=None, git_version=None, go_version=None, major=None, minor=None, platform=None):  # noqa: E501
         """VersionInfo - a model defined in Swagger"""  # noqa: E501
 
@@ -321,7 +334,10 @@ class VersionInfo(object):
         if not isinstance(other, VersionInfo):
             return False
 
-        return self.__dict__ == other.__dict__
+        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
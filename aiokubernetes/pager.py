@@ -0,0 +1,177 @@
+"""Iterate over large K8s lists page by page.
+
+K8s can split list responses into pages of `limit` items each. Every page
+contains a `metadata.continue` token to request the next one. The `Pager`
+follows these tokens, prefetches the next page while the caller processes the
+current one, and yields the items one at a time. This bounds the memory to
+roughly two pages, irrespective of the number of resources.
+
+The pager works with both client flavours:
+
+    # ApiClient: the list function makes the request itself.
+    pager = k8s.pager.Pager(k8s.CoreV1Api(api_client).list_pod_for_all_namespaces)
+
+    # Proxy: the list function returns a request dict for `client`.
+    proxy = k8s.api_proxy.Proxy(config)
+    pager = k8s.pager.Pager(
+        k8s.CoreV1Api(proxy).list_namespaced_pod, 'default', client=client)
+
+    async for pod in pager:
+        print(pod.metadata.name)
+"""
+import asyncio
+import collections
+
+import aiokubernetes as k8s
+from aiokubernetes.rest import ApiException
+
+
+class Pager(object):
+    """Async iterator over all items of a paginated K8s list call.
+
+    Continue tokens expire after a few minutes (410 Gone). The pager then
+    restarts the listing from the beginning, which means the caller may
+    receive some items twice. It gives up with `watch.ResourceExpired` after
+    `max_restarts` attempts.
+
+    Inputs:
+        list_fun: callable
+            Generated `list_*` method, bound to either an `ApiClient` or an
+            `api_proxy.Proxy` instance.
+        *args, **kwargs:
+            Passed verbatim to `list_fun`, eg the namespace or a label selector.
+        client: aiohttp.ClientSession
+            Must be provided if `list_fun` is bound to a Proxy, and must be
+            None if `list_fun` is bound to an `ApiClient`.
+        limit: int
+            Number of items per page.
+    """
+    # Restart the listing at most this many times if continue tokens expire.
+    max_restarts = 3
+
+    def __init__(self, list_fun, *args, client=None, limit=500, **kwargs):
+        self.list_fun, self.client = list_fun, client
+        self.args, self.kwargs = args, kwargs
+        self.limit = limit
+        self.codec = k8s.codec.get_codec_for(list_fun)
+
+        # Resource version of the most recent page. Watches that must not
+        # miss any changes made during the listing should start from here.
+        self.resource_version = None
+
+        # Metrics: number of fetched pages and restarts.
+        self.pages = 0
+        self.restarts = 0
+
+        # Undecoded items of the current page and their decoder.
+        self._items = collections.deque()
+        self._decode = None
+
+        # Task that fetches the next page, and the continue token it uses.
+        self._next, self._token = None, None
+        self._started = False
+
+    def __aiter__(self):
+        return self
+
+    async def fetch(self, token):
+        """Request the page at continue `token` and return the HTTP response.
+
+        The first page has a `token` of None.
+        """
+        kwargs = dict(self.kwargs, limit=self.limit)
+        if token is not None:
+            kwargs['_continue'] = token
+
+        if self.client is None:
+            ret = await self.list_fun(*self.args, _preload_content=False, **kwargs)
+            return ret.http
+
+        cargs = self.list_fun(*self.args, **kwargs)
+        return await self.client.request(**cargs)
+
+    async def fetch_page(self, token):
+        """Return the (status, reason, body) of the page at continue `token`."""
+        resp = await self.fetch(token)
+        try:
+            return resp.status, resp.reason, await resp.read()
+        finally:
+            resp.release()
+
+    def prefetch(self, token):
+        """Start to fetch the page at continue `token` in the background."""
+        self._next = asyncio.ensure_future(self.fetch_page(token))
+        self._token = token
+
+    async def __anext__(self):
+        if not self._started:
+            self._started = True
+            self.prefetch(None)
+
+        while not self._items:
+            if self._next is None:
+                raise StopAsyncIteration
+            task, token = self._next, self._token
+            self._next = None
+            status, reason, body = await task
+
+            # The continue token has expired: list everything again.
+            if status == 410 and token is not None:
+                if self.restarts >= self.max_restarts:
+                    raise k8s.watch.ResourceExpired(reason)
+                self.restarts += 1
+                self.prefetch(None)
+                continue
+
+            if status != 200:
+                raise ApiException(status=status, reason=reason)
+            try:
+                manifest = self.codec.loads(body)
+            except ValueError:
+                raise ApiException(status=0, reason="Could not decode list response")
+            self.pages += 1
+
+            # Fetch the next page while the caller consumes this one.
+            metadata = manifest.get('metadata') or {}
+            self.resource_version = metadata.get('resourceVersion')
+            if metadata.get('continue'):
+                self.prefetch(metadata['continue'])
+
+            if self._decode is None:
+                self._decode = get_item_decoder(manifest)
+            self._items.extend(manifest.get('items') or [])
+
+        # Only convert the item into a Swagger object once the caller asks
+        # for it.
+        return self._decode(self._items.popleft())
+
+    def close(self):
+        """Abort any outstanding page request."""
+        if self._next is not None:
+            self._next.cancel()
+            self._next = None
+        self._items.clear()
+
+
+def get_item_decoder(manifest):
+    """Return the Swagger decoder for the items of the list `manifest`.
+
+    K8s omits `apiVersion` and `kind` in the items of list responses. The item
+    type is therefore derived from the list type, eg `V1PodList` -> `V1Pod`.
+
+    Input:
+        manifest: dict
+            Json decoded K8s list response.
+
+    Returns:
+        callable: decoder(data) -> Swagger object, or the unchanged dict if
+            there is no Swagger model for the list, eg for CRDs.
+    """
+    klass = k8s.registry.get_model_class(
+        manifest.get('apiVersion'), manifest.get('kind'))
+    if klass is None or 'items' not in klass.swagger_types:
+        return lambda data: data
+
+    # "list[V1Pod]" -> "V1Pod"
+    item_type = klass.swagger_types['items'][len('list['):-1]
+    return k8s.swagger.get_decoder(item_type)
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import (
+    FakeClient, FakeResponse, make_pod, to_bytes,
+)
+
+
+def make_page(names, token=None, rv='10'):
+    pod_list = k8s.V1PodList(
+        api_version='v1', kind='PodList',
+        metadata=k8s.V1ListMeta(resource_version=rv, _continue=token),
+        items=[make_pod(name) for name in names],
+    )
+    return FakeResponse(body=to_bytes(pod_list))
+
+
+async def collect(pager):
+    return [pod.metadata.name async for pod in pager]
+
+
+class TestPager:
+    def setup_method(self):
+        config = k8s.configuration.Configuration()
+        self.list_fun = k8s.CoreV1Api(k8s.api_proxy.Proxy(config)).list_namespaced_pod
+
+    def test_proxy(self):
+        client = FakeClient([
+            make_page(['a', 'b'], token='t1'),
+            make_page(['c', 'd'], token='t2'),
+            make_page(['e'], rv='11'),
+        ])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client, limit=2)
+        assert fakes.run(collect(pager)) == ['a', 'b', 'c', 'd', 'e']
+
+        assert 'limit=2' in client.urls[0] and 'continue' not in client.urls[0]
+        assert 'continue=t1' in client.urls[1]
+        assert 'continue=t2' in client.urls[2]
+        assert pager.pages == 3 and pager.resource_version == '11'
+
+    def test_item_type(self):
+        client = FakeClient([make_page(['a'])])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+        pods = fakes.run(self._list(pager))
+        assert isinstance(pods[0], k8s.V1Pod)
+        assert pods[0] == make_pod('a')
+
+    def test_unknown_kind(self):
+        """Return the raw dicts if there is no model for the list, eg for CRDs."""
+        items = [{'metadata': {'name': 'a'}, 'spec': {'x': 1}}]
+        body = {
+            'apiVersion': 'example.com/v1', 'kind': 'WidgetList',
+            'metadata': {'resourceVersion': '10'}, 'items': items,
+        }
+        client = FakeClient([FakeResponse(body=json.dumps(body).encode())])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+        assert fakes.run(self._list(pager)) == items
+        assert pager.resource_version == '10'
+
+    async def _list(self, pager):
+        return [_ async for _ in pager]
+
+    def test_prefetch(self):
+        """The next page must be requested before the caller consumes this one."""
+        client = FakeClient([make_page(['a'], token='t1'), make_page(['b'])])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+
+        async def run():
+            pod = await pager.__anext__()
+            await asyncio.sleep(0)
+            assert len(client.urls) == 2
+            pager.close()
+            return pod
+
+        assert fakes.run(run()).metadata.name == 'a'
+
+    def test_expired(self):
+        """Restart the listing if the continue token has expired."""
+        client = FakeClient([
+            make_page(['a'], token='t1'),
+            FakeResponse(status=410),
+            make_page(['a'], token='t2'),
+            make_page(['b']),
+        ])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+        assert fakes.run(collect(pager)) == ['a', 'a', 'b']
+        assert pager.restarts == 1
+        assert 'continue' not in client.urls[2]
+
+        # Give up eventually.
+        client = FakeClient([make_page(['a'], token='t1'), FakeResponse(status=410)])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+        pager.max_restarts = 0
+        with pytest.raises(k8s.watch.ResourceExpired):
+            fakes.run(collect(pager))
+
+    def test_error(self):
+        client = FakeClient([FakeResponse(status=403)])
+        pager = k8s.pager.Pager(self.list_fun, 'default', client=client)
+        with pytest.raises(k8s.rest.ApiException) as err:
+            fakes.run(collect(pager))
+        assert err.value.status == 403
+
+    def test_api_client(self):
+        """Use the raw response if the list function is bound to an ApiClient."""
+        pages = [make_page(['a'], token='t1'), make_page(['b'])]
+        calls = []
+
+        async def list_fun(namespace, **kwargs):
+            calls.append(kwargs)
+            return k8s.api_client.ApiResponse(http=pages.pop(0), obj=None)
+
+        pager = k8s.pager.Pager(list_fun, 'default', limit=1)
+        assert fakes.run(collect(pager)) == ['a', 'b']
+        assert calls == [
+            {'limit': 1, '_preload_content': False},
+            {'limit': 1, '_continue': 't1', '_preload_content': False},
+        ]
@@ -0,0 +1,261 @@
+"""Client side rate limiting for K8s API requests.
+
+A `RateLimiter` is a token bucket that refills at `qps` tokens per second and
+holds at most `burst` tokens. Every request must acquire one token and will
+wait until one becomes available.
+
+`ApiClient` and the sessions returned by `k8s.clients.get_aiohttp` wrap their
+aiohttp sessions in a `RateLimitedSession` if the configuration asks for it:
+
+    config.qps, config.burst = 20, 40
+    client = k8s.clients.get_aiohttp(config)
+
+The wrapper waits for the token before it hands the request to aiohttp. The
+time spent throttled therefore does not count against the request timeout.
+"""
+import asyncio
+import time
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Token bucket that refills at `qps` tokens/second up to `burst` tokens.
+
+    The bucket starts full, ie the first `burst` requests will not wait.
+
+    Inputs:
+        qps: float
+            Sustained number of requests per second.
+        burst: int
+            Maximum number of requests that may be made back-to-back.
+    """
+    def __init__(self, qps, burst):
+        assert qps > 0, 'QPS must be positive'
+        assert burst >= 1, 'Burst must be at least 1'
+        self.qps = float(qps)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last = time.monotonic()
+
+        # Metrics: number of acquired tokens and seconds spent waiting.
+        self.acquired = 0
+        self.wait_time = 0.0
+
+    def reserve(self):
+        """Take a token and return the seconds to wait until it is valid.
+
+        The token counter may become negative. This queues up the callers in
+        order of arrival without the need for an explicit queue.
+        """
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.last) * self.qps)
+        self.last = now
+
+        self.tokens -= 1
+        self.acquired += 1
+        if self.tokens >= 0:
+            return 0.0
+        delay = -self.tokens / self.qps
+        self.wait_time += delay
+        return delay
+
+    async def acquire(self):
+        """Wait until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Rate limit API requests globally and, optionally, per verb/resource.
+
+    Inputs:
+        qps: float
+            Global requests per second.
+        burst: int
+            Global burst size.
+        limits: dict
+            Optional additional limits for specific verbs and resources. The
+            keys are (verb, resource) tuples, eg ('LIST', 'pods'), and the
+            values (qps, burst) tuples. Either element of the key may be None
+            to match any verb or resource. See `classify` for the verb and
+            resource names.
+    """
+    def __init__(self, qps, burst, limits=None):
+        self.bucket = TokenBucket(qps, burst)
+        self.buckets = {
+            key: TokenBucket(*value) for key, value in (limits or {}).items()
+        }
+
+    @property
+    def acquired(self):
+        """Number of requests that passed the global limiter."""
+        return self.bucket.acquired
+
+    @property
+    def wait_time(self):
+        """Total number of seconds all requests had to wait."""
+        return self.bucket.wait_time + sum(_.wait_time for _ in self.buckets.values())
+
+    async def acquire(self, method='GET', url=''):
+        """Wait until the request `method` to `url` may proceed."""
+        buckets = [self.bucket]
+        if self.buckets:
+            verb, resource = classify(method, url)
+            for key in ((verb, resource), (verb, None), (None, resource)):
+                if key in self.buckets:
+                    buckets.append(self.buckets[key])
+
+        # Reserve all tokens first, then wait for the slowest one.
+        delay = max(bucket.reserve() for bucket in buckets)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimitedSession:
+    """Wrap an `aiohttp.ClientSession` and rate limit all its requests.
+
+    The `request`, `get`, `post`, `put`, `patch`, `delete` and `ws_connect`
+    methods acquire a token from `limiter` before they call `session`. Like
+    their aiohttp counterparts, the return values support `await` and
+    `async with`. All other attributes are those of `session`.
+
+    Inputs:
+        session: aiohttp.ClientSession
+        limiter: RateLimiter
+    """
+    def __init__(self, session, limiter):
+        self.session = session
+        self.limiter = limiter
+
+    def __getattr__(self, name):
+        return getattr(self.session, name)
+
+    def request(self, method, url, **kwargs):
+        return _LimitedRequest(
+            self.limiter, method, url, self.session.request, (method, url), kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request('PATCH', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def ws_connect(self, url, **kwargs):
+        return _LimitedRequest(
+            self.limiter, 'GET', url, self.session.ws_connect, (url,), kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.session.close()
+
+
+class _LimitedRequest:
+    """Acquire a token from `limiter`, then return `fun(*args, **kwargs)`."""
+    def __init__(self, limiter, method, url, fun, args, kwargs):
+        self.limiter = limiter
+        self.method, self.url = method, url
+        self.fun, self.args, self.kwargs = fun, args, kwargs
+        self.ctx = None
+
+    async def _request(self):
+        await self.limiter.acquire(self.method, str(self.url))
+        self.ctx = self.fun(*self.args, **self.kwargs)
+        return self.ctx
+
+    def __await__(self):
+        return self._await().__await__()
+
+    async def _await(self):
+        return await (await self._request())
+
+    async def __aenter__(self):
+        return await (await self._request()).__aenter__()
+
+    async def __aexit__(self, *args):
+        return await self.ctx.__aexit__(*args)
+
+
+def classify(method, url):
+    """Return the K8s verb and resource for the request `method` to `url`.
+
+    Example: ('GET', 'https://host/api/v1/namespaces/ns/pods') -> ('LIST', 'pods')
+
+    Inputs:
+        method: str
+            HTTP method, eg GET or POST.
+        url: str
+            Request URL.
+
+    Returns:
+        tuple: (verb, resource). The verb is the HTTP method, except for
+            collection GETs, which are either LIST or WATCH. The resource is
+            the plural resource name, eg `pods` or `deployments`, or None.
+    """
+    parts = urlparse(url)
+    words = [_ for _ in parts.path.split('/') if _]
+
+    # Strip the API prefix, ie "api/v1" or "apis/apps/v1".
+    if words[:1] == ['api']:
+        words = words[2:]
+    elif words[:1] == ['apis']:
+        words = words[3:]
+    else:
+        return method.upper(), None
+
+    # Strip the namespace, ie "namespaces/foo/...". Note that "namespaces" on
+    # its own is a resource.
+    if len(words) > 2 and words[0] == 'namespaces':
+        words = words[2:]
+    if not words:
+        return method.upper(), None
+
+    verb = method.upper()
+    if verb == 'GET' and len(words) == 1:
+        verb = 'WATCH' if 'watch=true' in parts.query.lower() else 'LIST'
+    return verb, words[0]
+
+
+def get_rate_limiter(config):
+    """Return the `RateLimiter` for `config` or None if `config.qps` is not set.
+
+    All sessions created from the same `config` share the same
+    `config.rate_limiter`.
+
+    Input:
+        config: k8s.configuration.Config instance
+
+    Returns:
+        RateLimiter|None
+    """
+    if config.rate_limiter is None and config.qps:
+        config.rate_limiter = RateLimiter(
+            config.qps, config.burst or 1, config.rate_limits)
+    return config.rate_limiter
+
+
+def limit_session(session, config):
+    """Return `session` wrapped in a `RateLimitedSession` if `config` asks for it.
+
+    Input:
+        session: aiohttp.ClientSession
+        config: k8s.configuration.Config instance
+
+    Returns:
+        aiohttp.ClientSession|RateLimitedSession
+    """
+    limiter = get_rate_limiter(config)
+    if limiter is None:
+        return session
+    return RateLimitedSession(session, limiter)
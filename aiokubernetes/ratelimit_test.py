@@ -0,0 +1,141 @@
+import unittest.mock as mock
+
+import aiohttp
+from aiohttp import test_utils, web
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+
+
+class TestTokenBucket:
+    @mock.patch.object(k8s.ratelimit.time, 'monotonic')
+    def test_reserve(self, m_time):
+        m_time.return_value = 100
+        bucket = k8s.ratelimit.TokenBucket(qps=2, burst=3)
+
+        # The bucket starts full and permits `burst` requests without delay.
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+        # Subsequent requests must queue up at 1/qps intervals.
+        assert [bucket.reserve() for _ in range(3)] == [0.5, 1, 1.5]
+        assert bucket.acquired == 6
+        assert bucket.wait_time == 3
+
+        # After 10s the bucket must be full again but not exceed `burst`.
+        m_time.return_value = 110
+        assert [bucket.reserve() for _ in range(4)] == [0, 0, 0, 0.5]
+
+    @mock.patch.object(k8s.ratelimit.asyncio, 'sleep', new_callable=fakes.AsyncMock)
+    def test_acquire(self, m_sleep):
+        bucket = k8s.ratelimit.TokenBucket(qps=1, burst=1)
+
+        async def acquire():
+            await bucket.acquire()
+            await bucket.acquire()
+
+        fakes.run(acquire())
+        assert m_sleep.call_count == 1
+        assert 0.9 < m_sleep.call_args[0][0] <= 1
+
+
+class TestRateLimiter:
+    def test_classify(self):
+        fun = k8s.ratelimit.classify
+        host = 'https://k8s'
+        assert fun('GET', f'{host}/api/v1/pods') == ('LIST', 'pods')
+        assert fun('get', f'{host}/api/v1/namespaces/ns/pods') == ('LIST', 'pods')
+        assert fun('GET', f'{host}/api/v1/pods?watch=True') == ('WATCH', 'pods')
+        assert fun('GET', f'{host}/api/v1/namespaces/ns/pods/foo') == ('GET', 'pods')
+        ns_pods = f'{host}/api/v1/namespaces/ns/pods'
+        assert fun('GET', ns_pods + '/foo/log') == ('GET', 'pods')
+        assert fun('GET', f'{host}/api/v1/namespaces') == ('LIST', 'namespaces')
+        assert fun('DELETE', f'{host}/api/v1/namespaces/ns') == ('DELETE', 'namespaces')
+        assert fun('PATCH', f'{host}/apis/apps/v1/namespaces/ns/deployments/foo') == (
+            'PATCH', 'deployments')
+        assert fun('GET', f'{host}/version') == ('GET', None)
+        assert fun('GET', f'{host}/apis/apps/v1') == ('GET', None)
+
+    @mock.patch.object(k8s.ratelimit.asyncio, 'sleep', new_callable=fakes.AsyncMock)
+    def test_per_resource_limits(self, m_sleep):
+        limiter = k8s.ratelimit.RateLimiter(
+            qps=100, burst=100, limits={('LIST', 'pods'): (1, 1)})
+
+        async def acquire():
+            await limiter.acquire('GET', 'https://k8s/api/v1/pods')
+            await limiter.acquire('GET', 'https://k8s/api/v1/namespaces')
+            await limiter.acquire('GET', 'https://k8s/api/v1/pods')
+
+        # Only the second pod listing must have been delayed.
+        fakes.run(acquire())
+        assert m_sleep.call_count == 1
+        assert limiter.acquired == 3
+        assert limiter.wait_time > 0.9
+
+    def test_get_rate_limiter(self):
+        config = k8s.configuration.Configuration()
+
+        # Rate limiting must be disabled by default.
+        assert k8s.ratelimit.get_rate_limiter(config) is None
+        assert k8s.ratelimit.limit_session('session', config) == 'session'
+
+        # All sessions must share the same limiter.
+        config.qps, config.burst = 1, 1
+        limiter = k8s.ratelimit.get_rate_limiter(config)
+        assert config.rate_limiter is limiter
+        assert k8s.ratelimit.get_rate_limiter(config) is limiter
+        ret = k8s.ratelimit.limit_session('session', config)
+        assert isinstance(ret, k8s.ratelimit.RateLimitedSession)
+        assert ret.limiter is limiter and ret.session == 'session'
+
+
+class TestRateLimitedSession:
+    def test_request(self):
+        """Wait for the token before the request and its timeout start."""
+        async def handler(request):
+            return web.json_response({'path': request.path})
+
+        async def run():
+            server = test_utils.TestServer(web.Application())
+            server.app.router.add_get('/{tail:.*}', handler)
+            await server.start_server()
+
+            limiter = k8s.ratelimit.RateLimiter(qps=5, burst=1)
+            timeout = aiohttp.ClientTimeout(total=0.1)
+            session = k8s.ratelimit.RateLimitedSession(
+                aiohttp.ClientSession(timeout=timeout), limiter)
+            try:
+                # Each request but the first is throttled for 0.2s, which
+                # exceeds the timeout.
+                resp = await session.request('GET', server.make_url('/a'))
+                assert (await resp.json()) == {'path': '/a'}
+                resp.release()
+                async with session.request('GET', server.make_url('/b')) as resp:
+                    assert (await resp.json()) == {'path': '/b'}
+                resp = await session.get(server.make_url('/c'))
+                resp.release()
+            finally:
+                await session.close()
+                await server.close()
+            return limiter
+
+        limiter = fakes.run(run())
+        assert limiter.acquired == 3
+        assert limiter.wait_time > 0.35
+
+    def test_clients(self):
+        """`ApiClient` and `get_aiohttp` must rate limit both lanes."""
+        config = k8s.configuration.Configuration()
+        config.qps, config.burst = 10, 1
+
+        async def run():
+            clients = [
+                k8s.api_client.ApiClient(config), k8s.clients.get_aiohttp(config)]
+            sessions = [clients[0].session, clients[0].stream_session,
+                        clients[1].default, clients[1].stream]
+            for session in sessions:
+                assert isinstance(session, k8s.ratelimit.RateLimitedSession)
+                assert session.limiter is config.rate_limiter
+            for client in clients:
+                await client.close()
+
+        fakes.run(run())
@@ -0,0 +1,142 @@
+"""Map K8s (apiVersion, kind) pairs to Swagger models and API methods.
+
+Every decoded manifest and watch event must be matched to its Swagger model.
+`swagger.determine_type` derives the model name with string manipulations,
+which is wasteful in the watch hot path and wrong for some resources, eg it
+maps ('apps/v1', 'Deployment') to the non-existent 'AppsV1Deployment' instead
+of 'V1Deployment'.
+
+This module answers the same question with a dict lookup. The lookup table
+is generated from the API classes by `create-client/registry.py` and can be
+extended at runtime for custom resources:
+
+    k8s.registry.register('example.com/v1', 'Foo', FooModel, plural='foos')
+
+The registry also knows the plural name, scope and generated API methods of
+every built-in resource:
+
+    res = k8s.registry.get_resource('apps/v1', 'Deployment')
+    fun = k8s.registry.get_api_method('apps/v1', 'Deployment', 'list', proxy)
+"""
+import functools
+from collections import namedtuple
+
+import aiokubernetes as k8s
+from aiokubernetes.resources import RESOURCES
+
+# Describes one K8s resource type.
+#   model, list_model: Swagger model names (str) or classes.
+#   plural: the plural name in URLs, eg 'deployments'.
+#   namespaced: False for cluster scoped resources like Nodes.
+#   api: name of the generated API class, eg 'AppsV1Api'.
+#   methods: {verb: method name} of `api`, eg {'list': 'list_namespaced_pod'}.
+Resource = namedtuple(
+    'Resource',
+    'api_version kind model list_model plural namespaced api methods'
+)
+
+# {(apiVersion, kind): Resource}.
+_RESOURCES = {}
+
+# {(apiVersion, kind): model} for all registered resources and their lists.
+_MODELS = {}
+
+
+def register(api_version, kind, model, list_model=None, plural=None,
+             namespaced=True, api=None, methods=None):
+    """Register the model for the resource `kind` in `api_version`.
+
+    Inputs:
+        api_version: str
+            Eg 'v1' or 'example.com/v1'.
+        kind: str
+            Eg 'Pod' or 'Foo'.
+        model: str|type
+            Name of a Swagger model or a class with the same interface, ie
+            `swagger_types` and `attribute_map`.
+        list_model: str|type
+            Model for the `<kind>List` responses (optional).
+        plural: str
+            Plural name of the resource in URLs, eg 'foos'.
+        namespaced: bool
+            False for cluster scoped resources.
+        api: str
+            Name of the API class in `aiokubernetes` that serves the resource.
+        methods: dict
+            Map verbs like 'list' or 'read' to the method names of `api`.
+
+    Returns:
+        Resource
+    """
+    res = Resource(
+        api_version, kind, model, list_model, plural, namespaced, api, methods or {})
+    _RESOURCES[(api_version, kind)] = res
+    _MODELS[(api_version, kind)] = model
+    if list_model is not None:
+        _MODELS[(api_version, kind + 'List')] = list_model
+    return res
+
+
+def get_resource(api_version, kind):
+    """Return the `Resource` for `api_version` and `kind`, or None."""
+    return _RESOURCES.get((api_version, kind))
+
+
+def get_model(api_version, kind):
+    """Return the Swagger model for `api_version` and `kind`.
+
+    Falls back to `swagger.determine_type` for unregistered pairs, eg types
+    without API methods like 'Status'. The fallback is memoised in a bounded
+    cache because the pairs come from arbitrary manifests.
+
+    Returns:
+        str|type: model name or class. Both are valid `klass` arguments for
+            `swagger.deserialize`.
+    """
+    try:
+        return _MODELS[(api_version, kind)]
+    except KeyError:
+        return _determine_type(api_version, kind)
+
+
+@functools.lru_cache(maxsize=1024)
+def _determine_type(api_version, kind):
+    """Return the (cached) `swagger.determine_type` for unregistered pairs."""
+    return k8s.swagger.determine_type(api_version, kind)
+
+
+def get_model_class(api_version, kind):
+    """Same as `get_model` but always returns a class (or None if unknown)."""
+    model = get_model(api_version, kind)
+    if isinstance(model, str):
+        return getattr(k8s.models, model, None)
+    return model
+
+
+def get_api_method(api_version, kind, verb, api_client):
+    """Return the generated API method for `verb` bound to `api_client`.
+
+    Example: ('v1', 'Pod', 'list', proxy) -> CoreV1Api(proxy).list_namespaced_pod
+
+    Inputs:
+        api_version: str
+        kind: str
+        verb: str
+            One of 'list', 'list_all', 'read', 'create', 'replace', 'patch',
+            'delete' or 'delete_collection'.
+        api_client: ApiClient|api_proxy.Proxy
+
+    Returns:
+        callable, or None if the resource or verb is unknown.
+    """
+    res = get_resource(api_version, kind)
+    if res is None or res.api is None or verb not in res.methods:
+        return None
+    api = getattr(k8s, res.api)(api_client)
+    return getattr(api, res.methods[verb])
+
+
+# Load the generated table of built-in resources.
+for (_api_version, _kind), _value in RESOURCES.items():
+    register(_api_version, _kind, *_value)
+del _api_version, _kind, _value
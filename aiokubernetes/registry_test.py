@@ -0,0 +1,87 @@
+import aiokubernetes as k8s
+
+
+class TestRegistry:
+    def test_builtin(self):
+        res = k8s.registry.get_resource('apps/v1', 'Deployment')
+        assert res.model == 'V1Deployment'
+        assert res.list_model == 'V1DeploymentList'
+        assert res.plural == 'deployments' and res.namespaced
+        assert res.methods['list'] == 'list_namespaced_deployment'
+        assert res.methods['list_all'] == 'list_deployment_for_all_namespaces'
+
+        res = k8s.registry.get_resource('v1', 'Node')
+        assert not res.namespaced
+        assert res.methods['list'] == 'list_node'
+
+        assert k8s.registry.get_resource('v1', 'Foo') is None
+
+    def test_table(self):
+        """All models and methods in the generated table must exist."""
+        for (api_version, kind), res in k8s.registry._RESOURCES.items():
+            if res.api is None:
+                continue
+            assert hasattr(k8s.models, res.model)
+            if res.list_model is not None:
+                klass = getattr(k8s.models, res.list_model)
+                assert klass.swagger_types['items'] == f'list[{res.model}]'
+            api = getattr(k8s, res.api)
+            for name in res.methods.values():
+                assert hasattr(api, name)
+
+    def test_get_model(self):
+        assert k8s.registry.get_model('v1', 'Pod') == 'V1Pod'
+        assert k8s.registry.get_model('v1', 'PodList') == 'V1PodList'
+        assert k8s.registry.get_model('apps/v1', 'Deployment') == 'V1Deployment'
+
+        # Fall back to the heuristic for types without API methods.
+        assert k8s.registry.get_model('v1', 'Status') == 'V1Status'
+        assert k8s.registry.get_model_class('v1', 'Status') is k8s.V1Status
+        assert k8s.registry.get_model_class('v1', 'Foo') is None
+
+    def test_get_model_unknown(self):
+        """Unknown pairs must not grow the registry without bound."""
+        num_models = len(k8s.registry._MODELS)
+        for idx in range(2000):
+            k8s.registry.get_model('example.com/v1', f'Foo{idx}')
+        assert len(k8s.registry._MODELS) == num_models
+        info = k8s.registry._determine_type.cache_info()
+        assert info.currsize <= info.maxsize
+
+    def test_unpack(self):
+        """Decode manifests whose model name does not follow the heuristic."""
+        manifest = {
+            'apiVersion': 'apps/v1', 'kind': 'Deployment',
+            'metadata': {'name': 'foo'},
+        }
+        obj = k8s.swagger.unpack_manifest(manifest)
+        assert isinstance(obj, k8s.V1Deployment)
+        assert obj.metadata.name == 'foo'
+
+    def test_register(self):
+        k8s.registry.register(
+            'example.com/v1', 'Foo', k8s.V1ConfigMap, k8s.V1ConfigMapList,
+            plural='foos', api='CoreV1Api',
+            methods={'list': 'list_namespaced_config_map'},
+        )
+        try:
+            manifest = {
+                'apiVersion': 'example.com/v1', 'kind': 'Foo', 'data': {'a': 'b'},
+            }
+            obj = k8s.swagger.unpack_manifest(manifest)
+            assert isinstance(obj, k8s.V1ConfigMap) and obj.data == {'a': 'b'}
+            model = k8s.registry.get_model('example.com/v1', 'FooList')
+            assert model is k8s.V1ConfigMapList
+        finally:
+            del k8s.registry._RESOURCES[('example.com/v1', 'Foo')]
+            del k8s.registry._MODELS[('example.com/v1', 'Foo')]
+            del k8s.registry._MODELS[('example.com/v1', 'FooList')]
+
+    def test_get_api_method(self):
+        proxy = k8s.api_proxy.Proxy(k8s.configuration.Configuration())
+        fun = k8s.registry.get_api_method('v1', 'Pod', 'list', proxy)
+        cargs = fun('default')
+        assert cargs['url'].endswith('/api/v1/namespaces/default/pods')
+
+        assert k8s.registry.get_api_method('v1', 'Pod', 'foo', proxy) is None
+        assert k8s.registry.get_api_method('v1', 'Foo', 'list', proxy) is None
@@ -0,0 +1,1265 @@
+# coding: utf-8
+
+# flake8: noqa
+"""
+    Kubernetes
+
+    NOTE: this file was generated by `create-client/registry.py`.
+
+    Maps (apiVersion, kind) to
+    (model, list model, plural, namespaced, API class, {verb: API method}).
+"""
+RESOURCES = {
+    ('admissionregistration.k8s.io/v1alpha1', 'InitializerConfiguration'): (
+        'V1alpha1InitializerConfiguration',
+        'V1alpha1InitializerConfigurationList',
+        'initializerconfigurations',
+        False,
+        'AdmissionregistrationV1alpha1Api',
+        {
+            'create': 'create_initializer_configuration',
+            'delete': 'delete_initializer_configuration',
+            'delete_collection': 'delete_collection_initializer_configuration',
+            'list': 'list_initializer_configuration',
+            'patch': 'patch_initializer_configuration',
+            'read': 'read_initializer_configuration',
+            'replace': 'replace_initializer_configuration',
+        },
+    ),
+    ('admissionregistration.k8s.io/v1beta1', 'MutatingWebhookConfiguration'): (
+        'V1beta1MutatingWebhookConfiguration',
+        'V1beta1MutatingWebhookConfigurationList',
+        'mutatingwebhookconfigurations',
+        False,
+        'AdmissionregistrationV1beta1Api',
+        {
+            'create': 'create_mutating_webhook_configuration',
+            'delete': 'delete_mutating_webhook_configuration',
+            'delete_collection': 'delete_collection_mutating_webhook_configuration',
+            'list': 'list_mutating_webhook_configuration',
+            'patch': 'patch_mutating_webhook_configuration',
+            'read': 'read_mutating_webhook_configuration',
+            'replace': 'replace_mutating_webhook_configuration',
+        },
+    ),
+    ('admissionregistration.k8s.io/v1beta1', 'ValidatingWebhookConfiguration'): (
+        'V1beta1ValidatingWebhookConfiguration',
+        'V1beta1ValidatingWebhookConfigurationList',
+        'validatingwebhookconfigurations',
+        False,
+        'AdmissionregistrationV1beta1Api',
+        {
+            'create': 'create_validating_webhook_configuration',
+            'delete': 'delete_validating_webhook_configuration',
+            'delete_collection': 'delete_collection_validating_webhook_configuration',
+            'list': 'list_validating_webhook_configuration',
+            'patch': 'patch_validating_webhook_configuration',
+            'read': 'read_validating_webhook_configuration',
+            'replace': 'replace_validating_webhook_configuration',
+        },
+    ),
+    ('apiextensions.k8s.io/v1beta1', 'CustomResourceDefinition'): (
+        'V1beta1CustomResourceDefinition',
+        'V1beta1CustomResourceDefinitionList',
+        'customresourcedefinitions',
+        False,
+        'ApiextensionsV1beta1Api',
+        {
+            'create': 'create_custom_resource_definition',
+            'delete': 'delete_custom_resource_definition',
+            'delete_collection': 'delete_collection_custom_resource_definition',
+            'list': 'list_custom_resource_definition',
+            'patch': 'patch_custom_resource_definition',
+            'read': 'read_custom_resource_definition',
+            'replace': 'replace_custom_resource_definition',
+        },
+    ),
+    ('apiregistration.k8s.io/v1', 'APIService'): (
+        'V1APIService',
+        'V1APIServiceList',
+        'apiservices',
+        False,
+        'ApiregistrationV1Api',
+        {
+            'create': 'create_api_service',
+            'delete': 'delete_api_service',
+            'delete_collection': 'delete_collection_api_service',
+            'list': 'list_api_service',
+            'patch': 'patch_api_service',
+            'read': 'read_api_service',
+            'replace': 'replace_api_service',
+        },
+    ),
+    ('apiregistration.k8s.io/v1beta1', 'APIService'): (
+        'V1beta1APIService',
+        'V1beta1APIServiceList',
+        'apiservices',
+        False,
+        'ApiregistrationV1beta1Api',
+        {
+            'create': 'create_api_service',
+            'delete': 'delete_api_service',
+            'delete_collection': 'delete_collection_api_service',
+            'list': 'list_api_service',
+            'patch': 'patch_api_service',
+            'read': 'read_api_service',
+            'replace': 'replace_api_service',
+        },
+    ),
+    ('apps/v1', 'ControllerRevision'): (
+        'V1ControllerRevision',
+        'V1ControllerRevisionList',
+        'controllerrevisions',
+        True,
+        'AppsV1Api',
+        {
+            'create': 'create_namespaced_controller_revision',
+            'delete': 'delete_namespaced_controller_revision',
+            'delete_collection': 'delete_collection_namespaced_controller_revision',
+            'list': 'list_namespaced_controller_revision',
+            'list_all': 'list_controller_revision_for_all_namespaces',
+            'patch': 'patch_namespaced_controller_revision',
+            'read': 'read_namespaced_controller_revision',
+            'replace': 'replace_namespaced_controller_revision',
+        },
+    ),
+    ('apps/v1', 'DaemonSet'): (
+        'V1DaemonSet',
+        'V1DaemonSetList',
+        'daemonsets',
+        True,
+        'AppsV1Api',
+        {
+            'create': 'create_namespaced_daemon_set',
+            'delete': 'delete_namespaced_daemon_set',
+            'delete_collection': 'delete_collection_namespaced_daemon_set',
+            'list': 'list_namespaced_daemon_set',
+            'list_all': 'list_daemon_set_for_all_namespaces',
+            'patch': 'patch_namespaced_daemon_set',
+            'read': 'read_namespaced_daemon_set',
+            'replace': 'replace_namespaced_daemon_set',
+        },
+    ),
+    ('apps/v1', 'Deployment'): (
+        'V1Deployment',
+        'V1DeploymentList',
+        'deployments',
+        True,
+        'AppsV1Api',
+        {
+            'create': 'create_namespaced_deployment',
+            'delete': 'delete_namespaced_deployment',
+            'delete_collection': 'delete_collection_namespaced_deployment',
+            'list': 'list_namespaced_deployment',
+            'list_all': 'list_deployment_for_all_namespaces',
+            'patch': 'patch_namespaced_deployment',
+            'read': 'read_namespaced_deployment',
+            'replace': 'replace_namespaced_deployment',
+        },
+    ),
+    ('apps/v1', 'ReplicaSet'): (
+        'V1ReplicaSet',
+        'V1ReplicaSetList',
+        'replicasets',
+        True,
+        'AppsV1Api',
+        {
+            'create': 'create_namespaced_replica_set',
+            'delete': 'delete_namespaced_replica_set',
+            'delete_collection': 'delete_collection_namespaced_replica_set',
+            'list': 'list_namespaced_replica_set',
+            'list_all': 'list_replica_set_for_all_namespaces',
+            'patch': 'patch_namespaced_replica_set',
+            'read': 'read_namespaced_replica_set',
+            'replace': 'replace_namespaced_replica_set',
+        },
+    ),
+    ('apps/v1', 'StatefulSet'): (
+        'V1StatefulSet',
+        'V1StatefulSetList',
+        'statefulsets',
+        True,
+        'AppsV1Api',
+        {
+            'create': 'create_namespaced_stateful_set',
+            'delete': 'delete_namespaced_stateful_set',
+            'delete_collection': 'delete_collection_namespaced_stateful_set',
+            'list': 'list_namespaced_stateful_set',
+            'list_all': 'list_stateful_set_for_all_namespaces',
+            'patch': 'patch_namespaced_stateful_set',
+            'read': 'read_namespaced_stateful_set',
+            'replace': 'replace_namespaced_stateful_set',
+        },
+    ),
+    ('apps/v1beta1', 'ControllerRevision'): (
+        'V1beta1ControllerRevision',
+        'V1beta1ControllerRevisionList',
+        'controllerrevisions',
+        True,
+        'AppsV1beta1Api',
+        {
+            'create': 'create_namespaced_controller_revision',
+            'delete': 'delete_namespaced_controller_revision',
+            'delete_collection': 'delete_collection_namespaced_controller_revision',
+            'list': 'list_namespaced_controller_revision',
+            'list_all': 'list_controller_revision_for_all_namespaces',
+            'patch': 'patch_namespaced_controller_revision',
+            'read': 'read_namespaced_controller_revision',
+            'replace': 'replace_namespaced_controller_revision',
+        },
+    ),
+    ('apps/v1beta1', 'Deployment'): (
+        'AppsV1beta1Deployment',
+        'AppsV1beta1DeploymentList',
+        'deployments',
+        True,
+        'AppsV1beta1Api',
+        {
+            'create': 'create_namespaced_deployment',
+            'delete': 'delete_namespaced_deployment',
+            'delete_collection': 'delete_collection_namespaced_deployment',
+            'list': 'list_namespaced_deployment',
+            'list_all': 'list_deployment_for_all_namespaces',
+            'patch': 'patch_namespaced_deployment',
+            'read': 'read_namespaced_deployment',
+            'replace': 'replace_namespaced_deployment',
+        },
+    ),
+    ('apps/v1beta1', 'StatefulSet'): (
+        'V1beta1StatefulSet',
+        'V1beta1StatefulSetList',
+        'statefulsets',
+        True,
+        'AppsV1beta1Api',
+        {
+            'create': 'create_namespaced_stateful_set',
+            'delete': 'delete_namespaced_stateful_set',
+            'delete_collection': 'delete_collection_namespaced_stateful_set',
+            'list': 'list_namespaced_stateful_set',
+            'list_all': 'list_stateful_set_for_all_namespaces',
+            'patch': 'patch_namespaced_stateful_set',
+            'read': 'read_namespaced_stateful_set',
+            'replace': 'replace_namespaced_stateful_set',
+        },
+    ),
+    ('apps/v1beta2', 'ControllerRevision'): (
+        'V1beta2ControllerRevision',
+        'V1beta2ControllerRevisionList',
+        'controllerrevisions',
+        True,
+        'AppsV1beta2Api',
+        {
+            'create': 'create_namespaced_controller_revision',
+            'delete': 'delete_namespaced_controller_revision',
+            'delete_collection': 'delete_collection_namespaced_controller_revision',
+            'list': 'list_namespaced_controller_revision',
+            'list_all': 'list_controller_revision_for_all_namespaces',
+            'patch': 'patch_namespaced_controller_revision',
+            'read': 'read_namespaced_controller_revision',
+            'replace': 'replace_namespaced_controller_revision',
+        },
+    ),
+    ('apps/v1beta2', 'DaemonSet'): (
+        'V1beta2DaemonSet',
+        'V1beta2DaemonSetList',
+        'daemonsets',
+        True,
+        'AppsV1beta2Api',
+        {
+            'create': 'create_namespaced_daemon_set',
+            'delete': 'delete_namespaced_daemon_set',
+            'delete_collection': 'delete_collection_namespaced_daemon_set',
+            'list': 'list_namespaced_daemon_set',
+            'list_all': 'list_daemon_set_for_all_namespaces',
+            'patch': 'patch_namespaced_daemon_set',
+            'read': 'read_namespaced_daemon_set',
+            'replace': 'replace_namespaced_daemon_set',
+        },
+    ),
+    ('apps/v1beta2', 'Deployment'): (
+        'V1beta2Deployment',
+        'V1beta2DeploymentList',
+        'deployments',
+        True,
+        'AppsV1beta2Api',
+        {
+            'create': 'create_namespaced_deployment',
+            'delete': 'delete_namespaced_deployment',
+            'delete_collection': 'delete_collection_namespaced_deployment',
+            'list': 'list_namespaced_deployment',
+            'list_all': 'list_deployment_for_all_namespaces',
+            'patch': 'patch_namespaced_deployment',
+            'read': 'read_namespaced_deployment',
+            'replace': 'replace_namespaced_deployment',
+        },
+    ),
+    ('apps/v1beta2', 'ReplicaSet'): (
+        'V1beta2ReplicaSet',
+        'V1beta2ReplicaSetList',
+        'replicasets',
+        True,
+        'AppsV1beta2Api',
+        {
+            'create': 'create_namespaced_replica_set',
+            'delete': 'delete_namespaced_replica_set',
+            'delete_collection': 'delete_collection_namespaced_replica_set',
+            'list': 'list_namespaced_replica_set',
+            'list_all': 'list_replica_set_for_all_namespaces',
+            'patch': 'patch_namespaced_replica_set',
+            'read': 'read_namespaced_replica_set',
+            'replace': 'replace_namespaced_replica_set',
+        },
+    ),
+    ('apps/v1beta2', 'StatefulSet'): (
+        'V1beta2StatefulSet',
+        'V1beta2StatefulSetList',
+        'statefulsets',
+        True,
+        'AppsV1beta2Api',
+        {
+            'create': 'create_namespaced_stateful_set',
+            'delete': 'delete_namespaced_stateful_set',
+            'delete_collection': 'delete_collection_namespaced_stateful_set',
+            'list': 'list_namespaced_stateful_set',
+            'list_all': 'list_stateful_set_for_all_namespaces',
+            'patch': 'patch_namespaced_stateful_set',
+            'read': 'read_namespaced_stateful_set',
+            'replace': 'replace_namespaced_stateful_set',
+        },
+    ),
+    ('authentication.k8s.io/v1', 'TokenReview'): (
+        'V1TokenReview',
+        None,
+        'tokenreviews',
+        False,
+        'AuthenticationV1Api',
+        {
+            'create': 'create_token_review',
+        },
+    ),
+    ('authentication.k8s.io/v1beta1', 'TokenReview'): (
+        'V1beta1TokenReview',
+        None,
+        'tokenreviews',
+        False,
+        'AuthenticationV1beta1Api',
+        {
+            'create': 'create_token_review',
+        },
+    ),
+    ('authorization.k8s.io/v1', 'LocalSubjectAccessReview'): (
+        'V1LocalSubjectAccessReview',
+        None,
+        'localsubjectaccessreviews',
+        True,
+        'AuthorizationV1Api',
+        {
+            'create': 'create_namespaced_local_subject_access_review',
+        },
+    ),
+    ('authorization.k8s.io/v1', 'SelfSubjectAccessReview'): (
+        'V1SelfSubjectAccessReview',
+        None,
+        'selfsubjectaccessreviews',
+        False,
+        'AuthorizationV1Api',
+        {
+            'create': 'create_self_subject_access_review',
+        },
+    ),
+    ('authorization.k8s.io/v1', 'SelfSubjectRulesReview'): (
+        'V1SelfSubjectRulesReview',
+        None,
+        'selfsubjectrulesreviews',
+        False,
+        'AuthorizationV1Api',
+        {
+            'create': 'create_self_subject_rules_review',
+        },
+    ),
+    ('authorization.k8s.io/v1', 'SubjectAccessReview'): (
+        'V1SubjectAccessReview',
+        None,
+        'subjectaccessreviews',
+        False,
+        'AuthorizationV1Api',
+        {
+            'create': 'create_subject_access_review',
+        },
+    ),
+    ('authorization.k8s.io/v1beta1', 'LocalSubjectAccessReview'): (
+        'V1beta1LocalSubjectAccessReview',
+        None,
+        'localsubjectaccessreviews',
+        True,
+        'AuthorizationV1beta1Api',
+        {
+            'create': 'create_namespaced_local_subject_access_review',
+        },
+    ),
+    ('authorization.k8s.io/v1beta1', 'SelfSubjectAccessReview'): (
+        'V1beta1SelfSubjectAccessReview',
+        None,
+        'selfsubjectaccessreviews',
+        False,
+        'AuthorizationV1beta1Api',
+        {
+            'create': 'create_self_subject_access_review',
+        },
+    ),
+    ('authorization.k8s.io/v1beta1', 'SelfSubjectRulesReview'): (
+        'V1beta1SelfSubjectRulesReview',
+        None,
+        'selfsubjectrulesreviews',
+        False,
+        'AuthorizationV1beta1Api',
+        {
+            'create': 'create_self_subject_rules_review',
+        },
+    ),
+    ('authorization.k8s.io/v1beta1', 'SubjectAccessReview'): (
+        'V1beta1SubjectAccessReview',
+        None,
+        'subjectaccessreviews',
+        False,
+        'AuthorizationV1beta1Api',
+        {
+            'create': 'create_subject_access_review',
+        },
+    ),
+    ('autoscaling/v1', 'HorizontalPodAutoscaler'): (
+        'V1HorizontalPodAutoscaler',
+        'V1HorizontalPodAutoscalerList',
+        'horizontalpodautoscalers',
+        True,
+        'AutoscalingV1Api',
+        {
+            'create': 'create_namespaced_horizontal_pod_autoscaler',
+            'delete': 'delete_namespaced_horizontal_pod_autoscaler',
+            'delete_collection': 'delete_collection_namespaced_horizontal_pod_autoscaler',
+            'list': 'list_namespaced_horizontal_pod_autoscaler',
+            'list_all': 'list_horizontal_pod_autoscaler_for_all_namespaces',
+            'patch': 'patch_namespaced_horizontal_pod_autoscaler',
+            'read': 'read_namespaced_horizontal_pod_autoscaler',
+            'replace': 'replace_namespaced_horizontal_pod_autoscaler',
+        },
+    ),
+    ('autoscaling/v2beta1', 'HorizontalPodAutoscaler'): (
+        'V2beta1HorizontalPodAutoscaler',
+        'V2beta1HorizontalPodAutoscalerList',
+        'horizontalpodautoscalers',
+        True,
+        'AutoscalingV2beta1Api',
+        {
+            'create': 'create_namespaced_horizontal_pod_autoscaler',
+            'delete': 'delete_namespaced_horizontal_pod_autoscaler',
+            'delete_collection': 'delete_collection_namespaced_horizontal_pod_autoscaler',
+            'list': 'list_namespaced_horizontal_pod_autoscaler',
+            'list_all': 'list_horizontal_pod_autoscaler_for_all_namespaces',
+            'patch': 'patch_namespaced_horizontal_pod_autoscaler',
+            'read': 'read_namespaced_horizontal_pod_autoscaler',
+            'replace': 'replace_namespaced_horizontal_pod_autoscaler',
+        },
+    ),
+    ('batch/v1', 'Job'): (
+        'V1Job',
+        'V1JobList',
+        'jobs',
+        True,
+        'BatchV1Api',
+        {
+            'create': 'create_namespaced_job',
+            'delete': 'delete_namespaced_job',
+            'delete_collection': 'delete_collection_namespaced_job',
+            'list': 'list_namespaced_job',
+            'list_all': 'list_job_for_all_namespaces',
+            'patch': 'patch_namespaced_job',
+            'read': 'read_namespaced_job',
+            'replace': 'replace_namespaced_job',
+        },
+    ),
+    ('batch/v1beta1', 'CronJob'): (
+        'V1beta1CronJob',
+        'V1beta1CronJobList',
+        'cronjobs',
+        True,
+        'BatchV1beta1Api',
+        {
+            'create': 'create_namespaced_cron_job',
+            'delete': 'delete_namespaced_cron_job',
+            'delete_collection': 'delete_collection_namespaced_cron_job',
+            'list': 'list_namespaced_cron_job',
+            'list_all': 'list_cron_job_for_all_namespaces',
+            'patch': 'patch_namespaced_cron_job',
+            'read': 'read_namespaced_cron_job',
+            'replace': 'replace_namespaced_cron_job',
+        },
+    ),
+    ('batch/v2alpha1', 'CronJob'): (
+        'V2alpha1CronJob',
+        'V2alpha1CronJobList',
+        'cronjobs',
+        True,
+        'BatchV2alpha1Api',
+        {
+            'create': 'create_namespaced_cron_job',
+            'delete': 'delete_namespaced_cron_job',
+            'delete_collection': 'delete_collection_namespaced_cron_job',
+            'list': 'list_namespaced_cron_job',
+            'list_all': 'list_cron_job_for_all_namespaces',
+            'patch': 'patch_namespaced_cron_job',
+            'read': 'read_namespaced_cron_job',
+            'replace': 'replace_namespaced_cron_job',
+        },
+    ),
+    ('certificates.k8s.io/v1beta1', 'CertificateSigningRequest'): (
+        'V1beta1CertificateSigningRequest',
+        'V1beta1CertificateSigningRequestList',
+        'certificatesigningrequests',
+        False,
+        'CertificatesV1beta1Api',
+        {
+            'create': 'create_certificate_signing_request',
+            'delete': 'delete_certificate_signing_request',
+            'delete_collection': 'delete_collection_certificate_signing_request',
+            'list': 'list_certificate_signing_request',
+            'patch': 'patch_certificate_signing_request',
+            'read': 'read_certificate_signing_request',
+            'replace': 'replace_certificate_signing_request',
+        },
+    ),
+    ('events.k8s.io/v1beta1', 'Event'): (
+        'V1beta1Event',
+        'V1beta1EventList',
+        'events',
+        True,
+        'EventsV1beta1Api',
+        {
+            'create': 'create_namespaced_event',
+            'delete': 'delete_namespaced_event',
+            'delete_collection': 'delete_collection_namespaced_event',
+            'list': 'list_namespaced_event',
+            'list_all': 'list_event_for_all_namespaces',
+            'patch': 'patch_namespaced_event',
+            'read': 'read_namespaced_event',
+            'replace': 'replace_namespaced_event',
+        },
+    ),
+    ('extensions/v1beta1', 'DaemonSet'): (
+        'V1beta1DaemonSet',
+        'V1beta1DaemonSetList',
+        'daemonsets',
+        True,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_namespaced_daemon_set',
+            'delete': 'delete_namespaced_daemon_set',
+            'delete_collection': 'delete_collection_namespaced_daemon_set',
+            'list': 'list_namespaced_daemon_set',
+            'list_all': 'list_daemon_set_for_all_namespaces',
+            'patch': 'patch_namespaced_daemon_set',
+            'read': 'read_namespaced_daemon_set',
+            'replace': 'replace_namespaced_daemon_set',
+        },
+    ),
+    ('extensions/v1beta1', 'Deployment'): (
+        'ExtensionsV1beta1Deployment',
+        'ExtensionsV1beta1DeploymentList',
+        'deployments',
+        True,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_namespaced_deployment',
+            'delete': 'delete_namespaced_deployment',
+            'delete_collection': 'delete_collection_namespaced_deployment',
+            'list': 'list_namespaced_deployment',
+            'list_all': 'list_deployment_for_all_namespaces',
+            'patch': 'patch_namespaced_deployment',
+            'read': 'read_namespaced_deployment',
+            'replace': 'replace_namespaced_deployment',
+        },
+    ),
+    ('extensions/v1beta1', 'Ingress'): (
+        'V1beta1Ingress',
+        'V1beta1IngressList',
+        'ingresses',
+        True,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_namespaced_ingress',
+            'delete': 'delete_namespaced_ingress',
+            'delete_collection': 'delete_collection_namespaced_ingress',
+            'list': 'list_namespaced_ingress',
+            'list_all': 'list_ingress_for_all_namespaces',
+            'patch': 'patch_namespaced_ingress',
+            'read': 'read_namespaced_ingress',
+            'replace': 'replace_namespaced_ingress',
+        },
+    ),
+    ('extensions/v1beta1', 'NetworkPolicy'): (
+        'V1beta1NetworkPolicy',
+        'V1beta1NetworkPolicyList',
+        'networkpolicies',
+        True,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_namespaced_network_policy',
+            'delete': 'delete_namespaced_network_policy',
+            'delete_collection': 'delete_collection_namespaced_network_policy',
+            'list': 'list_namespaced_network_policy',
+            'list_all': 'list_network_policy_for_all_namespaces',
+            'patch': 'patch_namespaced_network_policy',
+            'read': 'read_namespaced_network_policy',
+            'replace': 'replace_namespaced_network_policy',
+        },
+    ),
+    ('extensions/v1beta1', 'PodSecurityPolicy'): (
+        'ExtensionsV1beta1PodSecurityPolicy',
+        'ExtensionsV1beta1PodSecurityPolicyList',
+        'podsecuritypolicies',
+        False,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_pod_security_policy',
+            'delete': 'delete_pod_security_policy',
+            'delete_collection': 'delete_collection_pod_security_policy',
+            'list': 'list_pod_security_policy',
+            'patch': 'patch_pod_security_policy',
+            'read': 'read_pod_security_policy',
+            'replace': 'replace_pod_security_policy',
+        },
+    ),
+    ('extensions/v1beta1', 'ReplicaSet'): (
+        'V1beta1ReplicaSet',
+        'V1beta1ReplicaSetList',
+        'replicasets',
+        True,
+        'ExtensionsV1beta1Api',
+        {
+            'create': 'create_namespaced_replica_set',
+            'delete': 'delete_namespaced_replica_set',
+            'delete_collection': 'delete_collection_namespaced_replica_set',
+            'list': 'list_namespaced_replica_set',
+            'list_all': 'list_replica_set_for_all_namespaces',
+            'patch': 'patch_namespaced_replica_set',
+            'read': 'read_namespaced_replica_set',
+            'replace': 'replace_namespaced_replica_set',
+        },
+    ),
+    ('networking.k8s.io/v1', 'NetworkPolicy'): (
+        'V1NetworkPolicy',
+        'V1NetworkPolicyList',
+        'networkpolicies',
+        True,
+        'NetworkingV1Api',
+        {
+            'create': 'create_namespaced_network_policy',
+            'delete': 'delete_namespaced_network_policy',
+            'delete_collection': 'delete_collection_namespaced_network_policy',
+            'list': 'list_namespaced_network_policy',
+            'list_all': 'list_network_policy_for_all_namespaces',
+            'patch': 'patch_namespaced_network_policy',
+            'read': 'read_namespaced_network_policy',
+            'replace': 'replace_namespaced_network_policy',
+        },
+    ),
+    ('policy/v1beta1', 'PodDisruptionBudget'): (
+        'V1beta1PodDisruptionBudget',
+        'V1beta1PodDisruptionBudgetList',
+        'poddisruptionbudgets',
+        True,
+        'PolicyV1beta1Api',
+        {
+            'create': 'create_namespaced_pod_disruption_budget',
+            'delete': 'delete_namespaced_pod_disruption_budget',
+            'delete_collection': 'delete_collection_namespaced_pod_disruption_budget',
+            'list': 'list_namespaced_pod_disruption_budget',
+            'list_all': 'list_pod_disruption_budget_for_all_namespaces',
+            'patch': 'patch_namespaced_pod_disruption_budget',
+            'read': 'read_namespaced_pod_disruption_budget',
+            'replace': 'replace_namespaced_pod_disruption_budget',
+        },
+    ),
+    ('policy/v1beta1', 'PodSecurityPolicy'): (
+        'PolicyV1beta1PodSecurityPolicy',
+        'PolicyV1beta1PodSecurityPolicyList',
+        'podsecuritypolicies',
+        False,
+        'PolicyV1beta1Api',
+        {
+            'create': 'create_pod_security_policy',
+            'delete': 'delete_pod_security_policy',
+            'delete_collection': 'delete_collection_pod_security_policy',
+            'list': 'list_pod_security_policy',
+            'patch': 'patch_pod_security_policy',
+            'read': 'read_pod_security_policy',
+            'replace': 'replace_pod_security_policy',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1', 'ClusterRoleBinding'): (
+        'V1ClusterRoleBinding',
+        'V1ClusterRoleBindingList',
+        'clusterrolebindings',
+        False,
+        'RbacAuthorizationV1Api',
+        {
+            'create': 'create_cluster_role_binding',
+            'delete': 'delete_cluster_role_binding',
+            'delete_collection': 'delete_collection_cluster_role_binding',
+            'list': 'list_cluster_role_binding',
+            'patch': 'patch_cluster_role_binding',
+            'read': 'read_cluster_role_binding',
+            'replace': 'replace_cluster_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1', 'ClusterRole'): (
+        'V1ClusterRole',
+        'V1ClusterRoleList',
+        'clusterroles',
+        False,
+        'RbacAuthorizationV1Api',
+        {
+            'create': 'create_cluster_role',
+            'delete': 'delete_cluster_role',
+            'delete_collection': 'delete_collection_cluster_role',
+            'list': 'list_cluster_role',
+            'patch': 'patch_cluster_role',
+            'read': 'read_cluster_role',
+            'replace': 'replace_cluster_role',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1', 'RoleBinding'): (
+        'V1RoleBinding',
+        'V1RoleBindingList',
+        'rolebindings',
+        True,
+        'RbacAuthorizationV1Api',
+        {
+            'create': 'create_namespaced_role_binding',
+            'delete': 'delete_namespaced_role_binding',
+            'delete_collection': 'delete_collection_namespaced_role_binding',
+            'list': 'list_namespaced_role_binding',
+            'list_all': 'list_role_binding_for_all_namespaces',
+            'patch': 'patch_namespaced_role_binding',
+            'read': 'read_namespaced_role_binding',
+            'replace': 'replace_namespaced_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1', 'Role'): (
+        'V1Role',
+        'V1RoleList',
+        'roles',
+        True,
+        'RbacAuthorizationV1Api',
+        {
+            'create': 'create_namespaced_role',
+            'delete': 'delete_namespaced_role',
+            'delete_collection': 'delete_collection_namespaced_role',
+            'list': 'list_namespaced_role',
+            'list_all': 'list_role_for_all_namespaces',
+            'patch': 'patch_namespaced_role',
+            'read': 'read_namespaced_role',
+            'replace': 'replace_namespaced_role',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1alpha1', 'ClusterRoleBinding'): (
+        'V1alpha1ClusterRoleBinding',
+        'V1alpha1ClusterRoleBindingList',
+        'clusterrolebindings',
+        False,
+        'RbacAuthorizationV1alpha1Api',
+        {
+            'create': 'create_cluster_role_binding',
+            'delete': 'delete_cluster_role_binding',
+            'delete_collection': 'delete_collection_cluster_role_binding',
+            'list': 'list_cluster_role_binding',
+            'patch': 'patch_cluster_role_binding',
+            'read': 'read_cluster_role_binding',
+            'replace': 'replace_cluster_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1alpha1', 'ClusterRole'): (
+        'V1alpha1ClusterRole',
+        'V1alpha1ClusterRoleList',
+        'clusterroles',
+        False,
+        'RbacAuthorizationV1alpha1Api',
+        {
+            'create': 'create_cluster_role',
+            'delete': 'delete_cluster_role',
+            'delete_collection': 'delete_collection_cluster_role',
+            'list': 'list_cluster_role',
+            'patch': 'patch_cluster_role',
+            'read': 'read_cluster_role',
+            'replace': 'replace_cluster_role',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1alpha1', 'RoleBinding'): (
+        'V1alpha1RoleBinding',
+        'V1alpha1RoleBindingList',
+        'rolebindings',
+        True,
+        'RbacAuthorizationV1alpha1Api',
+        {
+            'create': 'create_namespaced_role_binding',
+            'delete': 'delete_namespaced_role_binding',
+            'delete_collection': 'delete_collection_namespaced_role_binding',
+            'list': 'list_namespaced_role_binding',
+            'list_all': 'list_role_binding_for_all_namespaces',
+            'patch': 'patch_namespaced_role_binding',
+            'read': 'read_namespaced_role_binding',
+            'replace': 'replace_namespaced_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1alpha1', 'Role'): (
+        'V1alpha1Role',
+        'V1alpha1RoleList',
+        'roles',
+        True,
+        'RbacAuthorizationV1alpha1Api',
+        {
+            'create': 'create_namespaced_role',
+            'delete': 'delete_namespaced_role',
+            'delete_collection': 'delete_collection_namespaced_role',
+            'list': 'list_namespaced_role',
+            'list_all': 'list_role_for_all_namespaces',
+            'patch': 'patch_namespaced_role',
+            'read': 'read_namespaced_role',
+            'replace': 'replace_namespaced_role',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1beta1', 'ClusterRoleBinding'): (
+        'V1beta1ClusterRoleBinding',
+        'V1beta1ClusterRoleBindingList',
+        'clusterrolebindings',
+        False,
+        'RbacAuthorizationV1beta1Api',
+        {
+            'create': 'create_cluster_role_binding',
+            'delete': 'delete_cluster_role_binding',
+            'delete_collection': 'delete_collection_cluster_role_binding',
+            'list': 'list_cluster_role_binding',
+            'patch': 'patch_cluster_role_binding',
+            'read': 'read_cluster_role_binding',
+            'replace': 'replace_cluster_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1beta1', 'ClusterRole'): (
+        'V1beta1ClusterRole',
+        'V1beta1ClusterRoleList',
+        'clusterroles',
+        False,
+        'RbacAuthorizationV1beta1Api',
+        {
+            'create': 'create_cluster_role',
+            'delete': 'delete_cluster_role',
+            'delete_collection': 'delete_collection_cluster_role',
+            'list': 'list_cluster_role',
+            'patch': 'patch_cluster_role',
+            'read': 'read_cluster_role',
+            'replace': 'replace_cluster_role',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1beta1', 'RoleBinding'): (
+        'V1beta1RoleBinding',
+        'V1beta1RoleBindingList',
+        'rolebindings',
+        True,
+        'RbacAuthorizationV1beta1Api',
+        {
+            'create': 'create_namespaced_role_binding',
+            'delete': 'delete_namespaced_role_binding',
+            'delete_collection': 'delete_collection_namespaced_role_binding',
+            'list': 'list_namespaced_role_binding',
+            'list_all': 'list_role_binding_for_all_namespaces',
+            'patch': 'patch_namespaced_role_binding',
+            'read': 'read_namespaced_role_binding',
+            'replace': 'replace_namespaced_role_binding',
+        },
+    ),
+    ('rbac.authorization.k8s.io/v1beta1', 'Role'): (
+        'V1beta1Role',
+        'V1beta1RoleList',
+        'roles',
+        True,
+        'RbacAuthorizationV1beta1Api',
+        {
+            'create': 'create_namespaced_role',
+            'delete': 'delete_namespaced_role',
+            'delete_collection': 'delete_collection_namespaced_role',
+            'list': 'list_namespaced_role',
+            'list_all': 'list_role_for_all_namespaces',
+            'patch': 'patch_namespaced_role',
+            'read': 'read_namespaced_role',
+            'replace': 'replace_namespaced_role',
+        },
+    ),
+    ('scheduling.k8s.io/v1alpha1', 'PriorityClass'): (
+        'V1alpha1PriorityClass',
+        'V1alpha1PriorityClassList',
+        'priorityclasses',
+        False,
+        'SchedulingV1alpha1Api',
+        {
+            'create': 'create_priority_class',
+            'delete': 'delete_priority_class',
+            'delete_collection': 'delete_collection_priority_class',
+            'list': 'list_priority_class',
+            'patch': 'patch_priority_class',
+            'read': 'read_priority_class',
+            'replace': 'replace_priority_class',
+        },
+    ),
+    ('settings.k8s.io/v1alpha1', 'PodPreset'): (
+        'V1alpha1PodPreset',
+        'V1alpha1PodPresetList',
+        'podpresets',
+        True,
+        'SettingsV1alpha1Api',
+        {
+            'create': 'create_namespaced_pod_preset',
+            'delete': 'delete_namespaced_pod_preset',
+            'delete_collection': 'delete_collection_namespaced_pod_preset',
+            'list': 'list_namespaced_pod_preset',
+            'list_all': 'list_pod_preset_for_all_namespaces',
+            'patch': 'patch_namespaced_pod_preset',
+            'read': 'read_namespaced_pod_preset',
+            'replace': 'replace_namespaced_pod_preset',
+        },
+    ),
+    ('storage.k8s.io/v1', 'StorageClass'): (
+        'V1StorageClass',
+        'V1StorageClassList',
+        'storageclasses',
+        False,
+        'StorageV1Api',
+        {
+            'create': 'create_storage_class',
+            'delete': 'delete_storage_class',
+            'delete_collection': 'delete_collection_storage_class',
+            'list': 'list_storage_class',
+            'patch': 'patch_storage_class',
+            'read': 'read_storage_class',
+            'replace': 'replace_storage_class',
+        },
+    ),
+    ('storage.k8s.io/v1alpha1', 'VolumeAttachment'): (
+        'V1alpha1VolumeAttachment',
+        'V1alpha1VolumeAttachmentList',
+        'volumeattachments',
+        False,
+        'StorageV1alpha1Api',
+        {
+            'create': 'create_volume_attachment',
+            'delete': 'delete_volume_attachment',
+            'delete_collection': 'delete_collection_volume_attachment',
+            'list': 'list_volume_attachment',
+            'patch': 'patch_volume_attachment',
+            'read': 'read_volume_attachment',
+            'replace': 'replace_volume_attachment',
+        },
+    ),
+    ('storage.k8s.io/v1beta1', 'StorageClass'): (
+        'V1beta1StorageClass',
+        'V1beta1StorageClassList',
+        'storageclasses',
+        False,
+        'StorageV1beta1Api',
+        {
+            'create': 'create_storage_class',
+            'delete': 'delete_storage_class',
+            'delete_collection': 'delete_collection_storage_class',
+            'list': 'list_storage_class',
+            'patch': 'patch_storage_class',
+            'read': 'read_storage_class',
+            'replace': 'replace_storage_class',
+        },
+    ),
+    ('storage.k8s.io/v1beta1', 'VolumeAttachment'): (
+        'V1beta1VolumeAttachment',
+        'V1beta1VolumeAttachmentList',
+        'volumeattachments',
+        False,
+        'StorageV1beta1Api',
+        {
+            'create': 'create_volume_attachment',
+            'delete': 'delete_volume_attachment',
+            'delete_collection': 'delete_collection_volume_attachment',
+            'list': 'list_volume_attachment',
+            'patch': 'patch_volume_attachment',
+            'read': 'read_volume_attachment',
+            'replace': 'replace_volume_attachment',
+        },
+    ),
+    ('v1', 'Binding'): (
+        'V1Binding',
+        None,
+        'bindings',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_binding',
+        },
+    ),
+    ('v1', 'ComponentStatus'): (
+        'V1ComponentStatus',
+        'V1ComponentStatusList',
+        'componentstatuses',
+        False,
+        'CoreV1Api',
+        {
+            'list': 'list_component_status',
+            'read': 'read_component_status',
+        },
+    ),
+    ('v1', 'ConfigMap'): (
+        'V1ConfigMap',
+        'V1ConfigMapList',
+        'configmaps',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_config_map',
+            'delete': 'delete_namespaced_config_map',
+            'delete_collection': 'delete_collection_namespaced_config_map',
+            'list': 'list_namespaced_config_map',
+            'list_all': 'list_config_map_for_all_namespaces',
+            'patch': 'patch_namespaced_config_map',
+            'read': 'read_namespaced_config_map',
+            'replace': 'replace_namespaced_config_map',
+        },
+    ),
+    ('v1', 'Endpoints'): (
+        'V1Endpoints',
+        'V1EndpointsList',
+        'endpoints',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_endpoints',
+            'delete': 'delete_namespaced_endpoints',
+            'delete_collection': 'delete_collection_namespaced_endpoints',
+            'list': 'list_namespaced_endpoints',
+            'list_all': 'list_endpoints_for_all_namespaces',
+            'patch': 'patch_namespaced_endpoints',
+            'read': 'read_namespaced_endpoints',
+            'replace': 'replace_namespaced_endpoints',
+        },
+    ),
+    ('v1', 'Event'): (
+        'V1Event',
+        'V1EventList',
+        'events',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_event',
+            'delete': 'delete_namespaced_event',
+            'delete_collection': 'delete_collection_namespaced_event',
+            'list': 'list_namespaced_event',
+            'list_all': 'list_event_for_all_namespaces',
+            'patch': 'patch_namespaced_event',
+            'read': 'read_namespaced_event',
+            'replace': 'replace_namespaced_event',
+        },
+    ),
+    ('v1', 'LimitRange'): (
+        'V1LimitRange',
+        'V1LimitRangeList',
+        'limitranges',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_limit_range',
+            'delete': 'delete_namespaced_limit_range',
+            'delete_collection': 'delete_collection_namespaced_limit_range',
+            'list': 'list_namespaced_limit_range',
+            'list_all': 'list_limit_range_for_all_namespaces',
+            'patch': 'patch_namespaced_limit_range',
+            'read': 'read_namespaced_limit_range',
+            'replace': 'replace_namespaced_limit_range',
+        },
+    ),
+    ('v1', 'Namespace'): (
+        'V1Namespace',
+        'V1NamespaceList',
+        'namespaces',
+        False,
+        'CoreV1Api',
+        {
+            'create': 'create_namespace',
+            'delete': 'delete_namespace',
+            'list': 'list_namespace',
+            'patch': 'patch_namespace',
+            'read': 'read_namespace',
+            'replace': 'replace_namespace',
+        },
+    ),
+    ('v1', 'Node'): (
+        'V1Node',
+        'V1NodeList',
+        'nodes',
+        False,
+        'CoreV1Api',
+        {
+            'create': 'create_node',
+            'delete': 'delete_node',
+            'delete_collection': 'delete_collection_node',
+            'list': 'list_node',
+            'patch': 'patch_node',
+            'read': 'read_node',
+            'replace': 'replace_node',
+        },
+    ),
+    ('v1', 'PersistentVolumeClaim'): (
+        'V1PersistentVolumeClaim',
+        'V1PersistentVolumeClaimList',
+        'persistentvolumeclaims',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_persistent_volume_claim',
+            'delete': 'delete_namespaced_persistent_volume_claim',
+            'delete_collection': 'delete_collection_namespaced_persistent_volume_claim',
+            'list': 'list_namespaced_persistent_volume_claim',
+            'list_all': 'list_persistent_volume_claim_for_all_namespaces',
+            'patch': 'patch_namespaced_persistent_volume_claim',
+            'read': 'read_namespaced_persistent_volume_claim',
+            'replace': 'replace_namespaced_persistent_volume_claim',
+        },
+    ),
+    ('v1', 'PersistentVolume'): (
+        'V1PersistentVolume',
+        'V1PersistentVolumeList',
+        'persistentvolumes',
+        False,
+        'CoreV1Api',
+        {
+            'create': 'create_persistent_volume',
+            'delete': 'delete_persistent_volume',
+            'delete_collection': 'delete_collection_persistent_volume',
+            'list': 'list_persistent_volume',
+            'patch': 'patch_persistent_volume',
+            'read': 'read_persistent_volume',
+            'replace': 'replace_persistent_volume',
+        },
+    ),
+    ('v1', 'Pod'): (
+        'V1Pod',
+        'V1PodList',
+        'pods',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_pod',
+            'delete': 'delete_namespaced_pod',
+            'delete_collection': 'delete_collection_namespaced_pod',
+            'list': 'list_namespaced_pod',
+            'list_all': 'list_pod_for_all_namespaces',
+            'patch': 'patch_namespaced_pod',
+            'read': 'read_namespaced_pod',
+            'replace': 'replace_namespaced_pod',
+        },
+    ),
+    ('v1', 'PodTemplate'): (
+        'V1PodTemplate',
+        'V1PodTemplateList',
+        'podtemplates',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_pod_template',
+            'delete': 'delete_namespaced_pod_template',
+            'delete_collection': 'delete_collection_namespaced_pod_template',
+            'list': 'list_namespaced_pod_template',
+            'list_all': 'list_pod_template_for_all_namespaces',
+            'patch': 'patch_namespaced_pod_template',
+            'read': 'read_namespaced_pod_template',
+            'replace': 'replace_namespaced_pod_template',
+        },
+    ),
+    ('v1', 'ReplicationController'): (
+        'V1ReplicationController',
+        'V1ReplicationControllerList',
+        'replicationcontrollers',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_replication_controller',
+            'delete': 'delete_namespaced_replication_controller',
+            'delete_collection': 'delete_collection_namespaced_replication_controller',
+            'list': 'list_namespaced_replication_controller',
+            'list_all': 'list_replication_controller_for_all_namespaces',
+            'patch': 'patch_namespaced_replication_controller',
+            'read': 'read_namespaced_replication_controller',
+            'replace': 'replace_namespaced_replication_controller',
+        },
+    ),
+    ('v1', 'ResourceQuota'): (
+        'V1ResourceQuota',
+        'V1ResourceQuotaList',
+        'resourcequotas',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_resource_quota',
+            'delete': 'delete_namespaced_resource_quota',
+            'delete_collection': 'delete_collection_namespaced_resource_quota',
+            'list': 'list_namespaced_resource_quota',
+            'list_all': 'list_resource_quota_for_all_namespaces',
+            'patch': 'patch_namespaced_resource_quota',
+            'read': 'read_namespaced_resource_quota',
+            'replace': 'replace_namespaced_resource_quota',
+        },
+    ),
+    ('v1', 'Secret'): (
+        'V1Secret',
+        'V1SecretList',
+        'secrets',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_secret',
+            'delete': 'delete_namespaced_secret',
+            'delete_collection': 'delete_collection_namespaced_secret',
+            'list': 'list_namespaced_secret',
+            'list_all': 'list_secret_for_all_namespaces',
+            'patch': 'patch_namespaced_secret',
+            'read': 'read_namespaced_secret',
+            'replace': 'replace_namespaced_secret',
+        },
+    ),
+    ('v1', 'ServiceAccount'): (
+        'V1ServiceAccount',
+        'V1ServiceAccountList',
+        'serviceaccounts',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_service_account',
+            'delete': 'delete_namespaced_service_account',
+            'delete_collection': 'delete_collection_namespaced_service_account',
+            'list': 'list_namespaced_service_account',
+            'list_all': 'list_service_account_for_all_namespaces',
+            'patch': 'patch_namespaced_service_account',
+            'read': 'read_namespaced_service_account',
+            'replace': 'replace_namespaced_service_account',
+        },
+    ),
+    ('v1', 'Service'): (
+        'V1Service',
+        'V1ServiceList',
+        'services',
+        True,
+        'CoreV1Api',
+        {
+            'create': 'create_namespaced_service',
+            'delete': 'delete_namespaced_service',
+            'list': 'list_namespaced_service',
+            'list_all': 'list_service_for_all_namespaces',
+            'patch': 'patch_namespaced_service',
+            'read': 'read_namespaced_service',
+            'replace': 'replace_namespaced_service',
+        },
+    ),
+}
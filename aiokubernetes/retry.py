@@ -0,0 +1,189 @@
+"""Retry idempotent K8s API requests after transient failures.
+
+A `RetryPolicy` repeats requests that failed with 429 (Too Many Requests), a
+5xx status or a connection error. It honours the `Retry-After` header K8s
+sends with 429 responses and otherwise backs off exponentially with full
+jitter.
+
+Only idempotent requests are retried: GET, HEAD, OPTIONS and DELETE, as well
+as PUT if the body contains a `metadata.resourceVersion` (the optimistic
+concurrency check makes a duplicate PUT fail with 409 instead of silently
+overwriting a newer version).
+
+Example for the Proxy workflow:
+
+    policy = k8s.retry.RetryPolicy(max_retries=5)
+    cargs = k8s.CoreV1Api(proxy).read_namespaced_pod('foo', 'default')
+    resp = await policy.request(client, **cargs)
+"""
+import asyncio
+import datetime
+import email.utils
+import json
+import random
+
+import aiohttp
+
+# Response codes that indicate a transient problem.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Methods that are always safe to repeat.
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'DELETE')
+
+
+class RetryPolicy:
+    """Retry transient failures with exponential backoff and jitter.
+
+    Inputs:
+        max_retries: int
+            Maximum number of retries, ie a request is made at most
+            `max_retries + 1` times.
+        backoff: float
+            Base delay in seconds. The n-th retry waits a random time between
+            zero and `backoff * 2 ** n` seconds.
+        backoff_max: float
+            Upper limit for any delay, including those from `Retry-After`.
+        statuses: tuple[int]
+            HTTP status codes that warrant a retry.
+    """
+    def __init__(self, max_retries=3, backoff=0.5, backoff_max=30,
+                 statuses=RETRY_STATUSES):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.backoff_max = backoff_max
+        self.statuses = statuses
+
+        # Metrics: total number of retries, and the subset thereof that were
+        # caused by connection errors instead of HTTP status codes.
+        self.retries = 0
+        self.connection_retries = 0
+
+    def get_delay(self, attempt, response=None):
+        """Return the seconds to wait before retry number `attempt` (0-based).
+
+        A `Retry-After` header in `response` takes precedence over the
+        exponential backoff.
+        """
+        retry_after = None if response is None else response.headers.get('Retry-After')
+        if retry_after is not None:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff * 2 ** attempt))
+
+    async def request(self, session, method, url, data=None, idempotent=None,
+                      **kwargs):
+        """Make the request with `session` and retry it if necessary.
+
+        The arguments are those of `aiohttp.ClientSession.request`, which means
+        the request dicts of `api_proxy.Proxy` can be passed verbatim.
+
+        Returns the last response if all attempts failed with a retryable
+        status, and re-raises the last connection error if all attempts failed
+        with one.
+
+        Inputs:
+            idempotent: bool
+                Whether the request may be repeated. Use None to determine it
+                with `is_idempotent`.
+        """
+        if idempotent is None:
+            idempotent = is_idempotent(method, data)
+        if not idempotent:
+            return await session.request(
+                method=method, url=url, data=data, **kwargs)
+
+        attempt = 0
+        while True:
+            try:
+                response = await session.request(
+                    method=method, url=url, data=data, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt >= self.max_retries:
+                    raise
+                response = None
+                self.connection_retries += 1
+            else:
+                if response.status not in self.statuses or attempt >= self.max_retries:
+                    return response
+
+            delay = self.get_delay(attempt, response)
+            if response is not None:
+                response.release()
+            self.retries += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+def is_idempotent(method, body=None):
+    """Return True if the request can safely be repeated.
+
+    Inputs:
+        method: str
+            HTTP method.
+        body: dict|str|bytes
+            The request body, either as a Json compatible dict or already
+            encoded.
+
+    Returns:
+        bool
+    """
+    method = method.upper()
+    if method in IDEMPOTENT_METHODS:
+        return True
+    if method != 'PUT' or not body:
+        return False
+
+    if isinstance(body, (str, bytes)):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return False
+    try:
+        return bool(body['metadata']['resourceVersion'])
+    except (KeyError, TypeError):
+        return False
+
+
+def parse_retry_after(value):
+    """Return the delay in seconds specified by a `Retry-After` header.
+
+    The header may contain either the number of seconds or an HTTP date.
+    Returns None if `value` is neither.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
+def get_policy(config):
+    """Return the retry policy for `config` or None if retries are disabled.
+
+    All clients created from the same `config` share the same
+    `config.retry_policy`, which also provides the retry metrics.
+
+    Input:
+        config: k8s.configuration.Config instance
+
+    Returns:
+        RetryPolicy|None
+    """
+    if config.retry_policy is None:
+        if not config.max_retries:
+            return None
+        config.retry_policy = RetryPolicy(
+            max_retries=config.max_retries,
+            backoff=config.retry_backoff,
+            backoff_max=config.retry_backoff_max,
+        )
+    return config.retry_policy
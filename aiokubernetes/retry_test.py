@@ -0,0 +1,135 @@
+import asyncio
+import email.utils
+import time
+import unittest.mock as mock
+
+import aiohttp
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeClient, FakeResponse
+
+
+def run(policy, session, **kwargs):
+    with mock.patch.object(asyncio, 'sleep', fakes.AsyncMock()) as m_sleep:
+        ret = fakes.run(policy.request(session, **kwargs))
+    return ret, [_[0][0] for _ in m_sleep.call_args_list]
+
+
+class TestIdempotent:
+    def test_methods(self):
+        for method in ('GET', 'head', 'DELETE', 'OPTIONS'):
+            assert k8s.retry.is_idempotent(method)
+        for method in ('POST', 'PATCH', 'PUT'):
+            assert not k8s.retry.is_idempotent(method)
+
+    def test_put(self):
+        """PUT is only idempotent if it specifies the resource version."""
+        body = {'metadata': {'name': 'foo', 'resourceVersion': '5'}}
+        assert k8s.retry.is_idempotent('PUT', body)
+        assert k8s.retry.is_idempotent('PUT', '{"metadata": {"resourceVersion": "5"}}')
+        assert not k8s.retry.is_idempotent('PUT', {'metadata': {'name': 'foo'}})
+        assert not k8s.retry.is_idempotent('PUT', '{"metadata": null}')
+        assert not k8s.retry.is_idempotent('PUT', 'not json')
+
+
+class TestRetryAfter:
+    def test_parse(self):
+        assert k8s.retry.parse_retry_after('3') == 3
+        assert k8s.retry.parse_retry_after('-1') == 0
+        assert k8s.retry.parse_retry_after('foo') is None
+
+        date = email.utils.formatdate(time.time() + 100, usegmt=True)
+        assert 90 < k8s.retry.parse_retry_after(date) <= 100
+
+    def test_delay(self):
+        policy = k8s.retry.RetryPolicy(backoff=1, backoff_max=10)
+
+        # Jittered exponential backoff.
+        for attempt in range(6):
+            assert 0 <= policy.get_delay(attempt) <= min(10, 2 ** attempt)
+
+        # `Retry-After` takes precedence but is capped.
+        assert policy.get_delay(0, FakeResponse(headers={'Retry-After': '7'})) == 7
+        assert policy.get_delay(0, FakeResponse(headers={'Retry-After': '70'})) == 10
+
+
+class TestRetryPolicy:
+    def test_success(self):
+        policy = k8s.retry.RetryPolicy(max_retries=3)
+        session = FakeClient([FakeResponse(status=200)])
+        resp, delays = run(policy, session, method='GET', url='/foo')
+        assert resp.status == 200
+        assert delays == [] and policy.retries == 0
+
+    def test_retry_status(self):
+        policy = k8s.retry.RetryPolicy(max_retries=3)
+        responses = [
+            FakeResponse(status=429, headers={'Retry-After': '2'}),
+            FakeResponse(status=503),
+            FakeResponse(status=200),
+        ]
+        session = FakeClient(responses)
+        resp, delays = run(policy, session, method='GET', url='/foo')
+        assert resp is responses[-1]
+        assert len(session.calls) == 3
+        assert delays[0] == 2
+        assert responses[0].released and responses[1].released
+        assert policy.retries == 2 and policy.connection_retries == 0
+
+    def test_exhausted(self):
+        """Return the last response once all retries are exhausted."""
+        policy = k8s.retry.RetryPolicy(max_retries=2)
+        session = FakeClient([FakeResponse(status=500) for _ in range(3)])
+        resp, delays = run(policy, session, method='GET', url='/foo')
+        assert resp.status == 500 and not resp.released
+        assert len(delays) == 2
+
+    def test_connection_error(self):
+        policy = k8s.retry.RetryPolicy(max_retries=1)
+        session = FakeClient(
+            [aiohttp.ServerDisconnectedError(), FakeResponse(status=200)])
+        resp, _ = run(policy, session, method='DELETE', url='/foo')
+        assert resp.status == 200
+        assert policy.connection_retries == 1
+
+        # Re-raise the connection error once all retries are exhausted.
+        session = FakeClient([aiohttp.ServerDisconnectedError()] * 2)
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            run(policy, session, method='GET', url='/foo')
+
+    def test_not_idempotent(self):
+        """Never repeat requests that are not idempotent."""
+        policy = k8s.retry.RetryPolicy(max_retries=3)
+        session = FakeClient([FakeResponse(status=503)])
+        resp, _ = run(policy, session, method='POST', url='/foo', data='{}')
+        assert resp.status == 503 and len(session.calls) == 1
+
+        session = FakeClient([FakeResponse(status=503)])
+        resp, _ = run(policy, session, method='GET', url='/foo', idempotent=False)
+        assert resp.status == 503 and len(session.calls) == 1
+
+    def test_get_policy(self):
+        config = k8s.configuration.Configuration()
+        assert k8s.retry.get_policy(config) is None
+
+        config.max_retries = 4
+        policy = k8s.retry.get_policy(config)
+        assert policy.max_retries == 4
+        assert k8s.retry.get_policy(config) is policy
+
+    def test_http_request(self):
+        """`ApiClient.http_request` must retry with the policy."""
+        policy = k8s.retry.RetryPolicy(max_retries=1)
+        session = FakeClient([FakeResponse(status=503), FakeResponse(status=200)])
+        body = {'metadata': {'resourceVersion': '1'}}
+
+        async def request():
+            return await k8s.api_client.ApiClient.http_request(
+                session, 'PUT', '/foo', body=body, retry_policy=policy)
+
+        with mock.patch.object(asyncio, 'sleep', fakes.AsyncMock()):
+            resp = fakes.run(request())
+        assert resp.status == 200
+        assert session.calls[1]['data'] == '{"metadata": {"resourceVersion": "1"}}'
@@ -0,0 +1,375 @@
+"""Evaluate K8s label and field selectors locally.
+
+The generated `list_*` methods pass `label_selector` and `field_selector` to
+K8s as opaque strings. This module parses them with the same grammar as the
+API server and compiles them into predicates that work on Swagger models and
+raw Json dicts alike. This allows local caches, eg `informer.Store`, to answer
+selector queries without a round-trip.
+
+Example:
+
+    selector = k8s.selector.Selector(
+        'app in (web, api),tier!=db', 'status.phase=Running')
+    running = [pod for pod in pods if selector.matches(pod)]
+
+    # Use the label indexes of a store, if it has one for "app".
+    store.add_index('app', k8s.informer.index_label('app'))
+    running = selector.select(store)
+
+Label selectors support "=", "==", "!=", "in", "notin", ">", "<" and the
+existence checks "key" and "!key". Field selectors support "=", "==" and "!="
+on any field path like "metadata.name" or "spec.nodeName". NOTE: the API
+server only accepts a small set of fields for each kind (always
+"metadata.name" and "metadata.namespace", for Pods also "spec.nodeName",
+"status.phase" etc) whereas this module will evaluate any path.
+"""
+import functools
+import re
+from collections import namedtuple
+
+# One requirement of a selector.
+#   key: label key or field path, eg 'app' or 'spec.nodeName'.
+#   op: one of '=', '!=', 'in', 'notin', 'exists', '!', '>', '<'.
+#   values: tuple of values (empty for 'exists' and '!').
+Requirement = namedtuple('Requirement', 'key op values')
+
+# Label keys are an optional DNS subdomain prefix plus a name, values may be
+# empty (see K8s "Labels and Selectors").
+_KEY = (r'(?:[a-z0-9](?:[-a-z0-9]*[a-z0-9])?(?:\.[a-z0-9](?:[-a-z0-9]*[a-z0-9])?)*/)?'
+        r'[A-Za-z0-9](?:[-A-Za-z0-9_.]*[A-Za-z0-9])?')
+_VALUE = r'(?:(?:[A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?'
+
+_RE_EXISTS = re.compile(rf'\s*(!?)\s*({_KEY})\s*')
+_RE_COMPARE = re.compile(rf'\s*({_KEY})\s*(==|=|!=|>|<)\s*({_VALUE}|-\d+)\s*')
+_RE_SET = re.compile(rf'\s*({_KEY})\s+(in|notin)\s*\(([^()]*)\)\s*')
+_RE_SET_VALUE = re.compile(rf'\s*({_VALUE})\s*')
+
+# Field selectors compare the string representation of the field. Like the API
+# server, the values must escape "\\", "," and "=" with a backslash.
+_RE_FIELD_KEY = re.compile(r'[A-Za-z0-9_.-]+')
+_RE_FIELD_ESCAPE = re.compile(r'\\(.?)')
+
+# Cache for {model class: {Json name: attribute name}}.
+_ATTRIBUTES = {}
+
+
+def split_terms(selector):
+    """Split `selector` at all commas that are not inside parentheses."""
+    terms, depth, start = [], 0, 0
+    for idx, char in enumerate(selector):
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            terms.append(selector[start:idx])
+            start = idx + 1
+    terms.append(selector[start:])
+    return [_ for _ in terms if _.strip()]
+
+
+def parse_label_selector(selector):
+    """Return the list of `Requirement`s in the label `selector`.
+
+    Raises ValueError if `selector` is malformed.
+
+    Example:
+        'app=web,tier notin (db)' -> [
+            Requirement('app', '=', ('web',)),
+            Requirement('tier', 'notin', ('db',)),
+        ]
+    """
+    requirements = []
+    for term in split_terms(selector or ''):
+        match = _RE_SET.fullmatch(term)
+        if match:
+            key, op, values = match.groups()
+            values = values.split(',')
+            if values == [''] or not all(_RE_SET_VALUE.fullmatch(_) for _ in values):
+                raise ValueError(f'Invalid values in label selector term <{term}>')
+            requirements.append(Requirement(key, op, tuple(_.strip() for _ in values)))
+            continue
+
+        match = _RE_COMPARE.fullmatch(term)
+        if match:
+            key, op, value = match.groups()
+            if op in ('>', '<'):
+                if not re.fullmatch(r'-?\d+', value):
+                    raise ValueError(f'Label selector term <{term}> needs an integer')
+            elif value.startswith('-'):
+                raise ValueError(f'Invalid value in label selector term <{term}>')
+            requirements.append(Requirement(key, '=' if op == '==' else op, (value,)))
+            continue
+
+        match = _RE_EXISTS.fullmatch(term)
+        if match:
+            negate, key = match.groups()
+            requirements.append(Requirement(key, '!' if negate else 'exists', ()))
+            continue
+        raise ValueError(f'Invalid label selector term <{term}>')
+    return requirements
+
+
+def parse_field_selector(selector):
+    """Return the list of `Requirement`s in the field `selector`.
+
+    Raises ValueError if `selector` is malformed.
+
+    Example:
+        'spec.nodeName=n1,status.phase!=Failed' -> [
+            Requirement('spec.nodeName', '=', ('n1',)),
+            Requirement('status.phase', '!=', ('Failed',)),
+        ]
+    """
+    requirements = []
+    for term in split_escaped(selector or ''):
+        if not term.strip():
+            continue
+        key, op, value = split_field_term(term)
+        if _RE_FIELD_KEY.fullmatch(key) is None:
+            raise ValueError(f'Invalid field selector term <{term}>')
+        requirements.append(Requirement(key, op, (unescape_field_value(value),)))
+    return requirements
+
+
+def split_escaped(selector):
+    """Split the field `selector` at all commas not escaped with a backslash."""
+    terms, start, idx = [], 0, 0
+    while idx < len(selector):
+        if selector[idx] == '\\':
+            idx += 1
+        elif selector[idx] == ',':
+            terms.append(selector[start:idx])
+            start = idx + 1
+        idx += 1
+    terms.append(selector[start:])
+    return terms
+
+
+def split_field_term(term):
+    """Return (key, op, value) at the first unescaped operator of `term`.
+
+    The key and the (still escaped) value are stripped and "==" becomes "=".
+
+    Raises ValueError if `term` has no operator.
+    """
+    idx = 0
+    while idx < len(term):
+        if term[idx] == '\\':
+            idx += 2
+            continue
+        for op in ('!=', '==', '='):
+            if term.startswith(op, idx):
+                key, value = term[:idx].strip(), term[idx + len(op):].strip()
+                return key, '=' if op == '==' else op, value
+        idx += 1
+    raise ValueError(f'Invalid field selector term <{term}>')
+
+
+def unescape_field_value(value):
+    """Return the field selector `value` with its escape sequences resolved.
+
+    Raises ValueError for unknown escape sequences and unescaped separators.
+
+    Example:
+        'a\\,b\\=c\\\\' -> 'a,b=c\\'
+    """
+    def replace(match):
+        if match.group(1) not in ('\\', ',', '='):
+            raise ValueError(f'Invalid escape sequence in field value <{value}>')
+        return match.group(1)
+
+    bare = _RE_FIELD_ESCAPE.sub('', value)
+    if ',' in bare or '=' in bare:
+        raise ValueError(f'Unescaped separator in field value <{value}>')
+    return _RE_FIELD_ESCAPE.sub(replace, value)
+
+
+def _compile_label_requirement(req):
+    """Return a predicate for the labels dict that implements `req`."""
+    key, op, values = req
+    if op == 'exists':
+        return lambda labels: key in labels
+    if op == '!':
+        return lambda labels: key not in labels
+    if op == '=':
+        value = values[0]
+        return lambda labels: labels.get(key) == value
+    if op == '!=':
+        value = values[0]
+        return lambda labels: labels.get(key) != value
+    if op == 'in':
+        values = frozenset(values)
+        return lambda labels: key in labels and labels[key] in values
+    if op == 'notin':
+        values = frozenset(values)
+        return lambda labels: labels.get(key) not in values
+
+    # Numeric comparisons: the label must exist and be an integer.
+    limit = int(values[0])
+
+    def compare(labels):
+        try:
+            value = int(labels[key])
+        except (KeyError, ValueError):
+            return False
+        return value > limit if op == '>' else value < limit
+    return compare
+
+
+def compile_label_selector(selector):
+    """Return a predicate `fun(labels) -> bool` for the label `selector`.
+
+    The predicate accepts the labels dict of an object (or None). Raises
+    ValueError if `selector` is malformed.
+    """
+    funs = [_compile_label_requirement(_) for _ in parse_label_selector(selector)]
+    if not funs:
+        return lambda labels: True
+    if len(funs) == 1:
+        fun = funs[0]
+        return lambda labels: fun(labels or {})
+
+    def match(labels):
+        labels = labels or {}
+        for fun in funs:
+            if not fun(labels):
+                return False
+        return True
+    return match
+
+
+def get_labels(obj):
+    """Return the labels of the Swagger model or Json dict `obj` (or None)."""
+    if isinstance(obj, dict):
+        return (obj.get('metadata') or {}).get('labels')
+    metadata = getattr(obj, 'metadata', None)
+    return None if metadata is None else metadata.labels
+
+
+def get_field(obj, path):
+    """Return the value of the field `path`, eg "spec.nodeName", of `obj`.
+
+    `obj` can be a Swagger model or a Json dict. The path always uses the Json
+    names. Returns None if any part of the path does not exist.
+    """
+    for name in path.split('.'):
+        if obj is None:
+            return None
+        if isinstance(obj, dict):
+            obj = obj.get(name)
+            continue
+
+        # Map the Json name to the attribute name of the model, eg
+        # "nodeName" -> "node_name".
+        klass = type(obj)
+        try:
+            attributes = _ATTRIBUTES[klass]
+        except KeyError:
+            attribute_map = getattr(klass, 'attribute_map', {})
+            attributes = {v: k for k, v in attribute_map.items()}
+            _ATTRIBUTES[klass] = attributes
+        attr = attributes.get(name)
+        obj = None if attr is None else getattr(obj, attr, None)
+    return obj
+
+
+def field_to_str(value):
+    """Return the string K8s would compare a field selector against."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def compile_field_selector(selector):
+    """Return a predicate `fun(obj) -> bool` for the field `selector`.
+
+    The predicate accepts Swagger models and Json dicts. Raises ValueError if
+    `selector` is malformed.
+    """
+    checks = [(key, op == '=', values[0])
+              for key, op, values in parse_field_selector(selector)]
+
+    def match(obj):
+        for path, positive, value in checks:
+            if (field_to_str(get_field(obj, path)) == value) != positive:
+                return False
+        return True
+    return match
+
+
+class Selector(object):
+    """Compiled label and field selector.
+
+    Inputs:
+        label_selector: str
+            Eg "app=web,tier in (fe, be)". None or '' match everything.
+        field_selector: str
+            Eg "spec.nodeName=n1". None or '' match everything.
+
+    Raises ValueError if either selector is malformed.
+    """
+    def __init__(self, label_selector=None, field_selector=None):
+        self.label_selector = label_selector or None
+        self.field_selector = field_selector or None
+        self.requirements = parse_label_selector(label_selector)
+        self._match_labels = compile_label_selector(label_selector)
+        if self.field_selector:
+            self._match_fields = compile_field_selector(field_selector)
+        else:
+            self._match_fields = None
+
+    def __bool__(self):
+        """False if the selector matches everything."""
+        return bool(self.label_selector or self.field_selector)
+
+    def matches(self, obj):
+        """Return True if the Swagger model or Json dict `obj` matches."""
+        if not self._match_labels(get_labels(obj)):
+            return False
+        return self._match_fields is None or self._match_fields(obj)
+
+    def filter(self, objs):
+        """Return the list of all `objs` that match."""
+        if not self:
+            return list(objs)
+        return [obj for obj in objs if self.matches(obj)]
+
+    def select(self, store, namespace=None):
+        """Return all objects in `store` that match.
+
+        If `store` has a label index (see `informer.index_label`) for one of
+        the "=" or "in" requirements, only the candidates from that index are
+        tested instead of all objects.
+
+        Inputs:
+            store: informer.Store
+            namespace: str
+                Only return objects in `namespace` (None means all).
+        """
+        keys = None
+        for key, op, values in self.requirements:
+            if op not in ('=', 'in'):
+                continue
+            index = store.get_label_index(key)
+            if index is None:
+                continue
+            candidates = set()
+            for value in values:
+                candidates |= store.index_keys(index, value)
+            keys = candidates if keys is None else keys & candidates
+
+        if keys is None:
+            return self.filter(store.list(namespace))
+
+        objs = [store.get(*key) for key in keys
+                if namespace is None or key[0] == namespace]
+        return self.filter(objs)
+
+
+@functools.lru_cache(maxsize=256)
+def get_selector(label_selector=None, field_selector=None):
+    """Return the (cached) `Selector` for `label_selector` and `field_selector`."""
+    return Selector(label_selector, field_selector)
@@ -0,0 +1,163 @@
+import unittest.mock as mock
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes.selector import Requirement
+
+
+def make_pod(name, labels=None, node=None, phase=None, namespace='default'):
+    return k8s.V1Pod(
+        metadata=k8s.V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+        spec=k8s.V1PodSpec(containers=[], node_name=node),
+        status=k8s.V1PodStatus(phase=phase),
+    )
+
+
+class TestParse:
+    def test_label_selector(self):
+        fun = k8s.selector.parse_label_selector
+        assert fun('') == fun(None) == []
+        assert fun('app=web, tier==fe,env!=prod') == [
+            Requirement('app', '=', ('web',)),
+            Requirement('tier', '=', ('fe',)),
+            Requirement('env', '!=', ('prod',)),
+        ]
+        assert fun('app in (a, b),tier notin (c),x') == [
+            Requirement('app', 'in', ('a', 'b')),
+            Requirement('tier', 'notin', ('c',)),
+            Requirement('x', 'exists', ()),
+        ]
+        assert fun('!example.com/foo,replicas>2, x<-1, empty=') == [
+            Requirement('example.com/foo', '!', ()),
+            Requirement('replicas', '>', ('2',)),
+            Requirement('x', '<', ('-1',)),
+            Requirement('empty', '=', ('',)),
+        ]
+
+    @pytest.mark.parametrize('selector', [
+        'app in a', 'app in ()', 'app=a b', 'app=!x', 'a>b', 'a=-1', '-app', 'app=(a)',
+        'app in (a b)', 'Foo.com/x=y',
+    ])
+    def test_label_selector_invalid(self, selector):
+        with pytest.raises(ValueError):
+            k8s.selector.parse_label_selector(selector)
+
+    def test_field_selector(self):
+        fun = k8s.selector.parse_field_selector
+        assert fun('') == fun(None) == []
+        assert fun('spec.nodeName=n1, status.phase!=Failed,metadata.name==a') == [
+            Requirement('spec.nodeName', '=', ('n1',)),
+            Requirement('status.phase', '!=', ('Failed',)),
+            Requirement('metadata.name', '=', ('a',)),
+        ]
+        for selector in ('spec.nodeName', 'a b=c', '=x'):
+            with pytest.raises(ValueError):
+                fun(selector)
+
+    def test_field_selector_escape(self):
+        fun = k8s.selector.parse_field_selector
+        assert fun(r'metadata.name=a\,b,spec.x!=c\=d, spec.y==e\\') == [
+            Requirement('metadata.name', '=', ('a,b',)),
+            Requirement('spec.x', '!=', ('c=d',)),
+            Requirement('spec.y', '=', ('e\\',)),
+        ]
+
+        # Unknown escape sequences and unescaped separators are invalid.
+        for selector in (r'spec.x=a\b', 'spec.x=a\\', 'spec.x=a=b', r'spec\.x=a'):
+            with pytest.raises(ValueError):
+                fun(selector)
+
+
+class TestCompile:
+    def test_labels(self):
+        fun = k8s.selector.compile_label_selector
+        labels = {'app': 'web', 'tier': 'fe', 'replicas': '3'}
+        assert fun('')(labels) and fun('')(None)
+        assert fun('app=web')(labels)
+        assert not fun('app=web,tier!=fe')(labels)
+        assert fun('app in (web, db),tier notin (be)')(labels)
+        assert not fun('app in (db)')(labels)
+
+        # Negative requirements match objects without the label.
+        assert fun('other!=x')(labels) and fun('other notin (x)')(None)
+        assert not fun('other in (x)')(labels)
+        assert fun('app,!other')(labels)
+        assert not fun('!app')(labels)
+
+        # Numeric comparisons require an integer label.
+        assert fun('replicas>2,replicas<4')(labels)
+        assert not fun('replicas>3')(labels)
+        assert not fun('app>1')(labels) and not fun('other<1')(labels)
+
+    def test_fields(self):
+        fun = k8s.selector.compile_field_selector
+        pod = make_pod('a', node='n1', phase='Running')
+        raw = k8s.swagger.serialize(pod)
+        for obj in (pod, raw):
+            assert fun('spec.nodeName=n1,status.phase=Running')(obj)
+            assert fun('metadata.namespace!=kube-system')(obj)
+            assert not fun('status.phase!=Running')(obj)
+
+            # Missing fields compare as the empty string.
+            assert fun('spec.serviceAccountName=')(obj)
+            assert fun('spec.unknown.field=')(obj)
+
+        node = k8s.V1Node(spec=k8s.V1NodeSpec(unschedulable=True))
+        assert fun('spec.unschedulable=true')(node)
+        assert fun('spec.unschedulable=true')(k8s.swagger.serialize(node))
+
+
+class TestSelector:
+    def test_matches(self):
+        selector = k8s.selector.Selector('app in (web)', 'spec.nodeName=n1')
+        assert selector
+        assert not k8s.selector.Selector()
+        assert not k8s.selector.Selector('', '')
+
+        pods = [
+            make_pod('a', {'app': 'web'}, node='n1'),
+            make_pod('b', {'app': 'web'}, node='n2'),
+            make_pod('c', {'app': 'db'}, node='n1'),
+            make_pod('d', node='n1'),
+        ]
+        assert selector.matches(pods[0])
+        assert selector.matches(k8s.swagger.serialize(pods[0]))
+        assert selector.filter(pods) == pods[:1]
+        assert k8s.selector.Selector().filter(pods) == pods
+
+        with pytest.raises(ValueError):
+            k8s.selector.Selector('app in', None)
+
+    def test_select(self):
+        store = k8s.informer.Store()
+        pods = [
+            make_pod('a', {'app': 'web', 'tier': 'fe'}),
+            make_pod('b', {'app': 'web', 'tier': 'be'}),
+            make_pod('c', {'app': 'db'}),
+            make_pod('d', {'app': 'web'}, namespace='other'),
+        ]
+        store.replace(pods)
+
+        def names(objs):
+            return sorted(_.metadata.name for _ in objs)
+
+        selector = k8s.selector.Selector('app=web,tier!=be')
+        assert names(selector.select(store)) == ['a', 'd']
+        assert names(selector.select(store, 'default')) == ['a']
+
+        # Only the candidates from the index must be tested.
+        store.add_index('app', k8s.informer.index_label('app'))
+        store.add_index('tier', k8s.informer.index_label('tier'))
+        with mock.patch.object(store, 'list') as m_list:
+            assert names(selector.select(store)) == ['a', 'd']
+            assert names(selector.select(store, 'other')) == ['d']
+
+            selector = k8s.selector.Selector('app in (web, db),tier in (fe, be)')
+            assert names(selector.select(store)) == ['a', 'b']
+        assert not m_list.called
+
+    def test_get_selector(self):
+        fun = k8s.selector.get_selector
+        assert fun('app=web', None) is fun('app=web', None)
+        assert fun('app=web', None).label_selector == 'app=web'
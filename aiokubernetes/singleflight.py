@@ -0,0 +1,82 @@
+"""Merge identical concurrent requests into one.
+
+Controllers that reconcile many objects at once often read the same
+ConfigMap, Secret or Namespace from dozens of coroutines simultaneously. A
+`SingleFlight` ensures that only the first of these reads actually reaches
+K8s. All other callers wait for, and then share, its result.
+
+`ApiClient` uses it for GET requests if `Configuration.coalesce_requests` is
+set. Note that all coalesced callers receive the very same `ApiResponse`
+object and must treat it as read-only.
+"""
+import asyncio
+from urllib.parse import urlencode
+
+
+class SingleFlight(object):
+    """Deduplicate concurrent calls with the same key.
+
+    Only calls that overlap in time are merged. Once the call has finished,
+    the next call with the same key will run again, ie this is not a cache.
+    """
+    def __init__(self):
+        # Futures of the calls in flight, keyed by request.
+        self._calls = {}
+
+        # Metrics: number of calls that were actually made, and calls that
+        # piggybacked on one of them.
+        self.calls = 0
+        self.coalesced = 0
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key, fun, *args, **kwargs):
+        """Return `await fun(*args, **kwargs)`, or join the identical call.
+
+        Exceptions propagate to all waiters. Cancelling one waiter does not
+        cancel the call for the others.
+
+        Inputs:
+            key: hashable
+                Calls with the same key are considered identical.
+            fun: coroutine function
+        """
+        future = self._calls.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(fun(*args, **kwargs))
+            self._calls[key] = future
+            future.add_done_callback(lambda _: self._forget(key, future))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
+
+
+def request_key(method, url, kwargs, response_type=None):
+    """Return the hashable key that identifies an `ApiClient` request.
+
+    Requests are identical if they have the same method, URL, query, headers
+    (which includes the credentials) and expected response type.
+
+    Inputs:
+        method: str
+        url: str
+        kwargs: dict
+            The `query_params`, `headers` etc that `ApiClient.call_api` passes
+            to `ApiClient.http_request`.
+        response_type: str
+    """
+    query = kwargs.get('query_params')
+    headers = kwargs.get('headers') or {}
+    return (
+        method.upper(),
+        url,
+        urlencode(query) if query else '',
+        tuple(sorted(headers.items())),
+        response_type,
+    )
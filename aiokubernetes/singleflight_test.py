@@ -0,0 +1,103 @@
+import asyncio
+import unittest.mock as mock
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeResponse
+
+
+class TestSingleFlight:
+    def test_coalesce(self):
+        sf = k8s.singleflight.SingleFlight()
+        calls = []
+
+        async def fun(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            ret = await asyncio.gather(
+                sf.do('a', fun, 1), sf.do('a', fun, 2), sf.do('b', fun, 3))
+            assert len(sf) == 0
+
+            # Calls that do not overlap must not be merged.
+            ret.append(await sf.do('a', fun, 4))
+            return ret
+
+        assert fakes.run(run()) == [1, 1, 3, 4]
+        assert calls == [1, 3, 4]
+        assert sf.calls == 3 and sf.coalesced == 1
+
+    def test_exception(self):
+        sf = k8s.singleflight.SingleFlight()
+
+        async def fun():
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        async def run():
+            return await asyncio.gather(
+                sf.do('a', fun), sf.do('a', fun), return_exceptions=True)
+
+        ret = fakes.run(run())
+        assert all(isinstance(_, ValueError) for _ in ret)
+
+    def test_cancel(self):
+        """Cancelling one waiter must not affect the others."""
+        sf = k8s.singleflight.SingleFlight()
+
+        async def fun():
+            await asyncio.sleep(0.01)
+            return 'done'
+
+        async def run():
+            first = asyncio.ensure_future(sf.do('a', fun))
+            second = asyncio.ensure_future(sf.do('a', fun))
+            await asyncio.sleep(0)
+            first.cancel()
+            assert await second == 'done'
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        fakes.run(run())
+
+    def test_request_key(self):
+        fun = k8s.singleflight.request_key
+        kwargs = {'query_params': {'a': 1}, 'headers': {'authorization': 'x'}}
+        key = fun('get', '/foo', kwargs, 'V1Pod')
+        assert key == fun('GET', '/foo', dict(kwargs), 'V1Pod')
+        assert key != fun('GET', '/foo', {'query_params': {'a': 1}}, 'V1Pod')
+        assert key != fun('GET', '/bar', kwargs, 'V1Pod')
+
+
+class TestApiClient:
+    def test_call_api(self):
+        """Identical GETs through the ApiClient must share one request."""
+        config = k8s.configuration.Configuration()
+        config.coalesce_requests = True
+        data = {'metadata': {'name': 'foo'}}
+
+        async def http_request(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return FakeResponse(data=data)
+
+        async def run():
+            client = k8s.api_client.ApiClient(config)
+            api = k8s.CoreV1Api(client)
+            with mock.patch.object(client, 'http_request', side_effect=http_request) \
+                    as m_request:
+                ret = await asyncio.gather(
+                    api.read_namespaced_config_map('foo', 'default'),
+                    api.read_namespaced_config_map('foo', 'default'),
+                    api.read_namespaced_config_map('bar', 'default'),
+                )
+            await client.close()
+            return ret, m_request.call_count
+
+        ret, num_requests = fakes.run(run())
+        assert num_requests == 2
+        assert ret[0] is ret[1]
+        assert ret[0].obj.metadata.name == 'foo'
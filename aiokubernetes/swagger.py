@@ -1,10 +1,13 @@
 import datetime
 import json
+import operator
 import re
 
 from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
 
 import aiokubernetes.models
+import aiokubernetes.registry
 from aiokubernetes.rest import ApiException
 
 NATIVE_TYPES_MAPPING = {
@@ -19,6 +22,26 @@ NATIVE_TYPES_MAPPING = {
 }
 
 
+# Set this to True to keep all timestamps (eg `creationTimestamp`) as
+# `Timestamp` strings instead of converting them to `datetime` objects. The
+# conversion will then only happen when the user accesses `Timestamp.datetime`.
+RAW_TIMESTAMPS = False
+
+# K8s timestamps are always RFC3339, usually "2018-06-01T10:11:12Z" and
+# occasionally with fractional seconds and/or a UTC offset.
+_RE_RFC3339 = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)[Tt ](\d\d):(\d\d):(\d\d)'
+    r'(?:[.,](\d+))?'
+    r'(?:([Zz])|([+-])(\d\d):?(\d\d))$'
+)
+_UTC = tzutc()
+
+
+# Cache for the compiled decoders. The keys are either type strings like
+# "list[V1Container]" or model classes.
+_DECODERS = {}
+
+
 def deserialize(data, klass):
     """Deserializes dict, list, str into an object.
 
@@ -29,21 +52,56 @@ def deserialize(data, klass):
     """
     if data is None:
         return None
+    return get_decoder(klass)(data)
+
+
+def get_decoder(klass):
+    """Return a function that converts Json `data` into a `klass` instance.
+
+    The decoders are compiled on first use and cached, which means the type
+    strings need only be parsed once and the model classes resolved once.
+
+    Input:
+        klass: str|type
+            Swagger type string, eg "list[V1Container]", "dict(str, str)",
+            "V1Pod" or "datetime", or a Swagger model class.
+
+    Returns:
+        callable: decoder(data) -> object. `data` must not be None.
+    """
+    try:
+        return _DECODERS[klass]
+    except KeyError:
+        pass
+
+    decoder = _compile_decoder(klass)
+    _DECODERS[klass] = decoder
+    return decoder
 
-    if type(klass) == str:
+
+def _compile_decoder(klass):
+    """Return the uncached decoder for `klass` (see `get_decoder`)."""
+    if type(klass) is str:
         # Recursively unpack types like "list[V1ContainerStatus]".
         if klass.startswith('list['):
             # "list[V1ContainerStatus]" -> "V1ContainerStatus"
-            sub_kls = re.match('list\[(.*)\]', klass).group(1)
-            return [deserialize(sub_data, sub_kls) for sub_data in data]
+            decode_item = get_decoder(klass[len('list['):-1])
+
+            def decode_list(data):
+                return [None if _ is None else decode_item(_) for _ in data]
+            return decode_list
 
         # Recursively unpack types like "dict(str, str)".
         if klass.startswith('dict('):
             # "dict(str, int)" -> "int"
-            sub_kls = re.match('dict\(([^,]*), (.*)\)', klass).group(2)
             # fixup: is this a bug? The key will not get de-serialised, only
             # the value.
-            return {k: deserialize(v, sub_kls) for k, v in data.items()}
+            decode_value = get_decoder(klass[len('dict('):-1].split(', ', 1)[1])
+
+            def decode_dict(data):
+                return {k: None if v is None else decode_value(v)
+                        for k, v in data.items()}
+            return decode_dict
 
         # convert str to class
         if klass in NATIVE_TYPES_MAPPING:
@@ -58,14 +116,18 @@ def deserialize(data, klass):
     # `str` but is a class itself and has a `swagger_types` attributes. If
     # it does it can be parsed into a Swagger generated container class.
     if hasattr(klass, 'swagger_types'):
-        return deserialize_model(data, klass)
+        return get_model_decoder(klass)
     elif klass == datetime.date:
-        return deserialize_date(data)
+        return deserialize_date
     elif klass == datetime.datetime:
-        return deserialize_datatime(data)
+        return _decode_timestamp
     else:
         # No further processing required.
-        return data
+        return _identity
+
+
+def _identity(data):
+    return data
 
 
 def deserialize_date(string):
@@ -86,11 +148,17 @@ def deserialize_date(string):
 def deserialize_datatime(string):
     """Deserializes string to datetime.
 
-    The string should be in iso8601 datetime format.
+    The string should be in iso8601 datetime format. The RFC3339 timestamps K8s
+    uses are parsed directly and only other formats are delegated to the much
+    slower `dateutil` parser.
 
     :param: string: str.
     :return: datetime.
     """
+    ret = parse_rfc3339(string)
+    if ret is not None:
+        return ret
+
     try:
         return parse(string)
     except ValueError:
@@ -100,6 +168,74 @@ def deserialize_datatime(string):
         )
 
 
+def parse_rfc3339(string):
+    """Return the `datetime` for the RFC3339 timestamp `string`.
+
+    This is the fast path for K8s timestamps. Unlike `deserialize_datatime` it
+    returns None if `string` is not in RFC3339 format.
+
+    Input:
+        string: str
+            Eg "2018-06-01T10:11:12Z" or "2018-06-01T10:11:12.123456+02:00".
+
+    Returns:
+        datetime.datetime|None: timezone aware datetime object.
+    """
+    # The vast majority of K8s timestamps look like "2018-06-01T10:11:12Z".
+    # Slicing is considerably faster than any regular expression.
+    if len(string) == 20 and string[19] == 'Z' and string[10] == 'T':
+        try:
+            return datetime.datetime(
+                int(string[0:4]), int(string[5:7]), int(string[8:10]),
+                int(string[11:13]), int(string[14:16]), int(string[17:19]),
+                tzinfo=_UTC,
+            )
+        except ValueError:
+            return None
+
+    match = _RE_RFC3339.match(string)
+    if match is None:
+        return None
+    year, month, day, hour, minute, sec, frac, utc, sign, tz_h, tz_m = match.groups()
+
+    # Python only supports microsecond resolution, ie six digits.
+    usec = 0 if frac is None else int(frac[:6].ljust(6, '0'))
+    if utc is None:
+        offset = 60 * (60 * int(tz_h) + int(tz_m))
+        tz = tzoffset(None, -offset if sign == '-' else offset)
+    else:
+        tz = _UTC
+
+    try:
+        return datetime.datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(sec),
+            usec, tzinfo=tz,
+        )
+    except ValueError:
+        return None
+
+
+class Timestamp(str):
+    """Timestamp string that is only converted to a `datetime` on demand.
+
+    Models will contain these instead of `datetime` objects if
+    `RAW_TIMESTAMPS` is True. It behaves like the original string in every
+    respect, including serialisation.
+    """
+    __slots__ = ()
+
+    @property
+    def datetime(self):
+        """Return the timestamp as a `datetime.datetime` object."""
+        return deserialize_datatime(self)
+
+
+def _decode_timestamp(string):
+    if RAW_TIMESTAMPS:
+        return Timestamp(string)
+    return deserialize_datatime(string)
+
+
 def deserialize_model(data, klass):
     """Deserializes list or dict to model.
 
@@ -107,38 +243,204 @@ def deserialize_model(data, klass):
     :param: klass: class literal.
     :return: model object.
     """
-
     if getattr(klass, 'swagger_types', None) is None:
         # fixup: debug log message about unrecognised Swagger type?
         return None
+    return get_model_decoder(klass)(data)
+
+
+def get_model_decoder(klass):
+    """Return the compiled decoder for the Swagger model `klass`.
+
+    The decoder bypasses the constructor and property setters of the model.
+    Instead, it assigns the decoded values directly to the private attributes
+    (eg `_metadata`) with the help of a pre-computed list of Json keys,
+    attribute names and decoders for each field.
+
+    NOTE: the data is not validated, ie the decoder will neither complain about
+    missing required fields nor values the setter would reject. This is fine
+    for K8s responses, which are valid by definition.
+
+    Input:
+        klass: Swagger model class
+
+    Returns:
+        callable: decoder(data) -> klass instance.
+    """
+    try:
+        return _DECODERS[klass]
+    except KeyError:
+        pass
+
+    # The field list is populated _after_ the decoder was put into the cache
+    # because some models are recursive (eg `V1beta1JSONSchemaProps`).
+    fields = []
+    new = klass.__new__
+
+    def decode_model(data):
+        # This is unusual but has happened when there was an error.
+        # fixup: reproduce with all_in_one (run it twice back-to-back, then the
+        # error will materialise the second time, most likely because the
+        # deployment cannot be created since it has not been deleted yet from
+        # the previous run - this is speculation at this point).
+        if isinstance(data, str):
+            return klass()
+
+        # Since we are parsing JSON data returned from K8s it must be a dict
+        # (K8s never returns just a scalar).
+        assert isinstance(data, dict), f'Bug: invalid type <{type(data)}>'
+
+        obj = new(klass)
+        obj.discriminator = None
+        get = data.get
+        for key, attr, decode in fields:
+            value = get(key)
+            setattr(obj, attr, None if value is None else decode(value))
+        return obj
+
+    _DECODERS[klass] = decode_model
+    for attr, attr_type in klass.swagger_types.items():
+        fields.append((
+            klass.attribute_map[attr],
+            private_attribute(klass, attr),
+            get_decoder(attr_type),
+        ))
+    return decode_model
+
+
+def private_attribute(klass, attr):
+    """Return the name of the instance attribute that stores `attr`.
+
+    Swagger models store the value of eg the `metadata` property in
+    `self._metadata`. Properties that already start with an underscore (eg
+    `_continue`) are subject to Python's name mangling and end up in
+    `self._V1ListMeta__continue`.
+
+    Inputs:
+        klass: Swagger model class
+        attr: str
+            Name of the property, ie a key in `klass.swagger_types`.
+
+    Returns:
+        str: attribute name.
+    """
+    if attr.startswith('_'):
+        return f'_{klass.__name__.lstrip("_")}_{attr}'
+    return '_' + attr
+
+
+# Types that are already Json compatible.
+_PRIMITIVE_TYPES = (float, bool, bytes, int, str)
 
-    # This is unusual but has happened when there was an error.
-    # fixup: reproduce with all_in_one (run it twice back-to-back, then the
-    # error will materialise the second time, most likely because the
-    # deployment cannot be created since it has not been deleted yet from
-    # the previous run - this is speculation at this point).
-    if isinstance(data, str):
-        return klass()
-
-    # Since we are parsing JSON data returned from K8s it must be either a
-    # dict or a list (K8s never returns just a scalar).
-    assert isinstance(data, (list, dict)), f'Bug: invalid type <{type(data)}>'
-
-    # Do nothing unless we have data and a Swagger type.
-    kwargs = {}
-    if all((data, klass.swagger_types)):
-        for attr, attr_type in klass.swagger_types.items():
-            try:
-                value = data[klass.attribute_map[attr]]
-            except KeyError:
-                # fixup: log message here.
-                pass
-            else:
-                # Recursively de-serialise the object.
-                kwargs[attr] = deserialize(value, attr_type)
-
-    # Return an instance of the de-serialised class.
-    return klass(**kwargs)
+# Cache for the compiled encoders, keyed by type. Json compatible types map to
+# the identity function.
+_ENCODERS = {_type: _identity for _type in _PRIMITIVE_TYPES + (type(None),)}
+
+
+def serialize(obj):
+    """Convert `obj` into a Json compatible Python structure.
+
+    * None, str, int, float, bool and bytes are returned verbatim.
+    * Lists and tuples are serialised element by element.
+    * `datetime.datetime` and `datetime.date` become ISO 8601 strings.
+    * Dicts are copied and their values serialised.
+    * Swagger models become dicts with the Json keys of their non-None
+      properties.
+
+    The encoders for all types, and in particular for every Swagger model
+    class, are compiled on first use and cached.
+
+    Input:
+        obj: Swagger object, or any of the types listed above.
+
+    Returns:
+        Json compatible object.
+    """
+    try:
+        return _ENCODERS[type(obj)](obj)
+    except KeyError:
+        return get_encoder(obj)(obj)
+
+
+def get_encoder(obj):
+    """Return the (cached) function that serialises objects like `obj`."""
+    klass = type(obj)
+    if klass in _ENCODERS:
+        return _ENCODERS[klass]
+
+    if isinstance(obj, _PRIMITIVE_TYPES):
+        # Sub-classes like `Timestamp`.
+        encoder = _identity
+    elif isinstance(obj, list):
+        encoder = _serialize_list
+    elif isinstance(obj, tuple):
+        encoder = _serialize_tuple
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        encoder = _serialize_datetime
+    elif isinstance(obj, dict):
+        encoder = _serialize_dict
+    elif hasattr(klass, 'swagger_types') and hasattr(klass, 'attribute_map'):
+        encoder = get_model_encoder(klass)
+    else:
+        # Duck typed object whose `swagger_types` may differ between instances.
+        # These cannot be compiled and are not cached.
+        return _serialize_object
+
+    _ENCODERS[klass] = encoder
+    return encoder
+
+
+def _serialize_list(obj):
+    return [serialize(_) for _ in obj]
+
+
+def _serialize_tuple(obj):
+    return tuple(serialize(_) for _ in obj)
+
+
+def _serialize_datetime(obj):
+    return obj.isoformat()
+
+
+def _serialize_dict(obj):
+    return {k: serialize(v) for k, v in obj.items()}
+
+
+def _serialize_object(obj):
+    obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                for attr in obj.swagger_types}
+    return {k: serialize(v) for k, v in obj_dict.items() if v is not None}
+
+
+def get_model_encoder(klass):
+    """Return a function that converts `klass` instances into Json dicts.
+
+    The encoder fetches all properties with a single `attrgetter` call and
+    only dispatches values that are not already Json compatible.
+    """
+    attrs = list(klass.swagger_types)
+    keys = [klass.attribute_map[attr] for attr in attrs]
+    primitives = frozenset(_PRIMITIVE_TYPES)
+
+    if len(attrs) == 0:
+        return lambda obj: {}
+    elif len(attrs) == 1:
+        # `attrgetter` returns a scalar instead of a tuple for a single name.
+        getter = operator.attrgetter(attrs[0])
+
+        def get_values(obj):
+            return (getter(obj),)
+    else:
+        get_values = operator.attrgetter(*attrs)
+
+    def encode_model(obj):
+        ret = {}
+        for key, value in zip(keys, get_values(obj)):
+            if value is None:
+                continue
+            ret[key] = value if type(value) in primitives else serialize(value)
+        return ret
+    return encode_model
 
 
 def determine_type(api_version: str, kind: str):
@@ -177,7 +479,7 @@ def determine_type(api_version: str, kind: str):
     return klass
 
 
-def unpack(data: bytes):
+def unpack(data: bytes, codec=None):
     """Unpack the binary K8s `data` into a Swagger class and return it.
 
     The data must be from a K8s call with `watch=False`. See `unpack_watch` if
@@ -186,54 +488,91 @@ def unpack(data: bytes):
     Input:
         data: bytes
             UTF-8 encoded JSON payload.
+        codec: codec.Codec
+            Json backend (defaults to the standard library).
 
     Returns:
         SwaggerObject: parsed representation of `data`.
     """
+    loads = json.loads if codec is None else codec.loads
     try:
-        k8s_obj = json.loads(data.decode('utf8'))
-    except UnicodeDecodeError:
-        # fixup: log message
-        return None
-    except json.decoder.JSONDecodeError:
+        k8s_obj = loads(data)
+    except ValueError:
+        # Invalid UTF-8 or invalid Json.
         # fixup: log message
         return None
 
-    klass = determine_type(k8s_obj['apiVersion'], k8s_obj['kind'])
-    return deserialize(data=k8s_obj, klass=klass)
+    return unpack_manifest(k8s_obj)
 
 
-def unpack_watch(data: bytes):
-    """Unpack the binary K8s `data` into a Swagger class and return it.
+def unpack_manifest(manifest: dict):
+    """Convert the Json decoded K8s `manifest` into a Swagger object.
 
-    The data must be from a K8s call with `watch=True`. See `unpack` if
-    you want do de-serialise a response where `watch=False`.
+    Input:
+        manifest: dict
+            Must contain the `apiVersion` and `kind` keys.
+
+    Returns:
+        SwaggerObject: parsed representation of `manifest`.
+    """
+    klass = aiokubernetes.registry.get_model(manifest['apiVersion'], manifest['kind'])
+    return deserialize(data=manifest, klass=klass)
+
+
+def parse_watch(data: bytes, codec=None):
+    """Return the event name and raw K8s manifest of a watch event.
+
+    Unlike `unpack_watch` this will only decode the JSON but not convert the
+    manifest into a Swagger object.
 
     Input:
         data: bytes
             UTF-8 encoded JSON payload.
+        codec: codec.Codec
+            Json backend (defaults to the standard library).
 
     Returns:
-        SwaggerObject: parsed representation of `data`.
+        tuple: (name, manifest) where `name` is ADDED, MODIFIED, ERROR etc and
+            `manifest` the JSON decoded object (dict). None if the data is
+            invalid.
     """
+    loads = json.loads if codec is None else codec.loads
     try:
-        line = data.decode('utf8')
-        js = json.loads(line)
+        js = loads(data)
 
         # Unpack the watched event and extract the event name (ADDED, MODIFIED,
         # etc) and the raw event content.
-        name, k8s_obj = js['type'], js['object']
-    except UnicodeDecodeError:
-        # fixup: log message
-        return None
-    except json.decoder.JSONDecodeError:
+        return js['type'], js['object']
+    except ValueError:
+        # Invalid UTF-8 or invalid Json.
         # fixup: log message
         return None
     except KeyError:
         # fixup: log message
         return None
 
-    klass = determine_type(k8s_obj['apiVersion'], k8s_obj['kind'])
+
+def unpack_watch(data: bytes, codec=None):
+    """Unpack the binary K8s `data` into a Swagger class and return it.
+
+    The data must be from a K8s call with `watch=True`. See `unpack` if
+    you want do de-serialise a response where `watch=False`.
+
+    Input:
+        data: bytes
+            UTF-8 encoded JSON payload.
+        codec: codec.Codec
+            Json backend (defaults to the standard library).
+
+    Returns:
+        SwaggerObject: parsed representation of `data`.
+    """
+    event = parse_watch(data, codec)
+    if event is None:
+        return None
+    name, k8s_obj = event
+
+    klass = aiokubernetes.registry.get_model(k8s_obj['apiVersion'], k8s_obj['kind'])
 
     # Something went wrong. A typical example would be that the user
     # supplied a resource version that was too old. In that case K8s would
@@ -1,4 +1,10 @@
+import datetime
 import json
+import unittest.mock as mock
+
+import pytest
+from dateutil.parser import parse
+from dateutil.tz import tzutc
 
 import aiokubernetes as k8s
 
@@ -63,3 +69,172 @@ class TestProxyClass:
 
         raw = json.dumps({'foo': 'ADDED'}).encode('utf8')
         assert k8s.swagger.unpack_watch(raw) is None
+
+    def test_deserialize_nested(self):
+        manifest = {
+            'apiVersion': 'v1', 'kind': 'Pod',
+            'metadata': {
+                'name': 'foo', 'labels': {'app': 'foo'},
+                'creationTimestamp': '2018-06-01T10:11:12Z',
+                'ownerReferences': [
+                    {'apiVersion': 'v1', 'kind': 'ReplicaSet', 'name': 'rs', 'uid': '1'}
+                ],
+            },
+            'spec': {
+                'containers': [{'name': 'c1', 'args': ['a', 'b']}, {'name': 'c2'}],
+                'nodeSelector': None,
+            },
+        }
+        created = datetime.datetime(2018, 6, 1, 10, 11, 12, tzinfo=tzutc())
+        expected = k8s.V1Pod(
+            api_version='v1', kind='Pod',
+            metadata=k8s.V1ObjectMeta(
+                name='foo', labels={'app': 'foo'}, creation_timestamp=created,
+                owner_references=[k8s.V1OwnerReference(
+                    api_version='v1', kind='ReplicaSet', name='rs', uid='1')],
+            ),
+            spec=k8s.V1PodSpec(containers=[
+                k8s.V1Container(name='c1', args=['a', 'b']),
+                k8s.V1Container(name='c2'),
+            ]),
+        )
+        assert k8s.swagger.deserialize(manifest, 'V1Pod') == expected
+        assert k8s.swagger.deserialize(manifest, k8s.V1Pod) == expected
+        assert k8s.swagger.deserialize([manifest], 'list[V1Pod]') == [expected]
+        assert k8s.swagger.deserialize({'x': manifest}, 'dict(str, V1Pod)') == {
+            'x': expected}
+
+    def test_deserialize_recursive_model(self):
+        manifest = {'type': 'object', 'properties': {'spec': {'type': 'string'}}}
+        ret = k8s.swagger.deserialize(manifest, 'V1beta1JSONSchemaProps')
+        assert ret.properties['spec'] == k8s.V1beta1JSONSchemaProps(type='string')
+
+    def test_get_decoder_cached(self):
+        fun = k8s.swagger.get_decoder
+        assert fun('list[V1Pod]') is fun('list[V1Pod]')
+        assert fun('V1Pod') is fun(k8s.V1Pod)
+
+    def test_deserialize_mangled_attribute(self):
+        """Attributes like `_continue` are stored in name mangled fields."""
+        ret = k8s.swagger.deserialize({'continue': 'token'}, 'V1ListMeta')
+        assert ret._continue == 'token'
+        assert ret == k8s.V1ListMeta(_continue='token')
+
+    def test_parse_rfc3339(self):
+        fun = k8s.swagger.parse_rfc3339
+        valid = [
+            '2018-06-01T10:11:12Z',
+            '2018-06-01t10:11:12z',
+            '2018-06-01 10:11:12Z',
+            '2018-06-01T10:11:12.5Z',
+            '2018-06-01T10:11:12.123456Z',
+            '2018-06-01T10:11:12.123456789Z',
+            '2018-06-01T10:11:12+02:00',
+            '2018-06-01T10:11:12.25-03:30',
+        ]
+        for string in valid:
+            ret = fun(string)
+            assert ret == parse(string)
+            assert ret.utcoffset() == parse(string).utcoffset()
+
+        for string in ('2018-06-01', '2018-13-01T10:11:12Z', 'June 1st 2018'):
+            assert fun(string) is None
+
+        # Must fall back to the generic parser.
+        ret = k8s.swagger.deserialize_datatime('June 1st 2018')
+        assert ret == parse('June 1st 2018')
+
+    def test_raw_timestamps(self):
+        manifest = {'name': 'foo', 'creationTimestamp': '2018-06-01T10:11:12Z'}
+        created = datetime.datetime(2018, 6, 1, 10, 11, 12, tzinfo=tzutc())
+
+        with mock.patch.object(k8s.swagger, 'RAW_TIMESTAMPS', True):
+            ret = k8s.swagger.deserialize(manifest, 'V1ObjectMeta')
+        assert isinstance(ret.creation_timestamp, k8s.swagger.Timestamp)
+        assert ret.creation_timestamp == '2018-06-01T10:11:12Z'
+        assert ret.creation_timestamp.datetime == created
+
+        # Timestamps must serialise to the original string.
+        js = k8s.api_proxy.sanitize_for_serialization(ret)
+        assert js['creationTimestamp'] == '2018-06-01T10:11:12Z'
+
+        ret = k8s.swagger.deserialize(manifest, 'V1ObjectMeta')
+        assert ret.creation_timestamp == created
+
+
+class TestModels:
+    def test_slots(self):
+        """Models must store their properties in slots."""
+        meta = k8s.V1ListMeta(_continue='token', resource_version='5')
+        assert not hasattr(meta, '__dict__')
+        assert not hasattr(k8s.V1Pod(), '__dict__')
+        assert meta._continue == 'token'
+        assert meta.to_dict() == {
+            '_continue': 'token', 'resource_version': '5', 'self_link': None,
+        }
+
+        # The compiled decoder must be able to fill the slots.
+        ret = k8s.swagger.deserialize({'continue': 'token', 'resourceVersion': '5'},
+                                      'V1ListMeta')
+        assert ret == meta
+        assert ret != k8s.V1ListMeta(_continue='token')
+        assert ret != 'foo'
+
+    def test_arbitrary_attributes(self):
+        """Models have no `__dict__` for arbitrary attributes."""
+        meta = k8s.V1ListMeta(resource_version='5')
+        with pytest.raises(AttributeError):
+            meta.foo = 'bar'
+
+    def test_all_models(self):
+        for name in k8s.models.__all__:
+            klass = getattr(k8s.models, name)
+            assert 'discriminator' in klass.__slots__
+            assert '__dict__' not in klass.__slots__
+            assert len(klass.__slots__) == len(klass.swagger_types) + 1
+
+
+class TestSerialize:
+    def test_model(self):
+        created = datetime.datetime(2018, 6, 1, 10, 11, 12, tzinfo=tzutc())
+        pod = k8s.V1Pod(
+            api_version='v1', kind='Pod',
+            metadata=k8s.V1ObjectMeta(
+                name='foo', labels={'a': 'b'}, creation_timestamp=created),
+            spec=k8s.V1PodSpec(containers=[
+                k8s.V1Container(
+                    name='c', ports=[k8s.V1ContainerPort(container_port=80)]),
+            ]),
+        )
+        assert k8s.swagger.serialize(pod) == {
+            'apiVersion': 'v1', 'kind': 'Pod',
+            'metadata': {
+                'name': 'foo', 'labels': {'a': 'b'},
+                'creationTimestamp': created.isoformat(),
+            },
+            'spec': {'containers': [{'name': 'c', 'ports': [{'containerPort': 80}]}]},
+        }
+
+        # The encoder must be compiled once per class.
+        assert k8s.swagger.get_encoder(pod) is k8s.swagger.get_encoder(k8s.V1Pod())
+
+        # Name mangled properties must serialise as well.
+        meta = k8s.V1ListMeta(_continue='token')
+        assert k8s.swagger.serialize(meta) == {'continue': 'token'}
+
+    def test_basic_types(self):
+        fun = k8s.swagger.serialize
+        stamp = k8s.swagger.Timestamp('2018-06-01T10:11:12Z')
+        assert fun(stamp) == '2018-06-01T10:11:12Z'
+        assert fun((1, [None, 'a'])) == (1, [None, 'a'])
+        assert fun({'a': None, 'b': datetime.date(2018, 1, 2)}) == {
+            'a': None, 'b': '2018-01-02',
+        }
+
+    def test_proxy_and_client(self):
+        """Both sanitisers must use the compiled encoders."""
+        obj = k8s.V1DeleteOptions(grace_period_seconds=0)
+        expected = {'gracePeriodSeconds': 0}
+        assert k8s.api_proxy.sanitize_for_serialization(obj) == expected
+        fun = k8s.api_client.ApiClient.sanitize_for_serialization
+        assert fun(None, obj) == expected
@@ -12,15 +12,93 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import random
 from collections import namedtuple
 
+import aiohttp
+
 import aiokubernetes as k8s
+from aiokubernetes.rest import ApiException
+
+# Sentinel for a Swagger object that was not yet created.
+_UNSET = object()
+
+
+class WatchResponse(namedtuple('WatchResponse', 'name raw obj')):
+    """A single K8s watch event.
+
+    The `name` will be 'ADDED', MODIFIED, etc, `raw` the unprocessed response
+    line from K8s and `manifest` the Json decoded object from `raw`.
+
+    The `obj` attribute contains the Swagger object created from `manifest`
+    (None if there was an error). Building it is expensive and therefore
+    deferred until the first access. Consumers that only need the name or
+    labels of an object should use `metadata` instead, which only converts the
+    metadata of the manifest into a `V1ObjectMeta` instance.
+
+    The response is still the `(name, raw, obj)` namedtuple it once was, ie it
+    supports unpacking, indexing, `len`, hashing, `_replace` and `_asdict`.
+    All of them create `obj` on demand.
+    """
+    def __new__(cls, name, raw, obj=_UNSET, manifest=None):
+        self = super().__new__(cls, name, raw, obj)
+        self.manifest = manifest
+        self._obj = obj
+        self._metadata = _UNSET
+        return self
+
+    @classmethod
+    def _make(cls, iterable):
+        return cls(*iterable)
+
+    @property
+    def obj(self):
+        if self._obj is _UNSET:
+            if self.name == 'ERROR' or self.manifest is None:
+                self._obj = None
+            else:
+                self._obj = k8s.swagger.unpack_manifest(self.manifest)
+        return self._obj
+
+    @property
+    def metadata(self):
+        if self._metadata is _UNSET:
+            if self._obj is not _UNSET:
+                self._metadata = getattr(self._obj, 'metadata', None)
+            elif self.name == 'ERROR' or self.manifest is None:
+                self._metadata = None
+            else:
+                self._metadata = k8s.swagger.deserialize(
+                    self.manifest.get('metadata'), 'V1ObjectMeta')
+        return self._metadata
+
+    # The tuple itself may still hold the placeholder for `obj`. All methods
+    # that access the elements must therefore go through the properties.
+    def __iter__(self):
+        return iter((self.name, self.raw, self.obj))
+
+    def __getitem__(self, idx):
+        return tuple(self)[idx]
+
+    def __contains__(self, value):
+        return value in tuple(self)
 
-# All API responses will be wrapped into this tuple.
-# The `name` will be 'ADDED', MODIFIED, etc, `raw` will the unprocessed but
-# Json decoded response from K8s and `obj` will be the Swagger object created
-# from `raw` (may be None if there was an error).
-WatchResponse = namedtuple('WatchResponse', 'name raw obj')
+    def __eq__(self, other):
+        if not isinstance(other, tuple):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __ne__(self, other):
+        if not isinstance(other, tuple):
+            return NotImplemented
+        return tuple(self) != tuple(other)
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f'WatchResponse(name={self.name!r}, raw={self.raw!r})'
 
 
 class AioHttpClientWatch(object):
@@ -30,10 +108,14 @@ class AioHttpClientWatch(object):
 
     Input:
         request: AioHttp client instance.
+        codec: codec.Codec|str
+            Json backend to decode the events (defaults to the standard
+            library).
     """
-    def __init__(self, request):
+    def __init__(self, request, codec=None):
         self.request = request
         self.connection = None
+        self.codec = k8s.codec.get_codec(codec)
 
     def __aiter__(self):
         return self
@@ -52,9 +134,212 @@ class AioHttpClientWatch(object):
         if len(line) == 0:
             raise StopAsyncIteration
 
-        # Return the unpacked response.
-        name, obj = k8s.swagger.unpack_watch(line)
-        return WatchResponse(name=name, raw=line, obj=obj)
+        # Decode the Json but defer the creation of the Swagger object until
+        # the user accesses it.
+        event = k8s.swagger.parse_watch(line, self.codec)
+        if event is None:
+            return WatchResponse(name=None, raw=line, obj=None)
+        name, manifest = event
+        return WatchResponse(name=name, raw=line, manifest=manifest)
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class ResourceExpired(ApiException):
+    """K8s no longer has the requested resource version (410 Gone).
+
+    The watch cannot be resumed. Callers must re-list the resource and start a
+    new watch from the resource version of that list.
+    """
+    def __init__(self, reason='Expired'):
+        super().__init__(status=410, reason=reason)
+
+
+def is_transient(status):
+    """Return True if a watch that failed with HTTP `status` may be re-opened.
+
+    This is the case for 429 (Too Many Requests) and all 5xx codes. Everything
+    else, eg 401, 403 or 404, will not go away by trying again.
+    """
+    return status is not None and (status == 429 or 500 <= status < 600)
+
+
+class ResumableWatch(object):
+    """Watch a K8s resource and transparently resume the event stream.
+
+    K8s terminates every watch after `timeout_seconds` and connections may drop
+    at any time. This iterator keeps track of the `resourceVersion` of the
+    last event and re-opens the stream from there, so that the consumer sees
+    one uninterrupted sequence of events.
+
+    Connection errors, 429 and 5xx responses as well as streams that K8s
+    closes before they delivered any event are retried with a capped
+    exponential backoff and jitter. A `Retry-After` header takes precedence
+    over the backoff.
+
+    The iterator raises `ResourceExpired` if K8s has compacted the requested
+    resource version away, in which case the caller must re-list the
+    resource. All other errors, eg 401, 403 or 404, raise `ApiException`.
+
+    Inputs:
+        client: aiohttp.ClientSession
+            Typically the return value of `k8s.clients.get_aiohttp`.
+        list_fun: callable
+            Generated `list_*` method bound to an `api_proxy.Proxy` instance,
+            eg `k8s.CoreV1Api(proxy).list_namespaced_pod`.
+        *args, **kwargs:
+            Passed verbatim to `list_fun`, eg the namespace or a label selector.
+        resource_version: str
+            Start watching after this version. Use the `resource_version` of a
+            preceding list call to not miss any events.
+        timeout_seconds: int
+            Server side timeout for each individual watch request.
+        codec: codec.Codec|str
+            Json backend to decode the events. Defaults to the `json_codec` of
+            the configuration `list_fun` is bound to.
+    """
+    # Seconds to wait before the first re-connection attempt after an error.
+    # The delay doubles with every consecutive failure up to `retry_delay_max`.
+    retry_delay = 1
+    retry_delay_max = 30
+
+    def __init__(self, client, list_fun, *args, resource_version=None,
+                 timeout_seconds=300, codec=None, **kwargs):
+        self.client = client
+        self.list_fun = list_fun
+        self.args, self.kwargs = args, kwargs
+        self.resource_version = resource_version
+        self.timeout_seconds = timeout_seconds
+        self.connection = None
+        if codec is None:
+            self.codec = k8s.codec.get_codec_for(list_fun)
+        else:
+            self.codec = k8s.codec.get_codec(codec)
+
+        # Number of consecutive failed connection attempts, and when the
+        # current stream was opened and how many events it has produced.
+        self.failures = 0
+        self._opened = None
+        self._num_events = 0
+
+    def __aiter__(self):
+        return self
+
+    async def connect(self):
+        """Open a new watch stream that resumes from `resource_version`.
+
+        Raises `ApiException` with the response headers if K8s rejected the
+        request.
+        """
+        cargs = self.list_fun(
+            *self.args,
+            watch=True,
+            resource_version=self.resource_version,
+            timeout_seconds=self.timeout_seconds,
+            **self.kwargs
+        )
+        connection = await self.client.request(**cargs)
+        if connection.status == 410:
+            connection.close()
+            raise ResourceExpired(connection.reason)
+        if connection.status != 200:
+            connection.close()
+            err = ApiException(status=connection.status, reason=connection.reason)
+            err.headers = connection.headers
+            raise err
+        self.connection = connection
+        self._opened = asyncio.get_event_loop().time()
+        self._num_events = 0
+
+    def get_delay(self, headers=None):
+        """Return the seconds to wait before the next connection attempt.
+
+        A `Retry-After` entry in `headers` takes precedence over the
+        exponential backoff. Either way, the delay never exceeds
+        `retry_delay_max`.
+        """
+        retry_after = headers.get('Retry-After') if headers else None
+        if retry_after is not None:
+            delay = k8s.retry.parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.retry_delay_max)
+        delay = self.retry_delay * 2 ** min(self.failures, 30)
+        return random.uniform(0.5, 1) * min(delay, self.retry_delay_max)
+
+    async def backoff(self, headers=None):
+        """Wait before the next connection attempt (see `get_delay`)."""
+        delay = self.get_delay(headers)
+        self.failures += 1
+        await asyncio.sleep(delay)
+
+    def is_healthy(self):
+        """Return True if the current stream may be re-opened straight away.
+
+        This is the case if it delivered at least one event, or if it lasted
+        until `timeout_seconds` expired.
+        """
+        if self._num_events > 0:
+            return True
+        if self._opened is None or self.timeout_seconds is None:
+            return False
+        return asyncio.get_event_loop().time() - self._opened >= self.timeout_seconds
+
+    async def __anext__(self):
+        while True:
+            # (Re)connect to K8s. Back off if K8s is unreachable or overloaded.
+            if self.connection is None:
+                try:
+                    await self.connect()
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    await self.backoff()
+                    continue
+                except ApiException as err:
+                    if not is_transient(err.status):
+                        raise
+                    await self.backoff(err.headers)
+                    continue
+
+            # Wait until K8s sends another line (ie another event). An empty
+            # line means K8s closed the stream, usually because
+            # `timeout_seconds` expired. Either way, we will re-open it, but
+            # back off first if the stream ended without delivering anything
+            # to not hammer an API server that keeps closing it.
+            try:
+                line = await self.connection.content.readline()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                line = b''
+            if len(line) == 0:
+                healthy = self.is_healthy()
+                self.close()
+                if not healthy:
+                    await self.backoff()
+                continue
+
+            event = k8s.swagger.parse_watch(line, self.codec)
+            if event is None:
+                continue
+            name, manifest = event
+
+            # K8s may also report errors inside the stream. Re-connect if the
+            # error is transient, otherwise give up.
+            if name == 'ERROR':
+                self.close()
+                code, reason = manifest.get('code'), manifest.get('message')
+                if code == 410:
+                    raise ResourceExpired(reason)
+                if is_transient(code):
+                    await self.backoff()
+                    continue
+                raise ApiException(status=code, reason=reason)
+
+            # Remember where we are in case we need to re-connect.
+            self.failures = 0
+            self._num_events += 1
+            self.resource_version = manifest['metadata']['resourceVersion']
+            return WatchResponse(name=name, raw=line, manifest=manifest)
 
     def close(self):
         if self.connection is not None:
@@ -0,0 +1,197 @@
+import asyncio
+import copy
+import pickle
+import unittest.mock as mock
+
+import aiohttp
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import (
+    FakeClient, FakeResponse, error_line, event_line, make_pod,
+)
+
+
+class TestWatchResponse:
+    def test_lazy_obj(self):
+        """Only create the Swagger object when the user accesses it."""
+        pod = make_pod('a', rv='5')
+        line = event_line('ADDED', pod)
+        name, manifest = k8s.swagger.parse_watch(line)
+
+        with mock.patch.object(k8s.swagger, 'unpack_manifest',
+                               wraps=k8s.swagger.unpack_manifest) as m_unpack:
+            event = k8s.watch.WatchResponse(name=name, raw=line, manifest=manifest)
+            assert event.metadata == pod.metadata
+            assert not m_unpack.called
+
+            assert event.obj == pod
+            assert event.obj is event.obj
+            assert m_unpack.call_count == 1
+
+        # Must still unpack like the original tuple.
+        assert tuple(event) == ('ADDED', line, pod)
+        assert event == k8s.watch.WatchResponse('ADDED', line, pod)
+
+    def test_namedtuple(self):
+        """Must behave like the `(name, raw, obj)` namedtuple it once was."""
+        pod = make_pod('a', rv='5')
+        line = event_line('ADDED', pod)
+        name, manifest = k8s.swagger.parse_watch(line)
+
+        def make():
+            return k8s.watch.WatchResponse(name=name, raw=line, manifest=manifest)
+
+        event = make()
+        assert isinstance(event, tuple) and len(event) == 3
+        assert event[0] == 'ADDED' and event[-1] == pod and event[:2] == ('ADDED', line)
+        assert pod in make() and 'foo' not in event
+        assert event == ('ADDED', line, pod) and not event != ('ADDED', line, pod)
+        assert make()._asdict() == {'name': 'ADDED', 'raw': line, 'obj': pod}
+        assert make()._replace(name='MODIFIED') == ('MODIFIED', line, pod)
+        assert copy.copy(make()) == event
+        assert pickle.loads(pickle.dumps(make())) == event
+
+        # Hash like the tuple of its elements.
+        error = k8s.watch.WatchResponse(name='ERROR', raw=b'x', manifest={})
+        assert hash(error) == hash(('ERROR', b'x', None))
+
+    def test_error(self):
+        line = error_line(410)
+        name, manifest = k8s.swagger.parse_watch(line)
+        event = k8s.watch.WatchResponse(name=name, raw=line, manifest=manifest)
+        assert event.obj is None
+        assert event.metadata is None
+
+
+class TestAioHttpClientWatch:
+    def test_iterate(self):
+        lines = [
+            event_line('ADDED', make_pod('a')),
+            event_line('DELETED', make_pod('a')),
+        ]
+
+        async def consume():
+            response = FakeResponse(lines=lines)
+            watch = k8s.watch.AioHttpClientWatch(FakeClient([response]).request(url=''))
+            return [event async for event in watch]
+
+        events = fakes.run(consume())
+        assert [_.name for _ in events] == ['ADDED', 'DELETED']
+        assert [_.raw for _ in events] == lines
+        assert events[1].obj == make_pod('a')
+
+
+class TestResumableWatch:
+    def setup_method(self):
+        config = k8s.configuration.Configuration()
+        self.list_fun = k8s.CoreV1Api(k8s.api_proxy.Proxy(config)).list_namespaced_pod
+
+    async def consume(self, watch, num):
+        return [await watch.__anext__() for _ in range(num)]
+
+    def test_resume(self):
+        """Re-connect after timeouts and errors from the last resource version."""
+        client = FakeClient([
+            # Stream ends after one event, eg because `timeout_seconds` expired.
+            FakeResponse(lines=[event_line('ADDED', make_pod('a', rv='5'))]),
+
+            # API server is temporarily unavailable.
+            aiohttp.ClientConnectionError(),
+
+            # Connection drops after one event.
+            FakeResponse(lines=[
+                event_line('MODIFIED', make_pod('a', rv='6')),
+                aiohttp.ClientPayloadError(),
+            ]),
+            FakeResponse(lines=[event_line('DELETED', make_pod('a', rv='7'))]),
+        ])
+        watch = k8s.watch.ResumableWatch(
+            client, self.list_fun, 'default', resource_version='1')
+        watch.retry_delay = 0
+
+        events = fakes.run(self.consume(watch, 3))
+        assert [_.name for _ in events] == ['ADDED', 'MODIFIED', 'DELETED']
+        assert events[0].obj == make_pod('a', rv='5')
+        assert watch.resource_version == '7'
+
+        assert len(client.urls) == 4
+        assert 'resourceVersion=1&' in client.urls[0]
+        assert 'resourceVersion=5&' in client.urls[1]
+        assert 'resourceVersion=5&' in client.urls[2]
+        assert 'resourceVersion=6&' in client.urls[3]
+        assert all('watch=True' in _ for _ in client.urls)
+
+    def test_expired(self):
+        # K8s may either reject the request outright or send an error event.
+        for response in (FakeResponse(status=410),
+                         FakeResponse(lines=[error_line(410)])):
+            client = FakeClient([response])
+            watch = k8s.watch.ResumableWatch(client, self.list_fun, 'default')
+            with pytest.raises(k8s.watch.ResourceExpired):
+                fakes.run(self.consume(watch, 1))
+            assert response.closed
+
+    def test_transient_errors(self):
+        """Retry 429, 5xx and empty streams with backoff and `Retry-After`."""
+        client = FakeClient([
+            FakeResponse(status=500),
+            FakeResponse(status=429, headers={'Retry-After': '3'}),
+            FakeResponse(lines=[error_line(503)]),
+
+            # K8s closes the stream straight away.
+            FakeResponse(lines=[]),
+            FakeResponse(lines=[event_line('ADDED', make_pod('a', rv='5'))]),
+        ])
+        watch = k8s.watch.ResumableWatch(client, self.list_fun, 'default')
+
+        with mock.patch.object(asyncio, 'sleep', new_callable=fakes.AsyncMock) \
+                as m_sleep:
+            events = fakes.run(self.consume(watch, 1))
+        assert events[0].obj == make_pod('a', rv='5')
+        assert len(client.urls) == 5
+
+        # Exponential backoff with jitter, except for the `Retry-After` header.
+        delays = [_[0][0] for _ in m_sleep.call_args_list]
+        assert len(delays) == 4
+        assert 0.5 <= delays[0] <= 1
+        assert delays[1] == 3
+        assert 2 <= delays[2] <= 4
+        assert 4 <= delays[3] <= 8
+
+        # A successful event resets the backoff.
+        assert watch.failures == 0
+
+    def test_backoff_cap(self):
+        watch = k8s.watch.ResumableWatch(FakeClient([]), self.list_fun, 'default')
+        watch.failures = 5000
+        assert 15 <= watch.get_delay() <= 30
+        assert watch.get_delay({'Retry-After': '100'}) == 30
+
+    def test_healthy(self):
+        """Streams that expired normally must be re-opened without delay."""
+        client = FakeClient([FakeResponse(), FakeResponse()])
+        watch = k8s.watch.ResumableWatch(
+            client, self.list_fun, 'default', timeout_seconds=0)
+
+        async def run():
+            await watch.connect()
+            return watch.is_healthy()
+
+        assert fakes.run(run()) is True
+        watch.timeout_seconds = 300
+        assert fakes.run(run()) is False
+
+    def test_other_errors(self):
+        """Do not retry errors that will not go away, eg 401, 403 or 404."""
+        for response in (FakeResponse(status=401),
+                         FakeResponse(status=403),
+                         FakeResponse(status=404),
+                         FakeResponse(lines=[error_line(403)])):
+            client = FakeClient([response, FakeResponse()])
+            watch = k8s.watch.ResumableWatch(client, self.list_fun, 'default')
+            with pytest.raises(k8s.rest.ApiException) as err:
+                fakes.run(self.consume(watch, 1))
+            assert not isinstance(err.value, k8s.watch.ResourceExpired)
+            assert len(client.urls) == 1
@@ -0,0 +1,234 @@
+"""Rate limited work queue for controllers.
+
+A controller watches resources, puts the keys of changed objects into a
+queue and reconciles them with a pool of workers. The `WorkQueue` takes care
+of the tedious parts:
+
+  * a key is queued at most once, no matter how many events arrive for it;
+  * a key is never processed by two workers at the same time. Keys that are
+    added again while being processed are re-queued once the worker is done;
+  * failed keys are retried with a per-key exponential backoff;
+  * optionally, all workers together process at most `qps` keys per second.
+
+Example:
+
+    async def reconcile(key):
+        namespace, name = key
+        ...
+
+    queue = k8s.workqueue.WorkQueue(qps=10, burst=100)
+    watch = k8s.watch.ResumableWatch(client, v1.list_pod_for_all_namespaces)
+    await asyncio.gather(queue.feed(watch), queue.run(reconcile, workers=4))
+"""
+import asyncio
+from collections import deque
+
+import aiokubernetes as k8s
+
+
+class QueueShutDown(Exception):
+    """The queue was shut down and will not produce any more keys."""
+
+
+class WorkQueue(object):
+    """Queue of unique keys with per-key backoff and a global rate limit.
+
+    Inputs:
+        qps: float
+            Maximum number of keys per second that `get` returns (None means
+            no limit).
+        burst: int
+            Number of keys `get` may return back-to-back (defaults to `qps`).
+        backoff: float
+            Delay in seconds before the first retry of a failed key. The
+            delay doubles for every consecutive failure.
+        backoff_max: float
+            Maximum delay in seconds before a retry.
+    """
+    def __init__(self, qps=None, burst=None, backoff=0.005, backoff_max=1000):
+        self.backoff, self.backoff_max = backoff, backoff_max
+        if qps is None:
+            self.bucket = None
+        else:
+            self.bucket = k8s.ratelimit.TokenBucket(qps, burst or max(1, int(qps)))
+
+        # Queued keys in order, and the set of keys that are queued or must be
+        # re-queued once they are done.
+        self._queue = deque()
+        self._dirty = set()
+
+        # Keys currently held by a worker.
+        self._processing = set()
+
+        # {key: number of consecutive failures} and {key: timer} for the
+        # delayed keys.
+        self._failures = {}
+        self._timers = {}
+
+        self._nonempty = asyncio.Event()
+        self.shutting_down = False
+
+        # Metrics: number of added keys, keys that were already queued and
+        # retries of failed keys.
+        self.adds = 0
+        self.deduplicated = 0
+        self.retries = 0
+
+    def __len__(self):
+        """Number of keys that are ready to be processed."""
+        return len(self._queue)
+
+    def add(self, key):
+        """Queue `key` unless it is already queued."""
+        if self.shutting_down:
+            return
+        self.adds += 1
+        if key in self._dirty:
+            self.deduplicated += 1
+            return
+        self._dirty.add(key)
+
+        # `done` will re-queue the key once its worker has finished.
+        if key in self._processing:
+            return
+        self._queue.append(key)
+        self._nonempty.set()
+
+    def add_after(self, key, delay):
+        """Queue `key` after `delay` seconds.
+
+        If `key` is already scheduled, the earlier of the two times wins.
+        """
+        if self.shutting_down:
+            return
+        if delay <= 0:
+            self.add(key)
+            return
+
+        loop = asyncio.get_event_loop()
+        timer = self._timers.get(key)
+        if timer is not None:
+            if timer.when() <= loop.time() + delay:
+                return
+            timer.cancel()
+        self._timers[key] = loop.call_later(delay, self._fire, key)
+
+    def add_rate_limited(self, key):
+        """Queue `key` after its exponential backoff delay (see `get_delay`)."""
+        delay = self.get_delay(key)
+        self._failures[key] = self._failures.get(key, 0) + 1
+        self.retries += 1
+        self.add_after(key, delay)
+
+    def get_delay(self, key):
+        """Return the backoff delay for the next retry of `key`."""
+        failures = self._failures.get(key, 0)
+        return min(self.backoff * 2 ** failures, self.backoff_max)
+
+    def forget(self, key):
+        """Reset the backoff of `key`, typically after it succeeded."""
+        self._failures.pop(key, None)
+
+    def num_requeues(self, key):
+        """Return the number of consecutive failures of `key`."""
+        return self._failures.get(key, 0)
+
+    async def get(self):
+        """Wait for the next key and mark it as being processed.
+
+        Every key returned by `get` must be passed to `done` eventually.
+
+        Raises `QueueShutDown` once the queue was shut down.
+        """
+        while True:
+            while not self._queue:
+                if self.shutting_down:
+                    raise QueueShutDown()
+                self._nonempty.clear()
+                await self._nonempty.wait()
+
+            # Another worker may have taken the key while we waited for the
+            # rate limiter.
+            if self.bucket is not None:
+                await self.bucket.acquire()
+                if not self._queue:
+                    continue
+
+            key = self._queue.popleft()
+            self._dirty.discard(key)
+            self._processing.add(key)
+            return key
+
+    def done(self, key):
+        """Mark `key` as processed and re-queue it if it was added meanwhile."""
+        self._processing.discard(key)
+        if key in self._dirty:
+            self._queue.append(key)
+            self._nonempty.set()
+
+    def shutdown(self):
+        """Stop accepting keys and make `get` raise `QueueShutDown`.
+
+        Workers will still receive the keys that are already queued.
+        """
+        self.shutting_down = True
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._nonempty.set()
+
+    async def run(self, handler, workers=1, max_retries=None):
+        """Process the keys with `workers` concurrent calls to `handler`.
+
+        Keys for which `handler` raises an exception are retried with the
+        exponential backoff, at most `max_retries` times (None means forever).
+        Returns once the queue was shut down.
+
+        Inputs:
+            handler: coroutine function
+                Called with one key at a time.
+            workers: int
+                Number of concurrent workers.
+            max_retries: int
+        """
+        async def worker():
+            while True:
+                try:
+                    key = await self.get()
+                except QueueShutDown:
+                    return
+                try:
+                    await handler(key)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    if max_retries is None or self.num_requeues(key) < max_retries:
+                        self.add_rate_limited(key)
+                    else:
+                        self.forget(key)
+                else:
+                    self.forget(key)
+                finally:
+                    self.done(key)
+
+        await asyncio.gather(*[worker() for _ in range(workers)])
+
+    async def feed(self, watch, key=None):
+        """Add the key of every event in `watch` to the queue.
+
+        Inputs:
+            watch: async iterator
+                Produces `WatchResponse` objects, eg `watch.ResumableWatch`.
+            key: callable
+                key(event) -> hashable or None to ignore the event. Defaults to
+                the (namespace, name) of the object.
+        """
+        key = key or k8s.debounce.object_key
+        async for event in watch:
+            value = key(event)
+            if value is not None:
+                self.add(value)
+
+    def _fire(self, key):
+        del self._timers[key]
+        self.add(key)
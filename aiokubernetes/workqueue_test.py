@@ -0,0 +1,160 @@
+import asyncio
+
+import pytest
+
+import aiokubernetes as k8s
+from aiokubernetes import fakes_test as fakes
+from aiokubernetes.fakes_test import FakeWatch, make_event
+
+
+class TestWorkQueue:
+    def test_dedup(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue()
+            for key in ('a', 'b', 'a', 'a'):
+                queue.add(key)
+            assert len(queue) == 2 and queue.deduplicated == 2
+
+            assert await queue.get() == 'a'
+
+            # 'a' is being processed: adding it again must only queue it once
+            # the worker is done.
+            queue.add('a')
+            queue.add('a')
+            assert len(queue) == 1
+            assert await queue.get() == 'b'
+            queue.done('a')
+            assert len(queue) == 1
+            assert await queue.get() == 'a'
+            queue.done('a')
+            queue.done('b')
+            assert len(queue) == 0
+
+        fakes.run(run())
+
+    def test_backoff(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue(backoff=1, backoff_max=5)
+            delays = []
+            for _ in range(5):
+                delays.append(queue.get_delay('a'))
+                queue.add_rate_limited('a')
+            assert delays == [1, 2, 4, 5, 5]
+            assert queue.num_requeues('a') == 5
+            queue.forget('a')
+            assert queue.get_delay('a') == 1
+            queue.shutdown()
+
+        fakes.run(run())
+
+    def test_add_after(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue()
+            queue.add_after('a', 0.05)
+            queue.add_after('a', 0.01)
+            queue.add_after('a', 10)
+            queue.add_after('b', 0)
+            assert await queue.get() == 'b'
+            assert len(queue) == 0
+
+            start = asyncio.get_event_loop().time()
+            assert await asyncio.wait_for(queue.get(), 1) == 'a'
+            assert asyncio.get_event_loop().time() - start < 0.04
+            assert queue._timers == {}
+
+        fakes.run(run())
+
+    def test_rate_limit(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue(qps=100, burst=1)
+            for key in range(5):
+                queue.add(key)
+            start = asyncio.get_event_loop().time()
+            ret = [await queue.get() for _ in range(5)]
+            return ret, asyncio.get_event_loop().time() - start
+
+        keys, elapsed = fakes.run(run())
+        assert keys == [0, 1, 2, 3, 4]
+        assert elapsed >= 0.035
+
+    def test_shutdown(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue()
+            queue.add('a')
+            queue.add_after('b', 0.01)
+            queue.shutdown()
+            queue.add('c')
+
+            # Already queued keys are still delivered.
+            assert await queue.get() == 'a'
+            with pytest.raises(k8s.workqueue.QueueShutDown):
+                await queue.get()
+
+        fakes.run(run())
+
+
+class TestRun:
+    def test_workers(self):
+        """Workers must process every key once and never concurrently."""
+        async def run():
+            queue = k8s.workqueue.WorkQueue()
+            active, processed = set(), []
+
+            async def handler(key):
+                assert key not in active
+                active.add(key)
+                await asyncio.sleep(0.01)
+                active.discard(key)
+                processed.append(key)
+
+            for key in range(10):
+                queue.add(key)
+            task = asyncio.ensure_future(queue.run(handler, workers=4))
+            await asyncio.sleep(0.01)
+            queue.add(0)
+            await asyncio.sleep(0.05)
+            queue.shutdown()
+            await asyncio.wait_for(task, 1)
+            return processed
+
+        processed = fakes.run(run())
+        assert sorted(processed) == [0] + list(range(10))
+
+    def test_retries(self):
+        async def run():
+            queue = k8s.workqueue.WorkQueue(backoff=0.001)
+            calls = []
+
+            async def handler(key):
+                calls.append(key)
+                if key == 'bad' or len(calls) < 3:
+                    raise ValueError()
+
+            queue.add('good')
+            queue.add('bad')
+            task = asyncio.ensure_future(queue.run(handler, workers=2, max_retries=3))
+            await asyncio.sleep(0.1)
+            queue.shutdown()
+            await asyncio.wait_for(task, 1)
+            return queue, calls
+
+        queue, calls = fakes.run(run())
+
+        # 'bad' must be given up after the initial call and three retries.
+        assert calls.count('bad') == 4
+        assert calls.count('good') == 2
+        assert queue.num_requeues('good') == 0 and queue.num_requeues('bad') == 0
+
+    def test_feed(self):
+        events = [
+            make_event('ADDED', 'a'),
+            make_event('MODIFIED', 'a'),
+            make_event('ADDED', 'b', namespace='other'),
+        ]
+
+        async def run():
+            queue = k8s.workqueue.WorkQueue()
+            await queue.feed(FakeWatch(events))
+            return [await queue.get() for _ in range(len(queue))]
+
+        assert fakes.run(run()) == [('default', 'a'), ('other', 'b')]
@@ -0,0 +1,250 @@
+"""Replace the bodies of the generated `*_with_http_info` methods.
+
+The Swagger templates make every API method copy `locals()`, validate the
+keyword arguments against a freshly built `all_params` list, check every
+possible query parameter with `if 'x' in params` and pick the `Accept` and
+`Content-Type` headers from a list of candidates. All of that happens for
+every single request, even though none of it ever changes.
+
+This script extracts the static parts of every method, ie resource path,
+HTTP method, positional arguments, query parameters, headers and response
+type, into an `aiokubernetes.endpoint.Endpoint` class attribute and reduces
+the method body to
+
+    return self._list_namespaced_pod_endpoint.call(
+        self.api_client, (namespace,), kwargs)
+
+The signatures, doc-strings and error messages of the methods remain
+unchanged. The `Endpoint` definition keeps the resource path, HTTP method and
+response type on separate lines, which means `registry.py` works on the
+converted files as well.
+
+The script aborts if a method contains anything the `Endpoint` cannot
+express, eg form parameters or custom headers.
+
+The script is idempotent.
+
+Usage:
+    python endpoints.py path/to/aiokubernetes/api
+"""
+import ast
+import glob
+import os
+import re
+import sys
+
+SUFFIX = '_with_http_info'
+IMPORT_API_CLIENT = 'from aiokubernetes.api_client import ApiClient\n'
+IMPORT_ENDPOINT = 'from aiokubernetes.endpoint import Endpoint\n'
+
+# Class level statement or module level statement.
+RE_OUTDENT = re.compile(r'^(    )?\S')
+
+
+def subscript_key(node):
+    """Return the key of the subscript `node`, eg 'foo' for `params['foo']`."""
+    node = node.slice
+    if isinstance(node, getattr(ast, 'Index', ())):
+        node = node.value
+    return ast.literal_eval(node)
+
+
+def is_name(node, name):
+    """Return True if `node` is the variable `name`."""
+    return isinstance(node, ast.Name) and node.id == name
+
+
+def target_name(node):
+    """Return eg 'path_params' for `path_params['foo'] = ...` (or None)."""
+    if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+        return None
+    target = node.targets[0]
+    if isinstance(target, ast.Name):
+        return target.id
+    if isinstance(target, ast.Subscript) and isinstance(target.value, ast.Name):
+        return target.value.id + '[]'
+    return None
+
+
+def parse_method(fun):
+    """Return the `Endpoint` arguments of the generated method `fun`.
+
+    Raises ValueError if `fun` does something an `Endpoint` cannot express.
+    """
+    name = fun.name[:-len(SUFFIX)]
+    required = tuple(_.arg for _ in fun.args.args[1:])
+    meta = {'name': name, 'required': required, 'query': []}
+    path_params = set()
+    has_body = False
+
+    for node in ast.walk(fun):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            attr, args = node.func.attr, node.args
+            if attr == 'call_api':
+                meta['path'] = ast.literal_eval(args[0])
+                meta['method'] = ast.literal_eval(args[1])
+                kwargs = {_.arg: _.value for _ in node.keywords}
+                meta['response_type'] = ast.literal_eval(kwargs['response_type'])
+            elif attr == 'select_header_accept':
+                meta['accepts'] = ast.literal_eval(args[0])
+            elif attr == 'select_header_content_type':
+                meta['content_types'] = ast.literal_eval(args[0])
+            elif attr == 'append' and is_name(node.func.value, 'query_params'):
+                query, value = args[0].elts
+                meta['query'].append((subscript_key(value), ast.literal_eval(query)))
+
+        target = target_name(node)
+        if target == 'auth_settings':
+            meta['auth_settings'] = ast.literal_eval(node.value)
+        elif target == 'path_params[]':
+            key = subscript_key(node.targets[0])
+            if key != subscript_key(node.value):
+                raise ValueError(f'{name}: path parameter <{key}> is renamed')
+            path_params.add(key)
+        elif target == 'body_params' and isinstance(node.value, ast.Subscript):
+            has_body = subscript_key(node.value) == 'body'
+            if not has_body:
+                raise ValueError(f'{name}: unsupported body')
+        elif target == 'header_params[]':
+            key = subscript_key(node.targets[0])
+            if key not in ('Accept', 'Content-Type'):
+                raise ValueError(f'{name}: unsupported header <{key}>')
+        elif target in ('collection_formats[]', 'local_var_files[]'):
+            raise ValueError(f'{name}: unsupported <{target}>')
+        elif (isinstance(node, ast.Call) and
+              getattr(node.func, 'attr', None) == 'append' and
+              is_name(node.func.value, 'form_params')):
+            raise ValueError(f'{name}: unsupported form parameters')
+
+    # All path parameters (and the body) must be positional arguments and
+    # vice versa, since `Endpoint.call` relies on it.
+    positional = path_params | ({'body'} if has_body else set())
+    if positional != set(required):
+        raise ValueError(f'{name}: positional arguments do not match {required}')
+    if 'path' not in meta:
+        raise ValueError(f'{name}: no call to `call_api`')
+    meta['query'] = tuple(meta['query'])
+    return meta
+
+
+def noqa(line):
+    """Append the flake8 suppression to `line` if it is too long (like Swagger)."""
+    if len(line) > 79:
+        return line + '  # noqa: E501'
+    return line
+
+
+def format_endpoint(attr, meta):
+    """Return the source lines of the class attribute `attr` for `meta`."""
+    lines = [
+        f'    {attr} = Endpoint(',
+        f'        {meta["name"]!r},',
+        f'        {meta["path"]!r}, {meta["method"]!r},',
+        f'        required={meta["required"]!r},',
+    ]
+    if meta['query']:
+        lines.append('        query=(')
+        lines += [f'            {_!r},' for _ in meta['query']]
+        lines.append('        ),')
+    for key in ('accepts', 'content_types'):
+        if key in meta:
+            lines.append(f'        {key}={tuple(meta[key])!r},')
+    lines += [
+        f'        response_type={meta["response_type"]!r},',
+        f'        auth_settings={tuple(meta["auth_settings"])!r},',
+        '    )',
+    ]
+
+    # `registry.py` expects the resource path line without a comment.
+    return [(_ if idx == 2 else noqa(_)) + '\n' for idx, _ in enumerate(lines)]
+
+
+def format_body(attr, meta):
+    """Return the source lines of the method body that calls `attr`."""
+    args = ', '.join(meta['required'])
+    if len(meta['required']) == 1:
+        args += ','
+    lines = [
+        f'        return self.{attr}.call(',
+        f'            self.api_client, ({args}), kwargs)',
+    ]
+    return [noqa(_) + '\n' for _ in lines]
+
+
+def find_docstring_end(lines, start):
+    """Return the index of the line after the doc-string of the method at `start`."""
+    for idx in range(start + 2, len(lines)):
+        if lines[idx].strip() == '"""':
+            return idx + 1
+    raise ValueError(f'Method in line {start + 1} has no doc-string')
+
+
+def find_method_end(lines, start):
+    """Return the index after the last non-empty line of the method at `start`.
+
+    This does the job of the `end_lineno` attribute of AST nodes, which only
+    exists in Python 3.8+.
+    """
+    end = len(lines)
+    for idx in range(start + 1, len(lines)):
+        if RE_OUTDENT.match(lines[idx]):
+            end = idx
+            break
+    while not lines[end - 1].strip():
+        end -= 1
+    return end
+
+
+def convert(src):
+    """Return the API module source `src` with `Endpoint`s (None if unchanged)."""
+    tree = ast.parse(src)
+    methods = [
+        fun
+        for klass in tree.body if isinstance(klass, ast.ClassDef)
+        for fun in klass.body
+        if isinstance(fun, ast.FunctionDef) and fun.name.endswith(SUFFIX)
+    ]
+
+    # Only convert the methods that still build `all_params`.
+    methods = [
+        fun for fun in methods
+        if any(target_name(_) == 'all_params' for _ in fun.body)
+    ]
+    if not methods:
+        return None
+
+    # Replace the methods back to front to keep the line numbers valid.
+    lines = src.splitlines(keepends=True)
+    for fun in reversed(methods):
+        meta = parse_method(fun)
+        attr = f'_{meta["name"]}_endpoint'
+        start = fun.lineno - 1
+        body = find_docstring_end(lines, start)
+        end = find_method_end(lines, start)
+        lines[body:end] = (
+            format_body(attr, meta) + ['\n'] + format_endpoint(attr, meta))
+
+    src = str.join('', lines)
+    if IMPORT_ENDPOINT not in src:
+        assert IMPORT_API_CLIENT in src
+        src = src.replace(IMPORT_API_CLIENT, IMPORT_API_CLIENT + IMPORT_ENDPOINT)
+    return src
+
+
+def main():
+    if len(sys.argv) != 2:
+        print(f'Usage: {sys.argv[0]} path/to/aiokubernetes/api')
+        sys.exit(1)
+
+    for fname in sorted(glob.glob(os.path.join(sys.argv[1], '*_api.py'))):
+        try:
+            src = convert(open(fname, encoding='utf8').read())
+        except ValueError as err:
+            print(f'{fname}: {err}')
+            sys.exit(1)
+        if src is not None:
+            open(fname, 'w', encoding='utf8').write(src)
+
+
+if __name__ == '__main__':
+    main()
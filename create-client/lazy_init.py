@@ -0,0 +1,202 @@
+"""Convert the generated `__init__.py` files into lazy loading versions.
+
+Swagger generates `__init__.py` files that eagerly import all API and model
+modules, which takes more than a second. This script replaces every
+
+    from aiokubernetes.models.v1_pod import V1Pod
+
+line with an entry in a `{name: module}` table. The `__getattr__` function of
+the package then imports the module on first access (PEP 562). The same
+applies to the classes the root package exposes directly, ie
+
+    from aiokubernetes.api_client import ApiClient
+
+Usage:
+    python lazy_init.py path/to/aiokubernetes
+"""
+import os
+import re
+import sys
+
+# Matches eg "from aiokubernetes.models.v1_pod import V1Pod".
+RE_IMPORT = re.compile(r'^from (aiokubernetes\.(?:api|models)\.\w+) import (\w+)$')
+
+# Matches eg "from aiokubernetes.api_client import ApiClient" in the root
+# `__init__.py`, but not the API and model imports.
+RE_ROOT_IMPORT = re.compile(r'^from (aiokubernetes\.\w+) import (\w+)$')
+
+HEADER = '''# coding: utf-8
+
+# flake8: noqa
+"""
+    Kubernetes
+
+    No description provided (generated by Swagger Codegen https://github.com/swagger-api/swagger-codegen)  # noqa: E501
+
+    OpenAPI spec version: v1.10.6
+
+    Generated by: https://github.com/swagger-api/swagger-codegen.git
+
+    NOTE: this file was converted by `create-client/lazy_init.py`.
+"""
+import importlib
+import sys
+
+'''
+
+PACKAGE_TEMPLATE = HEADER + '''# Map the name of every {what} to the module that defines it. The modules are
+# only imported when the user accesses the name for the first time.
+_MODULES = {{
+{table}
+}}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
+
+
+# Python 3.6 does not support module level `__getattr__` functions.
+if sys.version_info < (3, 7):
+    for _name in _MODULES:
+        __getattr__(_name)
+'''
+
+ROOT_TEMPLATE = HEADER + '''# Classes that are available as attributes of the `aiokubernetes` package, eg
+# `aiokubernetes.ApiClient`, and the module that defines them.
+_ATTRIBUTES = {{
+{attributes}
+}}
+
+# Sub-modules that are available as attributes of the `aiokubernetes` package.
+_SUBMODULES = {{
+{submodules}
+}}
+
+
+def __getattr__(name):
+    # Convenience: import eg `aiokubernetes.swagger` on first access.
+    if name in _SUBMODULES:
+        return importlib.import_module(f'{{__name__}}.{{name}}')
+
+    if name in _ATTRIBUTES:
+        value = getattr(importlib.import_module(_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+
+    # `from aiokubernetes import *` exports all of the above as well as all
+    # APIs and models. Compute the list on demand because it requires the
+    # `api` and `models` packages.
+    if name == '__all__':
+        api = importlib.import_module(f'{{__name__}}.api')
+        models = importlib.import_module(f'{{__name__}}.models')
+        value = sorted(_ATTRIBUTES) + sorted(_SUBMODULES) + api.__all__ + models.__all__
+        globals()[name] = value
+        return value
+
+    # Expose all APIs and models at the top level, eg `aiokubernetes.V1Pod`.
+    for package in ('api', 'models'):
+        package = importlib.import_module(f'{{__name__}}.{{package}}')
+        if name in package._MODULES:
+            value = getattr(package, name)
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+
+def __dir__():
+    api = importlib.import_module(f'{{__name__}}.api')
+    models = importlib.import_module(f'{{__name__}}.models')
+    names = set(globals()) | set(_ATTRIBUTES) | _SUBMODULES
+    return sorted(names | set(api._MODULES) | set(models._MODULES))
+
+
+# Python 3.6 does not support module level `__getattr__` functions.
+if sys.version_info < (3, 7):
+    for _name in sorted(_ATTRIBUTES) + sorted(_SUBMODULES):
+        __getattr__(_name)
+    from aiokubernetes.api import *  # noqa: F401,F403
+    from aiokubernetes.models import *  # noqa: F401,F403
+    __getattr__('__all__')
+'''
+
+# Hand written modules that users can access as eg `aiokubernetes.watch`
+# without an explicit import.
+SUBMODULES = (
+    'api',
+    'api_client',
+    'api_proxy',
+    'cache',
+    'cached',
+    'clients',
+    'codec',
+    'config',
+    'configuration',
+    'debounce',
+    'endpoint',
+    'hub',
+    'informer',
+    'jsonstream',
+    'pager',
+    'models',
+    'ratelimit',
+    'registry',
+    'rest',
+    'retry',
+    'selector',
+    'singleflight',
+    'swagger',
+    'utils',
+    'watch',
+    'workqueue',
+)
+
+
+def parse_imports(fname, regex=RE_IMPORT):
+    """Return the {name: module} table from the import lines in `fname`."""
+    table = {}
+    for line in open(fname):
+        match = regex.match(line.strip())
+        if match is not None:
+            module, name = match.groups()
+            table[name] = module
+    return table
+
+
+def format_table(table):
+    return '\n'.join(f"    {name!r}: {module!r}," for name, module in table.items())
+
+
+def main():
+    root = sys.argv[1]
+
+    for package, what in (('api', 'API class'), ('models', 'model')):
+        fname = os.path.join(root, package, '__init__.py')
+        table = parse_imports(fname)
+        assert len(table) > 0, f'No imports found in <{fname}>'
+        src = PACKAGE_TEMPLATE.format(what=what, table=format_table(table))
+        open(fname, 'w').write(src)
+
+    # The root package must keep exposing eg `ApiClient` and `Configuration`.
+    fname = os.path.join(root, '__init__.py')
+    attributes = parse_imports(fname, RE_ROOT_IMPORT)
+    assert len(attributes) > 0, f'No imports found in <{fname}>'
+    submodules = '\n'.join(f"    {name!r}," for name in SUBMODULES)
+    src = ROOT_TEMPLATE.format(
+        attributes=format_table(attributes), submodules=submodules)
+    open(fname, 'w').write(src)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""Generate the static (apiVersion, kind) -> model/API table.
+
+K8s manifests identify their type with `apiVersion` and `kind`. The Swagger
+models do not record either, but the generated API methods do: every method
+passes its resource path, eg `/apis/apps/v1/namespaces/{namespace}/deployments`,
+and its `response_type`, eg `V1Deployment`, to `call_api`.
+
+This script collects these calls from all generated API classes and writes the
+`aiokubernetes/resources.py` table that `aiokubernetes.registry` loads.
+
+Usage:
+    python registry.py path/to/aiokubernetes
+"""
+import glob
+import os
+import re
+import sys
+
+# Matches the generated method definitions and their `call_api` invocation.
+RE_METHOD = re.compile(r'^    def (\w+)_with_http_info\(self')
+RE_CALL = re.compile(r"^ +'(/[^']*)', '(\w+)',$")
+RE_RESPONSE = re.compile(r"^ +response_type='(\w+)',")
+RE_CLASS = re.compile(r'^class (\w+)\(object\):')
+
+# Split a resource path into group, version, namespace flag, plural and item
+# flag, eg "/apis/apps/v1/namespaces/{namespace}/deployments/{name}".
+RE_PATH = re.compile(
+    r'^/(?:api|apis/(?P<group>[^/]+))/(?P<version>v\w+)/'
+    r'(?P<namespaced>namespaces/\{namespace\}/)?'
+    r'(?P<plural>[a-z0-9]+)(?P<item>/\{name\})?$'
+)
+
+# Verb names for (HTTP method, item path) combinations.
+VERBS = {
+    ('GET', False): 'list',
+    ('POST', False): 'create',
+    ('DELETE', False): 'delete_collection',
+    ('GET', True): 'read',
+    ('PUT', True): 'replace',
+    ('PATCH', True): 'patch',
+    ('DELETE', True): 'delete',
+}
+
+HEADER = '''# coding: utf-8
+
+# flake8: noqa
+"""
+    Kubernetes
+
+    NOTE: this file was generated by `create-client/registry.py`.
+
+    Maps (apiVersion, kind) to
+    (model, list model, plural, namespaced, API class, {verb: API method}).
+"""
+'''
+
+
+def parse_calls(fname):
+    """Yield (api class, method name, path, HTTP method, response type)."""
+    klass = name = path = http_method = None
+    for line in open(fname):
+        match = RE_CLASS.match(line)
+        if match:
+            klass = match.group(1)
+        match = RE_METHOD.match(line)
+        if match:
+            name, path, http_method = match.group(1), None, None
+        match = RE_CALL.match(line)
+        if match:
+            path, http_method = match.groups()
+        match = RE_RESPONSE.match(line)
+        if match and path is not None:
+            yield klass, name, path, http_method, match.group(1)
+            path = None
+
+
+def strip_version(model, group, version):
+    """Return the kind of `model`, eg 'V1Deployment' -> 'Deployment'.
+
+    Some models carry the group name as well, eg
+    'ExtensionsV1beta1Deployment'. Returns None if `model` does not belong to
+    the `group` and `version`.
+    """
+    version = version[0].upper() + version[1:]
+    prefixes = [version]
+    if group:
+        word = group.split('.')[0]
+        prefixes.insert(0, word[0].upper() + word[1:] + version)
+    for prefix in prefixes:
+        kind = model[len(prefix):]
+        if model.startswith(prefix) and kind[:1].isupper():
+            return kind
+    return None
+
+
+def build_table(root):
+    """Return the {(apiVersion, kind): entry} table for all API classes."""
+    resources = {}
+    for fname in sorted(glob.glob(os.path.join(root, 'api', '*_api.py'))):
+        for klass, name, path, http_method, response in parse_calls(fname):
+            match = RE_PATH.match(path)
+            if match is None:
+                continue
+            group, version = match.group('group'), match.group('version')
+            api_version = f'{group}/{version}' if group else version
+            key = (api_version, match.group('plural'))
+
+            res = resources.setdefault(key, {
+                'model': None, 'list': None, 'namespaced': False,
+                'api': klass, 'methods': {}, 'group': group, 'version': version,
+            })
+            is_item = match.group('item') is not None
+            verb = VERBS.get((http_method, is_item))
+            if verb is None:
+                continue
+            if match.group('namespaced'):
+                res['namespaced'] = True
+            elif verb == 'list' and res['namespaced'] or 'for_all_namespaces' in name:
+                verb = 'list_all'
+            res['methods'][verb] = name
+
+            if verb in ('list', 'list_all'):
+                res['list'] = response
+            elif verb in ('read', 'create', 'replace') and res['model'] is None:
+                res['model'] = response
+
+    # Key the table by (apiVersion, kind) instead of (apiVersion, plural).
+    table = {}
+    for (api_version, plural), res in sorted(resources.items()):
+        if res['model'] is None:
+            continue
+        kind = strip_version(res['model'], res['group'], res['version'])
+        if kind is None:
+            print(f'Skipping {api_version} {plural}: unexpected model {res["model"]}')
+            continue
+        # Cluster scoped resources have no "all namespaces" variant.
+        methods = dict(sorted(res['methods'].items()))
+        if not res['namespaced'] and 'list_all' in methods:
+            methods['list'] = methods.pop('list_all')
+        table[(api_version, kind)] = (
+            res['model'], res['list'], plural, res['namespaced'], res['api'], methods
+        )
+    return table
+
+
+def main():
+    root = sys.argv[1]
+    table = build_table(root)
+    assert len(table) > 0, 'No API methods found'
+
+    lines = [HEADER, 'RESOURCES = {\n']
+    for key, (*fields, methods) in table.items():
+        lines.append(f'    {key!r}: (\n')
+        lines += [f'        {field!r},\n' for field in fields]
+        lines.append('        {\n')
+        lines += [f'            {verb!r}: {name!r},\n' for verb, name in methods.items()]
+        lines.append('        },\n    ),\n')
+    lines.append('}\n')
+    open(os.path.join(root, 'resources.py'), 'w').write(str.join('', lines))
+
+
+if __name__ == '__main__':
+    main()
@@ -76,14 +76,21 @@ sed -i '/^from __future__ import absolute_import/d' **/*.py
 # User convenience.
 # ----------------------------------------------------------------------
 
-# These imports are technically unnecessary but are convenient for end users.
-cat >>"__init__.py" <<EOF
-
-# These import are technically unnecessary but are convenient for end users.
-import aiokubernetes.config as config
-import aiokubernetes.swagger as swagger
-
-from aiokubernetes.watch import Watch
-EOF
+# Replace the eager imports in the `__init__` files with lazy loading tables.
+# These also expose the hand written modules like `aiokubernetes.swagger`.
+python "${SCRIPT_ROOT}/lazy_init.py" .
+
+# Generate the (apiVersion, kind) -> model/API table for `registry.py`.
+python "${SCRIPT_ROOT}/registry.py" .
+
+# Move the static parts of every API method, eg the valid keyword arguments and
+# query parameters, into an `Endpoint` that is built once at import time instead
+# of for every request.
+python "${SCRIPT_ROOT}/endpoints.py" api
+
+# Store the model attributes in `__slots__` instead of a per-instance dict to
+# reduce the memory footprint of large caches. Pass `--compat` to keep a
+# `__dict__` slot for users that attach arbitrary attributes to models.
+python "${SCRIPT_ROOT}/slots.py" models
 
 popd
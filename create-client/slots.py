@@ -0,0 +1,127 @@
+"""Add `__slots__` to the generated model classes.
+
+Swagger generated models store every property in a per-instance `__dict__`.
+A dict per object is expensive when caching hundreds of thousands of
+resources, each of which consists of dozens of nested model instances.
+
+This script inserts a
+
+    __slots__ = ('_api_version', '_kind', ..., 'discriminator')
+
+declaration after the `attribute_map` of every model and replaces the
+`__dict__` based `__eq__` with one that compares the properties instead. The
+public API, ie the properties, `to_dict` and equality, remains unchanged.
+
+The model instances have no per-instance dict, which means assigning
+arbitrary attributes, eg to annotate a model, raises AttributeError. Use
+`--compat` to add a `'__dict__'` slot that restores this ability. Python only
+allocates the dict once an arbitrary attribute is assigned.
+
+Properties whose name starts with an underscore, eg `_continue`, are stored
+in name mangled attributes like `self.__continue`. Python applies the same
+mangling to `__slots__` entries, which means the slot `'__continue'` is the
+correct one.
+
+The script is idempotent.
+
+Usage:
+    python slots.py [--compat] path/to/aiokubernetes/models
+"""
+import argparse
+import ast
+import glob
+import io
+import os
+import tokenize
+
+OLD_EQ = '        return self.__dict__ == other.__dict__\n'
+NEW_EQ = '''        return all(
+            getattr(self, attr) == getattr(other, attr)
+            for attr in self.swagger_types
+        )
+'''
+
+
+def find_model(tree):
+    """Return the class node and its `swagger_types` and `attribute_map` nodes."""
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        assigns = {
+            stmt.targets[0].id: stmt for stmt in node.body
+            if isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name)
+        }
+        if 'swagger_types' in assigns and 'attribute_map' in assigns:
+            return node, assigns['swagger_types'], assigns['attribute_map']
+    return None
+
+
+def find_end(src, lineno):
+    """Return the line number where the statement that starts at `lineno` ends.
+
+    This does the job of the `end_lineno` attribute of AST nodes, which only
+    exists in Python 3.8+.
+    """
+    depth = 0
+    for token in tokenize.generate_tokens(io.StringIO(src).readline):
+        if token.start[0] < lineno or token.type != tokenize.OP:
+            continue
+        if token.string in '([{':
+            depth += 1
+        elif token.string in ')]}':
+            depth -= 1
+            if depth == 0:
+                return token.end[0]
+    raise ValueError(f'Statement in line {lineno} does not end')
+
+
+def add_slots(src, compat=False):
+    """Return the model source `src` with `__slots__` (None if unchanged).
+
+    Add a `'__dict__'` slot if `compat` is True.
+    """
+    if '__slots__' in src:
+        return None
+    tree = ast.parse(src)
+    model = find_model(tree)
+    if model is None:
+        return None
+    _, swagger_types, attribute_map = model
+
+    # The properties store their values in attributes with a leading
+    # underscore. All models also have a `discriminator` attribute.
+    attrs = [ast.literal_eval(key) for key in swagger_types.value.keys]
+    slots = [f'_{attr}' for attr in attrs] + ['discriminator']
+    if compat:
+        slots.append('__dict__')
+    lines = ['    __slots__ = (\n']
+    lines += [f'        {slot!r},\n' for slot in slots]
+    lines += ['    )\n']
+
+    # Insert the slots after the `attribute_map` definition.
+    src_lines = src.splitlines(keepends=True)
+    pos = find_end(src, attribute_map.lineno)
+    src_lines[pos:pos] = ['\n'] + lines
+    src = str.join('', src_lines)
+
+    assert OLD_EQ in src
+    return src.replace(OLD_EQ, NEW_EQ)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Add __slots__ to the models')
+    parser.add_argument('--compat', action='store_true',
+                        help='allow arbitrary attributes on models')
+    parser.add_argument('root', help='path to aiokubernetes/models')
+    args = parser.parse_args()
+
+    for fname in sorted(glob.glob(os.path.join(args.root, '*.py'))):
+        if os.path.basename(fname) == '__init__.py':
+            continue
+        src = add_slots(open(fname, encoding='utf8').read(), args.compat)
+        if src is not None:
+            open(fname, 'w', encoding='utf8').write(src)
+
+
+if __name__ == '__main__':
+    main()